@@ -28,6 +28,7 @@ from openforms.submissions.api.permissions import (
 )
 from openforms.submissions.models import Submission
 
+from ..caching import get_availability
 from ..exceptions import AppointmentDeleteFailed, CancelAppointmentFailed
 from ..models import Appointment, AppointmentsConfig
 from ..utils import delete_appointment_for_submission, get_plugin
@@ -120,7 +121,7 @@ class ProductsListView(ListMixin, APIView):
                 span_type="app.appointments.get_products",
             ),
         ):
-            return plugin.get_available_products(**kwargs)
+            return get_availability(plugin, "get_available_products", **kwargs)
 
 
 @extend_schema(
@@ -165,7 +166,7 @@ class LocationsListView(ListMixin, APIView):
                 span_type="app.appointments.get_locations",
             ),
         ):
-            return plugin.get_locations(products)
+            return get_availability(plugin, "get_locations", products=products)
 
 
 @extend_schema(
@@ -215,7 +216,9 @@ class DatesListView(ListMixin, APIView):
                 name="get-available-dates", span_type="app.appointments.get_dates"
             ),
         ):
-            dates = plugin.get_dates(products, location)
+            dates = get_availability(
+                plugin, "get_dates", products=products, location=location
+            )
         return [{"date": date} for date in dates]
 
 
@@ -275,7 +278,9 @@ class TimesListView(ListMixin, APIView):
                 name="get-available-times", span_type="app.appointments.get_times"
             ),
         ):
-            times = plugin.get_times(products, location, date)
+            times = get_availability(
+                plugin, "get_times", products=products, location=location, day=date
+            )
         return [{"time": time} for time in times]
 
 
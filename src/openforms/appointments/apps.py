@@ -5,3 +5,7 @@ from django.utils.translation import gettext_lazy as _
 class AppointmentsAppConfig(AppConfig):
     name = "openforms.appointments"
     verbose_name = _("Appointments")
+
+    def ready(self):
+        # register signal receivers
+        from . import signals  # noqa
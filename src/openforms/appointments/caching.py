@@ -0,0 +1,243 @@
+"""
+Share the availability lookups of the appointment plugins between requests.
+
+The products, locations, dates and times are looked up for every (anonymous) request of
+the appointment widget, while many users make the same lookups against a slow backend.
+The results are stored in the default cache, keyed by the plugin, its configuration and
+the arguments of the lookup:
+
+* an entry is fresh for ``APPOINTMENTS_CACHE_TIMEOUT`` (products and locations) or
+  ``APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT`` (dates and times) seconds;
+* after that, the stale entry is still used for the same amount of time, while it is
+  refreshed in the background.
+
+Saving the configuration of the appointments (plugins) discards all the entries, see
+:mod:`openforms.appointments.signals`. Booking an appointment discards the dates and
+times for its products and location, see :func:`invalidate_availability`.
+"""
+
+import hashlib
+import json
+import uuid
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Literal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+import structlog
+
+from .base import BasePlugin, Location, Product
+from .registry import register
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# bump the version when the structure of the cached data changes
+CACHE_VERSION = 1
+GENERATION_CACHE_KEY = "appointments|generation"
+REFRESH_LOCK_TIMEOUT = 60
+# the number of (first) available dates for which the times are retrieved up front
+WARM_TIMES_MAX_DAYS = 14
+
+type Lookup = Literal[
+    "get_available_products", "get_locations", "get_dates", "get_times"
+]
+type Arguments = dict[str, str | list[tuple[str, int]]]
+
+
+@dataclass
+class CachedLookup:
+    value: Any
+    refresh_after: datetime
+
+    @property
+    def should_refresh(self) -> bool:
+        return timezone.now() >= self.refresh_after
+
+
+def _get_timeout(lookup: Lookup) -> int:
+    if lookup in ("get_available_products", "get_locations"):
+        return settings.APPOINTMENTS_CACHE_TIMEOUT
+    return settings.APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT
+
+
+def _dump_arguments(**kwargs: Any) -> Arguments:
+    arguments = {}
+    for name, value in kwargs.items():
+        match value:
+            case list():
+                arguments[name] = [
+                    (product.identifier, product.amount) for product in value
+                ]
+            case Location():
+                arguments[name] = value.identifier
+            case date():
+                arguments[name] = value.isoformat()
+            case _:
+                arguments[name] = value
+    return arguments
+
+
+def _load_arguments(arguments: Arguments) -> dict[str, Any]:
+    kwargs = {}
+    for name, value in arguments.items():
+        match name:
+            case "products" | "current_products" if value is not None:
+                kwargs[name] = [
+                    Product(identifier=identifier, name="", amount=amount)
+                    for identifier, amount in value
+                ]
+            case "location":
+                kwargs[name] = Location(identifier=value, name="")
+            case "day":
+                kwargs[name] = date.fromisoformat(value)
+            case _:
+                kwargs[name] = value
+    return kwargs
+
+
+def _get_cache_key(plugin_id: str, lookup: Lookup, arguments: Arguments) -> str:
+    generation = cache.get(GENERATION_CACHE_KEY) or ""
+    # the products are given in the order the user selected them
+    normalized = {
+        name: sorted(value) if isinstance(value, list) else value
+        for name, value in arguments.items()
+    }
+    digest = hashlib.md5(
+        json.dumps(normalized, sort_keys=True).encode(), usedforsecurity=False
+    ).hexdigest()
+    return (
+        f"appointments|{lookup}|plugin:{plugin_id}|generation:{generation}|"
+        f"arguments:{digest}"
+    )
+
+
+def _fetch(plugin: BasePlugin, lookup: Lookup, arguments: Arguments) -> CachedLookup:
+    value = getattr(plugin, lookup)(**_load_arguments(arguments))
+    timeout = _get_timeout(lookup)
+    cached_lookup = CachedLookup(
+        value=value, refresh_after=timezone.now() + timedelta(seconds=timeout)
+    )
+    cache.set(
+        _get_cache_key(plugin.identifier, lookup, arguments),
+        cached_lookup,
+        # keep serving the stale value while it is refreshed
+        timeout=timeout * 2,
+        version=CACHE_VERSION,
+    )
+
+    if lookup == "get_dates" and value:
+        _schedule_warm_times(plugin, arguments, value)
+    return cached_lookup
+
+
+def _claim_refresh(cache_key: str) -> bool:
+    return cache.add(f"{cache_key}|refresh", True, timeout=REFRESH_LOCK_TIMEOUT)
+
+
+def _schedule_refresh(plugin: BasePlugin, lookup: Lookup, arguments: Arguments) -> None:
+    # circular import
+    from .tasks import refresh_availability
+
+    transaction.on_commit(
+        lambda: refresh_availability.delay(plugin.identifier, lookup, arguments)
+    )
+
+
+def _schedule_warm_times(
+    plugin: BasePlugin, arguments: Arguments, dates: Sequence[date]
+) -> None:
+    # circular import
+    from .tasks import warm_times
+
+    days = [day.isoformat() for day in dates[:WARM_TIMES_MAX_DAYS]]
+    transaction.on_commit(
+        lambda: warm_times.delay(
+            plugin.identifier, arguments["products"], arguments["location"], days
+        )
+    )
+
+
+def get_availability(plugin: BasePlugin, lookup: Lookup, **kwargs: Any) -> Any:
+    """
+    Call the lookup method of the plugin, using the cached result if possible.
+
+    Stale results are returned as is, and refreshed in the background.
+    """
+    if not _get_timeout(lookup):
+        return getattr(plugin, lookup)(**kwargs)
+
+    arguments = _dump_arguments(**kwargs)
+    cache_key = _get_cache_key(plugin.identifier, lookup, arguments)
+    cached_lookup: CachedLookup | None = cache.get(cache_key, version=CACHE_VERSION)
+    if cached_lookup is None:
+        return _fetch(plugin, lookup, arguments).value
+
+    if cached_lookup.should_refresh and _claim_refresh(cache_key):
+        logger.debug("appointments.stale_lookup", plugin=plugin, lookup=lookup)
+        _schedule_refresh(plugin, lookup, arguments)
+    return cached_lookup.value
+
+
+def refresh_availability(plugin_id: str, lookup: Lookup, arguments: Arguments) -> None:
+    """
+    Retrieve the result of the lookup and (re)place it in the cache.
+    """
+    _fetch(register[plugin_id], lookup, arguments)
+
+
+def warm_times(
+    plugin_id: str,
+    products: list[tuple[str, int]],
+    location_id: str,
+    days: Iterable[str],
+) -> None:
+    """
+    Retrieve the times of the available days that are not cached (or stale) yet.
+    """
+    plugin = register[plugin_id]
+    for day in days:
+        arguments: Arguments = {
+            "products": products,
+            "location": location_id,
+            "day": day,
+        }
+        cache_key = _get_cache_key(plugin_id, "get_times", arguments)
+        cached_lookup = cache.get(cache_key, version=CACHE_VERSION)
+        if cached_lookup is not None and not cached_lookup.should_refresh:
+            continue
+        _fetch(plugin, "get_times", arguments)
+
+
+def invalidate_availability(
+    plugin: BasePlugin, products: list[Product], location: Location, day: date
+) -> None:
+    """
+    Discard the cached dates and times affected by booking an appointment.
+
+    Only the lookups for the exact products of the appointment are discarded, other
+    combinations of products expire after their (short) timeout.
+    """
+    arguments = _dump_arguments(products=products, location=location)
+    cache.delete_many(
+        [
+            _get_cache_key(plugin.identifier, "get_dates", arguments),
+            _get_cache_key(
+                plugin.identifier,
+                "get_times",
+                {**arguments, "day": day.isoformat()},
+            ),
+        ],
+        version=CACHE_VERSION,
+    )
+
+
+def invalidate_configuration() -> None:
+    """
+    Discard all the cached lookups, by moving on to a new generation of cache keys.
+    """
+    cache.set(GENERATION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
@@ -1,6 +1,6 @@
 from zeep.client import Client
 
-from soap.client import build_client
+from soap.client import build_client, get_cached_client
 
 from .models import JccConfig
 
@@ -8,4 +8,4 @@ from .models import JccConfig
 def get_client() -> Client:
     config = JccConfig.get_solo()
     assert config.service is not None
-    return build_client(config.service)
+    return get_cached_client(config.service, build=build_client)
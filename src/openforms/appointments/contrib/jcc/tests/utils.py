@@ -4,6 +4,7 @@ from unittest.mock import patch
 from zeep.client import Client
 
 from openforms.utils.tests.cache import clear_caches
+from soap.client import clear_cached_clients
 from soap.tests.factories import SoapServiceFactory
 
 from ....models import AppointmentsConfig
@@ -40,6 +41,7 @@ class MockConfigMixin:
         super().setUp()  # type: ignore
 
         self.addCleanup(clear_caches)  # type: ignore
+        self.addCleanup(clear_cached_clients)  # type: ignore
 
         main_config_patcher = patch(
             "openforms.appointments.utils.AppointmentsConfig.get_solo",
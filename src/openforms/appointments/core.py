@@ -5,6 +5,7 @@ This module is the follow-up to the bulk of functionality in utils.py, which is
 way too much but can't be easily refactored without breaking existing functionality.
 """
 
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 import elasticapm
@@ -15,6 +16,7 @@ from openforms.logging import audit_logger
 from openforms.submissions.models import Submission
 
 from .base import BasePlugin, CustomerDetails, Location, Product
+from .caching import invalidate_availability
 from .constants import AppointmentDetailsStatus
 from .exceptions import (
     AppointmentCreateFailed,
@@ -63,6 +65,10 @@ def book(appointment: Appointment, remarks: str = "") -> str:
         customer,
         remarks=remarks,
     )
+    # the booked time slot is no longer available
+    invalidate_availability(
+        plugin, products, location, timezone.localdate(appointment.datetime)
+    )
     AppointmentInfo.objects.create(
         status=AppointmentDetailsStatus.success,
         appointment_id=appointment_id,
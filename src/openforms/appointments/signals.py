@@ -0,0 +1,32 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from solo.models import SingletonModel
+from zgw_consumers.models import Service
+
+from soap.models import SoapService
+
+from .caching import invalidate_configuration
+
+
+@receiver(post_save, dispatch_uid="appointments.invalidate_cached_lookups")
+def invalidate_cached_lookups(sender, instance, **kwargs) -> None:
+    # the configuration of the appointments and their plugins are singletons
+    if isinstance(instance, SingletonModel) and sender.__module__.startswith(
+        "openforms.appointments."
+    ):
+        invalidate_configuration()
+
+
+# the plugins connect to their backend through these services, changing the URL or
+# credentials may point them to another backend
+@receiver(
+    post_save, sender=SoapService, dispatch_uid="appointments.invalidate_soap_service"
+)
+@receiver(
+    post_delete, sender=SoapService, dispatch_uid="appointments.invalidate_soap_service"
+)
+@receiver(post_save, sender=Service, dispatch_uid="appointments.invalidate_service")
+@receiver(post_delete, sender=Service, dispatch_uid="appointments.invalidate_service")
+def invalidate_cached_service_lookups(sender, instance, **kwargs) -> None:
+    invalidate_configuration()
@@ -4,10 +4,11 @@ from celery_once import QueueOnce
 from openforms.celery import app
 from openforms.submissions.models import Submission
 
+from . import caching
 from .core import book_for_submission
 from .exceptions import AppointmentRegistrationFailed, NoAppointmentForm
 
-__all__ = ["maybe_register_appointment"]
+__all__ = ["maybe_register_appointment", "refresh_availability", "warm_times"]
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -39,3 +40,17 @@ def maybe_register_appointment(submission_id: int) -> None | str:
     except AppointmentRegistrationFailed as exc:
         log.info("appointment_registration_failure", exc_info=exc)
         raise
+
+
+@app.task(ignore_result=True)
+def refresh_availability(
+    plugin_id: str, lookup: caching.Lookup, arguments: caching.Arguments
+) -> None:
+    caching.refresh_availability(plugin_id, lookup, arguments)
+
+
+@app.task(ignore_result=True)
+def warm_times(
+    plugin_id: str, products: list[tuple[str, int]], location_id: str, days: list[str]
+) -> None:
+    caching.warm_times(plugin_id, products, location_id, days)
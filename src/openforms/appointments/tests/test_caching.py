@@ -0,0 +1,170 @@
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from zgw_consumers.test.factories import ServiceFactory
+
+from openforms.utils.tests.cache import clear_caches
+from soap.tests.factories import SoapServiceFactory
+
+from ..base import Location, Product
+from ..caching import get_availability, invalidate_availability, warm_times
+from ..contrib.demo.plugin import DemoAppointment
+from ..models import AppointmentsConfig
+from ..registry import register
+
+LOCATION = Location(identifier="1", name="")
+DAY = date(2026, 10, 19)
+
+
+@override_settings(
+    APPOINTMENTS_CACHE_TIMEOUT=300,
+    APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT=60,
+)
+class AvailabilityCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+        self.plugin = register["demo"]
+        self.products = [
+            Product(identifier="1", name="", amount=2),
+            Product(identifier="2", name=""),
+        ]
+
+    @patch.object(DemoAppointment, "get_locations", return_value=[LOCATION])
+    def test_lookup_is_cached(self, m_get_locations):
+        locations1 = get_availability(
+            self.plugin, "get_locations", products=self.products
+        )
+        # the order of the products does not matter
+        locations2 = get_availability(
+            self.plugin, "get_locations", products=self.products[::-1]
+        )
+
+        self.assertEqual(locations1, [LOCATION])
+        self.assertEqual(locations2, [LOCATION])
+        m_get_locations.assert_called_once_with(products=self.products)
+
+        with self.subTest("different arguments"):
+            get_availability(self.plugin, "get_locations", products=self.products[:1])
+
+            self.assertEqual(m_get_locations.call_count, 2)
+
+    @override_settings(APPOINTMENTS_CACHE_TIMEOUT=0)
+    @patch.object(DemoAppointment, "get_locations", return_value=[LOCATION])
+    def test_caching_can_be_disabled(self, m_get_locations):
+        for _ in range(2):
+            get_availability(self.plugin, "get_locations", products=self.products)
+
+        self.assertEqual(m_get_locations.call_count, 2)
+
+    @patch.object(DemoAppointment, "get_times", return_value=[])
+    def test_stale_lookup_is_refreshed_in_background(self, m_get_times):
+        get_availability(
+            self.plugin,
+            "get_times",
+            products=self.products,
+            location=LOCATION,
+            day=DAY,
+        )
+        later = timezone.now() + timedelta(seconds=90)
+
+        with (
+            patch("django.utils.timezone.now", return_value=later),
+            patch("openforms.appointments.tasks.refresh_availability.delay") as m_delay,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            for _ in range(2):
+                get_availability(
+                    self.plugin,
+                    "get_times",
+                    products=self.products,
+                    location=LOCATION,
+                    day=DAY,
+                )
+
+        m_get_times.assert_called_once()
+        m_delay.assert_called_once_with(
+            "demo",
+            "get_times",
+            {
+                "products": [("1", 2), ("2", 1)],
+                "location": "1",
+                "day": "2026-10-19",
+            },
+        )
+
+    @patch.object(DemoAppointment, "get_times", return_value=[])
+    @patch.object(DemoAppointment, "get_dates", return_value=[DAY])
+    def test_times_of_available_dates_are_warmed(self, m_get_dates, m_get_times):
+        with (
+            patch("openforms.appointments.tasks.warm_times.delay") as m_delay,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            get_availability(
+                self.plugin, "get_dates", products=self.products, location=LOCATION
+            )
+
+        m_delay.assert_called_once_with(
+            "demo", [("1", 2), ("2", 1)], "1", ["2026-10-19"]
+        )
+
+        warm_times(*m_delay.call_args.args)
+        get_availability(
+            self.plugin,
+            "get_times",
+            products=self.products,
+            location=LOCATION,
+            day=DAY,
+        )
+
+        m_get_times.assert_called_once_with(
+            products=self.products, location=LOCATION, day=DAY
+        )
+
+    @patch.object(DemoAppointment, "get_times", return_value=[])
+    @patch.object(DemoAppointment, "get_dates", return_value=[])
+    def test_booking_invalidates_dates_and_times(self, m_get_dates, m_get_times):
+        def lookup():
+            get_availability(
+                self.plugin, "get_dates", products=self.products, location=LOCATION
+            )
+            get_availability(
+                self.plugin,
+                "get_times",
+                products=self.products,
+                location=LOCATION,
+                day=DAY,
+            )
+
+        lookup()
+        invalidate_availability(self.plugin, self.products[::-1], LOCATION, DAY)
+        lookup()
+
+        self.assertEqual(m_get_dates.call_count, 2)
+        self.assertEqual(m_get_times.call_count, 2)
+
+    @patch.object(DemoAppointment, "get_locations", return_value=[LOCATION])
+    def test_saving_configuration_invalidates_lookups(self, m_get_locations):
+        get_availability(self.plugin, "get_locations", products=self.products)
+
+        AppointmentsConfig.get_solo().save()
+        get_availability(self.plugin, "get_locations", products=self.products)
+
+        self.assertEqual(m_get_locations.call_count, 2)
+
+    @patch.object(DemoAppointment, "get_locations", return_value=[LOCATION])
+    def test_saving_service_invalidates_lookups(self, m_get_locations):
+        for factory in (SoapServiceFactory, ServiceFactory):
+            with self.subTest(factory=factory):
+                m_get_locations.reset_mock()
+                service = factory.create()
+                get_availability(self.plugin, "get_locations", products=self.products)
+
+                service.save()
+                get_availability(self.plugin, "get_locations", products=self.products)
+
+                self.assertEqual(m_get_locations.call_count, 2)
@@ -687,6 +687,11 @@ TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS = config(
 # Zip files for file exports: after how long should they be deleted
 FORMS_EXPORT_REMOVED_AFTER_DAYS = config("FORMS_EXPORT_REMOVED_AFTER_DAYS", default=7)
 
+# Data removal: the number of submissions deleted/anonymized per transaction and the
+# pause (in seconds) between batches, to limit the load on the database.
+DATA_REMOVAL_BATCH_SIZE: int = config("DATA_REMOVAL_BATCH_SIZE", default=500)
+DATA_REMOVAL_BATCH_DELAY: float = config("DATA_REMOVAL_BATCH_DELAY", default=0.0)
+
 # a custom default timeout for the requests library, added via monkeypatch in
 # :mod:`openforms.setup`. Value is in seconds.
 DEFAULT_TIMEOUT_REQUESTS = config("DEFAULT_TIMEOUT_REQUESTS", default=10.0)
@@ -695,6 +700,39 @@ MAX_FILE_UPLOAD_SIZE: int = config(
     "MAX_FILE_UPLOAD_SIZE", default="50M", cast=Filesize()
 )
 
+# ZGW APIs registration: attachments larger than the threshold are uploaded in parts
+# (streamed) rather than base64 encoded in a single request. This requires Documenten
+# API 1.1+, so it's disabled (0) by default. The calls to the APIs are made
+# concurrently, with a separate limit for the number of concurrent uploads.
+ZGW_DOCUMENTS_PART_UPLOAD_THRESHOLD: int = config(
+    "ZGW_DOCUMENTS_PART_UPLOAD_THRESHOLD", default="0", cast=Filesize()
+)
+ZGW_DOCUMENTS_UPLOAD_CONCURRENCY: int = config(
+    "ZGW_DOCUMENTS_UPLOAD_CONCURRENCY", default=4
+)
+ZGW_REGISTRATION_CONCURRENCY: int = config("ZGW_REGISTRATION_CONCURRENCY", default=8)
+
+# Prefill: the calls to the prefill plugins are made concurrently when a submission is
+# started. Every plugin gets this many seconds (for all its calls), slower plugins do not
+# prefill any values.
+PREFILL_PLUGIN_TIMEOUT: float = config("PREFILL_PLUGIN_TIMEOUT", default=15.0)
+# Prefill in the background: a prefill that is still pending after this many seconds is
+# considered lost (e.g. the task was never executed), and no longer blocks the form.
+PREFILL_BACKGROUND_TIMEOUT: int = config("PREFILL_BACKGROUND_TIMEOUT", default=300)
+
+# Appointments: the lookups of the appointment plugins are cached for this many seconds
+# (products and locations, and the (more volatile) dates and times), after which they
+# are refreshed in the background. Set to 0 to disable the caching.
+APPOINTMENTS_CACHE_TIMEOUT: int = config("APPOINTMENTS_CACHE_TIMEOUT", default=300)
+APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT: int = config(
+    "APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT", default=60
+)
+
+# ZGW: the responses of the Catalogi API (case types, document types...) are shared
+# between registrations for this many seconds, after which responses with an ETag are
+# revalidated. Set to 0 to disable the caching.
+ZGW_CATALOGI_CACHE_TIMEOUT: int = config("ZGW_CATALOGI_CACHE_TIMEOUT", default=900)
+
 # Deal with being hosted on a subpath
 SUBPATH = config("SUBPATH", default="")
 if SUBPATH:
@@ -948,7 +986,7 @@ CORS_ALLOWED_ORIGIN_REGEXES = config(
 # Authorization is included in default_cors_headers
 CORS_ALLOW_HEADERS = (
     list(default_cors_headers)
-    + [NONCE_HTTP_HEADER]
+    + [NONCE_HTTP_HEADER, "upload-offset", "upload-checksum"]
     + config("CORS_EXTRA_ALLOW_HEADERS", split=True, default=[])
 )
 CORS_EXPOSE_HEADERS = [
@@ -956,6 +994,8 @@ CORS_EXPOSE_HEADERS = [
     "X-CSRFToken",
     "X-Is-Form-Designer",
     "Content-Language",
+    "Upload-Offset",
+    "Upload-Length",
 ]
 CORS_ALLOW_CREDENTIALS = True  # required to send cross domain cookies
 
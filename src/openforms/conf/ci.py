@@ -47,6 +47,15 @@ TIMELINE_HANDLER_USE_QUEUE = False
 # ensure we insert outgoing request logs in the main thread & DB transaction in tests
 LOG_OUTGOING_REQUESTS_HANDLER_USE_QUEUE = False
 
+# make the registration calls in the main thread and in order, so that the responses of
+# the recorded VCR cassettes are replayed in the recorded order
+ZGW_REGISTRATION_CONCURRENCY = 1
+# don't share the (mocked) Catalogi API responses between tests
+ZGW_CATALOGI_CACHE_TIMEOUT = 0
+# don't share the (mocked) appointment plugin lookups between tests
+APPOINTMENTS_CACHE_TIMEOUT = 0
+APPOINTMENTS_AVAILABILITY_CACHE_TIMEOUT = 0
+
 # shut up logging
 mute_logging(LOGGING)
 
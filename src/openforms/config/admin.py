@@ -176,6 +176,7 @@ class GlobalConfigurationAdmin(TranslationAdmin, SingletonModelAdmin):
             {
                 "fields": (
                     "plugin_configuration",
+                    "prefill_in_background",
                     "family_members_data_api",
                     "communication_preferences_portal_url",
                     "reference_lists_services",
@@ -200,6 +201,7 @@ class GlobalConfigurationAdmin(TranslationAdmin, SingletonModelAdmin):
                     "clamav_host",
                     "clamav_port",
                     "clamav_timeout",
+                    "virus_scan_in_background",
                 )
             },
         ),
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("config", "0061_alter_richtextcolor_color"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="globalconfiguration",
+            name="virus_scan_in_background",
+            field=models.BooleanField(
+                default=False,
+                help_text="Whether the uploaded files are scanned in the background rather than during the upload. The uploads can only be used in a submission once the scan has found them to be clean.",
+                verbose_name="Scan in the background",
+            ),
+        ),
+    ]
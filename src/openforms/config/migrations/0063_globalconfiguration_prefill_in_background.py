@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("config", "0062_globalconfiguration_virus_scan_in_background"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="globalconfiguration",
+            name="prefill_in_background",
+            field=models.BooleanField(
+                default=False,
+                help_text="Whether the prefill plugins are called in the background when a form is started, rather than before the first step is shown. The steps that depend on prefilled values can only be submitted once the values are retrieved.",
+                verbose_name="prefill in the background",
+            ),
+        ),
+    ]
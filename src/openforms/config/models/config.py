@@ -569,6 +569,16 @@ class GlobalConfiguration(SingletonModel):
         ),
         blank=True,
     )
+    prefill_in_background = models.BooleanField(
+        _("prefill in the background"),
+        default=False,
+        help_text=_(
+            "Whether the prefill plugins are called in the background when a form is "
+            "started, rather than before the first step is shown. The steps that "
+            "depend on prefilled values can only be submitted once the values are "
+            "retrieved."
+        ),
+    )
     family_members_data_api = models.CharField(
         _("family members data api"),
         help_text=_("Which API to use to retrieve the data of the family members."),
@@ -626,6 +636,15 @@ class GlobalConfiguration(SingletonModel):
         blank=True,
         validators=[MaxValueValidator(60)],
     )
+    virus_scan_in_background = models.BooleanField(
+        _("Scan in the background"),
+        default=False,
+        help_text=_(
+            "Whether the uploaded files are scanned in the background rather than "
+            "during the upload. The uploads can only be used in a submission once "
+            "the scan has found them to be clean."
+        ),
+    )
 
     recipients_email_digest = ArrayField(
         models.EmailField(),
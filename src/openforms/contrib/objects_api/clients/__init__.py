@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING
 
 from zgw_consumers.client import build_client
 
+from openforms.contrib.zgw.caching import get_cache_scope
 from openforms.contrib.zgw.clients import CatalogiClient, DocumentenClient
 
 from .objects import ObjectsClient
@@ -46,7 +47,16 @@ def get_documents_client(config: ObjectsAPIGroupConfig) -> DocumentenClient:
     return build_client(service, client_factory=DocumentenClient)
 
 
-def get_catalogi_client(config: ObjectsAPIGroupConfig) -> CatalogiClient:
+def get_catalogi_client(
+    config: ObjectsAPIGroupConfig, cached: bool = False
+) -> CatalogiClient:
+    """
+    Build the Catalogi API client.
+
+    :param cached: Share the responses through the cache, for the lookups of the
+      registration. Other callers need the live data.
+    """
     if not (service := config.catalogi_service):
         raise NoServiceConfigured("No Catalogi API service configured!")
-    return build_client(service, client_factory=CatalogiClient)
+    cache_scope = get_cache_scope(service) if cached else ""
+    return build_client(service, client_factory=CatalogiClient, cache_scope=cache_scope)
@@ -0,0 +1,173 @@
+"""
+Share the reference lists tables and their items between requests.
+
+The tables are looked up for the dynamic options of form components on every (logic)
+check of a submission step. A table and its items are stored together in the default
+cache, for at most :data:`REFERENCE_LISTS_LOOKUP_CACHE_TIMEOUT` seconds and no longer
+than the first upcoming end of validity of the table or its items, so that expired
+options disappear in time. Entries in the last part of their lifetime should be
+refreshed in the background (see :attr:`CachedReferenceList.should_refresh`), so that
+users don't have to wait for the API.
+"""
+
+from collections import defaultdict
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from math import ceil
+
+from django.core.cache import cache
+from django.utils import timezone
+
+import structlog
+from requests.exceptions import RequestException
+from zgw_consumers.client import build_client
+from zgw_consumers.concurrent import parallel
+from zgw_consumers.models import Service
+
+from .client import (
+    REFERENCE_LISTS_LOOKUP_CACHE_TIMEOUT,
+    ReferenceListsClient,
+    Table,
+    TableItem,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# bump the version when the structure of the cached data changes
+CACHE_VERSION = 1
+# the part of the lifetime of an entry after which it should be refreshed
+REFRESH_AFTER = 0.8
+REFRESH_LOCK_TIMEOUT = 60
+
+type ReferenceListKey = tuple[str, str]  # service slug and table code
+
+
+@dataclass
+class CachedReferenceList:
+    table: Table | None
+    items: list[TableItem]
+    refresh_after: datetime
+
+    @property
+    def should_refresh(self) -> bool:
+        return timezone.now() >= self.refresh_after
+
+
+def _get_cache_key(service_slug: str, code: str, language: str) -> str:
+    return (
+        f"reference_lists|table|service:{service_slug}|code:{code}|language:{language}"
+    )
+
+
+def _get_timeout(table: Table | None, items: list[TableItem]) -> int:
+    now = timezone.now()
+    timeout = REFERENCE_LISTS_LOOKUP_CACHE_TIMEOUT
+    end_dates = [item.expires_on for item in items]
+    if table is not None:
+        end_dates.append(table.expires_on)
+    for end_date in end_dates:
+        if end_date is not None and end_date > now:
+            timeout = min(timeout, ceil((end_date - now).total_seconds()))
+    return timeout
+
+
+def _fetch(
+    client: ReferenceListsClient, service_slug: str, code: str, language: str
+) -> CachedReferenceList:
+    table = client.get_table(code)
+    # the items of an expired table are never shown. Note that the ``is_expired``
+    # property is avoided, as its cached value would end up in the cache.
+    if table and table.expires_on and table.expires_on <= timezone.now():
+        items = []
+    else:
+        items = client.get_items_for_table(code, language)
+
+    timeout = _get_timeout(table, items)
+    reference_list = CachedReferenceList(
+        table=table,
+        items=items,
+        refresh_after=timezone.now() + timedelta(seconds=timeout * REFRESH_AFTER),
+    )
+    cache.set(
+        _get_cache_key(service_slug, code, language),
+        reference_list,
+        timeout=timeout,
+        version=CACHE_VERSION,
+    )
+    return reference_list
+
+
+def get_reference_list(
+    service_slug: str, code: str, language: str
+) -> CachedReferenceList:
+    """
+    Get the table and its items, from the cache if possible.
+
+    :raises Service.DoesNotExist: if there is no service with the slug.
+    :raises RequestException: if the table or items could not be retrieved.
+    """
+    cache_key = _get_cache_key(service_slug, code, language)
+    if (reference_list := cache.get(cache_key, version=CACHE_VERSION)) is not None:
+        return reference_list
+    return refresh_reference_list(service_slug, code, language)
+
+
+def prefetch_reference_lists(keys: Collection[ReferenceListKey], language: str) -> None:
+    """
+    Retrieve the tables that are not cached yet in a single pass.
+
+    One client is used for all the tables of a service, and the services are queried
+    concurrently. Failures are only logged, they are reported when the table is
+    looked up with :func:`get_reference_list`.
+    """
+    cache_keys = {
+        _get_cache_key(service_slug, code, language): (service_slug, code)
+        for service_slug, code in keys
+    }
+    cached = cache.get_many(cache_keys, version=CACHE_VERSION)
+    missing: defaultdict[str, list[str]] = defaultdict(list)
+    for cache_key, (service_slug, code) in cache_keys.items():
+        if cache_key not in cached:
+            missing[service_slug].append(code)
+    if not missing:
+        return
+
+    def fetch_tables(service: Service) -> None:
+        log = logger.bind(service=service.slug, language=language)
+        try:
+            with build_client(service, client_factory=ReferenceListsClient) as client:
+                for code in missing[service.slug]:
+                    _fetch(client, service.slug, code, language)
+        except RequestException as exc:
+            log.info("reference_lists.prefetch_failed", exc_info=exc)
+
+    services = list(Service.objects.filter(slug__in=missing))
+    if len(services) == 1:
+        fetch_tables(services[0])
+        return
+
+    with parallel() as executor:
+        list(executor.map(fetch_tables, services))
+
+
+def claim_refresh(service_slug: str, code: str, language: str) -> bool:
+    """
+    Claim the refresh of a cached table, so that it is only refreshed once.
+    """
+    lock_key = f"{_get_cache_key(service_slug, code, language)}|refresh"
+    return cache.add(lock_key, True, timeout=REFRESH_LOCK_TIMEOUT)
+
+
+def refresh_reference_list(
+    service_slug: str, code: str, language: str
+) -> CachedReferenceList:
+    """
+    Retrieve the table and its items and (re)place them in the cache.
+
+    :raises Service.DoesNotExist: if there is no service with the slug.
+    :raises RequestException: if the table or items could not be retrieved.
+    """
+    service = Service.objects.get(slug=service_slug)
+    with build_client(service, client_factory=ReferenceListsClient) as client:
+        return _fetch(client, service_slug, code, language)
@@ -0,0 +1,197 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone, translation
+
+import requests_mock
+from glom import glom
+from zgw_consumers.constants import AuthTypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openforms.formio.constants import DataSrcOptions
+from openforms.formio.datastructures import FormioConfigurationWrapper
+from openforms.formio.dynamic_config import rewrite_formio_components
+from openforms.submissions.tests.factories import SubmissionFactory
+from openforms.utils.tests.cache import clear_caches
+
+from ..caching import claim_refresh, get_reference_list, prefetch_reference_lists
+from ..client import REFERENCE_LISTS_LOOKUP_CACHE_TIMEOUT
+
+
+def _paginated(*results):
+    return {"count": len(results), "next": None, "previous": None, "results": results}
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+@requests_mock.Mocker()
+class ReferenceListsCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.service = ServiceFactory.create(
+            slug="reference-lists",
+            api_root="http://reference-lists.local/api/v1/",
+            auth_type=AuthTypes.no_auth,
+        )
+        cls.other_service = ServiceFactory.create(
+            slug="other-reference-lists",
+            api_root="http://other-reference-lists.local/api/v1/",
+            auth_type=AuthTypes.no_auth,
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+
+    def _mock_table(self, m, service, code, items, table_end_date=None):
+        m.get(
+            f"{service.api_root}tabellen?code={code}",
+            json=_paginated(
+                {"code": code, "naam": code, "einddatumGeldigheid": table_end_date}
+            ),
+        )
+        m.get(f"{service.api_root}items?tabel__code={code}", json=_paginated(*items))
+
+    def test_prefetch_tables(self, m):
+        item = {"code": "option", "naam": "Option", "einddatumGeldigheid": None}
+        self._mock_table(m, self.service, "table1", [item])
+        self._mock_table(m, self.service, "table2", [item])
+        self._mock_table(m, self.other_service, "table1", [item])
+        keys = {
+            ("reference-lists", "table1"),
+            ("reference-lists", "table2"),
+            ("other-reference-lists", "table1"),
+        }
+
+        prefetch_reference_lists(keys, language="nl")
+
+        self.assertEqual(len(m.request_history), 6)
+
+        with self.subTest("lookups are cached"):
+            for service_slug, code in keys:
+                reference_list = get_reference_list(service_slug, code, "nl")
+
+                self.assertEqual(reference_list.items[0].code, "option")
+            self.assertEqual(len(m.request_history), 6)
+
+        with self.subTest("cached tables are not prefetched again"):
+            prefetch_reference_lists(keys, language="nl")
+
+            self.assertEqual(len(m.request_history), 6)
+
+    def test_options_of_configuration_are_prefetched(self, m):
+        item = {"code": "option", "naam": "Option", "einddatumGeldigheid": None}
+        self._mock_table(m, self.service, "table1", [item])
+        configuration = {
+            "components": [
+                {
+                    "type": component_type,
+                    "key": component_type,
+                    "label": component_type,
+                    "values": [],
+                    "data": {},
+                    "openForms": {
+                        "dataSrc": DataSrcOptions.reference_lists,
+                        "service": "reference-lists",
+                        "code": "table1",
+                    },
+                }
+                for component_type in ("radio", "select", "selectboxes")
+            ]
+        }
+        submission = SubmissionFactory.create()
+
+        with patch(
+            "openforms.formio.dynamic_config.reference_lists.prefetch_reference_lists",
+            wraps=prefetch_reference_lists,
+        ) as m_prefetch:
+            rewrite_formio_components(
+                FormioConfigurationWrapper(configuration), submission=submission
+            )
+
+        m_prefetch.assert_called_once()
+        self.assertEqual(len(m.request_history), 2)
+        for component in configuration["components"]:
+            options = glom(component, "data.values", default=component["values"])
+            self.assertEqual(options, [{"label": "Option", "value": "option"}])
+
+    def test_cached_until_first_end_of_validity(self, m):
+        end_date = timezone.now() + timedelta(seconds=60)
+        self._mock_table(
+            m,
+            self.service,
+            "table1",
+            [
+                {"code": "option1", "naam": "Option 1", "einddatumGeldigheid": None},
+                {
+                    "code": "option2",
+                    "naam": "Option 2",
+                    "einddatumGeldigheid": end_date.isoformat(),
+                },
+            ],
+        )
+
+        with patch("openforms.contrib.reference_lists.caching.cache.set") as m_set:
+            reference_list = get_reference_list("reference-lists", "table1", "nl")
+
+        timeout = m_set.call_args.kwargs["timeout"]
+        self.assertLess(timeout, REFERENCE_LISTS_LOOKUP_CACHE_TIMEOUT)
+        self.assertLessEqual(timeout, 60)
+        self.assertLessEqual(
+            reference_list.refresh_after, timezone.now() + timedelta(seconds=60)
+        )
+
+    def test_expired_table_items_are_not_retrieved(self, m):
+        end_date = timezone.now() - timedelta(days=1)
+        self._mock_table(m, self.service, "table1", [], end_date.isoformat())
+
+        reference_list = get_reference_list("reference-lists", "table1", "nl")
+
+        self.assertEqual(reference_list.items, [])
+        self.assertEqual(len(m.request_history), 1)
+
+    def test_refresh_is_claimed_once(self, m):
+        self.assertTrue(claim_refresh("reference-lists", "table1", "nl"))
+        self.assertFalse(claim_refresh("reference-lists", "table1", "nl"))
+        self.assertTrue(claim_refresh("reference-lists", "table1", "en"))
+
+    def test_stale_table_is_refreshed_in_background(self, m):
+        item = {"code": "option", "naam": "Option", "einddatumGeldigheid": None}
+        self._mock_table(m, self.service, "table1", [item])
+        get_reference_list("reference-lists", "table1", "nl")
+        component = {
+            "type": "radio",
+            "key": "radio",
+            "label": "Radio",
+            "values": [],
+            "openForms": {
+                "dataSrc": DataSrcOptions.reference_lists,
+                "service": "reference-lists",
+                "code": "table1",
+            },
+        }
+        submission = SubmissionFactory.create()
+        later = timezone.now() + timedelta(
+            seconds=REFERENCE_LISTS_LOOKUP_CACHE_TIMEOUT - 1
+        )
+
+        with (
+            patch("django.utils.timezone.now", return_value=later),
+            patch("openforms.formio.tasks.refresh_reference_list.delay") as m_delay,
+            translation.override("nl"),
+        ):
+            for _ in range(2):
+                rewrite_formio_components(
+                    FormioConfigurationWrapper({"components": [component]}),
+                    submission=submission,
+                )
+
+        m_delay.assert_called_once_with("reference-lists", "table1", "nl")
+        # the cached options are used in the meantime
+        self.assertEqual(len(m.request_history), 2)
+        self.assertEqual(component["values"], [{"label": "Option", "value": "option"}])
@@ -0,0 +1,144 @@
+"""
+Share the Catalogi API responses between registrations.
+
+The case types, document types, role types, status types and properties (eigenschappen)
+are looked up for every registration, while they rarely change. The registration
+backends create their :class:`openforms.contrib.zgw.clients.CatalogiClient` with a
+cache scope (see :func:`get_cache_scope`), and the responses to its ``GET`` requests
+are then stored in the default cache, keyed by the scope, the requested URL and the
+query parameters:
+
+* a response is used as is for at most ``ZGW_CATALOGI_CACHE_TIMEOUT`` seconds;
+* after that, a response with an ``ETag`` is revalidated with a conditional request,
+  so that an unchanged resource doesn't have to be transferred and processed again;
+* responses marked ``Cache-Control: no-store`` or ``private`` are never stored.
+
+Other callers (the form builder endpoints, validators and health checks) don't pass a
+scope and always get the live response.
+"""
+
+import hashlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+if TYPE_CHECKING:
+    from zgw_consumers.models import Service
+
+# bump the version when the structure of the cached data changes
+CACHE_VERSION = 1
+# the time a response with an ETag is kept around to revalidate it
+REVALIDATION_TIMEOUT = 60 * 60 * 24
+
+
+@dataclass
+class CachedResponse:
+    content: bytes
+    headers: CaseInsensitiveDict[str]
+    encoding: str | None
+    fresh_until: datetime
+
+    @property
+    def is_fresh(self) -> bool:
+        return timezone.now() < self.fresh_until
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("ETag")
+
+    def to_response(self, url: str) -> Response:
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response._content = self.content
+        return response
+
+
+def get_cache_scope(service: "Service") -> str:
+    """
+    Return the cache scope of the responses for the given service.
+
+    Services with different credentials may see different data, so the responses are
+    only shared between the clients of the same service and credentials.
+    """
+    credentials = "|".join(
+        [service.auth_type, service.client_id, service.header_key, service.header_value]
+    )
+    digest = hashlib.sha256(credentials.encode()).hexdigest()
+    return f"{service.pk}:{digest}"
+
+
+def _get_cache_key(scope: str, url: str) -> str:
+    digest = hashlib.sha256(f"{scope}|{url}".encode()).hexdigest()
+    return f"zgw|catalogi|response:{digest}"
+
+
+def _is_storable(response: Response) -> bool:
+    directives = {
+        directive.split("=", 1)[0].strip().lower()
+        for directive in response.headers.get("Cache-Control", "").split(",")
+    }
+    return not directives & {"no-store", "private"}
+
+
+def _store(cache_key: str, cached_response: CachedResponse, timeout: int) -> None:
+    cache.set(
+        cache_key,
+        cached_response,
+        timeout=max(timeout, REVALIDATION_TIMEOUT) if cached_response.etag else timeout,
+        version=CACHE_VERSION,
+    )
+
+
+def get_with_cache(
+    send: Callable[..., Response], scope: str, url: str, **kwargs
+) -> Response:
+    """
+    Make the ``GET`` request with ``send``, unless a cached response can be used.
+
+    :param send: Callable making the actual request, taking the request kwargs.
+    :param scope: The cache scope of the client, see :func:`get_cache_scope`.
+    :param url: The absolute URL of the request, without the query parameters (those
+      are taken from the ``params`` kwarg).
+    """
+    if not (timeout := settings.ZGW_CATALOGI_CACHE_TIMEOUT):
+        return send(**kwargs)
+
+    prepared = PreparedRequest()
+    prepared.prepare_url(url, kwargs.get("params"))
+    assert prepared.url is not None
+    cache_key = _get_cache_key(scope, prepared.url)
+
+    cached_response: CachedResponse | None = cache.get(cache_key, version=CACHE_VERSION)
+    if cached_response is not None:
+        if cached_response.is_fresh:
+            return cached_response.to_response(prepared.url)
+        if etag := cached_response.etag:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "If-None-Match": etag}
+
+    response = send(**kwargs)
+    match response.status_code:
+        case 304 if cached_response is not None:
+            cached_response.fresh_until = timezone.now() + timedelta(seconds=timeout)
+            _store(cache_key, cached_response, timeout)
+            return cached_response.to_response(prepared.url)
+        case 200 if _is_storable(response):
+            cached_response = CachedResponse(
+                content=response.content,
+                headers=CaseInsensitiveDict(response.headers),
+                encoding=response.encoding,
+                fresh_until=timezone.now() + timedelta(seconds=timeout),
+            )
+            _store(cache_key, cached_response, timeout)
+    return response
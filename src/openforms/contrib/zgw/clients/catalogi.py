@@ -1,6 +1,6 @@
 from collections.abc import Callable, Iterator
 from datetime import date
-from functools import cached_property
+from functools import cached_property, partial
 from operator import itemgetter
 from typing import Literal, NotRequired, TypedDict
 
@@ -11,6 +11,7 @@ from zgw_consumers.nlx import NLXClient
 from openforms.contrib.client import LoggingMixin
 from openforms.utils.api_clients import PaginatedResponseData, pagination_helper
 
+from ..caching import get_with_cache
 from ..exceptions import StandardViolation
 
 
@@ -141,6 +142,12 @@ class RoleTypeListParams(TypedDict, total=False):
 class CatalogiClient(LoggingMixin, NLXClient):
     _api_version: CatalogiAPIVersion | None = None
 
+    def __init__(self, *args, cache_scope: str = "", **kwargs):
+        super().__init__(*args, **kwargs)
+        # the responses are only cached when a scope is given, see
+        # :func:`openforms.contrib.zgw.caching.get_cache_scope`
+        self.cache_scope = cache_scope
+
     @property
     def api_version(self) -> CatalogiAPIVersion:
         if self._api_version is None:
@@ -169,8 +176,14 @@ class CatalogiClient(LoggingMixin, NLXClient):
         assert enabled is not None
         return enabled
 
-    def request(self, *args, **kwargs):
-        response = super().request(*args, **kwargs)
+    def request(self, method, url, *args, **kwargs):
+        send = partial(super().request, method, url, *args)
+        if method == "GET" and self.cache_scope:
+            response = get_with_cache(
+                send, self.cache_scope, self.to_absolute_url(url), **kwargs
+            )
+        else:
+            response = send(**kwargs)
         if not self._api_version:
             self._api_version = self._determine_api_version(response)
         return response
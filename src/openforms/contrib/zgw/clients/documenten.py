@@ -1,8 +1,10 @@
 from base64 import b64encode
-from typing import BinaryIO, Literal
+from typing import BinaryIO, Literal, TypedDict
+from uuid import uuid4
 
 from django.core.files.base import ContentFile
 
+from urllib3.fields import format_multipart_header_param
 from zgw_consumers.nlx import NLXClient
 
 from openforms.contrib.client import LoggingMixin
@@ -17,8 +19,76 @@ type DocumentStatus = Literal[
 ]
 
 
+class Bestandsdeel(TypedDict):
+    url: str
+    volgnummer: int
+    omvang: int
+    voltooid: bool
+
+
+class MultipartFileStream:
+    """
+    File-like ``multipart/form-data`` request body, streaming a slice of a file.
+
+    The ``requests`` library reads files passed via ``files=`` fully into memory to
+    encode them. Passing this object as ``data`` instead sends the body in blocks, as
+    it's read by the HTTP connection.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, str],
+        file_field: str,
+        filename: str,
+        file: BinaryIO,
+        size: int,
+    ):
+        boundary = uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        # quote the names like urllib3 does for the requests made with ``files=``
+        head = "".join(
+            f"--{boundary}\r\nContent-Disposition: form-data; "
+            f"{format_multipart_header_param('name', name)}\r\n\r\n{value}\r\n"
+            for name, value in fields.items()
+        )
+        head += (
+            f"--{boundary}\r\nContent-Disposition: form-data; "
+            f"{format_multipart_header_param('name', file_field)}; "
+            f"{format_multipart_header_param('filename', filename)}\r\n"
+            "Content-Type: application/octet-stream\r\n\r\n"
+        )
+        self._head = head.encode()
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+        self._file = file
+        self._remaining = size
+        self._length = len(self._head) + size + len(self._tail)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length
+        chunks: list[bytes] = []
+        while size > 0:
+            if self._head:
+                chunk, self._head = self._head[:size], self._head[size:]
+            elif self._remaining:
+                chunk = self._file.read(min(size, self._remaining))
+                if not chunk:
+                    raise ValueError("The file is smaller than the expected size.")
+                self._remaining -= len(chunk)
+            elif self._tail:
+                chunk, self._tail = self._tail[:size], self._tail[size:]
+            else:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+
 class DocumentenClient(LoggingMixin, NLXClient):
-    def create_document(
+    def _get_document_data(
         self,
         informatieobjecttype: str,
         bronorganisatie: str,
@@ -26,40 +96,135 @@ class DocumentenClient(LoggingMixin, NLXClient):
         author: str,
         language: str,
         format: str,
-        content: ContentFile | BinaryIO,
         status: DocumentStatus,
         filename: str,
-        received_date: str | None = None,
-        description: str = "",
-        vertrouwelijkheidaanduiding: str = "",
-    ):
+        received_date: str | None,
+        description: str,
+        vertrouwelijkheidaanduiding: str,
+    ) -> dict:
         assert author, "author must be a non-empty string"
-        today = get_today().isoformat()
-        file_content = content.read()
-        base64_body = b64encode(file_content).decode()
         data = {
             "informatieobjecttype": informatieobjecttype,
             "bronorganisatie": bronorganisatie,
-            "creatiedatum": today,
+            "creatiedatum": get_today().isoformat(),
             "titel": title,
             "auteur": author,
             "taal": to_iso639_2b(language),
             "formaat": format,
-            "inhoud": base64_body,
             "status": status,
             "bestandsnaam": filename,
             "ontvangstdatum": received_date,
             "beschrijving": description,
             "indicatieGebruiksrecht": False,
-            "bestandsomvang": (
-                content.size if hasattr(content, "size") else len(file_content)
-            ),
         }
-
         if vertrouwelijkheidaanduiding:
             data["vertrouwelijkheidaanduiding"] = vertrouwelijkheidaanduiding
+        return data
+
+    def create_document(
+        self,
+        informatieobjecttype: str,
+        bronorganisatie: str,
+        title: str,
+        author: str,
+        language: str,
+        format: str,
+        content: ContentFile | BinaryIO,
+        status: DocumentStatus,
+        filename: str,
+        received_date: str | None = None,
+        description: str = "",
+        vertrouwelijkheidaanduiding: str = "",
+    ):
+        data = self._get_document_data(
+            informatieobjecttype=informatieobjecttype,
+            bronorganisatie=bronorganisatie,
+            title=title,
+            author=author,
+            language=language,
+            format=format,
+            status=status,
+            filename=filename,
+            received_date=received_date,
+            description=description,
+            vertrouwelijkheidaanduiding=vertrouwelijkheidaanduiding,
+        )
+        file_content = content.read()
+        data["inhoud"] = b64encode(file_content).decode()
+        data["bestandsomvang"] = (
+            content.size if hasattr(content, "size") else len(file_content)
+        )
+
+        response = self.post("enkelvoudiginformatieobjecten", json=data)
+        response.raise_for_status()
+
+        return response.json()
+
+    def create_document_for_upload(
+        self,
+        informatieobjecttype: str,
+        bronorganisatie: str,
+        title: str,
+        author: str,
+        language: str,
+        format: str,
+        size: int,
+        status: DocumentStatus,
+        filename: str,
+        received_date: str | None = None,
+        description: str = "",
+        vertrouwelijkheidaanduiding: str = "",
+    ) -> dict:
+        """
+        Create a (locked) document without content, to upload the content in parts.
+
+        The response contains the ``lock`` and the ``bestandsdelen`` to upload with
+        :meth:`upload_part`, after which the document must be unlocked with
+        :meth:`unlock_document`. Requires version 1.1 or newer of the Documenten API.
+        """
+        data = self._get_document_data(
+            informatieobjecttype=informatieobjecttype,
+            bronorganisatie=bronorganisatie,
+            title=title,
+            author=author,
+            language=language,
+            format=format,
+            status=status,
+            filename=filename,
+            received_date=received_date,
+            description=description,
+            vertrouwelijkheidaanduiding=vertrouwelijkheidaanduiding,
+        )
+        data["inhoud"] = None
+        data["bestandsomvang"] = size
 
         response = self.post("enkelvoudiginformatieobjecten", json=data)
         response.raise_for_status()
 
         return response.json()
+
+    def upload_part(
+        self, part: Bestandsdeel, lock: str, content: BinaryIO, filename: str
+    ) -> dict:
+        """
+        Upload a part of the document content, read from the current file position.
+        """
+        body = MultipartFileStream(
+            fields={"lock": lock},
+            file_field="inhoud",
+            filename=filename,
+            file=content,
+            size=part["omvang"],
+        )
+        response = self.put(
+            part["url"], data=body, headers={"Content-Type": body.content_type}
+        )
+        response.raise_for_status()
+
+        return response.json()
+
+    def unlock_document(self, document: dict) -> None:
+        response = self.post(
+            f"{document['url']}/unlock", json={"lock": document["lock"]}
+        )
+        response.raise_for_status()
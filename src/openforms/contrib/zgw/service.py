@@ -1,5 +1,8 @@
+from collections.abc import Callable, Mapping
 from io import BytesIO
-from typing import Literal, NotRequired, TypedDict
+from typing import Any, Literal, NotRequired, TypedDict
+
+from django.conf import settings
 
 from openforms.submissions.models import SubmissionFileAttachment, SubmissionReport
 
@@ -7,6 +10,9 @@ from .clients.documenten import DocumentenClient
 
 type SupportedLanguage = Literal["nl", "en"]
 
+type RecordResult = Callable[[str, Any], None]
+"""Callback to persist an intermediate result of an upload, by key."""
+
 
 class DocumentOptions(TypedDict):
     informatieobjecttype: str
@@ -74,24 +80,70 @@ def create_attachment_document(
     submission_attachment: SubmissionFileAttachment,
     options: DocumentOptions,
     language: SupportedLanguage,
+    *,
+    intermediate_results: Mapping[str, Any] | None = None,
+    record: RecordResult | None = None,
 ) -> dict:
     """
     Create a document for a submission attachment (user upload).
+
+    If ``settings.ZGW_DOCUMENTS_PART_UPLOAD_THRESHOLD`` is set, larger attachments are
+    uploaded in parts (``bestandsdelen``), streamed from the storage, so the memory
+    usage doesn't depend on the file size. This is opt-in, as it requires version 1.1
+    or newer of the Documenten API.
+
+    :param intermediate_results: The results recorded by a previous, failed attempt,
+      to resume the upload from. Parts that were already uploaded are skipped.
+    :param record: Callback to persist the intermediate results of a part upload, with
+      the key ``"upload"`` for the created document and ``"parts.<volgnummer>"`` for
+      the uploaded parts and ``"unlocked"`` once the upload is finished.
     """
+    intermediate_results = intermediate_results or {}
+    document_kwargs = {
+        "informatieobjecttype": options["informatieobjecttype"],
+        "bronorganisatie": options["organisatie_rsin"],
+        "title": options.get("titel") or name,
+        "author": options.get("auteur") or "Aanvrager",
+        "language": language,
+        "format": submission_attachment.content_type,
+        "status": "definitief",
+        "filename": submission_attachment.get_display_name(),
+        "description": "Bijgevoegd document",
+        "received_date": options.get("ontvangstdatum"),
+        "vertrouwelijkheidaanduiding": options.get(
+            "doc_vertrouwelijkheidaanduiding", ""
+        ),
+    }
+
+    size = submission_attachment.content.size
+    threshold = settings.ZGW_DOCUMENTS_PART_UPLOAD_THRESHOLD
+    if not threshold or size <= threshold:
+        with submission_attachment.content.open("rb") as content:
+            return client.create_document(content=content, **document_kwargs)
+
+    if (document := intermediate_results.get("upload")) is None:
+        document = client.create_document_for_upload(size=size, **document_kwargs)
+        if record is not None:
+            record("upload", document)
+
+    uploaded_parts = intermediate_results.get("parts", {})
+    offset = 0
     with submission_attachment.content.open("rb") as content:
-        return client.create_document(
-            informatieobjecttype=options["informatieobjecttype"],
-            bronorganisatie=options["organisatie_rsin"],
-            title=options.get("titel") or name,
-            author=options.get("auteur") or "Aanvrager",
-            language=language,
-            format=submission_attachment.content_type,
-            content=content,
-            status="definitief",
-            filename=submission_attachment.get_display_name(),
-            description="Bijgevoegd document",
-            received_date=options.get("ontvangstdatum"),
-            vertrouwelijkheidaanduiding=options.get(
-                "doc_vertrouwelijkheidaanduiding", ""
-            ),
-        )
+        for part in sorted(document["bestandsdelen"], key=lambda p: p["volgnummer"]):
+            if not part["voltooid"] and str(part["volgnummer"]) not in uploaded_parts:
+                content.seek(offset)
+                result = client.upload_part(
+                    part,
+                    lock=document["lock"],
+                    content=content,
+                    filename=document_kwargs["filename"],
+                )
+                if record is not None:
+                    record(f"parts.{part['volgnummer']}", result)
+            offset += part["omvang"]
+
+    if not intermediate_results.get("unlocked"):
+        client.unlock_document(document)
+        if record is not None:
+            record("unlocked", True)
+    return document
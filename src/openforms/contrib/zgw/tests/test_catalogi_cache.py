@@ -0,0 +1,216 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import requests_mock
+from zgw_consumers.constants import AuthTypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openforms.utils.tests.cache import clear_caches
+
+from ..caching import get_cache_scope
+from ..clients import CatalogiClient
+
+CATALOGUE = {"url": "https://dummy/catalogussen/1"}
+SCOPE = "1:credentials"
+
+
+def _paginated(*results):
+    return {"count": len(results), "next": None, "previous": None, "results": results}
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    ZGW_CATALOGI_CACHE_TIMEOUT=60,
+)
+@requests_mock.Mocker()
+class CatalogiCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+
+    def test_responses_are_shared_between_clients(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/catalogussen?domein=TEST&rsin=000000000",
+            headers={"API-version": "1.2.0"},
+            json=_paginated(CATALOGUE),
+        )
+
+        for _ in range(2):
+            with CatalogiClient(base_url="https://dummy/", cache_scope=SCOPE) as client:
+                catalogus = client.find_catalogus(domain="TEST", rsin="000000000")
+
+                self.assertEqual(catalogus, CATALOGUE)
+                self.assertEqual(client.api_version, (1, 2, 0))
+
+        self.assertEqual(len(m.request_history), 1)
+
+        with self.subTest("different parameters"):
+            m.get(
+                "https://dummy/catalogussen?domein=OTHER&rsin=000000000",
+                headers={"API-version": "1.2.0"},
+                json=_paginated(),
+            )
+
+            with CatalogiClient(base_url="https://dummy/", cache_scope=SCOPE) as client:
+                catalogus = client.find_catalogus(domain="OTHER", rsin="000000000")
+
+            self.assertIsNone(catalogus)
+            self.assertEqual(len(m.request_history), 2)
+
+        with self.subTest("different API root"):
+            m.get(
+                "https://other/catalogussen?domein=TEST&rsin=000000000",
+                headers={"API-version": "1.2.0"},
+                json=_paginated(),
+            )
+
+            with CatalogiClient(base_url="https://other/", cache_scope=SCOPE) as client:
+                catalogus = client.find_catalogus(domain="TEST", rsin="000000000")
+
+            self.assertIsNone(catalogus)
+            self.assertEqual(len(m.request_history), 3)
+
+    def test_stale_response_is_revalidated(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/statustypen?zaaktype=https%3A%2F%2Fdummy%2Fzaaktypen%2F1",
+            [
+                {
+                    "headers": {"API-version": "1.2.0", "ETag": '"v1"'},
+                    "json": _paginated({"volgnummer": 1}),
+                },
+                {"status_code": 304, "headers": {"API-version": "1.2.0"}},
+            ],
+        )
+        client = CatalogiClient(base_url="https://dummy/", cache_scope=SCOPE)
+        client.list_statustypen("https://dummy/zaaktypen/1")
+        later = timezone.now() + timedelta(seconds=90)
+
+        with patch("django.utils.timezone.now", return_value=later):
+            for _ in range(2):
+                statustypen = client.list_statustypen("https://dummy/zaaktypen/1")
+
+        self.assertEqual(statustypen, [{"volgnummer": 1}])
+        self.assertEqual(len(m.request_history), 2)
+        self.assertNotIn("If-None-Match", m.request_history[0].headers)
+        self.assertEqual(m.request_history[1].headers["If-None-Match"], '"v1"')
+
+    def test_changed_response_replaces_cached_response(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/roltypen?zaaktype=https%3A%2F%2Fdummy%2Fzaaktypen%2F1",
+            [
+                {
+                    "headers": {"API-version": "1.2.0", "ETag": '"v1"'},
+                    "json": _paginated({"omschrijving": "old"}),
+                },
+                {
+                    "headers": {"API-version": "1.2.0", "ETag": '"v2"'},
+                    "json": _paginated({"omschrijving": "new"}),
+                },
+            ],
+        )
+        client = CatalogiClient(base_url="https://dummy/", cache_scope=SCOPE)
+        client.list_roltypen(zaaktype="https://dummy/zaaktypen/1")
+        later = timezone.now() + timedelta(seconds=90)
+
+        with patch("django.utils.timezone.now", return_value=later):
+            roltypen1 = client.list_roltypen(zaaktype="https://dummy/zaaktypen/1")
+            roltypen2 = client.list_roltypen(zaaktype="https://dummy/zaaktypen/1")
+
+        self.assertEqual(roltypen1, [{"omschrijving": "new"}])
+        self.assertEqual(roltypen2, [{"omschrijving": "new"}])
+        self.assertEqual(len(m.request_history), 2)
+
+    def test_error_responses_are_not_cached(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/eigenschappen?zaaktype=https%3A%2F%2Fdummy%2Fzaaktypen%2F1",
+            status_code=500,
+            headers={"API-version": "1.2.0"},
+        )
+        client = CatalogiClient(base_url="https://dummy/", cache_scope=SCOPE)
+
+        for _ in range(2):
+            response = client.get(
+                "eigenschappen", params={"zaaktype": "https://dummy/zaaktypen/1"}
+            )
+
+            self.assertEqual(response.status_code, 500)
+
+        self.assertEqual(len(m.request_history), 2)
+
+    @override_settings(ZGW_CATALOGI_CACHE_TIMEOUT=0)
+    def test_caching_can_be_disabled(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/catalogussen?domein=TEST&rsin=000000000",
+            headers={"API-version": "1.2.0", "ETag": '"v1"'},
+            json=_paginated(CATALOGUE),
+        )
+        client = CatalogiClient(base_url="https://dummy/", cache_scope=SCOPE)
+
+        for _ in range(2):
+            client.find_catalogus(domain="TEST", rsin="000000000")
+
+        self.assertEqual(len(m.request_history), 2)
+        self.assertNotIn("If-None-Match", m.request_history[1].headers)
+
+    def test_client_without_scope_is_not_cached(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/catalogussen?domein=TEST&rsin=000000000",
+            headers={"API-version": "1.2.0"},
+            json=_paginated(CATALOGUE),
+        )
+
+        for _ in range(2):
+            with CatalogiClient(base_url="https://dummy/") as client:
+                client.find_catalogus(domain="TEST", rsin="000000000")
+
+        self.assertEqual(len(m.request_history), 2)
+
+    def test_responses_are_not_shared_between_scopes(self, m: requests_mock.Mocker):
+        m.get(
+            "https://dummy/catalogussen?domein=TEST&rsin=000000000",
+            headers={"API-version": "1.2.0"},
+            json=_paginated(CATALOGUE),
+        )
+
+        for scope in (SCOPE, "2:other-credentials", SCOPE):
+            with CatalogiClient(base_url="https://dummy/", cache_scope=scope) as client:
+                client.find_catalogus(domain="TEST", rsin="000000000")
+
+        self.assertEqual(len(m.request_history), 2)
+
+    def test_uncacheable_responses_are_not_stored(self, m: requests_mock.Mocker):
+        for cache_control in ("no-store", "private, max-age=60"):
+            with self.subTest(cache_control=cache_control):
+                m.reset_mock()
+                m.get(
+                    "https://dummy/catalogussen?domein=TEST&rsin=000000000",
+                    headers={"API-version": "1.2.0", "Cache-Control": cache_control},
+                    json=_paginated(CATALOGUE),
+                )
+                client = CatalogiClient(base_url="https://dummy/", cache_scope=SCOPE)
+
+                for _ in range(2):
+                    client.find_catalogus(domain="TEST", rsin="000000000")
+
+                self.assertEqual(len(m.request_history), 2)
+
+
+class CacheScopeTests(TestCase):
+    def test_scope_depends_on_the_service_credentials(self):
+        service = ServiceFactory.create(
+            auth_type=AuthTypes.zgw, client_id="client", secret="secret"
+        )
+        other_service = ServiceFactory.create(
+            auth_type=AuthTypes.zgw, client_id="client", secret="secret"
+        )
+        scope = get_cache_scope(service)
+
+        self.assertNotEqual(scope, get_cache_scope(other_service))
+
+        service.client_id = "other-client"
+
+        self.assertNotEqual(scope, get_cache_scope(service))
@@ -0,0 +1,220 @@
+"""
+Unit tests for the (large file) document uploads to the Documenten API.
+
+These tests make use of requests-mock rather than VCR, as the docker-compose Documenten
+API splits files in parts of 1 GB and recording such uploads is not practical.
+"""
+
+from io import BytesIO
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+import requests_mock
+from privates.test import temp_private_root
+
+from openforms.submissions.tests.factories import SubmissionFileAttachmentFactory
+
+from ..clients import DocumentenClient
+from ..clients.documenten import MultipartFileStream
+from ..service import DocumentOptions, create_attachment_document
+
+DOCUMENT_URL = "https://dummy/enkelvoudiginformatieobjecten/1"
+
+OPTIONS: DocumentOptions = {
+    "informatieobjecttype": "https://catalogi/informatieobjecttypen/1",
+    "organisatie_rsin": "000000000",
+}
+
+
+def _read_part(request) -> bytes:
+    body = request.body
+    return body if isinstance(body, bytes) else body.read()
+
+
+class MultipartFileStreamTests(SimpleTestCase):
+    def test_streams_slice_of_file(self):
+        file = BytesIO(b"0123456789")
+        file.seek(2)
+
+        body = MultipartFileStream(
+            fields={"lock": "abc"},
+            file_field="inhoud",
+            filename="file.txt",
+            file=file,
+            size=5,
+        )
+        length = len(body)
+        content = b"".join(iter(lambda: body.read(7), b""))
+
+        self.assertEqual(len(content), length)
+        self.assertIn(b'name="lock"\r\n\r\nabc\r\n', content)
+        self.assertIn(b'filename="file.txt"', content)
+        self.assertIn(b"\r\n\r\n23456\r\n", content)
+        self.assertEqual(file.tell(), 7)
+
+    def test_header_parameters_are_quoted(self):
+        body = MultipartFileStream(
+            fields={},
+            file_field="inhoud",
+            filename='evil"\r\nContent-Type: text/html.txt',
+            file=BytesIO(b"0"),
+            size=1,
+        )
+
+        content = body.read()
+
+        self.assertIn(
+            b'filename="evil%22%0D%0AContent-Type: text/html.txt"\r\n', content
+        )
+        self.assertEqual(content.count(b"Content-Type:"), 2)
+
+    def test_file_too_small(self):
+        body = MultipartFileStream(
+            fields={},
+            file_field="inhoud",
+            filename="file.txt",
+            file=BytesIO(b"012"),
+            size=5,
+        )
+
+        with self.assertRaises(ValueError):
+            body.read()
+
+
+@temp_private_root()
+@override_settings(ZGW_DOCUMENTS_PART_UPLOAD_THRESHOLD=4)
+class PartUploadTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.documents_client = DocumentenClient(base_url="https://dummy/")
+        self.attachment = SubmissionFileAttachmentFactory.create(
+            content__data=b"0123456789", file_name="file.txt"
+        )
+        self.requests_mock = requests_mock.Mocker()
+        self.requests_mock.start()
+        self.addCleanup(self.requests_mock.stop)
+
+        self.requests_mock.post(
+            "https://dummy/enkelvoudiginformatieobjecten",
+            status_code=201,
+            json={
+                "url": DOCUMENT_URL,
+                "lock": "lock-id",
+                "bestandsdelen": [
+                    {
+                        "url": "https://dummy/bestandsdelen/2",
+                        "volgnummer": 2,
+                        "omvang": 4,
+                        "voltooid": False,
+                    },
+                    {
+                        "url": "https://dummy/bestandsdelen/1",
+                        "volgnummer": 1,
+                        "omvang": 6,
+                        "voltooid": False,
+                    },
+                ],
+            },
+        )
+        self.parts: dict[str, bytes] = {}
+
+        def _upload(request, context):
+            self.parts[request.url] = _read_part(request)
+            return {"url": request.url, "voltooid": True}
+
+        self.part_1 = self.requests_mock.put(
+            "https://dummy/bestandsdelen/1", json=_upload
+        )
+        self.part_2 = self.requests_mock.put(
+            "https://dummy/bestandsdelen/2", json=_upload
+        )
+        self.unlock = self.requests_mock.post(f"{DOCUMENT_URL}/unlock", status_code=204)
+
+    def test_small_file_is_uploaded_in_one_request(self):
+        with override_settings(ZGW_DOCUMENTS_PART_UPLOAD_THRESHOLD=100):
+            create_attachment_document(
+                self.documents_client, "Form", self.attachment, OPTIONS, "nl"
+            )
+
+        create_request = self.requests_mock.request_history[0]
+        self.assertEqual(create_request.json()["inhoud"], "MDEyMzQ1Njc4OQ==")
+        self.assertEqual(len(self.requests_mock.request_history), 1)
+
+    def test_upload_in_parts_is_opt_in(self):
+        with override_settings(ZGW_DOCUMENTS_PART_UPLOAD_THRESHOLD=0):
+            create_attachment_document(
+                self.documents_client, "Form", self.attachment, OPTIONS, "nl"
+            )
+
+        create_request = self.requests_mock.request_history[0]
+        self.assertEqual(create_request.json()["inhoud"], "MDEyMzQ1Njc4OQ==")
+        self.assertEqual(len(self.requests_mock.request_history), 1)
+
+    def test_large_file_is_uploaded_in_parts(self):
+        recorded = {}
+
+        document = create_attachment_document(
+            self.documents_client,
+            "Form",
+            self.attachment,
+            OPTIONS,
+            "nl",
+            record=recorded.__setitem__,
+        )
+
+        self.assertEqual(document["url"], DOCUMENT_URL)
+        create_request = self.requests_mock.request_history[0].json()
+        self.assertIsNone(create_request["inhoud"])
+        self.assertEqual(create_request["bestandsomvang"], 10)
+        self.assertIn(
+            b"\r\n\r\n012345\r\n", self.parts["https://dummy/bestandsdelen/1"]
+        )
+        self.assertIn(b"\r\n\r\n6789\r\n", self.parts["https://dummy/bestandsdelen/2"])
+        self.assertIn(b"lock-id", self.parts["https://dummy/bestandsdelen/1"])
+        self.assertEqual(self.unlock.last_request.json(), {"lock": "lock-id"})
+        self.assertEqual(set(recorded), {"upload", "parts.1", "parts.2", "unlocked"})
+
+    def test_resume_skips_uploaded_parts(self):
+        recorded = {}
+        create_document = self.requests_mock.post(
+            "https://dummy/enkelvoudiginformatieobjecten"
+        )
+        previous_upload = {
+            "url": DOCUMENT_URL,
+            "lock": "lock-id",
+            "bestandsdelen": [
+                {
+                    "url": "https://dummy/bestandsdelen/1",
+                    "volgnummer": 1,
+                    "omvang": 6,
+                    "voltooid": False,
+                },
+                {
+                    "url": "https://dummy/bestandsdelen/2",
+                    "volgnummer": 2,
+                    "omvang": 4,
+                    "voltooid": False,
+                },
+            ],
+        }
+
+        create_attachment_document(
+            self.documents_client,
+            "Form",
+            self.attachment,
+            OPTIONS,
+            "nl",
+            intermediate_results={
+                "upload": previous_upload,
+                "parts": {"1": {"voltooid": True}},
+            },
+            record=recorded.__setitem__,
+        )
+
+        self.assertFalse(create_document.called)
+        self.assertFalse(self.part_1.called)
+        self.assertTrue(self.part_2.called)
+        self.assertIn(b"\r\n\r\n6789\r\n", self.parts["https://dummy/bestandsdelen/2"])
+        self.assertTrue(self.unlock.called)
+        self.assertEqual(set(recorded), {"parts.2", "unlocked"})
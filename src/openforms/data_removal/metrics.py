@@ -0,0 +1,16 @@
+from opentelemetry import metrics
+
+meter = metrics.get_meter("openforms.data_removal")
+
+processed_submissions_counter = meter.create_counter(
+    "openforms.data_removal.processed_submissions",
+    unit="1",  # unitless count
+    description="The number of submissions deleted or anonymized by the data removal.",
+)
+
+batch_duration = meter.create_histogram(
+    name="openforms.data_removal.batch_duration",
+    unit="s",
+    description="Duration of processing a single batch of submissions.",
+    explicit_bucket_boundaries_advisory=(0.1, 0.5, 1, 5, 10, 30, 60),
+)
@@ -1,7 +1,11 @@
-import itertools
+import time
+from collections.abc import Callable
 from datetime import timedelta
 
-from django.db.models import F, Q
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Q, QuerySet
 from django.utils import timezone
 
 import structlog
@@ -11,11 +15,91 @@ from openforms.submissions.constants import Stages
 from openforms.submissions.models import Submission
 
 from .constants import RemovalMethods
+from .metrics import batch_duration, processed_submissions_counter
 
 logger = structlog.stdlib.get_logger(__name__)
 
 TIME_SINCE_CREATION_DELTA = F("removal_limit") * timedelta(days=1)
 
+# how long the progress of an interrupted run is remembered
+CHECKPOINT_TIMEOUT = 60 * 60 * 24 * 7
+
+
+def _get_checkpoint_key(action: str, kind: str) -> str:
+    return f"data_removal:{action}:{kind}:checkpoint"
+
+
+def process_in_batches(
+    queryset: QuerySet[Submission],
+    process_batch: Callable[[QuerySet[Submission]], object],
+    *,
+    action: str,
+    kind: str,
+) -> int:
+    """
+    Process the submissions matching the queryset in batches.
+
+    The submissions are paginated on their primary key, in batches of
+    ``settings.DATA_REMOVAL_BATCH_SIZE``. Every batch is processed in its own
+    transaction, which keeps the locks and the amount of changes per transaction
+    small. After every batch, the last processed primary key is stored as checkpoint
+    so that an interrupted run (e.g. because the task hit the time limit) resumes
+    where it stopped.
+
+    :param queryset: The submissions to process.
+    :param process_batch: Callable receiving the queryset of a single batch.
+    :param action: The action name, used for the checkpoint and metrics.
+    :param kind: The kind of submissions, used for the checkpoint and metrics.
+    :returns: The number of processed submissions.
+    """
+    log = logger.bind(action=f"data_removal.{action}", kind=kind)
+    batch_size: int = settings.DATA_REMOVAL_BATCH_SIZE
+    delay: float = settings.DATA_REMOVAL_BATCH_DELAY
+    attributes = {"action": action, "kind": kind}
+
+    checkpoint_key = _get_checkpoint_key(action, kind)
+    last_pk: int = cache.get(checkpoint_key, 0)
+    if last_pk:
+        log.info("resume_from_checkpoint", last_pk=last_pk)
+
+    total = 0
+    start = time.monotonic()
+    while True:
+        pks = list(
+            queryset.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            break
+
+        batch_start = time.monotonic()
+        with transaction.atomic():
+            # the filters of the queryset are applied again, in case a submission
+            # changed in the meantime
+            process_batch(queryset.filter(pk__in=pks))
+        batch_duration.record(time.monotonic() - batch_start, attributes=attributes)
+        processed_submissions_counter.add(len(pks), attributes=attributes)
+
+        total += len(pks)
+        last_pk = pks[-1]
+        cache.set(checkpoint_key, last_pk, timeout=CHECKPOINT_TIMEOUT)
+
+        if len(pks) < batch_size:
+            break
+        if delay:
+            time.sleep(delay)
+
+    cache.delete(checkpoint_key)
+    duration = time.monotonic() - start
+    log.info(
+        "batches_processed",
+        amount=total,
+        duration=round(duration, 3),
+        submissions_per_second=round(total / duration, 1) if duration else None,
+    )
+    return total
+
 
 @app.task(ignore_result=True)
 def delete_submissions():
@@ -41,34 +125,15 @@ def delete_submissions():
         stage=Stages.successfully_completed,
     )
 
-    log.info(
-        "delete_submissions",
-        kind="successful",
-        amount=successful_submissions_to_delete.count(),
-    )
-    successful_submissions_to_delete.delete()
-
     incomplete_submissions_to_delete = base_qs.annotate_removal_fields(
         "incomplete_submissions_removal_limit",
         method_field="incomplete_submissions_removal_method",
     ).filter(**filters, stage=Stages.incomplete)
-    log.info(
-        "delete_submissions",
-        kind="incomplete",
-        amount=incomplete_submissions_to_delete.count(),
-    )
-    incomplete_submissions_to_delete.delete()
 
     errored_submissions_to_delete = base_qs.annotate_removal_fields(
         "errored_submissions_removal_limit",
         method_field="errored_submissions_removal_method",
     ).filter(**filters, stage=Stages.errored)
-    log.info(
-        "delete_submissions",
-        kind="errored",
-        amount=errored_submissions_to_delete.count(),
-    )
-    errored_submissions_to_delete.delete()
 
     other_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "all_submissions_removal_limit"
@@ -76,10 +141,20 @@ def delete_submissions():
         ~future_appointments_filter,
         time_since_creation__gt=TIME_SINCE_CREATION_DELTA,
     )
-    log.info(
-        "delete_submissions", kind="other", amount=other_submissions_to_delete.count()
-    )
-    other_submissions_to_delete.delete()
+
+    for kind, queryset in (
+        ("successful", successful_submissions_to_delete),
+        ("incomplete", incomplete_submissions_to_delete),
+        ("errored", errored_submissions_to_delete),
+        ("other", other_submissions_to_delete),
+    ):
+        log.info("delete_submissions", kind=kind, amount=queryset.count())
+        process_in_batches(
+            queryset,
+            lambda batch: batch.delete(),
+            action="delete_submissions",
+            kind=kind,
+        )
 
 
 @app.task(ignore_result=True)
@@ -108,23 +183,15 @@ def make_sensitive_data_anonymous() -> None:
         method_field="errored_submissions_removal_method",
     ).filter(**filters, stage=Stages.errored)
 
-    log.info(
-        "anonymize_submissions",
-        kind="successful",
-        amount=successful_submissions.count(),
-    )
-    log.info(
-        "anonymize_submissions",
-        kind="incomplete",
-        amount=incomplete_submissions.count(),
-    )
-    log.info(
-        "anonymize_submissions", kind="errored", amount=errored_submissions.count()
-    )
-
-    for submission in itertools.chain(
-        successful_submissions.iterator(),
-        incomplete_submissions.iterator(),
-        errored_submissions.iterator(),
+    for kind, queryset in (
+        ("successful", successful_submissions),
+        ("incomplete", incomplete_submissions),
+        ("errored", errored_submissions),
     ):
-        submission.remove_sensitive_data()
+        log.info("anonymize_submissions", kind=kind, amount=queryset.count())
+        process_in_batches(
+            queryset,
+            lambda batch: batch.remove_sensitive_data(),
+            action="make_sensitive_data_anonymous",
+            kind=kind,
+        )
@@ -1,7 +1,9 @@
 from datetime import timedelta
+from unittest.mock import call, patch
 
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
-from django.test import TestCase, tag
+from django.test import TestCase, override_settings, tag
 from django.utils import timezone
 
 from freezegun import freeze_time
@@ -24,7 +26,11 @@ from openforms.submissions.tests.factories import (
 )
 
 from ..constants import RemovalMethods
-from ..tasks import delete_submissions, make_sensitive_data_anonymous
+from ..tasks import (
+    delete_submissions,
+    make_sensitive_data_anonymous,
+    process_in_batches,
+)
 
 
 class DeleteSubmissionsTask(TestCase):
@@ -1458,3 +1464,108 @@ class MakeSensitiveDataAnonymousTask(TestCase):
                 "This is also not sensitive",
             )
             self.assertTrue(submission_to_be_anonymous._is_cleaned)
+
+
+class BatchedProcessingTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _create_expired_submissions(self, amount: int) -> list[Submission]:
+        config = GlobalConfiguration.get_solo()
+        before_limit = timezone.now() - timedelta(
+            days=config.successful_submissions_removal_limit + 1
+        )
+        with freeze_time(before_limit):
+            return SubmissionFactory.create_batch(amount, registration_success=True)
+
+    @override_settings(DATA_REMOVAL_BATCH_SIZE=2)
+    def test_delete_submissions_in_batches(self):
+        self._create_expired_submissions(5)
+        SubmissionFactory.create(registration_success=True)
+
+        with patch(
+            "openforms.data_removal.tasks.processed_submissions_counter"
+        ) as mock_counter:
+            delete_submissions()
+
+        self.assertEqual(Submission.objects.count(), 1)
+        mock_counter.add.assert_has_calls(
+            [
+                call(
+                    2, attributes={"action": "delete_submissions", "kind": "successful"}
+                ),
+                call(
+                    2, attributes={"action": "delete_submissions", "kind": "successful"}
+                ),
+                call(
+                    1, attributes={"action": "delete_submissions", "kind": "successful"}
+                ),
+            ]
+        )
+
+    @override_settings(DATA_REMOVAL_BATCH_SIZE=2)
+    def test_interrupted_run_resumes_from_checkpoint(self):
+        submissions = self._create_expired_submissions(4)
+        queryset = Submission.objects.all()
+        batches: list[list[int]] = []
+
+        def process_batch(batch):
+            batches.append(sorted(batch.values_list("pk", flat=True)))
+
+        def interrupted_process_batch(batch):
+            if batches:
+                raise RuntimeError("interrupted")
+            process_batch(batch)
+
+        with self.assertRaises(RuntimeError):
+            process_in_batches(
+                queryset, interrupted_process_batch, action="test", kind="test"
+            )
+        total = process_in_batches(queryset, process_batch, action="test", kind="test")
+
+        self.assertEqual(
+            batches,
+            [
+                [submissions[0].pk, submissions[1].pk],
+                [submissions[2].pk, submissions[3].pk],
+            ],
+        )
+        self.assertEqual(total, 2)
+
+        with self.subTest("checkpoint is cleared after a complete run"):
+            total = process_in_batches(
+                queryset, lambda batch: None, action="test", kind="test"
+            )
+
+            self.assertEqual(total, 4)
+
+    @override_settings(DATA_REMOVAL_BATCH_SIZE=1)
+    def test_make_sensitive_data_anonymous_in_batches(self):
+        submissions = self._create_expired_submissions(3)
+        Submission.objects.update(
+            co_sign_data={
+                "version": "v1",
+                "plugin": "digid",
+                "identifier": "123456782",
+                "representation": "T. Hulk",
+                "co_sign_auth_attribute": "bsn",
+                "fields": {"firstName": "The", "lastName": "Hulk"},
+            }
+        )
+        for submission in submissions:
+            submission.form.successful_submissions_removal_method = (
+                RemovalMethods.make_anonymous
+            )
+            submission.form.save()
+
+        make_sensitive_data_anonymous()
+
+        for submission in Submission.objects.all():
+            with self.subTest(submission=submission):
+                self.assertTrue(submission._is_cleaned)
+                self.assertEqual(submission.co_sign_data["identifier"], "")
+                self.assertEqual(submission.co_sign_data["fields"], {})
+                self.assertEqual(submission.co_sign_data["representation"], "T. Hulk")
@@ -1,15 +1,45 @@
+import os
+
+from django.conf import settings
+from django.core.files.base import ContentFile
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 from rest_framework.reverse import reverse
 
-from openforms.submissions.constants import SUBMISSIONS_SESSION_KEY
-from openforms.submissions.models import Submission
+from openforms.api.exceptions import RequestEntityTooLarge
+from openforms.submissions.constants import SUBMISSIONS_SESSION_KEY, VirusScanStatuses
+from openforms.submissions.models import PartialFileUpload, Submission
 
+from ..components.utils import sanitize_file_name
 from .validators import MimeTypeValidator, NoVirusValidator
 
 
-class TemporaryFileUploadSerializer(serializers.Serializer):
+def trim_file_name(file_name: str) -> str:
+    # trim name part if necessary but keep the extension
+    name, ext = os.path.splitext(file_name)
+    return name[: 255 - len(ext)] + ext
+
+
+class ActiveSubmissionFieldMixin:
+    """
+    Limit the ``submission`` field to the active submissions of the session.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        view = self.context.get("view")
+        if getattr(view, "swagger_fake_view", False):
+            return fields
+
+        session = self.context["request"].session
+        fields["submission"].queryset = Submission.objects.filter(
+            completed_on=None, uuid__in=session.get(SUBMISSIONS_SESSION_KEY, [])
+        )
+        return fields
+
+
+class TemporaryFileUploadSerializer(ActiveSubmissionFieldMixin, serializers.Serializer):
     """
     https://help.form.io/integrations/filestorage/#url
 
@@ -42,7 +72,17 @@ class TemporaryFileUploadSerializer(serializers.Serializer):
         label=_("File name"), source="file_name", read_only=True
     )
     size = serializers.IntegerField(
-        label=_("File size"), source="content.size", read_only=True
+        label=_("File size"), source="file_size", read_only=True
+    )
+    virus_scan_status = serializers.ChoiceField(
+        label=_("Virus scan status"),
+        choices=VirusScanStatuses.choices,
+        read_only=True,
+        help_text=_(
+            "When the files are scanned for viruses in the background, the upload can "
+            "only be used in the submission once the status is `clean`. Poll the "
+            "upload status endpoint to follow the progress."
+        ),
     )
 
     def get_url(self, instance) -> str:
@@ -53,14 +93,73 @@ class TemporaryFileUploadSerializer(serializers.Serializer):
             request=request,
         )
 
-    def get_fields(self):
-        fields = super().get_fields()
-        view = self.context.get("view")
-        if getattr(view, "swagger_fake_view", False):
-            return fields
 
-        session = self.context["request"].session
-        fields["submission"].queryset = Submission.objects.filter(
-            completed_on=None, uuid__in=session.get(SUBMISSIONS_SESSION_KEY, [])
+class PartialFileUploadSerializer(ActiveSubmissionFieldMixin, serializers.Serializer):
+    """
+    Start a resumable file upload.
+
+    The content is sent afterwards in one or more chunks to the returned URL.
+    """
+
+    submission = serializers.HyperlinkedRelatedField(
+        view_name="api:submission-detail",
+        lookup_field="uuid",
+        queryset=Submission.objects.none(),  # Overridden dynamically
+        label=_("Submission"),
+        write_only=True,
+        required=True,
+    )
+    name = serializers.CharField(
+        label=_("File name"),
+        source="file_name",
+        help_text=_("Name of the file, including the extension."),
+    )
+    size = serializers.IntegerField(
+        label=_("File size"),
+        source="file_size",
+        min_value=1,
+        help_text=_("Size in bytes of the complete file."),
+    )
+    type = serializers.CharField(
+        label=_("Content type"),
+        source="content_type",
+        max_length=255,
+        default="application/octet-stream",
+        help_text=_("The MIME type of the file."),
+    )
+
+    url = serializers.SerializerMethodField(
+        label=_("URL"), source="get_url", read_only=True
+    )
+    offset = serializers.IntegerField(
+        label=_("Offset"),
+        read_only=True,
+        help_text=_("Number of bytes received so far."),
+    )
+
+    def get_url(self, instance) -> str:
+        request = self.context["request"]
+        return reverse(
+            "api:formio:partial-file-upload-detail",
+            kwargs={"uuid": instance.uuid},
+            request=request,
         )
-        return fields
+
+    def validate_name(self, value: str) -> str:
+        # the name is not sanitized by the multipart parser, as it is for the regular
+        # temporary file uploads
+        if not (name := sanitize_file_name(value)):
+            raise serializers.ValidationError(_("Invalid file name."))
+        return trim_file_name(name)
+
+    def validate_size(self, value: int) -> int:
+        if value > settings.MAX_FILE_UPLOAD_SIZE:
+            raise RequestEntityTooLarge()
+        return value
+
+    def create(self, validated_data):
+        upload = PartialFileUpload(**validated_data)
+        # chunks are appended to this (empty) file
+        upload.content.save(upload.file_name, ContentFile(b""), save=False)
+        upload.save()
+        return upload
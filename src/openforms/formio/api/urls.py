@@ -1,6 +1,11 @@
 from django.urls import path
 
-from .views import TemporaryFileUploadView
+from .views import (
+    PartialFileUploadCreateView,
+    PartialFileUploadView,
+    TemporaryFileUploadDetailView,
+    TemporaryFileUploadView,
+)
 
 app_name = "formio"
 
@@ -10,4 +15,19 @@ urlpatterns = [
         TemporaryFileUploadView.as_view(),
         name="temporary-file-upload",
     ),
+    path(
+        "fileupload/<uuid:uuid>",
+        TemporaryFileUploadDetailView.as_view(),
+        name="temporary-file-upload-detail",
+    ),
+    path(
+        "fileupload/resumable",
+        PartialFileUploadCreateView.as_view(),
+        name="partial-file-upload-list",
+    ),
+    path(
+        "fileupload/resumable/<uuid:uuid>",
+        PartialFileUploadView.as_view(),
+        name="partial-file-upload-detail",
+    ),
 ]
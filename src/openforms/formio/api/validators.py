@@ -154,7 +154,8 @@ class MimeTypeValidator:
 class NoVirusValidator:
     def __call__(self, uploaded_file: UploadedFile) -> None:
         config = GlobalConfiguration.get_solo()
-        if not config.enable_virus_scan:
+        # the upload is scanned after it's stored, see ``openforms.submissions.virus_scan``
+        if not config.enable_virus_scan or config.virus_scan_in_background:
             return
 
         scanner = clamd.ClamdNetworkSocket(
@@ -1,23 +1,69 @@
+import base64
+import binascii
+import hashlib
 import os
 
 from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
 from django.template.defaultfilters import filesizeformat
 from django.utils.translation import gettext_lazy as _
 
 from djangorestframework_camel_case.render import CamelCaseJSONRenderer
-from drf_spectacular.utils import extend_schema
-from rest_framework import status
-from rest_framework.generics import GenericAPIView
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from rest_framework import serializers, status
+from rest_framework.exceptions import UnsupportedMediaType
+from rest_framework.generics import GenericAPIView, RetrieveAPIView
 from rest_framework.response import Response
 
 from openforms.api.authentication import AnonCSRFSessionAuthentication
+from openforms.api.exceptions import Conflict, RequestEntityTooLarge
 from openforms.api.parsers import MaxFilesizeMultiPartParser
-from openforms.submissions.api.permissions import AnyActiveSubmissionPermission
+from openforms.submissions.api.permissions import (
+    AnyActiveSubmissionPermission,
+    OwnsTemporaryUploadPermission,
+)
 from openforms.submissions.api.renderers import PlainTextErrorRenderer
 from openforms.submissions.attachments import clean_mime_type
-from openforms.submissions.models import TemporaryFileUpload
+from openforms.submissions.models import PartialFileUpload, TemporaryFileUpload
+from openforms.submissions.virus_scan import (
+    get_initial_scan_status,
+    schedule_virus_scan,
+)
+
+from .serializers import (
+    PartialFileUploadSerializer,
+    TemporaryFileUploadSerializer,
+    trim_file_name,
+)
+from .validators import MimeTypeValidator, NoVirusValidator
 
-from .serializers import TemporaryFileUploadSerializer
+# content type of the chunks of a resumable upload, borrowed from the tus protocol
+CHUNK_CONTENT_TYPE = "application/offset+octet-stream"
+# the request body is streamed to the file in blocks of this size
+CHUNK_READ_SIZE = 64 * 1024
+CHECKSUM_ALGORITHMS = ("sha1", "sha256")
+
+
+def get_mime_type(file_name: str, content_type: str) -> str:
+    match content_type:
+        # mime type + extension validation was performed in the serializer
+        case "application/octet-stream" if os.path.splitext(file_name)[1] == ".msg":
+            return "application/vnd.ms-outlook"
+        case _:
+            return content_type
+
+
+class PlainTextErrorsMixin:
+    def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Override renderer to support JSON for success and text for error response
+        """
+        if response.status_code == 400:
+            request.accepted_renderer = PlainTextErrorRenderer()
+            request.accepted_media_type = PlainTextErrorRenderer.media_type
+        response = super().finalize_response(request, response, *args, **kwargs)
+        return response
 
 
 @extend_schema(
@@ -40,7 +86,7 @@ from .serializers import TemporaryFileUploadSerializer
         (400, PlainTextErrorRenderer.media_type): str,
     },
 )
-class TemporaryFileUploadView(GenericAPIView):
+class TemporaryFileUploadView(PlainTextErrorsMixin, GenericAPIView):
     parser_classes = [MaxFilesizeMultiPartParser]
     serializer_class = TemporaryFileUploadSerializer
     authentication_classes = (AnonCSRFSessionAuthentication,)
@@ -59,15 +105,8 @@ class TemporaryFileUploadView(GenericAPIView):
         submission = serializer.validated_data["submission"]
         file = serializer.validated_data["file"]
 
-        # trim name part if necessary but keep the extension
-        name, ext = os.path.splitext(file.name)
-        name = name[: 255 - len(ext)] + ext
-        match mime_type := file.content_type:
-            # mime type + extension validation was performed in the serializer
-            case "application/octet-stream" if ext == ".msg":
-                mime_type = "application/vnd.ms-outlook"
-            case _:
-                pass
+        name = trim_file_name(file.name)
+        mime_type = get_mime_type(name, file.content_type)
 
         upload = TemporaryFileUpload.objects.create(
             submission=submission,
@@ -75,17 +114,293 @@ class TemporaryFileUploadView(GenericAPIView):
             file_name=name,
             content_type=clean_mime_type(mime_type),
             file_size=file.size,
+            virus_scan_status=get_initial_scan_status(),
         )
+        schedule_virus_scan(upload)
         return Response(
             self.serializer_class(instance=upload, context={"request": request}).data
         )
 
-    def finalize_response(self, request, response, *args, **kwargs):
-        """
-        Override renderer to support JSON for success and text for error response
-        """
-        if response.status_code == 400:
-            request.accepted_renderer = PlainTextErrorRenderer()
-            request.accepted_media_type = PlainTextErrorRenderer.media_type
-        response = super().finalize_response(request, response, *args, **kwargs)
-        return response
+
+@extend_schema(
+    summary=_("Retrieve temporary file upload"),
+    description=_(
+        "Retrieve the details of a temporary file upload, including the status of the "
+        "virus scan. Poll this endpoint when the files are scanned for viruses in the "
+        "background."
+    ),
+)
+class TemporaryFileUploadDetailView(RetrieveAPIView):
+    authentication_classes = (AnonCSRFSessionAuthentication,)
+    permission_classes = [OwnsTemporaryUploadPermission]
+    renderer_classes = [CamelCaseJSONRenderer]
+    serializer_class = TemporaryFileUploadSerializer
+    queryset = TemporaryFileUpload.objects.select_related("submission")
+    lookup_field = "uuid"
+
+
+def _get_upload_headers(upload: PartialFileUpload) -> dict[str, str]:
+    return {
+        "Upload-Offset": str(upload.offset),
+        "Upload-Length": str(upload.file_size),
+        "Cache-Control": "no-store",
+    }
+
+
+def _parse_checksum(header: str) -> tuple[str, bytes] | None:
+    """
+    Parse the ``Upload-Checksum`` header: the algorithm and the base64 encoded digest.
+    """
+    if not header:
+        return None
+    algorithm, __, digest = header.partition(" ")
+    if algorithm not in CHECKSUM_ALGORITHMS:
+        raise serializers.ValidationError(
+            _("Unsupported checksum algorithm, use one of: {algorithms}.").format(
+                algorithms=", ".join(CHECKSUM_ALGORITHMS)
+            )
+        )
+    try:
+        return algorithm, base64.b64decode(digest, validate=True)
+    except binascii.Error as exc:
+        raise serializers.ValidationError(_("Invalid checksum.")) from exc
+
+
+def append_chunk(
+    upload: PartialFileUpload, stream, checksum: tuple[str, bytes] | None
+) -> int:
+    """
+    Append the request body to the content of the upload.
+
+    The body is streamed to the file, it is never held in memory completely. Bytes
+    written after the current offset (by an earlier, interrupted request) are
+    discarded. On errors, the file is restored to the current offset.
+
+    :returns: The number of bytes written.
+    """
+    remaining = upload.file_size - upload.offset
+    hasher = hashlib.new(checksum[0]) if checksum else None
+    written = 0
+    with upload.content.open("r+b") as destination:
+        destination.seek(upload.offset)
+        destination.truncate()
+        try:
+            while stream is not None and (chunk := stream.read(CHUNK_READ_SIZE)):
+                written += len(chunk)
+                if written > remaining:
+                    raise RequestEntityTooLarge()
+                if hasher is not None:
+                    hasher.update(chunk)
+                destination.write(chunk)
+
+            if hasher is not None and hasher.digest() != checksum[1]:
+                raise serializers.ValidationError(
+                    _("The checksum of the chunk does not match.")
+                )
+        except BaseException:
+            destination.seek(upload.offset)
+            destination.truncate()
+            raise
+    return written
+
+
+@extend_schema_view(
+    post=extend_schema(
+        summary=_("Start resumable file upload"),
+        description=_(
+            "Alternative to the temporary file upload for large files and unreliable "
+            "connections. This call registers the name, size and type of the file. "
+            "The content is then sent in one or more chunks to the returned URL, "
+            "which allows resuming an interrupted upload.\n\n"
+            "The maximum upload size for this instance is `{max_upload_size}`."
+        ).format(max_upload_size=filesizeformat(settings.MAX_FILE_UPLOAD_SIZE)),
+        responses={
+            201: PartialFileUploadSerializer,
+            (400, PlainTextErrorRenderer.media_type): str,
+        },
+    ),
+)
+class PartialFileUploadCreateView(PlainTextErrorsMixin, GenericAPIView):
+    serializer_class = PartialFileUploadSerializer
+    authentication_classes = (AnonCSRFSessionAuthentication,)
+    permission_classes = [AnyActiveSubmissionPermission]
+    renderer_classes = [CamelCaseJSONRenderer]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST,
+                content_type="text/plain",
+            )
+
+        upload = serializer.save()
+        return Response(
+            serializer.data,
+            status=status.HTTP_201_CREATED,
+            headers={"Location": serializer.data["url"], **_get_upload_headers(upload)},
+        )
+
+
+@extend_schema_view(
+    head=extend_schema(
+        summary=_("Retrieve resumable file upload offset"),
+        description=_(
+            "The number of bytes received so far is returned in the `Upload-Offset` "
+            "header. Use it to resume an interrupted upload."
+        ),
+        responses={200: None},
+    ),
+    patch=extend_schema(
+        summary=_("Upload chunk"),
+        description=_(
+            "Append a chunk to the file. The request body is the raw content of the "
+            "chunk, with the content type `{content_type}`. The `Upload-Offset` header "
+            "must match the number of bytes received so far. Optionally, the integrity "
+            "of the chunk is checked with the `Upload-Checksum` header, formatted as "
+            "the algorithm (`sha1` or `sha256`) followed by a space and the base64 "
+            "encoded digest.\n\n"
+            "Incomplete uploads respond with a 204 and the new offset. The chunk "
+            "completing the upload validates the file and responds with the temporary "
+            "file upload, which is used by the form submission like any other "
+            "temporary file upload. Unclaimed uploads expire after {expire_days} "
+            "day(s)."
+        ).format(
+            content_type=CHUNK_CONTENT_TYPE,
+            expire_days=settings.TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS,
+        ),
+        request={CHUNK_CONTENT_TYPE: OpenApiTypes.BINARY},
+        parameters=[
+            OpenApiParameter(
+                name="Upload-Offset",
+                type=int,
+                location=OpenApiParameter.HEADER,
+                required=True,
+            ),
+            OpenApiParameter(
+                name="Upload-Checksum",
+                type=str,
+                location=OpenApiParameter.HEADER,
+                required=False,
+            ),
+        ],
+        responses={
+            200: TemporaryFileUploadSerializer,
+            204: None,
+            (400, PlainTextErrorRenderer.media_type): str,
+        },
+    ),
+    delete=extend_schema(
+        summary=_("Cancel resumable file upload"),
+        responses={204: None},
+    ),
+)
+class PartialFileUploadView(PlainTextErrorsMixin, GenericAPIView):
+    authentication_classes = (AnonCSRFSessionAuthentication,)
+    permission_classes = [OwnsTemporaryUploadPermission]
+    renderer_classes = [CamelCaseJSONRenderer]
+    serializer_class = TemporaryFileUploadSerializer
+    queryset = PartialFileUpload.objects.select_related("submission")
+    lookup_field = "uuid"
+
+    def head(self, request, *args, **kwargs):
+        upload = self.get_object()
+        return Response(headers=_get_upload_headers(upload))
+
+    def patch(self, request, *args, **kwargs):
+        if request.content_type.split(";")[0].strip() != CHUNK_CONTENT_TYPE:
+            raise UnsupportedMediaType(request.content_type)
+
+        upload = self.get_object()
+        try:
+            offset, checksum = self._parse_headers(request)
+        except serializers.ValidationError as exc:
+            return self._chunk_error(exc)
+
+        # chunks of the same upload are received one at a time, without holding a
+        # database transaction while receiving the request body
+        if not upload.claim_chunk(offset):
+            upload.refresh_from_db(fields=["offset"])
+            raise Conflict(
+                _(
+                    "The offset does not match the {offset} bytes received, or another "
+                    "chunk is being received."
+                ).format(offset=upload.offset)
+            )
+        try:
+            written = append_chunk(upload, request.stream, checksum)
+        except serializers.ValidationError as exc:
+            upload.release_chunk()
+            return self._chunk_error(exc)
+        except BaseException:
+            upload.release_chunk()
+            raise
+        if not upload.commit_chunk(written):
+            raise Conflict(_("The chunk was superseded by another chunk."))
+
+        if not upload.is_complete:
+            return Response(
+                status=status.HTTP_204_NO_CONTENT, headers=_get_upload_headers(upload)
+            )
+        return self._complete(upload)
+
+    @staticmethod
+    def _chunk_error(exc: serializers.ValidationError) -> Response:
+        return Response(
+            {"chunk": exc.detail},
+            status=status.HTTP_400_BAD_REQUEST,
+            content_type="text/plain",
+        )
+
+    @staticmethod
+    def _parse_headers(request) -> tuple[int, tuple[str, bytes] | None]:
+        try:
+            offset = int(request.headers["Upload-Offset"])
+        except (KeyError, ValueError) as exc:
+            raise serializers.ValidationError(
+                _("The 'Upload-Offset' header is required.")
+            ) from exc
+        return offset, _parse_checksum(request.headers.get("Upload-Checksum", ""))
+
+    def delete(self, request, *args, **kwargs):
+        upload = self.get_object()
+        upload.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def _complete(self, upload: PartialFileUpload) -> Response:
+        # same validation as the regular temporary file upload, but reading the file
+        # from the storage rather than from the request body
+        errors = []
+        with upload.content.open("rb") as content:
+            file = UploadedFile(
+                file=content,
+                name=upload.file_name,
+                content_type=upload.content_type,
+                size=upload.file_size,
+            )
+            for validator in (MimeTypeValidator(), NoVirusValidator()):
+                file.seek(0)
+                try:
+                    validator(file)
+                except serializers.ValidationError as exc:
+                    errors += exc.detail
+
+        if errors:
+            upload.delete()
+            return Response(
+                {"file": errors},
+                status=status.HTTP_400_BAD_REQUEST,
+                content_type="text/plain",
+            )
+
+        mime_type = get_mime_type(upload.file_name, upload.content_type)
+        temporary_upload = upload.complete(
+            content_type=clean_mime_type(mime_type),
+            virus_scan_status=get_initial_scan_status(),
+        )
+        schedule_virus_scan(temporary_upload)
+        return Response(
+            self.get_serializer(instance=temporary_upload).data,
+            headers=_get_upload_headers(upload),
+        )
@@ -0,0 +1,128 @@
+"""
+Share the component indexes of Formio configurations between requests.
+
+Building the internal datastructures of a :class:`FormioConfigurationWrapper` requires
+walking the complete configuration tree, which was done for every form definition on
+every request. The component locations only depend on the configuration itself, so
+they are captured in an immutable :class:`ComponentIndex` keyed by the hash of the
+configuration. The index is kept in memory of the worker process and in the default
+(Redis) cache for the other workers.
+
+Every request still wraps its own configuration instance, as logic actions mutate the
+components in place.
+
+Likewise, the component properties resulting from applying the translations and custom
+error messages only depend on the configuration and the language. They are shared in
+the same way, keyed by the configuration hash - saving a changed configuration results
+in a new hash and thus new localized properties.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+
+from django.core.cache import cache
+
+import structlog
+
+from .datastructures import (
+    ComponentIndex,
+    FormioConfigurationWrapper,
+    StaleComponentIndex,
+)
+from .dynamic_config import LocalizedProperties, get_localized_properties
+from .typing import FormioConfiguration
+
+logger = structlog.stdlib.get_logger(__name__)
+
+COMPONENT_INDEX_CACHE_TIMEOUT = 60 * 60 * 24
+# upper bound of component indexes kept in memory by a single process
+MAX_COMPONENT_INDEXES = 1_000
+# upper bound of localized properties kept in memory by a single process
+MAX_LOCALIZED_PROPERTIES = 1_000
+
+type LocalizationKey = tuple[str, str, bool]
+
+_component_indexes: dict[str, ComponentIndex] = {}
+_localized_properties: dict[LocalizationKey, LocalizedProperties] = {}
+_lock = Lock()
+
+
+def _get_cache_key(configuration_hash: str) -> str:
+    return f"formio:component-index:{configuration_hash}"
+
+
+def _remember[K, V](store: dict[K, V], max_size: int, key: K, value: V) -> None:
+    with _lock:
+        if len(store) >= max_size:
+            store.pop(next(iter(store)))
+        store[key] = value
+
+
+def get_component_index(configuration_hash: str) -> ComponentIndex | None:
+    if (index := _component_indexes.get(configuration_hash)) is not None:
+        return index
+
+    index = cache.get(_get_cache_key(configuration_hash))
+    if index is not None:
+        _remember(_component_indexes, MAX_COMPONENT_INDEXES, configuration_hash, index)
+    return index
+
+
+def get_configuration_wrapper(
+    configuration: FormioConfiguration, configuration_hash: str
+) -> FormioConfigurationWrapper:
+    """
+    Wrap the configuration, re-using the shared component index if possible.
+
+    :param configuration: The configuration to wrap. It is not copied.
+    :param configuration_hash: The hash of the configuration content, see
+      :meth:`openforms.forms.models.FormDefinition.get_hash`.
+    """
+    if (index := get_component_index(configuration_hash)) is not None:
+        try:
+            wrapper = FormioConfigurationWrapper.from_index(configuration, index)
+        except StaleComponentIndex:
+            logger.warning(
+                "formio.stale_component_index", configuration_hash=configuration_hash
+            )
+        else:
+            wrapper.configuration_hash = configuration_hash
+            return wrapper
+
+    wrapper = FormioConfigurationWrapper(configuration)
+    if (index := ComponentIndex.from_wrapper(wrapper)) is not None:
+        _remember(_component_indexes, MAX_COMPONENT_INDEXES, configuration_hash, index)
+        cache.set(
+            _get_cache_key(configuration_hash),
+            index,
+            timeout=COMPONENT_INDEX_CACHE_TIMEOUT,
+        )
+        wrapper.configuration_hash = configuration_hash
+    return wrapper
+
+
+def get_cached_localized_properties(
+    wrapper: FormioConfigurationWrapper, language_code: str, enabled: bool
+) -> LocalizedProperties:
+    """
+    Get the localized properties of the components, computing them once per
+    configuration hash and language.
+
+    :param wrapper: The wrapper of the (stored) configuration, it must have a
+      configuration hash.
+    """
+    assert wrapper.configuration_hash is not None
+    key: LocalizationKey = (wrapper.configuration_hash, language_code, enabled)
+    if (properties := _localized_properties.get(key)) is not None:
+        return properties
+
+    cache_key = "formio:localized-properties:{}:{}:{}".format(*key)
+    properties = cache.get(cache_key)
+    if properties is None:
+        properties = get_localized_properties(
+            wrapper.configuration, language_code, enabled=enabled
+        )
+        cache.set(cache_key, properties, timeout=COMPONENT_INDEX_CACHE_TIMEOUT)
+    _remember(_localized_properties, MAX_LOCALIZED_PROPERTIES, key, properties)
+    return properties
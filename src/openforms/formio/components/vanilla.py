@@ -31,8 +31,10 @@ from csp_post_processor import post_process_html
 from openforms.config.constants import UploadFileType
 from openforms.config.models import GlobalConfiguration
 from openforms.submissions.attachments import temporary_upload_from_url
+from openforms.submissions.constants import VirusScanStatuses
 from openforms.submissions.form_logic import process_visibility
 from openforms.submissions.models import EmailVerification
+from openforms.submissions.virus_scan import get_virus_scan_error
 from openforms.typing import JSONObject
 from openforms.utils.json_schema import to_multiple
 from openforms.utils.urls import build_absolute_uri
@@ -397,9 +399,18 @@ class FileSerializer(serializers.Serializer):
 
     def __init__(self, *args, **kwargs) -> None:
         allowed_mime_types = kwargs.pop("allowed_mime_types", [])
+        # the configured file types are looked up during validation, as the field is
+        # re-used (see :func:`openforms.formio.serializers.build_serializer`)
+        self.use_config_file_types = kwargs.pop("use_config_file_types", False)
         self.mime_type_validator = MimeTypeValidator(allowed_mime_types)
         super().__init__(*args, **kwargs)
 
+    def get_mime_type_validator(self) -> MimeTypeValidator:
+        if not self.use_config_file_types:
+            return self.mime_type_validator
+        config = GlobalConfiguration.get_solo()
+        return MimeTypeValidator(config.form_upload_default_file_types)
+
     def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
         # when the file is being uploaded "temporary-file-upload" endpoint is used.
         # It has MultiPartParser, which changes the file name in sanitize_file_name,
@@ -442,6 +453,16 @@ class FileSerializer(serializers.Serializer):
         if temporary_upload.submission != self.context["submission"]:
             raise serializers.ValidationError({"url": _("Invalid URL.")})
 
+        # uploads that are still being scanned in the background are accepted, they are
+        # only claimed by the submission once they're clean
+        if temporary_upload.virus_scan_status in (
+            VirusScanStatuses.infected,
+            VirusScanStatuses.failed,
+        ):
+            raise serializers.ValidationError(
+                {"url": get_virus_scan_error(temporary_upload)}
+            )
+
         with temporary_upload.content.open("rb") as infile:
             # wrap in UploadedFile just to reuse DRF validator
             uploaded_file = UploadedFile(
@@ -449,7 +470,7 @@ class FileSerializer(serializers.Serializer):
                 name=temporary_upload.file_name,
                 content_type=temporary_upload.content_type,
             )
-            self.mime_type_validator(uploaded_file)
+            self.get_mime_type_validator()(uploaded_file)
 
         return attrs
 
@@ -483,16 +504,13 @@ class File(BasePlugin[FileComponent]):
         validate = component.get("validate", {})
         required = validate.get("required", False)
 
-        if component.get("useConfigFiletypes"):
-            config = GlobalConfiguration.get_solo()
-            allowed_mime_types = config.form_upload_default_file_types
-        else:
-            allowed_mime_types = glom(component, "file.type", default=[])
-
         return serializers.ListField(
             max_length=max_number_of_files,
             min_length=1 if required else None,
-            child=FileSerializer(allowed_mime_types=allowed_mime_types),
+            child=FileSerializer(
+                allowed_mime_types=glom(component, "file.type", default=[]),
+                use_config_file_types=component.get("useConfigFiletypes", False),
+            ),
             required=required,
         )
 
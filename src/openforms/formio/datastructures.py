@@ -3,6 +3,12 @@ from __future__ import annotations
 import re
 from collections import UserDict
 from collections.abc import Iterator, Sequence
+from copy import deepcopy
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from functools import cached_property, lru_cache
+from typing import Any, Self
 
 from glom import glom
 
@@ -26,6 +32,12 @@ class DuplicateKeyError(Exception):
         self.key = key
 
 
+class StaleComponentIndex(Exception):
+    """
+    Error raised when a component index does not match the wrapped configuration.
+    """
+
+
 def _get_editgrid_component_map(component: EditGridComponent) -> dict[str, Component]:
     """
     Given an edit grid component, return a component map with namespaced keys.
@@ -46,6 +58,53 @@ def _get_editgrid_component_map(component: EditGridComponent) -> dict[str, Compo
     return component_map
 
 
+def _parse_path(path: str) -> tuple[str | int, ...]:
+    return tuple(int(bit) if bit.isdigit() else bit for bit in path.split("."))
+
+
+@dataclass(frozen=True)
+class ComponentIndex:
+    """
+    Immutable index of the component locations in a Formio configuration.
+
+    The index only holds the (JSON) paths to the components rather than the components
+    themselves, so it can be shared between wrappers of equal configurations and it can
+    be stored in a cache. Resolving the paths against a configuration is a lot cheaper
+    than walking the configuration tree to build the internal datastructures of the
+    :class:`FormioConfigurationWrapper`.
+    """
+
+    # flattened path, parsed path, key and type of every component, depth-first
+    components: tuple[tuple[str, tuple[str | int, ...], str, str], ...]
+    # component map keys and the position of their component in ``components``
+    component_map: tuple[tuple[str, int], ...]
+
+    @classmethod
+    def from_wrapper(cls, wrapper: FormioConfigurationWrapper) -> ComponentIndex | None:
+        """
+        Build the index from the datastructures of a configuration wrapper.
+
+        Returns ``None`` if not every component can be located by its path.
+        """
+        positions: dict[int, int] = {}
+        components = []
+        for position, (path, component) in enumerate(wrapper.flattened_by_path.items()):
+            positions[id(component)] = position
+            components.append(
+                (path, _parse_path(path), component.get("key"), component.get("type"))
+            )
+
+        try:
+            component_map = tuple(
+                (key, positions[id(component)])
+                for key, component in wrapper.component_map.items()
+            )
+        except KeyError:
+            return None
+
+        return cls(components=tuple(components), component_map=component_map)
+
+
 class FormioConfigurationWrapper:
     """
     Wrap around the Formio configuration dictionary for further processing.
@@ -59,6 +118,10 @@ class FormioConfigurationWrapper:
     _cached_component_map: dict[str, Component] | None = None
     _flattened_by_path: None | dict[str, Component] = None
     _reverse_flattened: None | dict[str, str] = None
+    # hash of the (stored) configuration, set if all components are located by path
+    configuration_hash: str | None = None
+    # whether the translations and custom error messages were applied
+    localized: bool = False
 
     def __init__(
         self, configuration: FormioConfiguration, *, validate_unique_keys: bool = False
@@ -67,6 +130,37 @@ class FormioConfigurationWrapper:
         # this flag should not be necessary, but we likely need to address #2713 first
         self.validate_unique_keys = validate_unique_keys
 
+    @classmethod
+    def from_index(
+        cls, configuration: FormioConfiguration, index: ComponentIndex
+    ) -> FormioConfigurationWrapper:
+        """
+        Wrap the configuration, locating the components with a (shared) index.
+
+        :raises StaleComponentIndex: if the index does not match the configuration.
+        """
+        components: list[Component] = []
+        try:
+            for _, path, key, component_type in index.components:
+                node = configuration
+                for bit in path:
+                    node = node[bit]
+                if node.get("key") != key or node.get("type") != component_type:
+                    raise StaleComponentIndex()
+                components.append(node)
+        except (KeyError, IndexError, TypeError, AttributeError) as exc:
+            raise StaleComponentIndex() from exc
+
+        wrapper = cls(configuration)
+        wrapper._flattened_by_path = {
+            path: component
+            for (path, *_), component in zip(index.components, components, strict=True)
+        }
+        wrapper._cached_component_map = {
+            key: components[position] for key, position in index.component_map
+        }
+        return wrapper
+
     @property
     def component_map(self) -> dict[str, Component]:
         if self._cached_component_map is None:
@@ -133,8 +227,35 @@ class FormioConfigurationWrapper:
     ) -> FormioConfigurationWrapper:
         self._configuration["components"] += other_wrapper._configuration["components"]
         self.component_map.update(other_wrapper.component_map)
+        self.__dict__.pop("conditional_evaluation_passes", None)
         return self
 
+    def copy(self) -> FormioConfigurationWrapper:
+        """
+        Create a wrapper for a deep copy of the configuration.
+
+        Mutating the components of the copy or adding other wrappers to it does not
+        affect this wrapper. The component lookups are carried over to the copied
+        components, rather than being rebuilt.
+        """
+        memo: dict[int, Any] = {}
+        configuration = deepcopy(self._configuration, memo)
+        wrapper = self.__class__(
+            configuration, validate_unique_keys=self.validate_unique_keys
+        )
+        wrapper._cached_component_map = {
+            # components outside the configuration tree (e.g. of an editgrid) are
+            # copied on their own
+            key: memo[id(component)] if id(component) in memo else deepcopy(component)
+            for key, component in self.component_map.items()
+        }
+        if self._flattened_by_path is not None:
+            wrapper._flattened_by_path = {
+                path: memo[id(component)]
+                for path, component in self._flattened_by_path.items()
+            }
+        return wrapper
+
     @property
     def configuration(self) -> FormioConfiguration:
         return self._configuration
@@ -154,6 +275,18 @@ class FormioConfigurationWrapper:
             }
         return self._reverse_flattened
 
+    @cached_property
+    def conditional_evaluation_passes(self) -> int | None:
+        """
+        The number of visibility processing passes required to resolve all
+        conditionals, or ``None`` if they must be processed until the data converges.
+
+        See :func:`openforms.formio.visibility.get_conditional_evaluation_passes`.
+        """
+        from .visibility import get_conditional_evaluation_passes
+
+        return get_conditional_evaluation_passes(self)
+
     def is_visible_in_frontend(self, key: str, values: FormioData) -> bool:
         config_path = self.reverse_flattened[key]
         path_bits = [".".join(bit) for bit in RE_PATH.findall(config_path)]
@@ -180,6 +313,28 @@ class FormioConfigurationWrapper:
         }
 
 
+# Types of (variable) values that are never mutated in place, and can thus be shared
+# between copies of the data.
+IMMUTABLE_VALUE_TYPES = frozenset(
+    {str, int, float, bool, type(None), Decimal, date, datetime, time, timedelta}
+)
+
+
+@lru_cache(maxsize=4096)
+def _split_key(key: str) -> tuple[str, ...]:
+    return tuple(key.split("."))
+
+
+def _copy_value(value: Any) -> Any:
+    if type(value) in IMMUTABLE_VALUE_TYPES:
+        return value
+    if type(value) is dict:
+        return {key: _copy_value(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_value(item) for item in value]
+    return deepcopy(value)
+
+
 class FormioData(UserDict):
     """
     Handle formio (submission) data transparently.
@@ -225,7 +380,7 @@ class FormioData(UserDict):
 
         value = self.data
         raise_error = False
-        for k in key.split("."):
+        for k in _split_key(key):
             if isinstance(value, dict):
                 try:
                     value = value[k]
@@ -258,7 +413,7 @@ class FormioData(UserDict):
             return
 
         data = self.data
-        key_list = key.split(".")
+        key_list = _split_key(key)
         for k in key_list[:-1]:
             if isinstance(data, dict):
                 child = data.get(k, None)
@@ -292,7 +447,7 @@ class FormioData(UserDict):
             return key in self.data
 
         value = self.data
-        for k in key.split("."):
+        for k in _split_key(key):
             if isinstance(value, dict):
                 try:
                     value = value[k]
@@ -340,3 +495,34 @@ class FormioData(UserDict):
                 raise error
         else:
             raise error
+
+    def snapshot(self) -> Self:
+        """
+        Take a copy of the data that is not affected by mutations of this instance.
+
+        This is equivalent to, but a lot cheaper than, :func:`copy.deepcopy`. Immutable
+        values are shared between the copies, only the containers (the nested data of
+        editgrids, selectboxes, file uploads...) are copied.
+        """
+        snapshot = self.__class__()
+        snapshot.data = _copy_value(self.data)
+        return snapshot
+
+    def __deepcopy__(self, memo) -> Self:
+        return self.snapshot()
+
+    def diff(self, other: FormioData) -> set[str]:
+        """
+        Get the top-level keys of which the values differ from the other data.
+
+        Keys that are only present in one of both are included. Values that are
+        shared by both (like the immutable values of a snapshot) are not compared.
+        """
+        data, other_data = self.data, other.data
+        changed = data.keys() ^ other_data.keys()
+        for key in data.keys() & other_data.keys():
+            if (value := data[key]) is not (other_value := other_data[key]) and (
+                value != other_value
+            ):
+                changed.add(key)
+        return changed
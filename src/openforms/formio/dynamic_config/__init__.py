@@ -4,12 +4,15 @@ Implement component-specific dynamic configuration based on (submission) state.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any
 
 from rest_framework.request import Request
 
 from ..datastructures import FormioConfigurationWrapper, FormioData
 from ..registry import register
+from ..typing import FormioConfiguration
+from ..utils import flatten_by_path
 
 if TYPE_CHECKING:
     from openforms.submissions.models import Submission
@@ -17,6 +20,12 @@ if TYPE_CHECKING:
 
 __all__ = ["rewrite_formio_components"]
 
+# the (top level) properties changed by localization, by component path
+type LocalizedProperties = dict[str, dict[str, Any]]
+
+# the properties holding the nested components, which are compared by their own path
+CONTAINER_PROPERTIES = ("components", "columns", "rows")
+
 
 def rewrite_formio_components(
     configuration_wrapper: FormioConfigurationWrapper,
@@ -35,7 +44,11 @@ def rewrite_formio_components(
     :param data: key-value mapping of variable name to variable value. If a submission
       context is available, the variables of the submission are included here.
     """
+    # circular import
+    from .reference_lists import prefetch_options_from_reference_lists
+
     data = data or FormioData()  # normalize
+    prefetch_options_from_reference_lists(configuration_wrapper)
     for component in configuration_wrapper:
         register.update_config(component, submission=submission, data=data)
     return configuration_wrapper
@@ -81,3 +94,68 @@ def localize_components(
         register.localize_component(
             component, language_code=language_code, enabled=enabled
         )
+
+
+def get_localized_properties(
+    configuration: FormioConfiguration, language_code: str, enabled: bool = True
+) -> LocalizedProperties:
+    """
+    Determine the component properties that change by localizing the configuration.
+
+    Localization only (re)places top level properties of the components, which is
+    captured by the changed properties of every component path. The nested components
+    of a container are compared by their own path, so the container itself only records
+    its own properties.
+    """
+    localized = FormioConfigurationWrapper(deepcopy(configuration))
+    get_translated_custom_error_messages(localized, language_code)
+    localize_components(localized, language_code, enabled=enabled)
+
+    original = flatten_by_path(configuration)
+    localized_properties: LocalizedProperties = {}
+    for path, component in localized.flattened_by_path.items():
+        original_component = original[path]
+        changed = {
+            prop: value
+            for prop, value in component.items()
+            if prop not in CONTAINER_PROPERTIES
+            if prop not in original_component or original_component[prop] != value
+        }
+        if changed:
+            localized_properties[path] = changed
+    return localized_properties
+
+
+def localize_configuration(
+    configuration_wrapper: FormioConfigurationWrapper,
+    language_code: str,
+    enabled: bool = True,
+) -> FormioConfigurationWrapper:
+    """
+    Apply the custom error messages and translations for the language.
+
+    For the wrapper of a stored configuration, the localized properties are computed
+    once and shared between requests. Localizing a configuration again has no effect.
+
+    .. note:: this function mutates the configuration.
+    """
+    from ..caching import get_cached_localized_properties  # circular import
+
+    if configuration_wrapper.localized:
+        return configuration_wrapper
+
+    if configuration_wrapper.configuration_hash is None:
+        get_translated_custom_error_messages(configuration_wrapper, language_code)
+        localize_components(configuration_wrapper, language_code, enabled=enabled)
+    else:
+        localized_properties = get_cached_localized_properties(
+            configuration_wrapper, language_code, enabled=enabled
+        )
+        components = configuration_wrapper.flattened_by_path
+        for path, properties in localized_properties.items():
+            # update the (indexed) component in place, the cached values may not be
+            # mutated by processing the configuration
+            components[path].update(deepcopy(properties))
+
+    configuration_wrapper.localized = True
+    return configuration_wrapper
@@ -1,17 +1,43 @@
-from django.utils.translation import gettext as _
+from django.utils.translation import get_language, gettext as _
 
 from glom import glom
 from requests.exceptions import RequestException
-from zgw_consumers.client import build_client
 from zgw_consumers.models import Service
 
-from openforms.contrib.reference_lists.client import ReferenceListsClient
+from openforms.contrib.reference_lists.caching import (
+    claim_refresh,
+    get_reference_list,
+    prefetch_reference_lists,
+)
 from openforms.logging import audit_logger
 from openforms.submissions.models import Submission
 
+from ..constants import DataSrcOptions
+from ..datastructures import FormioConfigurationWrapper
 from ..typing import Component
 
 
+def prefetch_options_from_reference_lists(
+    configuration_wrapper: FormioConfigurationWrapper,
+) -> None:
+    """
+    Retrieve the tables of all the components using reference lists in one go.
+
+    The results are cached, so that the options of the individual components can be
+    looked up without calling the API.
+    """
+    keys = {
+        (service_slug, code)
+        for component in configuration_wrapper
+        if glom(component, "openForms.dataSrc", default=None)
+        == DataSrcOptions.reference_lists
+        and (service_slug := glom(component, "openForms.service", default=None))
+        and (code := glom(component, "openForms.code", default=None))
+    }
+    if keys:
+        prefetch_reference_lists(keys, language=get_language())
+
+
 def fetch_options_from_reference_lists(
     component: Component, submission: Submission
 ) -> list[tuple[str, str]] | None:
@@ -39,8 +65,9 @@ def fetch_options_from_reference_lists(
         )
         return
 
+    language = get_language()
     try:
-        service = Service.objects.get(slug=service_slug)
+        reference_list = get_reference_list(service_slug, code, language)
     except Service.DoesNotExist:
         audit_log.warning(
             "form_configuration_error",
@@ -50,17 +77,6 @@ def fetch_options_from_reference_lists(
             ).format(service_slug=service_slug),
         )
         return
-
-    try:
-        with build_client(service, client_factory=ReferenceListsClient) as client:
-            # check if the table is valid (we don't want to show the possible valid
-            # options of an invalid table)
-            table = client.get_table(code)
-            if table:
-                if table.expires_on and table.is_expired:
-                    return []
-
-            items = client.get_items_for_table_cached(code)
     except RequestException as exc:
         audit_log.warning(
             "reference_lists_failure_response",
@@ -70,16 +86,26 @@ def fetch_options_from_reference_lists(
             exc_info=exc,
         )
         return
-    else:
-        if not items:
-            audit_log.warning(
-                "reference_lists_failure_response",
-                error_message=_("No results found from ReferenceLists API."),
-            )
-            return
 
-        return [
-            (item.code, item.name)
-            for item in items
-            if not item.expires_on or not item.is_expired
-        ]
+    if reference_list.should_refresh and claim_refresh(service_slug, code, language):
+        from ..tasks import refresh_reference_list  # circular import
+
+        refresh_reference_list.delay(service_slug, code, language)
+
+    # check if the table is valid (we don't want to show the possible valid options of
+    # an invalid table)
+    if (table := reference_list.table) and table.expires_on and table.is_expired:
+        return []
+
+    if not (items := reference_list.items):
+        audit_log.warning(
+            "reference_lists_failure_response",
+            error_message=_("No results found from ReferenceLists API."),
+        )
+        return
+
+    return [
+        (item.code, item.name)
+        for item in items
+        if not item.expires_on or not item.is_expired
+    ]
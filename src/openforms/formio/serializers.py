@@ -8,12 +8,23 @@ https://github.com/formio/formio.js/blob/4.13.x/src/validator/Validator.js.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import copy
+import dataclasses
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from itertools import count
+from threading import Lock
 from typing import TYPE_CHECKING
 
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.translation import get_language
+
 import structlog
 from glom import assign, glom
 from rest_framework import serializers
+from rest_framework.utils.serializer_helpers import BindingDict
 
 from openforms.formio.typing.base import FormioConfiguration
 
@@ -28,6 +39,20 @@ logger = structlog.stdlib.get_logger(__name__)
 
 type FieldOrNestedFields = serializers.Field | dict[str, "FieldOrNestedFields"]
 
+COMPILED_FIELDS_CACHE_SIZE = 512
+# properties of the components that don't affect their serializer field
+NON_VALIDATION_PROPERTIES = frozenset(
+    {
+        "conditional",
+        "defaultValue",
+        "description",
+        "hidden",
+        "label",
+        "placeholder",
+        "tooltip",
+    }
+)
+
 
 class StepDataSerializer(serializers.Serializer):
     def apply_hidden_state(
@@ -137,25 +162,203 @@ def dict_to_serializer(
     return serializer
 
 
+type CompiledFields = tuple[tuple[str, serializers.Field], ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class _CompiledFieldsKey:
+    fingerprint: str
+    register: ComponentRegistry
+    language: str
+
+
+@dataclasses.dataclass(frozen=True)
+class _Baseline:
+    """
+    The components of a stored configuration that the dynamic parts are compared to.
+    """
+
+    # distinguishes the baselines of the same configuration, as a baseline may be
+    # evicted and replaced by the components of another request
+    token: int
+    # deep copies of the (non-layout) components
+    components: list[Component]
+
+
+class _LRUCache[K, V]:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            if (value := self._items.get(key)) is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            if len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_compiled_fields = _LRUCache[_CompiledFieldsKey, CompiledFields](
+    max_size=COMPILED_FIELDS_CACHE_SIZE
+)
+_baselines = _LRUCache[tuple[str, str], _Baseline](max_size=COMPILED_FIELDS_CACHE_SIZE)
+_baseline_tokens = count()
+
+
+def _get_relevant_properties(component: Component) -> dict[str, object]:
+    return {
+        key: value
+        for key, value in component.items()
+        if key not in NON_VALIDATION_PROPERTIES
+    }
+
+
+def _iter_field_components(components: Sequence[Component]) -> Iterator[Component]:
+    config: FormioConfiguration = {"components": components}
+    for component in iter_components(config, recurse_into_editgrid=False):
+        if not is_layout_component(component):
+            yield component
+
+
+def get_validation_fingerprint(components: Sequence[Component]) -> str:
+    """
+    Hash the properties of the components that determine their serializer fields.
+
+    The properties that are only relevant for the hidden state or the presentation of
+    the (top level) components are left out, so that the compiled fields can be shared
+    by different submissions and logic outcomes.
+    """
+    relevant = [
+        _get_relevant_properties(component)
+        for component in _iter_field_components(components)
+    ]
+    encoded = json.dumps(relevant, sort_keys=True, cls=DjangoJSONEncoder)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _get_dynamic_fingerprint(
+    components: Sequence[Component], configuration_hash: str, language: str
+) -> str:
+    """
+    Fingerprint the components of a stored configuration by the parts that changed.
+
+    Logic, localization and the dynamic configuration only change some components of
+    the stored configuration. Rather than hashing the complete component tree on every
+    request, only the components that differ from the baseline of the configuration
+    (the components of the first request) are hashed.
+    """
+    baseline_key = (configuration_hash, language)
+    field_components = list(_iter_field_components(components))
+    if (baseline := _baselines.get(baseline_key)) is None:
+        baseline = _Baseline(
+            token=next(_baseline_tokens),
+            components=copy.deepcopy(field_components),
+        )
+        _baselines.set(baseline_key, baseline)
+    # the structure is determined by the configuration, this only happens when the
+    # configuration was replaced without updating its hash
+    elif [component["key"] for component in field_components] != [
+        component["key"] for component in baseline.components
+    ]:
+        return get_validation_fingerprint(components)
+
+    changed: list[tuple[int, dict[str, object]]] = []
+    for index, (component, base_component) in enumerate(
+        zip(field_components, baseline.components, strict=True)
+    ):
+        if component == base_component:
+            continue
+        relevant = _get_relevant_properties(component)
+        if relevant != _get_relevant_properties(base_component):
+            changed.append((index, relevant))
+    encoded = json.dumps(changed, sort_keys=True, cls=DjangoJSONEncoder)
+    digest = hashlib.sha256(encoded.encode()).hexdigest()
+    return f"{configuration_hash}:{baseline.token}:{digest}"
+
+
+def _compile_fields(
+    components: Sequence[Component], register: ComponentRegistry
+) -> CompiledFields:
+    return tuple(
+        (component["key"], register.build_serializer_field(component))
+        for component in _iter_field_components(components)
+    )
+
+
+def _clone_field[F: serializers.Field](field: F) -> F:
+    """
+    Copy a compiled (unbound) field, so it can be bound and mutated for a request.
+    """
+    clone = copy.copy(field)
+    # reset the state from binding the field
+    clone.source = field._kwargs.get("source")
+    clone.label = field._kwargs.get("label")
+    # nested serializers may have fields added after construction (e.g. the options of
+    # the selectboxes), so the fields are copied rather than recreated from the
+    # declared fields
+    if isinstance(field, serializers.Serializer) and "fields" in field.__dict__:
+        clone.fields = BindingDict(clone)  # pyright: ignore[reportAttributeAccessIssue]
+        for name, nested_field in field.fields.items():
+            clone.fields[name] = _clone_field(nested_field)
+    # list fields and list serializers bind their child to themselves
+    if isinstance(child := getattr(field, "child", None), serializers.Field):
+        clone_child = _clone_field(child)
+        clone_child.bind(field_name="", parent=clone)
+        clone.child = clone_child  # pyright: ignore[reportAttributeAccessIssue]
+    return clone
+
+
 def build_serializer(
-    components: Sequence[Component], register: ComponentRegistry, **kwargs
+    components: Sequence[Component],
+    register: ComponentRegistry,
+    configuration_hash: str = "",
+    **kwargs,
 ) -> StepDataSerializer:
     """
     Translate a sequence of Formio.js component definitions into a serializer.
 
     This recursively builds up the serializer fields for each (nested) component and
     puts them into a serializer instance ready for validation.
-    """
-    fields: dict[str, FieldOrNestedFields] = {}
 
-    config: FormioConfiguration = {"components": components}
-    for component in iter_components(config, recurse_into_editgrid=False):
-        if is_layout_component(component):
-            continue
+    The fields are compiled once per validation fingerprint and language, and copied
+    for every serializer. The hidden state of the components is applied to the copies.
 
-        field = register.build_serializer_field(component)
-        assign(obj=fields, path=component["key"], val=field, missing=dict)
+    :param configuration_hash: The hash of the stored configuration the components are
+      derived from, if any. The fingerprint is then based on the hash and the
+      components that differ from it, rather than on all components.
+    """
+    language = get_language()
+    key = _CompiledFieldsKey(
+        fingerprint=(
+            _get_dynamic_fingerprint(components, configuration_hash, language)
+            if configuration_hash
+            else get_validation_fingerprint(components)
+        ),
+        register=register,
+        language=language,
+    )
+    if (compiled_fields := _compiled_fields.get(key)) is None:
+        # the fields may hold on to (parts of) the components, so they must not be
+        # affected by changes to the configuration of a particular request
+        compiled_fields = _compile_fields(copy.deepcopy(components), register)
+        _compiled_fields.set(key, compiled_fields)
+
+    fields: dict[str, FieldOrNestedFields] = {}
+    for component_key, compiled_field in compiled_fields:
+        field = _clone_field(compiled_field)
+        assign(obj=fields, path=component_key, val=field, missing=dict)
 
     serializer = dict_to_serializer(fields, **kwargs)
-    serializer.apply_hidden_state(config, fields)
+    serializer.apply_hidden_state({"components": components}, fields)
     return serializer
@@ -19,10 +19,12 @@ from opentelemetry import trace
 
 from openforms.typing import JSONObject
 
+from .caching import get_configuration_wrapper
 from .datastructures import DuplicateKeyError, FormioConfigurationWrapper, FormioData
 from .dynamic_config import (
     get_translated_custom_error_messages,
     localize_components,
+    localize_configuration,
     rewrite_formio_components,
     rewrite_formio_components_for_request,
 )
@@ -41,7 +43,7 @@ from .utils import (
     iterate_data_with_components,
 )
 from .variables import extract_variables_from_template_properties, inject_variables
-from .visibility import process_visibility
+from .visibility import get_conditional_evaluation_passes, process_visibility
 
 if TYPE_CHECKING:
     from openforms.submissions.models import Submission
@@ -56,14 +58,18 @@ __all__ = [
     "format_value",
     "rewrite_formio_components_for_request",
     "FormioConfigurationWrapper",
+    "get_configuration_wrapper",
     "FormioData",
     "iterate_data_with_components",
     "build_serializer",
     "rewrite_formio_components",
     "as_json_schema",
     "process_visibility",
+    "get_conditional_evaluation_passes",
     "get_component_empty_value",
     "get_readable_path_from_configuration_path",
+    "get_translated_custom_error_messages",
+    "localize_components",
 ]
 
 tracer = trace.get_tracer("openforms.formio.service")
@@ -108,16 +114,17 @@ def get_dynamic_configuration(
     # Avoid circular imports
     from openforms.prefill.service import inject_prefill
 
-    rewrite_formio_components(config_wrapper, submission=submission, data=data)
-
-    # Add to each component the custom errors in the current locale
-    get_translated_custom_error_messages(config_wrapper, submission.language_code)
-    localize_components(
+    # Add to each component the custom errors and translations in the current locale.
+    # This only depends on the static configuration, so it is done before the dynamic
+    # rewrites (which replace the options etc.) to be able to share the result.
+    localize_configuration(
         config_wrapper,
         submission.language_code,
         enabled=submission.form.translation_enabled,
     )
 
+    rewrite_formio_components(config_wrapper, submission=submission, data=data)
+
     # prefill is still 'special' even though it uses variables, as we specifically
     # set the `defaultValue` key to the resulting variable.
     # This *could* be refactored in the future by assigning a template expression to
@@ -131,6 +138,7 @@ def get_dynamic_configuration(
 def build_serializer(
     components: Sequence[Component],
     _register: ComponentRegistry | None = None,
+    configuration_hash: str = "",
     **kwargs,
 ):
     """
@@ -138,8 +146,16 @@ def build_serializer(
 
     This recursively builds up the serializer fields for each (nested) component and
     puts them into a serializer instance ready for validation.
+
+    :param configuration_hash: The hash of the stored configuration the components are
+      derived from, if any. It is used to share the compiled fields more cheaply.
     """
-    return _build_serializer(components, register=_register or register, **kwargs)
+    return _build_serializer(
+        components,
+        register=_register or register,
+        configuration_hash=configuration_hash,
+        **kwargs,
+    )
 
 
 def as_json_schema(
@@ -0,0 +1,25 @@
+import structlog
+from requests.exceptions import RequestException
+from zgw_consumers.models import Service
+
+from openforms.celery import app
+from openforms.contrib.reference_lists import caching as reference_lists_caching
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@app.task(ignore_result=True)
+def refresh_reference_list(service_slug: str, code: str, language: str) -> None:
+    """
+    Refresh the cached reference list table used for the options of components.
+    """
+    try:
+        reference_lists_caching.refresh_reference_list(service_slug, code, language)
+    except (Service.DoesNotExist, RequestException) as exc:
+        logger.warning(
+            "reference_lists.refresh_failed",
+            service=service_slug,
+            code=code,
+            language=language,
+            exc_info=exc,
+        )
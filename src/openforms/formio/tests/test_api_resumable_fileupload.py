@@ -0,0 +1,274 @@
+import base64
+import hashlib
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.utils.translation import gettext as _
+
+import clamd
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from openforms.config.models import GlobalConfiguration
+from openforms.submissions.attachments import temporary_upload_from_url
+from openforms.submissions.models import PartialFileUpload
+from openforms.submissions.models.submission_files import CHUNK_TIMEOUT
+from openforms.submissions.tests.factories import SubmissionFactory
+from openforms.submissions.tests.mixins import SubmissionsMixin
+
+from ..api.views import CHUNK_CONTENT_TYPE
+
+TEST_FILES = Path(__file__).parent.resolve() / "files"
+
+
+@temp_private_root()
+@override_settings(LANGUAGE_CODE="en")
+class ResumableFileUploadTests(SubmissionsMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.submission = SubmissionFactory.create()
+        cls.submission_url = reverse(
+            "api:submission-detail", kwargs={"uuid": cls.submission.uuid}
+        )
+
+    def setUp(self):
+        super().setUp()
+        self._add_submission_to_session(self.submission)
+
+    def tearDown(self):
+        self._clear_session()
+
+    def _start_upload(self, name: str, content: bytes, content_type: str) -> str:
+        response = self.client.post(
+            reverse("api:formio:partial-file-upload-list"),
+            {
+                "submission": self.submission_url,
+                "name": name,
+                "size": len(content),
+                "type": content_type,
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.json()["url"]
+
+    def _send_chunk(self, url: str, chunk: bytes, offset: int, **headers):
+        return self.client.patch(
+            url,
+            chunk,
+            content_type=CHUNK_CONTENT_TYPE,
+            HTTP_UPLOAD_OFFSET=str(offset),
+            **headers,
+        )
+
+    def test_upload_in_chunks(self):
+        content = (TEST_FILES / "image-256x256.png").read_bytes()
+        url = self._start_upload("image.png", content, "image/png")
+
+        response = self._send_chunk(url, content[:100], offset=0)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(response["Upload-Offset"], "100")
+        self.assertEqual(response["Upload-Length"], str(len(content)))
+
+        # resume the upload
+        response = self.client.head(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Upload-Offset"], "100")
+
+        response = self._send_chunk(url, content[100:], offset=100)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(body["name"], "image.png")
+        self.assertEqual(body["size"], len(content))
+        upload = temporary_upload_from_url(body["url"])
+        assert upload is not None
+        self.assertEqual(upload.submission, self.submission)
+        self.assertEqual(upload.content_type, "image/png")
+        self.assertEqual(upload.content.read(), content)
+        self.assertFalse(PartialFileUpload.objects.exists())
+
+    def test_offset_mismatch(self):
+        url = self._start_upload("my-file.txt", b"my content", "text/plain")
+
+        response = self._send_chunk(url, b"content", offset=3)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        upload = PartialFileUpload.objects.get()
+        self.assertEqual(upload.offset, 0)
+
+    def test_chunk_in_progress(self):
+        url = self._start_upload("my-file.txt", b"my content", "text/plain")
+        upload = PartialFileUpload.objects.get()
+        assert upload.claim_chunk(0)
+
+        response = self._send_chunk(url, b"my content", offset=0)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        with self.subTest("claim expired"):
+            with patch(
+                "django.utils.timezone.now",
+                return_value=upload.chunk_started_on + CHUNK_TIMEOUT * 2,
+            ):
+                response = self._send_chunk(url, b"my content", offset=0)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with self.subTest("superseded chunk is not committed"):
+            self.assertFalse(upload.commit_chunk(10))
+
+    def test_file_name_is_sanitized(self):
+        response = self.client.post(
+            reverse("api:formio:partial-file-upload-list"),
+            {
+                "submission": self.submission_url,
+                "name": "../../my-file.txt",
+                "size": 10,
+                "type": "text/plain",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        upload = PartialFileUpload.objects.get()
+        self.assertEqual(upload.file_name, "my-file.txt")
+
+    def test_chunk_larger_than_announced_size(self):
+        url = self._start_upload("my-file.txt", b"my content", "text/plain")
+
+        response = self._send_chunk(url, b"my content is too long", offset=0)
+
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        upload = PartialFileUpload.objects.get()
+        self.assertEqual(upload.offset, 0)
+        self.assertEqual(upload.content.read(), b"")
+
+    def test_checksum(self):
+        url = self._start_upload("my-file.txt", b"my content", "text/plain")
+
+        with self.subTest("mismatch"):
+            digest = base64.b64encode(hashlib.sha256(b"other").digest()).decode()
+
+            response = self._send_chunk(
+                url, b"my ", offset=0, HTTP_UPLOAD_CHECKSUM=f"sha256 {digest}"
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(
+                response.content.decode(),
+                _("The checksum of the chunk does not match."),
+            )
+            self.assertEqual(PartialFileUpload.objects.get().offset, 0)
+
+        with self.subTest("match"):
+            digest = base64.b64encode(hashlib.sha256(b"my ").digest()).decode()
+
+            response = self._send_chunk(
+                url, b"my ", offset=0, HTTP_UPLOAD_CHECKSUM=f"sha256 {digest}"
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+            self.assertEqual(response["Upload-Offset"], "3")
+
+        with self.subTest("unsupported algorithm"):
+            response = self._send_chunk(
+                url, b"content", offset=3, HTTP_UPLOAD_CHECKSUM="md5 abc="
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(PartialFileUpload.objects.get().offset, 3)
+
+    def test_wrong_content_type(self):
+        url = self._start_upload("my-file.txt", b"my content", "text/plain")
+
+        response = self.client.patch(
+            url, b"my content", content_type="text/plain", HTTP_UPLOAD_OFFSET="0"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+    @override_settings(MAX_FILE_UPLOAD_SIZE=10)
+    def test_announced_size_too_large(self):
+        response = self.client.post(
+            reverse("api:formio:partial-file-upload-list"),
+            {
+                "submission": self.submission_url,
+                "name": "my-file.txt",
+                "size": 11,
+                "type": "text/plain",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertFalse(PartialFileUpload.objects.exists())
+
+    def test_content_inconsistent_with_mime_type(self):
+        url = self._start_upload("pixel.png", b"GIF89a", "image/png")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self._send_chunk(url, b"GIF89a", offset=0)
+
+        self.assertContains(
+            response,
+            _("The provided file is not a {file_type}.").format(file_type=".png"),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertFalse(PartialFileUpload.objects.exists())
+
+    def test_msg_mimetype_override(self):
+        content = (TEST_FILES / "sample.msg").read_bytes()
+        url = self._start_upload("sample.msg", content, "application/octet-stream")
+
+        response = self._send_chunk(url, content, offset=0)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        upload = temporary_upload_from_url(response.json()["url"])
+        assert upload is not None
+        self.assertEqual(upload.content_type, "application/vnd.ms-outlook")
+
+    @patch("openforms.formio.api.validators.GlobalConfiguration.get_solo")
+    def test_file_contains_virus(self, m_config):
+        m_config.return_value = GlobalConfiguration(enable_virus_scan=True)
+        url = self._start_upload("my-file.txt", b"my content", "text/plain")
+
+        with patch.object(
+            clamd.ClamdNetworkSocket,
+            "instream",
+            return_value={"stream": ("FOUND", "Win.Test.EICAR_HDB-1")},
+        ):
+            response = self._send_chunk(url, b"my content", offset=0)
+
+        self.assertContains(
+            response,
+            "File did not pass the virus scan. It was found to contain "
+            "'Win.Test.EICAR_HDB-1'.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    def test_owns_submission(self):
+        url = self._start_upload("my-file.txt", b"my content", "text/plain")
+        other_submission = SubmissionFactory.create()
+        self._clear_session()
+        self._add_submission_to_session(other_submission)
+
+        with self.subTest("resume"):
+            response = self.client.head(url)
+
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        with self.subTest("upload chunk"):
+            response = self._send_chunk(url, b"my content", offset=0)
+
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_cancel_upload(self):
+        url = self._start_upload("my-file.txt", b"my content", "text/plain")
+
+        response = self.client.delete(url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(PartialFileUpload.objects.exists())
@@ -0,0 +1,180 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from ..caching import (
+    _component_indexes,
+    _localized_properties,
+    get_configuration_wrapper,
+)
+from ..datastructures import FormioConfigurationWrapper
+from ..dynamic_config import (
+    get_translated_custom_error_messages,
+    localize_components,
+    localize_configuration,
+)
+from ..typing import FormioConfiguration
+
+
+def _get_configuration() -> FormioConfiguration:
+    return {
+        "components": [
+            {
+                "type": "fieldset",
+                "key": "fieldset",
+                "label": "Fieldset",
+                "components": [
+                    {"type": "textfield", "key": "textfield", "label": "Text field"}
+                ],
+            }
+        ]
+    }
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class ConfigurationWrapperCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        _component_indexes.clear()
+        self.addCleanup(_component_indexes.clear)
+        self.addCleanup(cache.clear)
+
+    def test_index_is_shared_between_configuration_instances(self):
+        wrapper1 = get_configuration_wrapper(_get_configuration(), "hash")
+        configuration = _get_configuration()
+
+        wrapper2 = get_configuration_wrapper(configuration, "hash")
+
+        self.assertIsNot(wrapper1.configuration, wrapper2.configuration)
+        self.assertIs(
+            wrapper2["textfield"], configuration["components"][0]["components"][0]
+        )
+        self.assertEqual(
+            wrapper2.reverse_flattened,
+            {"fieldset": "components.0", "textfield": "components.0.components.0"},
+        )
+
+    def test_index_is_loaded_from_cache(self):
+        get_configuration_wrapper(_get_configuration(), "hash")
+        # simulate another worker process
+        _component_indexes.clear()
+
+        wrapper = get_configuration_wrapper(_get_configuration(), "hash")
+
+        self.assertIn("hash", _component_indexes)
+        self.assertIn("textfield", wrapper)
+
+    def test_stale_index_is_replaced(self):
+        get_configuration_wrapper(_get_configuration(), "hash")
+        configuration = _get_configuration()
+        configuration["components"][0]["components"][0]["key"] = "renamed"
+
+        wrapper = get_configuration_wrapper(configuration, "hash")
+
+        self.assertIn("renamed", wrapper)
+        self.assertNotIn("textfield", wrapper)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class LocalizedPropertiesCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        _component_indexes.clear()
+        self.addCleanup(_component_indexes.clear)
+        _localized_properties.clear()
+        self.addCleanup(_localized_properties.clear)
+        self.addCleanup(cache.clear)
+
+    @staticmethod
+    def _get_configuration() -> FormioConfiguration:
+        configuration = _get_configuration()
+        configuration["components"][0]["components"][0].update(
+            {
+                "translatedErrors": {
+                    "en": {"required": "Required!"},
+                    "nl": {"required": "Verplicht!"},
+                },
+                "openForms": {
+                    "translations": {
+                        "en": {"label": "Text field"},
+                        "nl": {"label": "Tekstveld"},
+                    }
+                },
+            }
+        )
+        return configuration
+
+    def test_localization_is_equal_to_uncached_localization(self):
+        configuration = self._get_configuration()
+        localize_components(FormioConfigurationWrapper(configuration), "nl")
+        get_translated_custom_error_messages(
+            FormioConfigurationWrapper(configuration), "nl"
+        )
+        # warm the cache
+        localize_configuration(
+            get_configuration_wrapper(self._get_configuration(), "hash"), "nl"
+        )
+
+        wrapper = get_configuration_wrapper(self._get_configuration(), "hash")
+        localize_configuration(wrapper, "nl")
+
+        self.assertEqual(wrapper.configuration, configuration)
+        self.assertEqual(wrapper["textfield"]["label"], "Tekstveld")
+        self.assertEqual(wrapper["textfield"]["errors"], {"required": "Verplicht!"})
+        self.assertEqual(list(_localized_properties), [("hash", "nl", True)])
+
+    def test_cached_properties_are_not_shared(self):
+        wrapper1 = get_configuration_wrapper(self._get_configuration(), "hash")
+        localize_configuration(wrapper1, "nl")
+        wrapper1["textfield"]["errors"]["required"] = "Changed"
+
+        wrapper2 = get_configuration_wrapper(self._get_configuration(), "hash")
+        localize_configuration(wrapper2, "nl")
+
+        self.assertEqual(wrapper2["textfield"]["errors"], {"required": "Verplicht!"})
+
+    def test_localized_per_language(self):
+        wrapper1 = get_configuration_wrapper(self._get_configuration(), "hash")
+        localize_configuration(wrapper1, "nl")
+        wrapper2 = get_configuration_wrapper(self._get_configuration(), "hash")
+        localize_configuration(wrapper2, "en")
+
+        self.assertEqual(wrapper1["textfield"]["label"], "Tekstveld")
+        self.assertEqual(wrapper2["textfield"]["label"], "Text field")
+
+    def test_localize_again_has_no_effect(self):
+        wrapper = get_configuration_wrapper(self._get_configuration(), "hash")
+        localize_configuration(wrapper, "nl")
+        # e.g. a logic action
+        wrapper["textfield"]["label"] = "Changed"
+
+        localize_configuration(wrapper, "nl")
+
+        self.assertEqual(wrapper["textfield"]["label"], "Changed")
+
+    def test_nested_components_stay_indexed(self):
+        # warm the cache
+        localize_configuration(
+            get_configuration_wrapper(self._get_configuration(), "hash"), "nl"
+        )
+        configuration = self._get_configuration()
+        wrapper = get_configuration_wrapper(configuration, "hash")
+
+        localize_configuration(wrapper, "nl")
+        # e.g. prefill or a logic action
+        wrapper["textfield"]["defaultValue"] = "prefilled"
+
+        textfield = configuration["components"][0]["components"][0]
+        self.assertIs(wrapper["textfield"], textfield)
+        self.assertEqual(textfield["label"], "Tekstveld")
+        self.assertEqual(textfield["defaultValue"], "prefilled")
+        # only the translated component itself is changed, not the fieldset
+        self.assertEqual(
+            list(_localized_properties[("hash", "nl", True)]),
+            ["components.0.components.0"],
+        )
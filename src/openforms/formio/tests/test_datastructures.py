@@ -1,12 +1,16 @@
+from copy import deepcopy
+from datetime import date
 from unittest import TestCase
 
 from openforms.formio.typing import Component, EditGridComponent
 
 from ..datastructures import (
+    ComponentIndex,
     DuplicateKeyError,
     FormioConfiguration,
     FormioConfigurationWrapper,
     FormioData,
+    StaleComponentIndex,
 )
 
 
@@ -250,6 +254,57 @@ class FormioDataTests(TestCase):
                 del data["simply.3"]
             self.assertEqual(data["simply"], "lovely")
 
+    def test_snapshot_is_independent(self):
+        data = FormioData(
+            {
+                "textfield": "foo",
+                "date": date(2024, 1, 1),
+                "selectboxes": {"a": True, "b": False},
+                "editgrid": [{"nested": "bar"}],
+            }
+        )
+
+        snapshot = data.snapshot()
+        data["textfield"] = "changed"
+        data["selectboxes.a"] = False
+        data["editgrid.0.nested"] = "changed"
+        data.data["editgrid"].append({"nested": "baz"})
+
+        self.assertIsInstance(snapshot, FormioData)
+        self.assertEqual(
+            snapshot,
+            {
+                "textfield": "foo",
+                "date": date(2024, 1, 1),
+                "selectboxes": {"a": True, "b": False},
+                "editgrid": [{"nested": "bar"}],
+            },
+        )
+        # immutable values are shared
+        self.assertIs(snapshot.data["date"], data.data["date"])
+
+    def test_deepcopy_takes_snapshot(self):
+        data = FormioData({"foo": {"bar": "baz"}})
+
+        copy = deepcopy(data)
+        data["foo.bar"] = "changed"
+
+        self.assertEqual(copy["foo.bar"], "baz")
+
+    def test_diff(self):
+        data = FormioData(
+            {"unchanged": "a", "changed": "b", "nested": {"a": 1}, "removed": 1}
+        )
+        other = data.snapshot()
+
+        other["changed"] = "c"
+        other["nested.a"] = 2
+        other["added"] = True
+        del other["removed"]
+
+        self.assertEqual(data.diff(other), {"changed", "nested", "added", "removed"})
+        self.assertEqual(data.diff(data.snapshot()), set())
+
 
 class FormioConfigurationWrapperTests(TestCase):
     def test_editgrid_lookups_by_key(self):
@@ -319,3 +374,88 @@ class FormioConfigurationWrapperTests(TestCase):
 
         with self.assertRaises(DuplicateKeyError):
             config_wrapper["duplicated.key"]
+
+
+def _get_configuration() -> FormioConfiguration:
+    return {
+        "components": [
+            {"type": "textfield", "key": "textfield", "label": "Text field"},
+            {
+                "type": "columns",
+                "key": "columns",
+                "columns": [
+                    {
+                        "size": 6,
+                        "components": [
+                            {"type": "number", "key": "number", "label": "Number"}
+                        ],
+                    },
+                ],
+            },
+            {
+                "type": "editgrid",
+                "key": "editgrid",
+                "label": "Repeating group",
+                "components": [
+                    {"type": "textfield", "key": "nested", "label": "Nested"},
+                ],
+            },
+        ]
+    }
+
+
+class ComponentIndexTests(TestCase):
+    def test_wrapper_from_index_matches_regular_wrapper(self):
+        index = ComponentIndex.from_wrapper(
+            FormioConfigurationWrapper(_get_configuration())
+        )
+        assert index is not None
+        configuration = _get_configuration()
+
+        wrapper = FormioConfigurationWrapper.from_index(configuration, index)
+        expected = FormioConfigurationWrapper(configuration)
+
+        self.assertEqual(list(wrapper.component_map), list(expected.component_map))
+        for key, component in expected.component_map.items():
+            with self.subTest(key=key):
+                self.assertIs(wrapper[key], component)
+        self.assertEqual(wrapper.flattened_by_path, expected.flattened_by_path)
+        self.assertEqual(wrapper.reverse_flattened, expected.reverse_flattened)
+
+    def test_stale_index(self):
+        index = ComponentIndex.from_wrapper(
+            FormioConfigurationWrapper(_get_configuration())
+        )
+        assert index is not None
+
+        changed_key = _get_configuration()
+        changed_key["components"][0]["key"] = "other"
+        removed_component = _get_configuration()
+        del removed_component["components"][2]["components"][0]
+
+        for configuration in (changed_key, removed_component):
+            with (
+                self.subTest(configuration=configuration),
+                self.assertRaises(StaleComponentIndex),
+            ):
+                FormioConfigurationWrapper.from_index(configuration, index)
+
+    def test_copy_does_not_affect_original(self):
+        configuration = _get_configuration()
+        wrapper = FormioConfigurationWrapper(configuration)
+        other = FormioConfigurationWrapper(
+            {"components": [{"type": "email", "key": "email", "label": "Email"}]}
+        )
+
+        copy = wrapper.copy()
+        copy += other
+
+        self.assertIn("email", copy)
+        self.assertNotIn("email", wrapper)
+        self.assertEqual(len(configuration["components"]), 3)
+
+        with self.subTest("mutating the copied components"):
+            copy["textfield"]["label"] = "Changed"
+
+            self.assertNotEqual(wrapper["textfield"]["label"], "Changed")
+            self.assertIs(copy["textfield"], copy.configuration["components"][0])
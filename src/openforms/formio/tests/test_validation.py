@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.test import SimpleTestCase
 
 from rest_framework.serializers import ValidationError
@@ -5,6 +7,7 @@ from rest_framework.serializers import ValidationError
 from openforms.submissions.tests.factories import SubmissionFactory
 from openforms.typing import JSONObject, JSONValue
 
+from ..serializers import _compile_fields, get_validation_fingerprint
 from ..service import build_serializer
 from ..typing import Component, RadioComponent, TextFieldComponent
 
@@ -104,3 +107,163 @@ class GenericValidationTests(SimpleTestCase):
         self.assertIn("nested", detail["parent"])
         err_code = detail["parent"]["nested"][0].code
         self.assertEqual(err_code, "max_length")
+
+
+class CompiledFieldsTests(SimpleTestCase):
+    def test_fingerprint_ignores_presentation(self):
+        component: TextFieldComponent = {
+            "type": "textfield",
+            "key": "text",
+            "label": "Text",
+            "validate": {"maxLength": 3},
+        }
+        other: TextFieldComponent = {
+            **component,
+            "label": "Other label",
+            "hidden": True,
+            "defaultValue": "foo",
+        }
+
+        self.assertEqual(
+            get_validation_fingerprint([component]),
+            get_validation_fingerprint([other]),
+        )
+
+    def test_fingerprint_includes_validation(self):
+        component: TextFieldComponent = {
+            "type": "textfield",
+            "key": "text",
+            "label": "Text",
+            "validate": {"maxLength": 3},
+        }
+        variants: list[TextFieldComponent] = [
+            {**component, "key": "other"},
+            {**component, "validate": {"maxLength": 4}},
+            {**component, "validate": {"maxLength": 3, "required": True}},
+            {**component, "multiple": True},
+        ]
+
+        for variant in variants:
+            with self.subTest(variant=variant):
+                self.assertNotEqual(
+                    get_validation_fingerprint([component]),
+                    get_validation_fingerprint([variant]),
+                )
+
+    def test_compiled_fields_are_copied(self):
+        component: TextFieldComponent = {
+            "type": "textfield",
+            "key": "text",
+            "label": "Text",
+            "multiple": True,
+            "validate": {"required": True, "maxLength": 3},
+        }
+        hidden: TextFieldComponent = {**component, "hidden": True}
+
+        serializer1 = build_serializer(components=[component], data={})
+        serializer2 = build_serializer(components=[hidden], data={})
+
+        self.assertIsNot(serializer1.fields["text"], serializer2.fields["text"])
+        self.assertIsNot(
+            serializer1.fields["text"].child,  # pyright: ignore[reportAttributeAccessIssue]
+            serializer2.fields["text"].child,  # pyright: ignore[reportAttributeAccessIssue]
+        )
+        # the hidden state of one doesn't leak into the other
+        self.assertFalse(serializer1.is_valid())
+        self.assertTrue(serializer2.is_valid())
+        self.assertFalse(build_serializer(components=[component], data={}).is_valid())
+
+    def test_nested_fields_of_compiled_fields_are_copied(self):
+        component: Component = {
+            "type": "selectboxes",
+            "key": "selectboxes",
+            "label": "Selectboxes",
+            "values": [
+                {"value": "a", "label": "A"},
+                {"value": "b", "label": "B"},
+            ],
+            "validate": {"required": True},
+        }
+        data = {"selectboxes": {"a": True, "b": False}}
+
+        for _ in range(2):
+            serializer = build_serializer(components=[component], data=data)
+
+            self.assertTrue(serializer.is_valid())
+            self.assertEqual(
+                set(serializer.fields["selectboxes"].fields),  # pyright: ignore[reportAttributeAccessIssue]
+                {"a", "b"},
+            )
+
+    def test_fields_are_shared_by_configuration_hash(self):
+        component: TextFieldComponent = {
+            "type": "textfield",
+            "key": "text",
+            "label": "Text",
+            "validate": {"maxLength": 3},
+        }
+        other: TextFieldComponent = {**component, "key": "other"}
+
+        with (
+            patch(
+                "openforms.formio.serializers.get_validation_fingerprint"
+            ) as m_fingerprint,
+            patch(
+                "openforms.formio.serializers._compile_fields",
+                wraps=_compile_fields,
+            ) as m_compile_fields,
+        ):
+            # only the presentation differs
+            serializer1 = build_serializer(
+                components=[component, other],
+                configuration_hash="shared-hash",
+                data={"text": "abcd", "other": "abcd"},
+            )
+            serializer2 = build_serializer(
+                components=[{**component, "label": "Changed"}, other],
+                configuration_hash="shared-hash",
+                data={"text": "abcd", "other": "abcd"},
+            )
+            # logic changed the validation of a component
+            serializer3 = build_serializer(
+                components=[{**component, "validate": {"maxLength": 5}}, other],
+                configuration_hash="shared-hash",
+                data={"text": "abcd", "other": "abcd"},
+            )
+
+        m_fingerprint.assert_not_called()
+        self.assertEqual(m_compile_fields.call_count, 2)
+        self.assertFalse(serializer1.is_valid())
+        self.assertEqual(set(serializer1.errors), {"text", "other"})
+        self.assertFalse(serializer2.is_valid())
+        self.assertEqual(set(serializer2.errors), {"text", "other"})
+        self.assertFalse(serializer3.is_valid())
+        self.assertEqual(set(serializer3.errors), {"other"})
+
+    def test_compiled_fields_do_not_depend_on_the_request_components(self):
+        component: TextFieldComponent = {
+            "type": "textfield",
+            "key": "text",
+            "label": "Text",
+            "validate": {"maxLength": 3},
+        }
+        components: list[Component] = [component]
+
+        build_serializer(components=components, configuration_hash="other-hash")
+        # the request processing mutates its own configuration afterwards
+        component["validate"]["maxLength"] = 10
+
+        serializer = build_serializer(
+            components=[
+                {
+                    "type": "textfield",
+                    "key": "text",
+                    "label": "Text",
+                    "validate": {"maxLength": 3},
+                }
+            ],
+            configuration_hash="other-hash",
+            data={"text": "abcd"},
+        )
+
+        self.assertFalse(serializer.is_valid())
@@ -0,0 +1,138 @@
+from django.test import SimpleTestCase
+
+from openforms.submissions.form_logic import evaluate_conditional_logic
+
+from ..datastructures import FormioConfigurationWrapper, FormioData
+from ..typing import Component
+from ..visibility import get_conditional_evaluation_passes
+
+
+def _textfield(key: str, when: str = "", eq: str = "show") -> Component:
+    component: Component = {"type": "textfield", "key": key, "label": key}
+    if when:
+        component["conditional"] = {"show": True, "when": when, "eq": eq}
+    return component
+
+
+class ConditionalEvaluationPassesTests(SimpleTestCase):
+    def test_no_conditionals(self):
+        wrapper = FormioConfigurationWrapper(
+            {"components": [_textfield("a"), _textfield("b")]}
+        )
+
+        self.assertEqual(get_conditional_evaluation_passes(wrapper), 1)
+
+    def test_triggers_before_dependents(self):
+        wrapper = FormioConfigurationWrapper(
+            {
+                "components": [
+                    _textfield("a"),
+                    _textfield("b", when="a"),
+                    _textfield("c", when="b"),
+                ]
+            }
+        )
+
+        self.assertEqual(get_conditional_evaluation_passes(wrapper), 1)
+
+    def test_triggers_after_dependents(self):
+        wrapper = FormioConfigurationWrapper(
+            {
+                "components": [
+                    _textfield("c", when="b"),
+                    _textfield("b", when="a"),
+                    _textfield("a"),
+                ]
+            }
+        )
+
+        self.assertEqual(get_conditional_evaluation_passes(wrapper), 3)
+
+    def test_nested_components(self):
+        wrapper = FormioConfigurationWrapper(
+            {
+                "components": [
+                    {
+                        "type": "fieldset",
+                        "key": "fieldset",
+                        "label": "Fieldset",
+                        "conditional": {"show": True, "when": "trigger", "eq": "a"},
+                        "components": [_textfield("nested")],
+                    },
+                    {
+                        "type": "editgrid",
+                        "key": "editgrid",
+                        "label": "Editgrid",
+                        "components": [
+                            _textfield("child1"),
+                            _textfield("child2", when="editgrid.child1"),
+                        ],
+                    },
+                    _textfield("trigger"),
+                ]
+            }
+        )
+
+        # the fieldset trigger is processed after the fieldset, the edit grid children
+        # are processed in order
+        self.assertEqual(get_conditional_evaluation_passes(wrapper), 2)
+
+    def test_cycles(self):
+        configurations = [
+            [_textfield("a", when="a")],
+            [_textfield("a", when="b"), _textfield("b", when="a")],
+            [
+                {
+                    "type": "fieldset",
+                    "key": "fieldset",
+                    "label": "Fieldset",
+                    "conditional": {"show": True, "when": "nested", "eq": "a"},
+                    "components": [_textfield("nested")],
+                }
+            ],
+        ]
+
+        for components in configurations:
+            with self.subTest(components=components):
+                wrapper = FormioConfigurationWrapper({"components": components})
+
+                self.assertIsNone(get_conditional_evaluation_passes(wrapper))
+
+    def test_unknown_trigger(self):
+        wrapper = FormioConfigurationWrapper(
+            {"components": [_textfield("a", when="unknown")]}
+        )
+
+        self.assertIsNone(get_conditional_evaluation_passes(wrapper))
+
+    def test_same_result_as_iterative_evaluation(self):
+        configuration = {
+            "components": [
+                _textfield("d", when="c", eq="c"),
+                _textfield("c", when="b", eq="b"),
+                _textfield("b", when="a", eq="a"),
+                _textfield("a"),
+            ]
+        }
+        initial_data = {"a": "other", "b": "b", "c": "c", "d": "d"}
+
+        wrapper = FormioConfigurationWrapper(configuration)
+        data = FormioData(initial_data)
+        evaluate_conditional_logic(
+            configuration, data, wrapper, set(), data_for_hidden_state=FormioData()
+        )
+
+        # force the iterative path
+        iterative_wrapper = FormioConfigurationWrapper(configuration)
+        iterative_wrapper.conditional_evaluation_passes = None  # pyright: ignore[reportAttributeAccessIssue]
+        iterative_data = FormioData(initial_data)
+        evaluate_conditional_logic(
+            configuration,
+            iterative_data,
+            iterative_wrapper,
+            set(),
+            data_for_hidden_state=FormioData(),
+        )
+
+        self.assertEqual(data, iterative_data)
+        self.assertEqual(data, {"a": "other", "b": "", "c": "", "d": ""})
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import Protocol
 
 from openforms.typing import JSONObject, JSONValue
@@ -76,6 +77,107 @@ def is_hidden(
     return not show if triggered else show
 
 
+def _iter_components_with_parent(
+    configuration: FormioConfiguration | Component | Column | JSONObject,
+    parent: Component | None = None,
+) -> Iterator[tuple[Component, Component | None]]:
+    # Same (depth-first) order as :func:`process_visibility` walks the components.
+    for column in configuration.get("columns", []):
+        yield from _iter_components_with_parent(column, parent)
+    for component in configuration.get("components", []):
+        yield component, parent
+        yield from _iter_components_with_parent(component, component)
+
+
+def get_conditional_evaluation_passes(
+    wrapper: FormioConfigurationWrapper,
+) -> int | None:
+    """
+    Determine how many passes of :func:`process_visibility` resolve all conditionals.
+
+    The simple conditionals (``conditional.when``) form a dependency graph between the
+    components. Evaluating them in dependency order in a single pass is possible when
+    every trigger component is processed before the components depending on it. Each
+    dependency on a component that is only processed later requires an additional
+    pass, so the number of passes follows from the longest path in the graph.
+
+    :param wrapper: Formio configuration wrapper to analyze.
+    :return: The number of passes, or ``None`` if the conditionals contain a cycle or
+      refer to components that do not exist. In that case, the visibility must be
+      processed until the data no longer changes.
+    """
+    positions: dict[int, int] = {}
+    # position of the last component processed when a component value is final -
+    # editgrids replace their value after processing all the children
+    final_positions: dict[int, int] = {}
+    components: list[Component] = []
+    parent_positions: list[int | None] = []
+    for position, (component, parent) in enumerate(
+        _iter_components_with_parent(wrapper.configuration)
+    ):
+        positions[id(component)] = position
+        final_positions[id(component)] = position
+        components.append(component)
+        parent_positions.append(None if parent is None else positions[id(parent)])
+        ancestor_position = parent_positions[position]
+        while ancestor_position is not None:
+            ancestor = components[ancestor_position]
+            if ancestor.get("type") == "editgrid":
+                final_positions[id(ancestor)] = position
+            ancestor_position = parent_positions[ancestor_position]
+
+    # Resolve the trigger of every simple conditional to the position of the trigger
+    # component. Note that the component map also contains the namespaced keys of
+    # components inside edit grids.
+    triggers: dict[int, int] = {}
+    for position, component in enumerate(components):
+        if (conditional := get_conditional(component)) is None:
+            continue
+        trigger_component = wrapper.component_map.get(conditional[1])
+        if trigger_component is None or id(trigger_component) not in positions:
+            return None
+        triggers[position] = positions[id(trigger_component)]
+
+    # The pass in which the visibility (and thus value) of each component is final.
+    # Visit the dependencies first (depth-first, iteratively), detecting cycles.
+    final_pass: list[int] = [0] * len(components)
+    in_progress = set()
+    for start in range(len(components)):
+        stack = [start]
+        while stack:
+            position = stack[-1]
+            if final_pass[position]:
+                stack.pop()
+                continue
+            dependencies = [
+                dependency
+                for dependency in (parent_positions[position], triggers.get(position))
+                if dependency is not None and not final_pass[dependency]
+            ]
+            if dependencies:
+                if position in in_progress:
+                    # all dependencies are being resolved, so this is a cycle
+                    return None
+                in_progress.add(position)
+                stack.extend(dependencies)
+                continue
+
+            in_progress.discard(position)
+            stack.pop()
+            result = 1
+            if (parent_position := parent_positions[position]) is not None:
+                result = max(result, final_pass[parent_position])
+            if (trigger_position := triggers.get(position)) is not None:
+                trigger = components[trigger_position]
+                # a trigger processed after this component is only read in the
+                # next pass
+                backwards = final_positions[id(trigger)] >= position
+                result = max(result, final_pass[trigger_position] + backwards)
+            final_pass[position] = result
+
+    return max(final_pass, default=1)
+
+
 def get_component_empty_value(component: Component) -> JSONValue:
     if component["type"] in ("date", "time", "datetime"):
         return None
@@ -1,4 +1,7 @@
-from django.core.exceptions import ImproperlyConfigured
+import hashlib
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 from django.db import migrations
 
 from openforms.formio.migration_converters import CONVERTERS
@@ -36,10 +39,25 @@ class ApplyConverter:
             if updated_form_definition:
                 form_definitions_to_update.append(form_definition)
 
-        if form_definitions_to_update:
-            FormDefinition.objects.bulk_update(
-                form_definitions_to_update, fields=["configuration"]
-            )
+        if not form_definitions_to_update:
+            return
+
+        fields = ["configuration"]
+        # keep the configuration hash in sync, if it exists at this migration state
+        try:
+            FormDefinition._meta.get_field("_configuration_hash")
+        except FieldDoesNotExist:
+            pass
+        else:
+            fields.append("_configuration_hash")
+            for form_definition in form_definitions_to_update:
+                form_definition._configuration_hash = hashlib.md5(
+                    json.dumps(form_definition.configuration, sort_keys=True).encode(
+                        "utf-8"
+                    )
+                ).hexdigest()
+
+        FormDefinition.objects.bulk_update(form_definitions_to_update, fields=fields)
 
 
 class ConvertComponentsOperation(migrations.RunPython):
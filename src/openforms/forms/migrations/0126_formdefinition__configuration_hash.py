@@ -0,0 +1,42 @@
+# Generated by Django 5.2.12 on 2026-10-18 12:00
+
+import hashlib
+import json
+
+from django.db import migrations, models
+from django.db.migrations.state import StateApps
+
+
+def set_configuration_hash(apps: StateApps, _):
+    FormDefinition = apps.get_model("forms", "FormDefinition")
+
+    form_definitions = FormDefinition.objects.only("configuration")
+    for form_definition in form_definitions:
+        form_definition._configuration_hash = hashlib.md5(
+            json.dumps(form_definition.configuration, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    FormDefinition.objects.bulk_update(
+        form_definitions, fields=["_configuration_hash"], batch_size=100
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("forms", "0125_alter_form_new_logic_evaluation_enabled"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="formdefinition",
+            name="_configuration_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Hash of the Formio configuration, used to share the parsed configuration between requests.",
+                max_length=32,
+                verbose_name="configuration hash",
+            ),
+        ),
+        migrations.RunPython(set_configuration_hash, migrations.RunPython.noop),
+    ]
@@ -67,6 +67,19 @@ class FormDefinition(models.Model):
         default=0,
         help_text=_("The total number of Formio components used in the configuration"),
     )
+    _configuration_hash = models.CharField(
+        _("configuration hash"),
+        max_length=32,
+        blank=True,
+        editable=False,
+        help_text=_(
+            "Hash of the Formio configuration, used to share the parsed configuration "
+            "between requests."
+        ),
+    )
+
+    # the configuration instance the stored hash was computed for
+    _hashed_configuration = None
 
     class Meta:
         verbose_name = _("Form definition")
@@ -78,9 +91,18 @@ class FormDefinition(models.Model):
     def save(self, *args, **kwargs):
         # on every save, keep track of the number of components
         self._num_components = _get_number_of_components(self)
+        self._configuration_hash = self.get_hash()
+        self._hashed_configuration = self.configuration
 
         super().save(*args, **kwargs)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # deferred fields are absent from the instance dict
+        instance._hashed_configuration = instance.__dict__.get("configuration")
+        return instance
+
     def delete(self, using=None, keep_parents=False):
         if Form.objects.filter(formstep__form_definition=self).exists():
             raise ValidationError(
@@ -159,8 +181,21 @@ class FormDefinition(models.Model):
 
     @cached_property
     def configuration_wrapper(self) -> "FormioConfigurationWrapper":
-        from openforms.formio.service import FormioConfigurationWrapper
+        from openforms.formio.service import (
+            FormioConfigurationWrapper,
+            get_configuration_wrapper,
+        )
 
+        # The shared component index can only be used if the configuration was not
+        # replaced after it was loaded or saved, otherwise the hash may be outdated.
+        if (
+            self._configuration_hash
+            and self._hashed_configuration is not None
+            and self._hashed_configuration is self.configuration
+        ):
+            return get_configuration_wrapper(
+                self.configuration, self._configuration_hash
+            )
         return FormioConfigurationWrapper(self.configuration)
 
     def iter_components(self, configuration=None, recursive=True, **kwargs):
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.core.exceptions import ValidationError
 from django.test import TestCase, override_settings, tag
 from django.utils.translation import gettext as _
@@ -5,6 +7,7 @@ from django.utils.translation import gettext as _
 from hypothesis import given, strategies as st
 from hypothesis.extra.django import SimpleTestCase, TestCase as HypothesisTestCase
 
+from openforms.formio.datastructures import ComponentIndex
 from openforms.utils.tests.feature_flags import enable_feature_flag
 from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
 
@@ -460,6 +463,45 @@ class FormDefinitionTestCase(TestCase):
 
         self.assertEqual(fd._num_components, 2)
 
+    def test_configuration_hash_calculated_on_save(self):
+        fd = FormDefinitionFactory.build(
+            configuration={"components": [{"type": "textfield", "key": "textfield"}]}
+        )
+        self.assertEqual(fd._configuration_hash, "")
+
+        fd.save()
+
+        self.assertEqual(fd._configuration_hash, fd.get_hash())
+
+    def test_configuration_wrapper_shares_component_index(self):
+        fd = FormDefinitionFactory.create(
+            configuration={"components": [{"type": "textfield", "key": "textfield"}]}
+        )
+        fd1 = FormDefinition.objects.get(pk=fd.pk)
+        fd2 = FormDefinition.objects.get(pk=fd.pk)
+
+        with patch(
+            "openforms.formio.caching.ComponentIndex.from_wrapper",
+            wraps=ComponentIndex.from_wrapper,
+        ) as mock_from_wrapper:
+            wrapper1 = fd1.configuration_wrapper
+            wrapper2 = fd2.configuration_wrapper
+
+        self.assertLessEqual(mock_from_wrapper.call_count, 1)
+        self.assertIsNot(wrapper1["textfield"], wrapper2["textfield"])
+        self.assertIs(wrapper2["textfield"], fd2.configuration["components"][0])
+
+    def test_configuration_wrapper_for_replaced_configuration(self):
+        fd = FormDefinitionFactory.create(
+            configuration={"components": [{"type": "textfield", "key": "textfield"}]}
+        )
+        fd = FormDefinition.objects.get(pk=fd.pk)
+
+        fd.configuration = {"components": [{"type": "email", "key": "email"}]}
+
+        self.assertIn("email", fd.configuration_wrapper)
+        self.assertNotIn("textfield", fd.configuration_wrapper)
+
     def test_used_in_for_unsaved_fds(self):
         FormFactory.create(generate_minimal_setup=False)
         fd = FormDefinitionFactory.build()
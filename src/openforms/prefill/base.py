@@ -51,6 +51,14 @@ class BasePlugin[OptionsT: Options](AbstractBasePlugin):
     """
     for_components: Container[str] = AllComponentTypes()
     options: SerializerCls = EmptyOptions
+    options_per_variable: ClassVar[bool] = True
+    """
+    Indicates whether the values retrieved with the :attr:`options` depend on the
+    variable being prefilled.
+
+    If ``False``, variables that are prefilled with identical options share a single
+    call to :meth:`get_prefill_values_from_options`.
+    """
 
     @staticmethod
     def get_available_attributes() -> Iterable[tuple[str, StrOrPromise]]:
@@ -29,6 +29,8 @@ PLUGIN_IDENTIFIER = "objects_api"
 class ObjectsAPIPrefill(BasePlugin[ObjectsAPIOptions]):
     verbose_name = _("Objects API")
     options = ObjectsAPIOptionsSerializer
+    # the values are looked up in the initial data object, regardless of the variable
+    options_per_variable = False
 
     def verify_initial_data_ownership(
         self, submission: Submission, prefill_options: ObjectsAPIOptions
@@ -34,26 +34,29 @@ So, to recap:
    form field default values.
 """
 
+from functools import partial
+
+from django.db import transaction
+from django.utils import timezone
+
 import elasticapm
 import structlog
 from opentelemetry import trace
 
+from openforms.config.models import GlobalConfiguration
 from openforms.formio.service import (
     FormioConfigurationWrapper,
     FormioData,
 )
+from openforms.submissions.constants import PrefillStatuses
 from openforms.submissions.models import Submission
 from openforms.submissions.models.submission_value_variable import (
     SubmissionValueVariable,
 )
-from openforms.typing import JSONEncodable
 from openforms.variables.constants import FormVariableSources
 
 from .registry import Registry, register as default_register
-from .sources import (
-    fetch_prefill_values_from_attribute,
-    fetch_prefill_values_from_options,
-)
+from .sources import fetch_prefill_values
 
 logger = structlog.stdlib.get_logger(__name__)
 tracer = trace.get_tracer("openforms.prefill.service")
@@ -127,7 +130,6 @@ def prefill_variables(submission: Submission, register: Registry | None = None)
 
     variables_with_attribute: list[SubmissionValueVariable] = []
     variables_with_options: list[SubmissionValueVariable] = []
-    prefill_data: dict[str, JSONEncodable] = {}
 
     for variable in state.prefilled_variables.values():
         form_variable = variable.form_variable
@@ -152,16 +154,36 @@ def prefill_variables(submission: Submission, register: Registry | None = None)
             if form_variable.prefill_plugin and form_variable.prefill_attribute:
                 variables_with_attribute.append(variable)
 
-    if variables_with_attribute:
-        results_from_attribute = fetch_prefill_values_from_attribute(
-            submission, register, variables_with_attribute
-        )
-        prefill_data.update(**results_from_attribute)
+    prefill_data = fetch_prefill_values(
+        submission, register, variables_with_attribute, variables_with_options
+    )
+    state.save_prefill_data(FormioData(prefill_data))
+
 
-    if variables_with_options:
-        results_from_options = fetch_prefill_values_from_options(
-            submission, register, variables_with_options
-        )
-        prefill_data.update(**results_from_options)
+def start_prefill(submission: Submission) -> None:
+    """
+    Prefill the variables of a submission that was just started.
 
-    state.save_prefill_data(FormioData(prefill_data))
+    If :attr:`openforms.config.models.GlobalConfiguration.prefill_in_background` is
+    enabled, the plugins are called in a Celery task once the submission is saved.
+    Until then, the steps depending on prefilled values are pending, see
+    :attr:`openforms.submissions.models.SubmissionStep.prefill_pending`.
+    """
+    # circular import
+    from .tasks import prefill_submission
+
+    config = GlobalConfiguration.get_solo()
+    in_background = (
+        config.prefill_in_background
+        and submission.variables_state.prefilled_variables
+        # the ownership of the initial data must be checked before the form is started
+        and not submission.initial_data_reference
+    )
+    if not in_background:
+        prefill_variables(submission)
+        return
+
+    submission.prefill_status = PrefillStatuses.pending
+    submission.prefill_started_on = timezone.now()
+    submission.save(update_fields=["prefill_status", "prefill_started_on"])
+    transaction.on_commit(partial(prefill_submission.delay, submission.pk))
@@ -1,10 +1,16 @@
+import json
+import time
 from collections import defaultdict
+from collections.abc import Callable, Hashable
+from concurrent import futures
+from functools import partial
 
+from django.conf import settings
 from django.core.exceptions import PermissionDenied
 
-import elasticapm
 import structlog
 from opentelemetry import trace
+from opentelemetry.trace import Status, StatusCode
 from rest_framework.exceptions import ValidationError
 from zgw_consumers.concurrent import parallel
 
@@ -24,19 +30,210 @@ from .registry import Registry
 logger = structlog.stdlib.get_logger(__name__)
 tracer = trace.get_tracer("openforms.prefill.sources")
 
+type CallKey = tuple[Hashable, ...]
+type PrefillCall = Callable[[], dict[str, JSONEncodable]]
 
-def fetch_prefill_values_from_attribute(
+
+class PrefillScheduler:
+    """
+    Make the calls to the prefill plugins for a submission concurrently.
+
+    Calls are scheduled with a key - identical calls (with the same key) are only made
+    once. Every plugin gets ``timeout`` seconds for all its calls, the values of a
+    plugin that doesn't finish in time are discarded. Each plugin gets a single timing
+    span covering all its calls.
+
+    Exceptions raised by the calls are propagated, so the calls are responsible for
+    handling the errors that should not abort the prefill. The calls that time out keep
+    running in the background, their outcome is logged when they finish.
+    """
+
+    def __init__(self, submission: Submission, timeout: float | None = None):
+        self.submission = submission
+        self.timeout = settings.PREFILL_PLUGIN_TIMEOUT if timeout is None else timeout
+        self._plugins: dict[str, BasePlugin] = {}
+        self._calls: defaultdict[str, dict[CallKey, PrefillCall]] = defaultdict(dict)
+
+    def schedule(self, plugin: BasePlugin, key: CallKey, call: PrefillCall) -> CallKey:
+        """
+        Schedule the call, unless an identical call was scheduled already.
+
+        :returns: The key to look up the values in the results of :meth:`run`.
+        """
+        self._plugins[plugin.identifier] = plugin
+        key = (plugin.identifier, *key)
+        self._calls[plugin.identifier].setdefault(key, call)
+        return key
+
+    def run(self) -> dict[CallKey, dict[str, JSONEncodable]]:
+        num_calls = sum(len(plugin_calls) for plugin_calls in self._calls.values())
+        # no point in handing off a single call to another thread
+        if num_calls == 1:
+            (plugin_id,) = self._calls
+            return self._run_inline(plugin_id)
+
+        results: dict[CallKey, dict[str, JSONEncodable]] = {}
+        if not num_calls:
+            return results
+
+        pool = parallel()
+        start_time = time.time_ns()
+        deadline = time.monotonic() + self.timeout
+        try:
+            submitted = {
+                plugin_id: {
+                    key: pool.submit(_timed, call) for key, call in plugin_calls.items()
+                }
+                for plugin_id, plugin_calls in self._calls.items()
+            }
+            for plugin_id, plugin_futures in submitted.items():
+                results.update(
+                    self._collect(plugin_id, plugin_futures, start_time, deadline)
+                )
+        finally:
+            # don't wait for the calls that timed out
+            pool.executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def _run_inline(self, plugin_id: str) -> dict[CallKey, dict[str, JSONEncodable]]:
+        # the call cannot be interrupted in the current thread, but its values are
+        # discarded when it doesn't finish in time, like the concurrent calls
+        deadline = time.monotonic() + self.timeout
+        with tracer.start_as_current_span(
+            name="invoke-plugin", attributes=self._span_attributes(plugin_id)
+        ) as span:
+            results = {key: call() for key, call in self._calls[plugin_id].items()}
+            if time.monotonic() > deadline:
+                logger.warning(
+                    "prefill.plugin.timeout",
+                    submission_uuid=str(self.submission.uuid),
+                    plugin=self._plugins[plugin_id],
+                    timeout=self.timeout,
+                )
+                span.set_status(Status(StatusCode.ERROR, "timeout"))
+                return {}
+        return results
+
+    def _collect(
+        self,
+        plugin_id: str,
+        plugin_futures: dict[CallKey, futures.Future],
+        start_time: int,
+        deadline: float,
+    ) -> dict[CallKey, dict[str, JSONEncodable]]:
+        span = tracer.start_span(
+            name="invoke-plugin",
+            attributes=self._span_attributes(plugin_id),
+            start_time=start_time,
+        )
+        timeout = max(deadline - time.monotonic(), 0)
+        _, not_done = futures.wait(plugin_futures.values(), timeout=timeout)
+
+        if not_done:
+            log = logger.bind(
+                submission_uuid=str(self.submission.uuid),
+                plugin=self._plugins[plugin_id],
+            )
+            log.warning("prefill.plugin.timeout", timeout=self.timeout)
+            for future in not_done:
+                # calls that didn't start are cancelled, the running calls cannot be
+                # interrupted and are closed when they finish
+                if not future.cancel():
+                    future.add_done_callback(partial(_close_timed_out_call, log))
+            span.set_status(Status(StatusCode.ERROR, "timeout"))
+            span.end()
+            return {}
+
+        results: dict[CallKey, dict[str, JSONEncodable]] = {}
+        end_time = start_time
+        try:
+            for key, future in plugin_futures.items():
+                results[key], finished = future.result()
+                end_time = max(end_time, finished)
+        except Exception as exc:
+            span.record_exception(exc)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+            raise
+        span.end(end_time=end_time)
+        return results
+
+    def _span_attributes(self, plugin_id: str) -> dict[str, str | int]:
+        return {
+            "span.type": "app",
+            "span.subtype": "prefill",
+            "prefill.plugin": plugin_id,
+            "prefill.calls": len(self._calls[plugin_id]),
+        }
+
+
+def _timed(call: PrefillCall) -> tuple[dict[str, JSONEncodable], int]:
+    values = call()
+    return values, time.time_ns()
+
+
+def _close_timed_out_call(
+    log: structlog.stdlib.BoundLogger, future: futures.Future
+) -> None:
+    """
+    Log the outcome of a call that finished after its timeout, discarding its values.
+
+    The database connections of the worker thread are closed by
+    :class:`zgw_consumers.concurrent.parallel` when the call finishes.
+    """
+    if (exc := future.exception()) is not None:
+        log.warning("prefill.plugin.timed_out_call_failed", exc_info=exc)
+    else:
+        log.info("prefill.plugin.timed_out_call_finished")
+
+
+def fetch_prefill_values(
     submission: Submission,
     register: Registry,
-    submission_variables: list[SubmissionValueVariable],
+    variables_with_attribute: list[SubmissionValueVariable],
+    variables_with_options: list[SubmissionValueVariable],
 ) -> dict[str, JSONEncodable]:
-    # grouped_fields is a dict of the following shape:
-    # {"plugin_id": {"identifier_role": [{"attr_1":"var1_key", "attr_2":"var2_key"}]}}
-    # "identifier_role" is either "main" or "authorizee"
+    """
+    Retrieve the prefill values of the variables, calling the plugins concurrently.
 
-    grouped_fields: defaultdict[str, defaultdict[str, list[dict[str, str]]]] = (
-        defaultdict(lambda: defaultdict(list))
+    :returns: The prefill values, by variable key.
+    """
+    scheduler = PrefillScheduler(submission)
+    attribute_calls = schedule_prefill_from_attribute(
+        scheduler, submission, register, variables_with_attribute
     )
+    options_calls = schedule_prefill_from_options(
+        scheduler, submission, register, variables_with_options
+    )
+    results = scheduler.run()
+
+    prefill_data: dict[str, JSONEncodable] = {}
+    for key, variable_keys in attribute_calls.items():
+        for attribute, value in results.get(key, {}).items():
+            for variable_key in variable_keys.get(attribute, ()):
+                prefill_data[variable_key] = value
+    # options may set the values of other variables, so apply them in the order of the
+    # variables
+    for key in options_calls:
+        prefill_data.update(results.get(key, {}))
+    return prefill_data
+
+
+def schedule_prefill_from_attribute(
+    scheduler: PrefillScheduler,
+    submission: Submission,
+    register: Registry,
+    submission_variables: list[SubmissionValueVariable],
+) -> dict[CallKey, dict[str, list[str]]]:
+    """
+    Schedule a call per plugin and identifier role for the requested attributes.
+
+    :returns: For every call, the keys of the variables by attribute.
+    """
+    # {(plugin_id, identifier_role): {attribute: [var1_key, var2_key]}}
+    grouped_fields: defaultdict[
+        tuple[str, IdentifierRoles], defaultdict[str, list[str]]
+    ] = defaultdict(lambda: defaultdict(list))
 
     for variable in submission_variables:
         assert variable.form_variable is not None
@@ -46,25 +243,18 @@ def fetch_prefill_values_from_attribute(
         )
         attribute_name: str = variable.form_variable.prefill_attribute
 
-        grouped_fields[plugin_id][identifier_role].append(
-            {attribute_name: variable.form_variable.key}
+        grouped_fields[plugin_id, identifier_role][attribute_name].append(
+            variable.form_variable.key
         )
 
-    mappings: dict[str, JSONEncodable] = {}
-
-    @tracer.start_as_current_span(
-        name="invoke-plugin", attributes={"span.type": "app", "span.subtype": "prefill"}
-    )
-    @elasticapm.capture_span(span_type="app.prefill")
     def invoke_plugin(
-        item: tuple[BasePlugin, IdentifierRoles, list[dict[str, str]]],
-    ) -> tuple[list[dict[str, str]], dict[str, JSONEncodable]]:
-        plugin, identifier_role, fields = item
+        plugin: BasePlugin, identifier_role: IdentifierRoles, attributes: list[str]
+    ) -> dict[str, JSONEncodable]:
         log = logger.bind(
             submission_uuid=str(submission.uuid),
             plugin=plugin,
             for_role=identifier_role,
-            fields=fields,
+            attributes=attributes,
         )
         audit_log = audit_logger.bind(**structlog.get_context(log))
 
@@ -74,11 +264,9 @@ def fetch_prefill_values_from_attribute(
 
         if not plugin.verify_auth_plugin_requirement(submission):
             log.info("prefill.plugin.auth_plugin_requirements_not_met")
-            return fields, {}
+            return {}
 
-        attributes = [attribute for field in fields for attribute in field]
-        audit_log = audit_log.bind(attributes=attributes)
-        log.debug("prefill.plugin.lookup_attributes", attributes=attributes)
+        log.debug("prefill.plugin.lookup_attributes")
         try:
             values = plugin.get_prefill_values(submission, attributes, identifier_role)
         except PrefillSkipped:
@@ -91,71 +279,48 @@ def fetch_prefill_values_from_attribute(
             audit_log.info(
                 "prefill_retrieve_success" if values else "prefill_retrieve_empty"
             )
-        return fields, values
+        return values
 
-    invoke_plugin_args = []
-    for plugin_id, field_groups in grouped_fields.items():
+    calls: dict[CallKey, dict[str, list[str]]] = {}
+    # check if we need to run the plugin when the user is authenticated
+    auth_info = getattr(submission, "auth_info", None)
+    for (plugin_id, identifier_role), variable_keys in grouped_fields.items():
         plugin = register[plugin_id]
-
-        # check if we need to run the plugin when the user is authenticated
-        auth_info = getattr(submission, "auth_info", None)
         if auth_info and auth_info.attribute not in plugin.requires_auth:
             continue
 
-        for identifier_role, fields in field_groups.items():
-            invoke_plugin_args.append((plugin, identifier_role, fields))
-
-    with parallel() as executor:
-        results = executor.map(invoke_plugin, invoke_plugin_args)
-
-    for fields, values in list(results):
-        for attribute, value in values.items():
-            for field in fields:
-                for attr, var_key in field.items():
-                    if attribute == attr:
-                        mappings[var_key] = value
-    return mappings
+        attributes = list(variable_keys)
+        key = scheduler.schedule(
+            plugin,
+            (identifier_role,),
+            partial(invoke_plugin, plugin, identifier_role, attributes),
+        )
+        calls[key] = variable_keys
+    return calls
 
 
-def fetch_prefill_values_from_options(
+def schedule_prefill_from_options(
+    scheduler: PrefillScheduler,
     submission: Submission,
     register: Registry,
     variables: list[SubmissionValueVariable],
-) -> dict[str, JSONEncodable]:
-    values: dict[str, JSONEncodable] = {}
-    for variable in variables:
-        assert variable.form_variable is not None
-        plugin = register[variable.form_variable.prefill_plugin]
-        log = logger.bind(plugin=plugin)
+) -> list[CallKey]:
+    """
+    Schedule a call for every variable with valid prefill options.
 
-        if not plugin.is_enabled:
-            log.debug("plugin_disabled")
-            continue
+    :returns: The keys of the calls, in the order of the variables.
+    """
 
-        if not plugin.verify_auth_plugin_requirement(submission):
-            log.info("prefill.plugin.auth_plugin_requirements_not_met")
-            continue
-
-        raw_options = variable.form_variable.prefill_options
+    def invoke_plugin(
+        plugin: BasePlugin,
+        plugin_options,
+        variable: SubmissionValueVariable,
+    ) -> dict[str, JSONEncodable]:
         log = logger.bind(
             variable=variable.key, plugin=plugin, submission_uuid=str(submission.uuid)
         )
         audit_log = audit_logger.bind(**structlog.get_context(log))
 
-        # validate the options before processing them
-        options_serializer = plugin.options(data=raw_options)
-        try:
-            options_serializer.is_valid(raise_exception=True)
-        except ValidationError as exc:
-            audit_log.warning(
-                "prefill.plugin.retrieve_failure",
-                reason="invalid_options",
-                exc_info=exc,
-            )
-            continue
-
-        plugin_options = options_serializer.validated_data
-
         # If an `initial_data_reference` was passed, we must verify that the
         # authenticated user is the owner of the referenced object
         has_initial_data_reference = bool(submission.initial_data_reference)
@@ -175,20 +340,64 @@ def fetch_prefill_values_from_options(
                 raise exc
 
         try:
-            new_values = plugin.get_prefill_values_from_options(
+            values = plugin.get_prefill_values_from_options(
                 submission, plugin_options, variable
             )
         except PrefillSkipped:
             log.info("prefill.plugin.skipped")
-            values = {}
+            return {}
         except Exception as exc:
             audit_log.exception("prefill.plugin.retrieve_failure", exc_info=exc)
-        else:
-            if new_values:
-                values.update(**new_values)
-            audit_log.info(
-                "prefill_retrieve_success" if new_values else "prefill_retrieve_empty",
-                attributes=list(values),
+            return {}
+
+        audit_log.info(
+            "prefill_retrieve_success" if values else "prefill_retrieve_empty",
+            attributes=list(values or {}),
+        )
+        return values or {}
+
+    calls: list[CallKey] = []
+    for variable in variables:
+        assert variable.form_variable is not None
+        plugin = register[variable.form_variable.prefill_plugin]
+        log = logger.bind(plugin=plugin)
+
+        if not plugin.is_enabled:
+            log.debug("plugin_disabled")
+            continue
+
+        if not plugin.verify_auth_plugin_requirement(submission):
+            log.info("prefill.plugin.auth_plugin_requirements_not_met")
+            continue
+
+        raw_options = variable.form_variable.prefill_options
+        log = logger.bind(
+            variable=variable.key, plugin=plugin, submission_uuid=str(submission.uuid)
+        )
+        audit_log = audit_logger.bind(**structlog.get_context(log))
+
+        # validate the options before processing them
+        options_serializer = plugin.options(data=raw_options)
+        try:
+            options_serializer.is_valid(raise_exception=True)
+        except ValidationError as exc:
+            audit_log.warning(
+                "prefill.plugin.retrieve_failure",
+                reason="invalid_options",
+                exc_info=exc,
             )
+            continue
 
-    return values
+        key: CallKey = (json.dumps(raw_options, sort_keys=True),)
+        if plugin.options_per_variable:
+            key += (variable.key,)
+        calls.append(
+            scheduler.schedule(
+                plugin,
+                key,
+                partial(
+                    invoke_plugin, plugin, options_serializer.validated_data, variable
+                ),
+            )
+        )
+    return calls
@@ -0,0 +1,45 @@
+import structlog
+
+from openforms.celery import app
+from openforms.submissions.constants import PrefillStatuses
+from openforms.submissions.models import Submission
+
+from .service import prefill_variables
+
+__all__ = ["prefill_submission"]
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@app.task(ignore_result=True)
+def prefill_submission(submission_id: int) -> None:
+    """
+    Retrieve the prefill values of a submission in the background.
+
+    The submission is no longer pending afterwards, even if the prefill failed - the
+    form can be filled out without the prefill values. The values are not retrieved
+    anymore once the prefill expired (see ``settings.PREFILL_BACKGROUND_TIMEOUT``).
+    """
+    submission = Submission.objects.get(id=submission_id)
+    if submission.prefill_status != PrefillStatuses.pending:
+        return
+    # the form is filled out without the prefill values by now, don't overwrite them
+    if not submission.prefill_pending:
+        logger.warning(
+            "prefill.background_prefill_expired", submission_uuid=str(submission.uuid)
+        )
+        Submission.objects.filter(pk=submission.pk).update(
+            prefill_status=PrefillStatuses.done
+        )
+        return
+
+    try:
+        prefill_variables(submission)
+    except Exception:
+        logger.exception(
+            "prefill.background_prefill_failed", submission_uuid=str(submission.uuid)
+        )
+    finally:
+        Submission.objects.filter(pk=submission.pk).update(
+            prefill_status=PrefillStatuses.done
+        )
@@ -0,0 +1,182 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from openforms.config.models import GlobalConfiguration
+from openforms.forms.tests.factories import FormStepFactory, FormVariableFactory
+from openforms.submissions.constants import PrefillStatuses
+from openforms.submissions.models import Submission
+from openforms.submissions.tests.factories import SubmissionFactory
+from openforms.submissions.tests.mixins import SubmissionsMixin
+from openforms.variables.constants import FormVariableDataTypes
+
+from ..contrib.demo.plugin import DemoPrefill
+from ..service import start_prefill
+from ..tasks import prefill_submission
+
+CONFIGURATION = {
+    "components": [
+        {
+            "type": "textfield",
+            "key": "voornamen",
+            "label": "Voornamen",
+            "prefill": {"plugin": "demo", "attribute": "random_string"},
+            "disabled": False,
+        }
+    ]
+}
+
+
+@override_settings(
+    LANGUAGE_CODE="en",
+    CORS_ALLOW_ALL_ORIGINS=False,
+    CORS_ALLOWED_ORIGINS=["http://testserver.com"],
+)
+@patch.object(DemoPrefill, "get_prefill_values", return_value={"random_string": "Jane"})
+class BackgroundPrefillTests(SubmissionsMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form_step = FormStepFactory.create(
+            form_definition__configuration=CONFIGURATION
+        )
+        cls.form = cls.form_step.form
+
+    def setUp(self):
+        super().setUp()
+
+        patcher = patch(
+            "openforms.prefill.service.GlobalConfiguration.get_solo",
+            return_value=GlobalConfiguration(prefill_in_background=True),
+        )
+        self.m_config = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _start_submission(self) -> Submission:
+        form_url = reverse("api:form-detail", kwargs={"uuid_or_slug": self.form.uuid})
+        with (
+            patch("openforms.prefill.tasks.prefill_submission.delay") as m_delay,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = self.client.post(
+                reverse("api:submission-list"),
+                {
+                    "form": f"http://testserver{form_url}",
+                    "formUrl": "http://testserver.com/my-form",
+                },
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        submission = Submission.objects.get()
+        m_delay.assert_called_once_with(submission.pk)
+        return submission
+
+    def _get_step_url(self, submission: Submission) -> str:
+        return reverse(
+            "api:submission-steps-detail",
+            kwargs={
+                "submission_uuid": submission.uuid,
+                "step_uuid": self.form_step.uuid,
+            },
+        )
+
+    def test_prefill_in_background(self, m_get_values):
+        submission = self._start_submission()
+
+        self.assertEqual(submission.prefill_status, PrefillStatuses.pending)
+        m_get_values.assert_not_called()
+
+        with self.subTest("step is pending"):
+            response = self.client.get(self._get_step_url(submission))
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.json()["prefillPending"])
+
+        with self.subTest("step cannot be submitted"):
+            response = self.client.put(
+                self._get_step_url(submission), {"data": {"voornamen": "John"}}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        prefill_submission(submission.pk)
+
+        submission.refresh_from_db()
+        self.assertEqual(submission.prefill_status, PrefillStatuses.done)
+        response = self.client.get(self._get_step_url(submission))
+        self.assertFalse(response.json()["prefillPending"])
+        self.assertEqual(
+            response.json()["configuration"]["components"][0]["defaultValue"], "Jane"
+        )
+
+    def test_prefill_merged_with_initialised_variables(self, m_get_values):
+        FormVariableFactory.create(
+            form=self.form,
+            key="name",
+            user_defined=True,
+            data_type=FormVariableDataTypes.string,
+            initial_value="initial",
+            prefill_plugin="demo",
+            prefill_attribute="random_string",
+        )
+        submission = self._start_submission()
+        # the initial values of the user defined variables were saved on start
+        self.assertTrue(submission.submissionvaluevariable_set.filter(key="name"))
+
+        prefill_submission(submission.pk)
+
+        submission = Submission.objects.get()
+        state = submission.variables_state
+        self.assertEqual(state.get_variable("name").value, "Jane")
+        self.assertEqual(state.get_variable("voornamen").value, "Jane")
+
+    def test_failing_prefill_is_no_longer_pending(self, m_get_values):
+        submission = self._start_submission()
+
+        with patch(
+            "openforms.prefill.tasks.prefill_variables", side_effect=Exception("boom")
+        ):
+            prefill_submission(submission.pk)
+
+        submission.refresh_from_db()
+        self.assertEqual(submission.prefill_status, PrefillStatuses.done)
+
+    @override_settings(PREFILL_BACKGROUND_TIMEOUT=60)
+    def test_lost_prefill_expires(self, m_get_values):
+        submission = self._start_submission()
+        Submission.objects.filter(pk=submission.pk).update(
+            prefill_started_on=timezone.now() - timedelta(seconds=61)
+        )
+
+        response = self.client.put(
+            self._get_step_url(submission), {"data": {"voornamen": "John"}}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        with self.subTest("late task doesn't overwrite the data"):
+            prefill_submission(submission.pk)
+
+            submission.refresh_from_db()
+            self.assertEqual(submission.prefill_status, PrefillStatuses.done)
+            m_get_values.assert_not_called()
+            state = submission.variables_state
+            self.assertEqual(state.get_variable("voornamen").value, "John")
+
+    def test_prefill_before_start_with_initial_data_reference(self, m_get_values):
+        submission = SubmissionFactory.create(
+            form=self.form, initial_data_reference="ref"
+        )
+
+        with patch("openforms.prefill.tasks.prefill_submission.delay") as m_delay:
+            start_prefill(submission)
+
+        m_delay.assert_not_called()
+        m_get_values.assert_called_once()
@@ -65,7 +65,7 @@ CONFIGURATION = {
 
 class PrefillVariablesTests(TestCase):
     @patch(
-        "openforms.prefill.service.fetch_prefill_values_from_attribute",
+        "openforms.prefill.service.fetch_prefill_values",
         return_value={"voornamen": "Not so random string", "age": 123},
     )
     def test_applying_prefill_plugin_from_component_conf(self, m_prefill):
@@ -95,7 +95,7 @@ class PrefillVariablesTests(TestCase):
         )
 
     @patch(
-        "openforms.prefill.service.fetch_prefill_values_from_attribute",
+        "openforms.prefill.service.fetch_prefill_values",
         return_value={"voornamen": "Not so random string"},
     )
     def test_applying_prefill_plugin_from_user_defined_with_attribute(self, m_prefill):
@@ -123,7 +123,7 @@ class PrefillVariablesTests(TestCase):
         )
 
     @patch(
-        "openforms.prefill.service.fetch_prefill_values_from_attribute",
+        "openforms.prefill.service.fetch_prefill_values",
         return_value={
             "postcode": "1015CJ",
             "birthDate": "19990615",
@@ -308,7 +308,7 @@ class GenericExceptionPlugin(DemoPrefill):
 
 class PrefillVariablesFromOptionsTests(TestCase):
     @patch(
-        "openforms.prefill.service.fetch_prefill_values_from_options",
+        "openforms.prefill.service.fetch_prefill_values",
         return_value={
             "object_data": {
                 "voornamen": "Not so random string",
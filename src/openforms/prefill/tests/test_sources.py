@@ -0,0 +1,144 @@
+import threading
+import time
+from unittest.mock import patch
+
+from django.core.exceptions import PermissionDenied
+from django.test import SimpleTestCase, TestCase
+
+from openforms.forms.tests.factories import FormVariableFactory
+from openforms.submissions.models import Submission
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from ..contrib.demo.plugin import DemoPrefill
+from ..service import prefill_variables
+from ..sources import PrefillScheduler
+from .utils import get_test_register
+
+
+class PrefillSchedulerTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.submission = Submission()
+        self.demo = DemoPrefill("demo")
+        self.other = DemoPrefill("other")
+
+    def test_calls_are_made_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def call(value):
+            barrier.wait()
+            return {"attr": value}
+
+        scheduler = PrefillScheduler(self.submission, timeout=5)
+        key1 = scheduler.schedule(self.demo, ("main",), lambda: call(1))
+        key2 = scheduler.schedule(self.other, ("main",), lambda: call(2))
+
+        results = scheduler.run()
+
+        self.assertEqual(results, {key1: {"attr": 1}, key2: {"attr": 2}})
+
+    def test_identical_calls_are_made_once(self):
+        calls = []
+
+        def call():
+            calls.append(None)
+            return {"attr": "value"}
+
+        scheduler = PrefillScheduler(self.submission, timeout=5)
+        key1 = scheduler.schedule(self.demo, ("options",), call)
+        key2 = scheduler.schedule(self.demo, ("options",), call)
+        key3 = scheduler.schedule(self.other, ("options",), call)
+
+        results = scheduler.run()
+
+        self.assertEqual(key1, key2)
+        self.assertNotEqual(key1, key3)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(len(calls), 2)
+
+    def test_slow_plugin_is_discarded(self):
+        done = threading.Event()
+        self.addCleanup(done.set)
+
+        scheduler = PrefillScheduler(self.submission, timeout=0.1)
+        scheduler.schedule(self.demo, (), lambda: done.wait(5) and {"attr": "slow"})
+        key = scheduler.schedule(self.other, (), lambda: {"attr": "fast"})
+
+        results = scheduler.run()
+
+        self.assertEqual(results, {key: {"attr": "fast"}})
+
+    def test_single_slow_call_is_discarded(self):
+        def call():
+            time.sleep(0.2)
+            return {"attr": "slow"}
+
+        scheduler = PrefillScheduler(self.submission, timeout=0.1)
+        scheduler.schedule(self.demo, (), call)
+
+        results = scheduler.run()
+
+        self.assertEqual(results, {})
+
+    def test_timed_out_calls_are_closed(self):
+        started, done, closed = threading.Event(), threading.Event(), threading.Event()
+        self.addCleanup(done.set)
+
+        def call():
+            started.set()
+            done.wait(5)
+            return {"attr": "slow"}
+
+        scheduler = PrefillScheduler(self.submission, timeout=0.1)
+        scheduler.schedule(self.demo, (), call)
+        key = scheduler.schedule(self.other, (), lambda: {"attr": "fast"})
+
+        with patch(
+            "openforms.prefill.sources._close_timed_out_call",
+            side_effect=lambda log, future: closed.set(),
+        ):
+            results = scheduler.run()
+
+            self.assertEqual(results, {key: {"attr": "fast"}})
+            self.assertTrue(started.is_set())
+            self.assertFalse(closed.is_set())
+
+            done.set()
+
+            self.assertTrue(closed.wait(5))
+
+    def test_exceptions_are_propagated(self):
+        def call():
+            raise PermissionDenied()
+
+        scheduler = PrefillScheduler(self.submission, timeout=5)
+        scheduler.schedule(self.demo, (), call)
+        scheduler.schedule(self.other, (), lambda: {})
+
+        with self.assertRaises(PermissionDenied):
+            scheduler.run()
+
+
+class FetchPrefillValuesTests(TestCase):
+    @patch.object(
+        DemoPrefill, "get_prefill_values", return_value={"random_string": "a"}
+    )
+    def test_attribute_requested_once_for_multiple_variables(self, m_get_values):
+        submission = SubmissionFactory.create()
+        for key in ("first", "second"):
+            FormVariableFactory.create(
+                key=key,
+                form=submission.form,
+                user_defined=True,
+                prefill_plugin="demo",
+                prefill_attribute="random_string",
+            )
+
+        prefill_variables(submission=submission, register=get_test_register())
+
+        m_get_values.assert_called_once()
+        self.assertEqual(m_get_values.call_args.args[1], ["random_string"])
+        state = submission.load_submission_value_variables_state(refresh=True)
+        self.assertEqual(state.get_variable(key="first").value, "a")
+        self.assertEqual(state.get_variable(key="second").value, "a")
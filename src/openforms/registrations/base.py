@@ -91,6 +91,16 @@ class BasePlugin[OptionsT: Options](ABC, AbstractBasePlugin):
         """
         return PreRegistrationResult()
 
+    def prefetch_catalogue(self, options: OptionsT) -> None:
+        """
+        Retrieve the catalogue data (like case and document types) the options refer to.
+
+        The responses are cached, so that registering the submissions doesn't have to
+        wait for them. Plugins that don't use a catalogue don't need to implement this
+        method.
+        """
+        return None
+
     def get_custom_templatetags_libraries(self) -> list[str]:
         """
         Return a list of custom templatetags libraries that will be added to the 'sandboxed' Django templates backend.
@@ -4,6 +4,7 @@ from functools import partial
 from typing import TYPE_CHECKING, Any, override
 
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 import structlog
@@ -11,13 +12,18 @@ import structlog
 from openforms.config.data import Action
 from openforms.contrib.objects_api.checks import check_config
 from openforms.contrib.objects_api.clients import (
+    get_catalogi_client,
     get_objects_client,
     get_objecttypes_client,
 )
 from openforms.contrib.objects_api.ownership_validation import validate_object_ownership
 from openforms.formio.typing import Component, EditGridComponent
-from openforms.registrations.utils import execute_unless_result_exists
+from openforms.registrations.utils import (
+    execute_unless_result_exists,
+    with_registration_checkpoints,
+)
 from openforms.typing import JSONObject
+from openforms.utils.date import datetime_in_amsterdam
 from openforms.variables.service import get_static_variables
 
 from ...base import BasePlugin
@@ -82,6 +88,7 @@ class ObjectsAPIRegistration(BasePlugin[RegistrationOptions]):
             validate_object_ownership(submission, client, auth_attribute_path)
 
     @override
+    @with_registration_checkpoints
     def register_submission(
         self, submission: Submission, options: RegistrationOptions
     ) -> dict[str, Any]:
@@ -143,6 +150,38 @@ class ObjectsAPIRegistration(BasePlugin[RegistrationOptions]):
 
         return response
 
+    @override
+    def prefetch_catalogue(self, options: RegistrationOptions) -> None:
+        self.set_defaults(options)
+        if (catalogue := options.get("catalogue")) is None:
+            return
+
+        descriptions = [
+            description
+            for field in (
+                "iot_submission_report",
+                "iot_submission_csv",
+                "iot_attachment",
+            )
+            if (description := options.get(field))
+        ]
+        if not descriptions:
+            return
+
+        version_valid_on = datetime_in_amsterdam(timezone.now()).date()
+        with get_catalogi_client(
+            options["objects_api_group"], cached=True
+        ) as catalogi_client:
+            catalogus = catalogi_client.find_catalogus(**catalogue)
+            if catalogus is None:
+                raise RuntimeError(f"Could not resolve catalogue {catalogue}")
+            for description in descriptions:
+                catalogi_client.find_informatieobjecttypen(
+                    catalogus=catalogus["url"],
+                    description=description,
+                    valid_on=version_valid_on,
+                )
+
     @override
     def check_config(self):
         check_config()
@@ -286,7 +286,7 @@ class ObjectsAPIRegistrationHandler[
 
         with (
             get_documents_client(api_group) as documents_client,
-            get_catalogi_client(api_group) as catalogi_client,
+            get_catalogi_client(api_group, cached=True) as catalogi_client,
             save_and_raise(registration_data, submission_attachments),
         ):
             if not registration_data.pdf_url:
@@ -49,7 +49,7 @@ from stuf.stuf_zds.models import StufZDSConfig
 
 from ...exceptions import RegistrationFailed
 from ...registry import register
-from ...utils import execute_unless_result_exists
+from ...utils import execute_unless_result_exists, with_registration_checkpoints
 from .options import ZaakOptionsSerializer
 from .registration_variables import register as variables_registry
 from .typing import RegistrationOptions
@@ -232,6 +232,7 @@ class StufZDSRegistration(BasePlugin[RegistrationOptions]):
         "children": RegistrationAttribute.children,
     }
 
+    @with_registration_checkpoints
     def pre_register_submission(
         self, submission: Submission, options: RegistrationOptions
     ) -> PreRegistrationResult:
@@ -445,6 +446,7 @@ class StufZDSRegistration(BasePlugin[RegistrationOptions]):
         if branch_number:
             glom(zaak_data, Assign(vestigings_nummer_key, branch_number))
 
+    @with_registration_checkpoints
     def register_submission(
         self, submission: Submission, options: RegistrationOptions
     ) -> dict | None:
@@ -648,6 +650,7 @@ class StufZDSRegistration(BasePlugin[RegistrationOptions]):
             ),
         ]
 
+    @with_registration_checkpoints
     def update_registration_with_confirmation_email(
         self, submission: Submission, options: RegistrationOptions
     ) -> dict | None:
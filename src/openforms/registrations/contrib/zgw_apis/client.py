@@ -11,6 +11,7 @@ The clients used are:
 
 from zgw_consumers.client import build_client
 
+from openforms.contrib.zgw.caching import get_cache_scope
 from openforms.contrib.zgw.clients import CatalogiClient, DocumentenClient, ZakenClient
 
 from .models import ZGWApiGroupConfig
@@ -28,7 +29,16 @@ def get_documents_client(config: ZGWApiGroupConfig) -> DocumentenClient:
     return build_client(service, client_factory=DocumentenClient)
 
 
-def get_catalogi_client(config: ZGWApiGroupConfig) -> CatalogiClient:
+def get_catalogi_client(
+    config: ZGWApiGroupConfig, cached: bool = False
+) -> CatalogiClient:
+    """
+    Build the Catalogi API client.
+
+    :param cached: Share the responses through the cache, for the lookups of the
+      registration. Other callers need the live data.
+    """
     service = config.ztc_service
     assert service is not None
-    return build_client(service, client_factory=CatalogiClient)
+    cache_scope = get_cache_scope(service) if cached else ""
+    return build_client(service, client_factory=CatalogiClient, cache_scope=cache_scope)
@@ -1,17 +1,21 @@
 import warnings
+from collections.abc import Sequence
+from copy import deepcopy
 from datetime import datetime
 from functools import partial, wraps
 from io import BytesIO
-from typing import Any, TypedDict
+from typing import TypedDict
 
+from django.conf import settings
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.text import Truncator
 from django.utils.translation import gettext, gettext_lazy as _
 
 import requests
 import structlog
 from furl import furl
-from glom import assign
+from glom import assign, glom
 
 from openforms.authentication.service import get_branch_number
 from openforms.config.data import Action
@@ -23,6 +27,8 @@ from openforms.contrib.zgw.clients.catalogi import (
     EigenschapSpecificatie,
     omschrijving_matcher,
 )
+from openforms.contrib.zgw.clients.documenten import DocumentenClient
+from openforms.contrib.zgw.clients.zaken import ZakenClient
 from openforms.contrib.zgw.service import (
     DocumentOptions,
     create_attachment_document,
@@ -30,7 +36,11 @@ from openforms.contrib.zgw.service import (
 )
 from openforms.emails.service import get_last_confirmation_email
 from openforms.submissions.mapping import SKIP, FieldConf, apply_data_mapping
-from openforms.submissions.models import Submission, SubmissionReport
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+)
 from openforms.submissions.public_references import generate_unique_submission_reference
 from openforms.typing import VariableValue
 from openforms.utils.date import datetime_in_amsterdam
@@ -40,8 +50,9 @@ from ...base import BasePlugin, PreRegistrationResult
 from ...constants import REGISTRATION_ATTRIBUTE, RegistrationAttribute
 from ...contrib.objects_api.handlers.v1 import _get_variables_for_context
 from ...exceptions import RegistrationFailed
+from ...executor import RegistrationExecutor, ThreadLocalClient
 from ...registry import register
-from ...utils import execute_unless_result_exists
+from ...utils import execute_unless_result_exists, with_registration_checkpoints
 from .checks import check_config
 from .client import get_catalogi_client, get_documents_client, get_zaken_client
 from .models import ZGWApiGroupConfig
@@ -100,6 +111,46 @@ def wrap_api_errors(func):
     return decorator
 
 
+def add_attachment_documents(
+    executor: RegistrationExecutor,
+    submission: Submission,
+    client: DocumentenClient,
+    name: str,
+    attachments: Sequence[tuple[SubmissionFileAttachment, DocumentOptions]],
+) -> dict[int, str]:
+    """
+    Add the uploads of the submission attachments to the registration calls.
+
+    The uploaded parts of large files are recorded as they complete, so that a retry
+    resumes from the last uploaded part.
+
+    :returns: The spec of the created document, by the ID of the attachment.
+    """
+    documents: dict[int, str] = {}
+    for attachment, options in attachments:
+        prefix = f"intermediate.documents.{attachment.pk}"
+        # copied, as the calling thread keeps updating the registration result
+        intermediate_results = deepcopy(
+            glom(submission.registration_result or {}, prefix, default={})
+        )
+        documents[attachment.pk] = executor.add(
+            f"{prefix}.document",
+            partial(
+                create_attachment_document,
+                client=client,
+                name=name,
+                submission_attachment=attachment,
+                options=options,
+                # assume same as submission
+                language=attachment.submission_step.submission.language_code,
+                intermediate_results=intermediate_results,
+                record=executor.get_recorder(prefix),
+            ),
+            group="documents",
+        )
+    return documents
+
+
 class _Eigenschap(TypedDict):
     url: str
     specificatie: EigenschapSpecificatie
@@ -223,6 +274,7 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
     }
 
     @wrap_api_errors
+    @with_registration_checkpoints
     def pre_register_submission(
         self, submission: "Submission", options: RegistrationOptions
     ) -> PreRegistrationResult:
@@ -251,7 +303,7 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
         if case_type_identification := options["case_type_identification"]:
             catalogue = options.get("catalogue")
             assert catalogue is not None  # enforced by validation
-            with get_catalogi_client(zgw) as catalogi_client:
+            with get_catalogi_client(zgw, cached=True) as catalogi_client:
                 zaaktype_url = _resolve_case_type(
                     catalogi_client,
                     catalogue,
@@ -292,6 +344,7 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
         )
 
     @wrap_api_errors
+    @with_registration_checkpoints
     def register_submission(
         self, submission: Submission, options: RegistrationOptions
     ) -> dict | None:
@@ -363,10 +416,20 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
             # party...
             verblijfsadres["aoaIdentificatie"] = "OFWORKAROUND"
 
+        executor = RegistrationExecutor(
+            submission,
+            plugin=self.identifier,
+            max_workers=settings.ZGW_REGISTRATION_CONCURRENCY,
+            group_limits={"documents": settings.ZGW_DOCUMENTS_UPLOAD_CONCURRENCY},
+        )
+
+        # every worker thread of the executor uses its own clients
         with (
-            get_documents_client(zgw) as documents_client,
-            get_zaken_client(zgw) as zaken_client,
-            get_catalogi_client(zgw) as catalogi_client,
+            ThreadLocalClient(partial(get_documents_client, zgw)) as documents_client,
+            ThreadLocalClient(partial(get_zaken_client, zgw)) as zaken_client,
+            ThreadLocalClient(
+                partial(get_catalogi_client, zgw, cached=True)
+            ) as catalogi_client,
         ):
             # resolve (default) document type to use
             if document_type_description := options["document_type_description"]:
@@ -399,7 +462,8 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
                     "doc_vertrouwelijkheidaanduiding"
                 ],
             }
-            summary_pdf_document = execute_unless_result_exists(
+            summary_pdf_document = executor.add(
+                "intermediate.documents.report.document",
                 partial(
                     create_report_document,
                     client=documents_client,
@@ -408,45 +472,39 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
                     options=pdf_options,
                     language=submission_report.submission.language_code,
                 ),
-                submission,
-                "intermediate.documents.report.document",
+                group="documents",
             )
 
             # Relate summary PDF
-            execute_unless_result_exists(
-                partial(
-                    zaken_client.relate_document,
-                    zaak=zaak,
-                    document=summary_pdf_document,
-                ),
-                submission,
+            executor.add(
                 "intermediate.documents.report.relation",
+                partial(ZakenClient.relate_document, zaken_client, zaak),
+                depends_on=[summary_pdf_document],
             )
 
-            initiator_rol = execute_unless_result_exists(
+            initiator_rol = executor.add(
+                "intermediate.initiator_rol",
                 partial(
-                    zaken_client.create_rol,
+                    ZakenClient.create_rol,
+                    zaken_client,
                     catalogi_client=catalogi_client,
                     zaak=zaak,
                     betrokkene=initiator_rol_data,
                 ),
-                submission,
-                "intermediate.initiator_rol",
             )
 
             # We may have multiple roles that need to be created, for now this is needed
             # for custom partners and children components
-            partners_rollen = []
+            partners_rollen: list[str] = []
             if partners_rol_data:
-                for index, data in enumerate(partners_rol_data):
-                    partners_roltype_omschrijving = options["partners_roltype"]
-                    partners_description = options["partners_description"]
-                    roltypen = catalogi_client.list_roltypen(
-                        zaaktype=zaak["zaaktype"],
-                        matcher=omschrijving_matcher(partners_roltype_omschrijving),
-                    )
-                    roltype = roltypen[0]
+                partners_description = options["partners_description"]
+                roltypen = catalogi_client.list_roltypen(
+                    zaaktype=zaak["zaaktype"],
+                    matcher=omschrijving_matcher(options["partners_roltype"]),
+                )
+                roltype = roltypen[0]
 
+                for index, data in enumerate(partners_rol_data):
                     data.update(
                         {
                             "roltype": roltype["url"],
@@ -465,32 +523,31 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
                         }
                     )
 
-                    partner_rol = execute_unless_result_exists(
+                    partner_rol = executor.add(
+                        f"intermediate.partner_rol.{index + 1}",
                         partial(
-                            zaken_client.create_rol,
+                            ZakenClient.create_rol,
+                            zaken_client,
                             catalogi_client=catalogi_client,
                             zaak=zaak,
                             betrokkene=data,
                         ),
-                        submission,
-                        f"intermediate.partner_rol.{index + 1}",
                     )
                     partners_rollen.append(partner_rol)
 
-            children_rollen = []
+            children_rollen: list[str] = []
             if children_rol_data:
+                children_description = options["children_description"]
+                roltypen = catalogi_client.list_roltypen(
+                    zaaktype=zaak["zaaktype"],
+                    matcher=omschrijving_matcher(options["children_roltype"]),
+                )
+                roltype = roltypen[0]
+
                 for index, data in enumerate(children_rol_data):
                     if data.get("selected") not in (None, True):
                         continue
 
-                    children_roltype_omschrijving = options["children_roltype"]
-                    children_description = options["children_description"]
-                    roltypen = catalogi_client.list_roltypen(
-                        zaaktype=zaak["zaaktype"],
-                        matcher=omschrijving_matcher(children_roltype_omschrijving),
-                    )
-                    roltype = roltypen[0]
-
                     data.update(
                         {
                             "roltype": roltype["url"],
@@ -509,19 +566,19 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
                         }
                     )
 
-                    child_rol = execute_unless_result_exists(
+                    child_rol = executor.add(
+                        f"intermediate.child_rol.{index + 1}",
                         partial(
-                            zaken_client.create_rol,
+                            ZakenClient.create_rol,
+                            zaken_client,
                             catalogi_client=catalogi_client,
                             zaak=zaak,
                             betrokkene=data,
                         ),
-                        submission,
-                        f"intermediate.child_rol.{index + 1}",
                     )
                     children_rollen.append(child_rol)
 
-            medewerker_rol: dict[str, Any] | None = None
+            medewerker_rol: str | None = None
             if submission.has_registrator:
                 assert submission.registrator
 
@@ -544,28 +601,28 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
                     },
                 }
 
-                medewerker_rol = execute_unless_result_exists(
+                medewerker_rol = executor.add(
+                    "intermediate.medewerker_rol",
                     partial(
-                        zaken_client.create_rol,
+                        ZakenClient.create_rol,
+                        zaken_client,
                         catalogi_client=catalogi_client,
                         zaak=zaak,
                         betrokkene=registrator_rol_data,
                     ),
-                    submission,
-                    "intermediate.medewerker_rol",
                 )
 
-            status = execute_unless_result_exists(
+            status = executor.add(
+                "intermediate.status",
                 partial(
-                    zaken_client.create_status,
+                    ZakenClient.create_status,
+                    zaken_client,
                     catalogi_client=catalogi_client,
                     zaak=zaak,
                 ),
-                submission,
-                "intermediate.status",
             )
 
-            # TODO: threading? asyncio?
+            attachments: list[tuple[SubmissionFileAttachment, DocumentOptions]] = []
             for attachment in submission.attachments:
                 # collect attributes of the attachment and add them to the configuration
                 # attribute names conform to the Documenten API specification
@@ -603,123 +660,129 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
                     doc_options["doc_vertrouwelijkheidaanduiding"] = (
                         vertrouwelijkheidaanduiding
                     )
+                attachments.append((attachment, doc_options))
 
-                attachment_document = execute_unless_result_exists(
+            attachment_documents = add_attachment_documents(
+                executor,
+                submission,
+                client=documents_client,
+                name=submission.form.admin_name,
+                attachments=attachments,
+            )
+            for attachment_id, attachment_document in attachment_documents.items():
+                executor.add(
+                    f"intermediate.documents.{attachment_id}.relation",
+                    partial(ZakenClient.relate_document, zaken_client, zaak),
+                    depends_on=[attachment_document],
+                )
+
+            # Register submission to Objects API if configured
+            zaakobject: str | None = None
+            if (
+                options["objects_api_group"]
+                and (object_type := options.get("objecttype"))
+                and (object_type_version := options.get("objecttype_version"))
+                and options.get("content_json")
+            ):
+                # rendering the object data needs the database, so this is done in
+                # the calling thread
+                result["objects_api_object"] = execute_unless_result_exists(
                     partial(
-                        create_attachment_document,
-                        client=documents_client,
-                        name=submission.form.admin_name,
-                        submission_attachment=attachment,
-                        options=doc_options,
-                        language=attachment.submission_step.submission.language_code,  # assume same as submission
+                        self.register_submission_to_objects_api, submission, options
                     ),
                     submission,
-                    f"intermediate.documents.{attachment.id}.document",  # type: ignore
+                    "intermediate.objects_api_object",
                 )
-                execute_unless_result_exists(
+
+                # connect the zaak with the object
+                objecttype_version = (
+                    furl(object_type) / "versions" / str(object_type_version)
+                )
+
+                zaakobject = executor.add(
+                    "intermediate.objects_api_zaakobject",
                     partial(
-                        zaken_client.relate_document,
-                        zaak=zaak,
-                        document=attachment_document,
+                        ZakenClient.create_zaakobject,
+                        zaken_client,
+                        zaak,
+                        result["objects_api_object"]["url"],
+                        objecttype_version.url,
                     ),
+                )
+
+            # Map variables to case eigenschappen (if mappings are defined)
+            zaakeigenschappen: dict[str, str] = {}
+            if variables_properties := options.get("property_mappings"):
+                property_mappings = get_property_mappings_from_submission(
+                    submission, variables_properties
+                )
+
+                eigenschappen = execute_unless_result_exists(
+                    partial(catalogi_client.list_eigenschappen, zaak["zaaktype"]),
                     submission,
-                    f"intermediate.documents.{attachment.id}.relation",  # type: ignore
+                    "intermediate.zaaktype_eigenschappen",
                 )
 
-            result.update(
-                {
-                    "document": summary_pdf_document,
-                    "status": status,
-                    "initiator_rol": initiator_rol,
+                retrieved_eigenschappen: dict[str, _Eigenschap] = {
+                    eigenschap["naam"]: {
+                        "url": eigenschap["url"],
+                        "specificatie": eigenschap["specificatie"],
+                    }
+                    for eigenschap in eigenschappen
                 }
-            )
 
-        if medewerker_rol:
-            result["medewerker_rol"] = medewerker_rol
+                for key, value in property_mappings.items():
+                    if key in retrieved_eigenschappen:
+                        processed_value = process_according_to_eigenschap_format(
+                            retrieved_eigenschappen[key]["specificatie"], value
+                        )
+
+                        eigenschap_url = furl(retrieved_eigenschappen[key].get("url"))
+                        eigenschap_uuid = eigenschap_url.path.segments[-1]
+
+                        zaakeigenschappen[eigenschap_uuid] = executor.add(
+                            f"intermediate.zaakeigenschap.{eigenschap_uuid}",
+                            partial(
+                                ZakenClient.create_zaakeigenschap,
+                                zaken_client,
+                                zaak,
+                                {
+                                    "eigenschap": eigenschap_url.url,
+                                    "waarde": processed_value,
+                                },
+                            ),
+                        )
+
+            # the independent calls (those only needing the zaak) run concurrently
+            call_results = executor.run()
+
+        result.update(
+            {
+                "document": call_results[summary_pdf_document],
+                "status": call_results[status],
+                "initiator_rol": call_results[initiator_rol],
+            }
+        )
+
+        if medewerker_rol and (medewerker_rol_result := call_results[medewerker_rol]):
+            result["medewerker_rol"] = medewerker_rol_result
 
         if partners_rol_data:
-            result["partners_rollen"] = partners_rollen
+            result["partners_rollen"] = [call_results[rol] for rol in partners_rollen]
         if children_rol_data:
-            result["children_rollen"] = children_rollen
-
-        # Register submission to Objects API if configured
-        if (
-            options["objects_api_group"]
-            and (object_type := options.get("objecttype"))
-            and (object_type_version := options.get("objecttype_version"))
-            and options.get("content_json")
-        ):
-            result["objects_api_object"] = execute_unless_result_exists(
-                partial(self.register_submission_to_objects_api, submission, options),
-                submission,
-                "intermediate.objects_api_object",
-            )
-
-            # connect the zaak with the object
-            objecttype_version = (
-                furl(object_type) / "versions" / str(object_type_version)
-            )
+            result["children_rollen"] = [call_results[rol] for rol in children_rollen]
 
-            result["zaakobject"] = execute_unless_result_exists(
-                partial(
-                    zaken_client.create_zaakobject,
-                    zaak,
-                    result["objects_api_object"]["url"],
-                    objecttype_version.url,
-                ),
-                submission,
-                "intermediate.objects_api_zaakobject",
-            )
-
-        # Map variables to case eigenschappen (if mappings are defined)
-        if variables_properties := options.get("property_mappings"):
-            property_mappings = get_property_mappings_from_submission(
-                submission, variables_properties
-            )
+        if zaakobject:
+            result["zaakobject"] = call_results[zaakobject]
 
-            eigenschappen = execute_unless_result_exists(
-                partial(catalogi_client.list_eigenschappen, zaak["zaaktype"]),
-                submission,
-                "intermediate.zaaktype_eigenschappen",
+        for eigenschap_uuid, spec in zaakeigenschappen.items():
+            assign(
+                result,
+                f"zaakeigenschappen.{eigenschap_uuid}",
+                call_results[spec],
+                missing=dict,
             )
 
-            retrieved_eigenschappen: dict[str, _Eigenschap] = {
-                eigenschap["naam"]: {
-                    "url": eigenschap["url"],
-                    "specificatie": eigenschap["specificatie"],
-                }
-                for eigenschap in eigenschappen
-            }
-
-            for key, value in property_mappings.items():
-                if key in retrieved_eigenschappen:
-                    processed_value = process_according_to_eigenschap_format(
-                        retrieved_eigenschappen[key]["specificatie"], value
-                    )
-
-                    eigenschap_url = furl(retrieved_eigenschappen[key].get("url"))
-                    eigenschap_uuid = eigenschap_url.path.segments[-1]
-
-                    created_zaakeigenschap = execute_unless_result_exists(
-                        partial(
-                            zaken_client.create_zaakeigenschap,
-                            zaak,
-                            {
-                                "eigenschap": eigenschap_url.url,
-                                "waarde": processed_value,
-                            },
-                        ),
-                        submission,
-                        f"intermediate.zaakeigenschap.{eigenschap_uuid}",
-                    )
-
-                    assign(
-                        result,
-                        f"zaakeigenschappen.{eigenschap_uuid}",
-                        created_zaakeigenschap,
-                        missing=dict,
-                    )
-
         submission.registration_result = result
         submission.save()
         return result
@@ -734,6 +797,50 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
         with get_zaken_client(zgw) as zaken_client:
             zaken_client.set_payment_status(zaak)
 
+    @wrap_api_errors
+    def prefetch_catalogue(self, options: RegistrationOptions) -> None:
+        zgw = options["zgw_api_group"]
+        zgw.apply_defaults_to(options)
+        now = timezone.now()
+
+        with get_catalogi_client(zgw, cached=True) as catalogi_client:
+            if case_type_identification := options["case_type_identification"]:
+                catalogue = options.get("catalogue")
+                assert catalogue is not None  # enforced by validation
+                zaaktype_url = _resolve_case_type(
+                    catalogi_client, catalogue, case_type_identification, now
+                )
+            else:
+                zaaktype_url = options["zaaktype"]
+
+            if document_type_description := options["document_type_description"]:
+                catalogue = options.get("catalogue")
+                assert catalogue is not None  # enforced by validation
+                _resolve_document_type(
+                    catalogi_client,
+                    catalogue=catalogue,
+                    zaaktype_url=zaaktype_url,
+                    description=document_type_description,
+                    submission_completed=now,
+                )
+
+            # the lookups of the initial status and the initiator role
+            catalogi_client.list_statustypen(zaaktype_url)
+            catalogi_client.list_roltypen(
+                zaaktype=zaaktype_url, omschrijving_generiek="initiator"
+            )
+            if any(
+                options.get(option)
+                for option in (
+                    "medewerker_roltype",
+                    "partners_roltype",
+                    "children_roltype",
+                )
+            ):
+                catalogi_client.list_roltypen(zaaktype=zaaktype_url)
+            if options.get("property_mappings"):
+                catalogi_client.list_eigenschappen(zaaktype_url)
+
     def check_config(self):
         check_config()
 
@@ -797,6 +904,7 @@ class ZGWRegistration(BasePlugin[RegistrationOptions]):
             return response
 
     @wrap_api_errors
+    @with_registration_checkpoints
     def update_registration_with_confirmation_email(
         self, submission: Submission, options: RegistrationOptions
     ) -> dict | None:
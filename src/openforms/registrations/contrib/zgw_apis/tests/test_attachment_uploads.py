@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from privates.test import temp_private_root
+
+from openforms.contrib.zgw.clients import DocumentenClient
+from openforms.contrib.zgw.service import DocumentOptions
+from openforms.submissions.tests.factories import (
+    SubmissionFactory,
+    SubmissionFileAttachmentFactory,
+)
+
+from ....executor import RegistrationExecutor
+from ..plugin import add_attachment_documents
+
+OPTIONS: DocumentOptions = {
+    "informatieobjecttype": "https://catalogi/informatieobjecttypen/1",
+    "organisatie_rsin": "000000000",
+}
+
+
+@temp_private_root()
+class ConcurrentAttachmentUploadTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.submission = SubmissionFactory.create(completed=True)
+        self.attachments = [
+            SubmissionFileAttachmentFactory.create(
+                submission_step__submission=self.submission
+            )
+            for _ in range(3)
+        ]
+        self.documents_client = DocumentenClient(base_url="https://dummy/")
+
+    def _upload(self) -> dict[int, dict]:
+        executor = RegistrationExecutor(
+            self.submission,
+            plugin="zgw-create-zaak",
+            max_workers=4,
+            group_limits={"documents": 2},
+        )
+        specs = add_attachment_documents(
+            executor,
+            self.submission,
+            client=self.documents_client,
+            name="Form",
+            attachments=[(attachment, OPTIONS) for attachment in self.attachments],
+        )
+        results = executor.run()
+        return {attachment_id: results[spec] for attachment_id, spec in specs.items()}
+
+    def test_documents_are_stored_by_attachment(self):
+        def upload(*, submission_attachment, record, **kwargs):
+            record("upload", {"url": "locked"})
+            return {"url": f"https://dummy/{submission_attachment.pk}"}
+
+        with patch(
+            "openforms.registrations.contrib.zgw_apis.plugin.create_attachment_document",
+            side_effect=upload,
+        ):
+            documents = self._upload()
+
+        self.submission.refresh_from_db()
+        self.submission.load_registration_checkpoints()
+        intermediate = self.submission.registration_result["intermediate"]
+        for attachment in self.attachments:
+            expected = {"url": f"https://dummy/{attachment.pk}"}
+            with self.subTest(attachment=attachment):
+                self.assertEqual(documents[attachment.pk], expected)
+                self.assertEqual(
+                    intermediate["documents"][str(attachment.pk)],
+                    {"upload": {"url": "locked"}, "document": expected},
+                )
+
+    def test_successful_uploads_are_kept_on_failure(self):
+        # no new calls are started after a failure, so the failing upload is started
+        # last - after the first upload completed, as only two run at the same time
+        *succeeding, failing = self.attachments
+
+        def upload(*, submission_attachment, record, **kwargs):
+            if submission_attachment == failing:
+                record("parts.1", {"voltooid": True})
+                raise RuntimeError("upload failed")
+            return {"url": f"https://dummy/{submission_attachment.pk}"}
+
+        with (
+            patch(
+                "openforms.registrations.contrib.zgw_apis.plugin.create_attachment_document",
+                side_effect=upload,
+            ),
+            self.assertRaisesMessage(RuntimeError, "upload failed"),
+        ):
+            self._upload()
+
+        self.submission.refresh_from_db()
+        self.submission.load_registration_checkpoints()
+        documents = self.submission.registration_result["intermediate"]["documents"]
+        self.assertEqual(
+            documents[str(failing.pk)], {"parts": {"1": {"voltooid": True}}}
+        )
+        for attachment in succeeding:
+            self.assertIn("document", documents[str(attachment.pk)])
+
+        # retrying only uploads the failed attachment, resuming from its parts
+        with patch(
+            "openforms.registrations.contrib.zgw_apis.plugin.create_attachment_document",
+            return_value={"url": "https://dummy/retried"},
+        ) as mock_upload:
+            self._upload()
+
+        mock_upload.assert_called_once()
+        self.assertEqual(
+            mock_upload.call_args.kwargs["intermediate_results"],
+            {"parts": {"1": {"voltooid": True}}},
+        )
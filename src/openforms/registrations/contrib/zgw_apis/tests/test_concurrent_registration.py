@@ -0,0 +1,115 @@
+from threading import Barrier, get_ident
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+import requests_mock
+from privates.test import temp_private_root
+
+from openforms.submissions.tests.factories import (
+    SubmissionFactory,
+    SubmissionReportFactory,
+)
+from openforms.utils.tests.nlx import DisableNLXRewritingMixin
+
+from ..client import get_zaken_client
+from ..plugin import ZGWRegistration
+from ..typing import RegistrationOptions
+from .factories import ZGWApiGroupConfigFactory
+
+ZAKEN_ROOT = "https://zaken.example.com/api/v1/"
+DOCUMENTEN_ROOT = "https://documenten.example.com/api/v1/"
+CATALOGI_ROOT = "https://catalogi.example.com/api/v1/"
+DOCUMENT_URL = f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten/1"
+ROL_URL = f"{ZAKEN_ROOT}rollen/1"
+STATUS_URL = f"{ZAKEN_ROOT}statussen/1"
+ZAAK = {
+    "url": f"{ZAKEN_ROOT}zaken/1",
+    "zaaktype": f"{CATALOGI_ROOT}zaaktypen/1",
+}
+
+
+def _paginated(*results):
+    return {"count": len(results), "next": None, "previous": None, "results": results}
+
+
+@temp_private_root()
+@override_settings(ZGW_REGISTRATION_CONCURRENCY=4)
+class ConcurrentRegistrationTests(DisableNLXRewritingMixin, TestCase):
+    @requests_mock.Mocker()
+    def test_concurrent_calls_use_separate_clients(self, m: requests_mock.Mocker):
+        zgw_group = ZGWApiGroupConfigFactory.create(
+            zrc_service__api_root=ZAKEN_ROOT,
+            drc_service__api_root=DOCUMENTEN_ROOT,
+            ztc_service__api_root=CATALOGI_ROOT,
+        )
+        submission = SubmissionFactory.create(
+            completed=True, registration_result={"zaak": ZAAK}
+        )
+        SubmissionReportFactory.create(submission=submission)
+        options: RegistrationOptions = {
+            "zgw_api_group": zgw_group,
+            "case_type_identification": "",
+            "document_type_description": "",
+            "zaaktype": ZAAK["zaaktype"],
+            "informatieobjecttype": f"{CATALOGI_ROOT}informatieobjecttypen/1",
+            "organisatie_rsin": "000000000",
+            "zaak_vertrouwelijkheidaanduiding": "openbaar",
+            "doc_vertrouwelijkheidaanduiding": "openbaar",
+            "objects_api_group": None,
+            "product_url": "",
+            "partners_roltype": "",
+            "partners_description": "",
+            "children_roltype": "",
+            "children_description": "",
+        }
+        headers = {"API-version": "1.3.1"}
+        m.get(
+            f"{CATALOGI_ROOT}roltypen",
+            headers=headers,
+            json=_paginated({"url": f"{CATALOGI_ROOT}roltypen/1"}),
+        )
+        m.get(
+            f"{CATALOGI_ROOT}statustypen",
+            headers=headers,
+            json=_paginated({"url": f"{CATALOGI_ROOT}statustypen/1", "volgnummer": 1}),
+        )
+        m.post(
+            f"{DOCUMENTEN_ROOT}enkelvoudiginformatieobjecten",
+            status_code=201,
+            json={"url": DOCUMENT_URL},
+        )
+        m.post(
+            f"{ZAKEN_ROOT}zaakinformatieobjecten",
+            status_code=201,
+            json={"url": f"{ZAKEN_ROOT}zaakinformatieobjecten/1"},
+        )
+        m.post(f"{ZAKEN_ROOT}rollen", status_code=201, json={"url": ROL_URL})
+        m.post(f"{ZAKEN_ROOT}statussen", status_code=201, json={"url": STATUS_URL})
+        # requests-mock handles a single request at a time, so the clients are checked
+        # instead. Building the first two clients deadlocks (and times out) unless the
+        # rol and status are created at the same time.
+        barrier = Barrier(2, timeout=5)
+        zaken_client_threads: list[int] = []
+
+        def _get_zaken_client(config):
+            zaken_client_threads.append(get_ident())
+            if len(zaken_client_threads) <= 2:
+                barrier.wait()
+            return get_zaken_client(config)
+
+        plugin = ZGWRegistration("zgw-create-zaak")
+
+        with patch(
+            "openforms.registrations.contrib.zgw_apis.plugin.get_zaken_client",
+            side_effect=_get_zaken_client,
+        ):
+            result = plugin.register_submission(submission, options)
+
+        assert result is not None
+        self.assertEqual(result["initiator_rol"], {"url": ROL_URL})
+        self.assertEqual(result["status"], {"url": STATUS_URL})
+        self.assertEqual(result["document"], {"url": DOCUMENT_URL})
+        # every worker thread builds its own client
+        self.assertGreaterEqual(len(zaken_client_threads), 2)
+        self.assertEqual(len(set(zaken_client_threads)), len(zaken_client_threads))
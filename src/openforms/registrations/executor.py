@@ -0,0 +1,280 @@
+"""
+Execute the calls of a registration plugin concurrently.
+
+Registration plugins typically make a number of calls to external services, where many
+of them only depend on the result of a single earlier call (e.g. everything that is
+related to a created case). The :class:`RegistrationExecutor` runs those calls in a
+thread pool as soon as their dependencies are done.
+
+Every call is identified by the spec of its (intermediate) result in the registration
+result of the submission, like :func:`openforms.registrations.utils.execute_unless_result_exists`
+does for sequential calls. Calls with an existing result are not repeated, so a retry
+of a partially failed registration only makes the remaining calls.
+
+The worker threads only make the calls - the results are checkpointed in the calling
+thread, which owns the database connection. Results completing at the same time are
+written together. The API clients (and their HTTP sessions) are not shared between the
+worker threads either, see :class:`ThreadLocalClient`.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from queue import SimpleQueue
+from threading import Lock, local
+from typing import Any
+
+import structlog
+from ape_pie import APIClient
+from glom import glom
+
+from openforms.submissions.models import Submission
+
+from .metrics import call_duration
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class ThreadLocalClient[C: APIClient]:
+    """
+    Proxy to an API client, building a separate client for every thread using it.
+
+    A ``requests`` session (and the state some clients keep) is not safe to share
+    between the worker threads of the executor. Attribute lookups on the proxy are
+    resolved on the client of the current thread, which is created (and its session
+    opened) on first use. Use it as a context manager to close all the clients.
+
+    Binding a method of the proxy resolves the client of the thread that binds it. Pass
+    the unbound method with the proxy as ``self`` to the executor instead, e.g.
+    ``partial(ZakenClient.relate_document, zaken_client, zaak)``.
+    """
+
+    def __init__(self, factory: Callable[[], C]):
+        self._factory = factory
+        self._local = local()
+        self._clients: list[C] = []
+        self._lock = Lock()
+
+    def __enter__(self) -> C:
+        # the proxy behaves like the client itself
+        return self  # pyright: ignore[reportReturnType]
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_client(), name)
+
+    def _get_client(self) -> C:
+        client: C | None = getattr(self._local, "client", None)
+        if client is None:
+            client = self._factory()
+            client.__enter__()
+            self._local.client = client
+            with self._lock:
+                self._clients.append(client)
+        return client
+
+    def close(self) -> None:
+        with self._lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            client.__exit__(None, None, None)
+        self._local = local()
+
+
+@dataclass
+class _Call:
+    spec: str
+    callback: Callable[..., Any]
+    depends_on: Sequence[str]
+    group: str
+
+
+@dataclass
+class _Timed:
+    result: Any
+    duration: float
+
+
+def _get_operation(callback: Callable[..., Any]) -> str:
+    while isinstance(callback, partial):
+        callback = callback.func
+    return getattr(callback, "__qualname__", type(callback).__qualname__)
+
+
+@dataclass
+class RegistrationExecutor:
+    """
+    Run the calls of a registration concurrently, respecting their dependencies.
+
+    :param submission: The submission being registered, holding the results.
+    :param plugin: The registration plugin ID, used in the metrics.
+    :param max_workers: The maximum number of concurrent calls. With a single worker,
+      the calls are made in the calling thread, in the order they were added.
+    :param group_limits: The maximum number of concurrent calls per group of calls,
+      e.g. to limit the number of concurrent file uploads.
+    """
+
+    submission: Submission
+    plugin: str
+    max_workers: int = 1
+    group_limits: Mapping[str, int] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict, init=False)
+    _calls: dict[str, _Call] = field(default_factory=dict, init=False)
+    _records: SimpleQueue[tuple[str, Any]] = field(
+        default_factory=SimpleQueue, init=False
+    )
+
+    def add(
+        self,
+        spec: str,
+        callback: Callable[..., Any],
+        *,
+        depends_on: Sequence[str] = (),
+        group: str = "",
+    ) -> str:
+        """
+        Add a call to the execution graph.
+
+        :param spec: The spec of the result in the registration result.
+        :param callback: The call to make, receiving the results of its dependencies
+          as positional arguments.
+        :param depends_on: The specs of the calls that must be done first.
+        :param group: Name of the group of calls, see ``group_limits``.
+        :returns: The spec, to use in the ``depends_on`` of other calls.
+        """
+        assert spec not in self._calls, f"Duplicate call for spec '{spec}'"
+        for dependency in depends_on:
+            assert dependency in self._calls, f"Unknown dependency '{dependency}'"
+        self._calls[spec] = _Call(
+            spec=spec, callback=callback, depends_on=depends_on, group=group
+        )
+        return spec
+
+    def record(self, spec: str, value: Any) -> None:
+        """
+        Persist an intermediate result of a call in progress.
+
+        Safe to call from the worker threads - the result is stored by the calling
+        thread.
+        """
+        self._records.put((spec, value))
+
+    def get_recorder(self, prefix: str) -> Callable[[str, Any], None]:
+        """
+        Get a callback to :meth:`record` results relative to the ``prefix`` spec.
+        """
+        return lambda key, value: self.record(f"{prefix}.{key}", value)
+
+    def run(self) -> dict[str, Any]:
+        """
+        Make all the calls, returning the results by spec.
+
+        After a failed call, no new calls are started. The results of the calls that
+        did complete are persisted before the (first) error is raised.
+        """
+        registration_result = self.submission.registration_result or {}
+        results: dict[str, Any] = {}
+        pending: dict[str, _Call] = {}
+        for spec, call in self._calls.items():
+            if existing_result := glom(registration_result, spec, default=None):
+                results[spec] = existing_result
+            else:
+                pending[spec] = call
+
+        if self.max_workers <= 1:
+            for call in pending.values():
+                completed: dict[str, Any] = {}
+                try:
+                    timed = self._make_call(call, results)
+                    results[call.spec] = self._complete(call, timed, completed)
+                finally:
+                    self._flush(completed)
+            return results
+
+        running: dict[Future[_Timed], _Call] = {}
+        running_per_group: Counter[str] = Counter()
+        errors: list[BaseException] = []
+
+        def _can_start(call: _Call) -> bool:
+            if not all(dependency in results for dependency in call.depends_on):
+                return False
+            limit = self.group_limits.get(call.group)
+            return limit is None or running_per_group[call.group] < limit
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                if not errors:
+                    for spec, call in list(pending.items()):
+                        if len(running) >= self.max_workers:
+                            break
+                        if not _can_start(call):
+                            continue
+                        del pending[spec]
+                        future = executor.submit(self._make_call, call, results)
+                        running[future] = call
+                        running_per_group[call.group] += 1
+
+                if not running:
+                    break
+
+                done, _ = wait(running, timeout=0.5, return_when=FIRST_COMPLETED)
+                completed: dict[str, Any] = {}
+                for future in done:
+                    call = running.pop(future)
+                    running_per_group[call.group] -= 1
+                    if (exc := future.exception()) is not None:
+                        errors.append(exc)
+                        continue
+                    results[call.spec] = self._complete(
+                        call, future.result(), completed
+                    )
+                # the results completed in the same round are written together
+                self._flush(completed)
+
+        self._flush({})
+        if errors:
+            raise errors[0]
+        assert not pending, "Unresolvable dependencies in the registration calls"
+        return results
+
+    def _make_call(self, call: _Call, results: Mapping[str, Any]) -> _Timed:
+        args = [results[dependency] for dependency in call.depends_on]
+        start = time.perf_counter()
+        result = call.callback(*args)
+        return _Timed(result=result, duration=time.perf_counter() - start)
+
+    def _complete(self, call: _Call, timed: _Timed, completed: dict[str, Any]) -> Any:
+        operation = _get_operation(call.callback)
+        self.timings[call.spec] = timed.duration
+        call_duration.record(
+            timed.duration,
+            attributes={
+                "openforms.plugin.identifier": self.plugin,
+                "operation": operation,
+            },
+        )
+        logger.debug(
+            "registration_call_completed",
+            submission_uuid=str(self.submission.uuid),
+            spec=call.spec,
+            operation=operation,
+            duration=timed.duration,
+        )
+        completed[call.spec] = timed.result
+        return timed.result
+
+    def _flush(self, completed: dict[str, Any]) -> None:
+        results: dict[str, Any] = {}
+        while not self._records.empty():
+            spec, value = self._records.get()
+            results[spec] = value
+        results.update(completed)
+        if results:
+            self.submission.record_registration_results(results)
@@ -0,0 +1,43 @@
+from django.core.management import BaseCommand
+
+from openforms.forms.models import Form, FormRegistrationBackend
+
+from ...service import prefetch_catalogue
+
+
+class Command(BaseCommand):
+    help = (
+        "Retrieve the catalogue data (case types, document types...) referenced by the "
+        "registration backends of the live forms, so that it's cached for the "
+        "registrations."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--form",
+            dest="form_ids",
+            type=int,
+            action="append",
+            help="ID of a form to warm the cache for. Can be given multiple times.",
+        )
+
+    def handle(self, **options):
+        forms = Form.objects.live()
+        if form_ids := options["form_ids"]:
+            forms = forms.filter(pk__in=form_ids)
+        backends = FormRegistrationBackend.objects.filter(
+            form__in=forms
+        ).select_related("form")
+
+        num_failed = 0
+        for backend in backends.order_by("form", "pk").iterator():
+            self.stdout.write(f"Prefetching the catalogue data for {backend}...")
+            try:
+                prefetch_catalogue(backend.backend, backend.options)
+            except Exception as exc:
+                num_failed += 1
+                self.stderr.write(f"Prefetching failed with error: {exc}")
+
+        self.stdout.write(
+            f"Done, prefetching failed for {num_failed} registration backend(s)."
+        )
@@ -0,0 +1,10 @@
+from opentelemetry import metrics
+
+meter = metrics.get_meter("openforms.registrations")
+
+call_duration = meter.create_histogram(
+    name="openforms.registration.call_duration",
+    unit="s",
+    description="Duration of a single (external) call made by a registration plugin.",
+    explicit_bucket_boundaries_advisory=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
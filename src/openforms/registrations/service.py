@@ -8,6 +8,7 @@ from .registry import register as registry
 __all__ = [
     "get_registration_plugin",
     "plugin_allows_json_schema_generation",
+    "prefetch_catalogue",
     "process_variable_schema",
 ]
 
@@ -65,3 +66,24 @@ def process_variable_schema(
         )
 
     plugin.process_variable_schema(component, schema, backend_options)
+
+
+def prefetch_catalogue(backend: str, options: dict) -> None:
+    """
+    Retrieve (and cache) the catalogue data referenced by the registration options.
+
+    :param backend: The backend identifier.
+    :param options: The (serialized) backend options, as stored on the form.
+    :raises ValidationError: if the options are not valid.
+    """
+    try:
+        plugin = registry[backend]
+    except KeyError:
+        raise InvalidBackendIdError(f"No plugin found for backend id: {backend}")
+
+    serializer = plugin.configuration_options(
+        data=options,
+        context={"validate_business_logic": False},
+    )
+    serializer.is_valid(raise_exception=True)
+    plugin.prefetch_catalogue(serializer.validated_data)
@@ -0,0 +1,176 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from django.test import SimpleTestCase, TestCase
+
+from ape_pie import APIClient
+
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from ..executor import RegistrationExecutor, ThreadLocalClient
+
+
+class RegistrationExecutorTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.submission = SubmissionFactory.create(
+            completed=True, registration_result={"zaak": {"url": "zaak"}}
+        )
+
+    def test_results_are_stored_by_spec(self):
+        executor = RegistrationExecutor(self.submission, plugin="test", max_workers=4)
+        document = executor.add("intermediate.document", lambda: {"url": "document"})
+        executor.add(
+            "intermediate.relation",
+            lambda document: {"document": document["url"]},
+            depends_on=[document],
+        )
+        executor.add("intermediate.status", lambda: "status")
+
+        results = executor.run()
+
+        self.assertEqual(results["intermediate.relation"], {"document": "document"})
+        self.submission.refresh_from_db()
+        self.submission.load_registration_checkpoints()
+        self.assertEqual(
+            self.submission.registration_result["intermediate"],
+            {
+                "document": {"url": "document"},
+                "relation": {"document": "document"},
+                "status": "status",
+            },
+        )
+        self.assertEqual(
+            set(executor.timings),
+            {"intermediate.document", "intermediate.relation", "intermediate.status"},
+        )
+
+    def test_independent_calls_run_concurrently(self):
+        # deadlocks (and times out) unless both calls are running at the same time
+        barrier = Barrier(2, timeout=5)
+        executor = RegistrationExecutor(self.submission, plugin="test", max_workers=2)
+        executor.add("intermediate.first", lambda: barrier.wait() + 1)
+        executor.add("intermediate.second", lambda: barrier.wait() + 1)
+
+        results = executor.run()
+
+        self.assertEqual(set(results.values()), {1, 2})
+
+    def test_group_limit(self):
+        running = 0
+        max_running = 0
+
+        def upload():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            time.sleep(0.01)
+            running -= 1
+            return "document"
+
+        executor = RegistrationExecutor(
+            self.submission,
+            plugin="test",
+            max_workers=4,
+            group_limits={"documents": 1},
+        )
+        for index in range(4):
+            executor.add(f"intermediate.documents.{index}", upload, group="documents")
+
+        executor.run()
+
+        self.assertEqual(max_running, 1)
+
+    def test_existing_results_are_not_repeated(self):
+        self.submission.registration_result["intermediate"] = {"status": "existing"}
+        calls = []
+        executor = RegistrationExecutor(self.submission, plugin="test", max_workers=2)
+        status = executor.add("intermediate.status", lambda: calls.append("status"))
+        executor.add(
+            "intermediate.relation",
+            lambda status: calls.append(status) or "relation",
+            depends_on=[status],
+        )
+
+        results = executor.run()
+
+        self.assertEqual(calls, ["existing"])
+        self.assertEqual(results["intermediate.status"], "existing")
+
+    def test_completed_calls_are_stored_on_failure(self):
+        def fail():
+            raise RuntimeError("call failed")
+
+        for max_workers in (1, 2):
+            with self.subTest(max_workers=max_workers):
+                self.submission.registration_result = {"zaak": {"url": "zaak"}}
+                executor = RegistrationExecutor(
+                    self.submission, plugin="test", max_workers=max_workers
+                )
+                executor.add("intermediate.status", lambda: "status")
+                failing = executor.add("intermediate.failing", fail)
+                executor.add(
+                    "intermediate.dependent", lambda _: "never", depends_on=[failing]
+                )
+
+                with self.assertRaisesMessage(RuntimeError, "call failed"):
+                    executor.run()
+
+                self.submission.refresh_from_db()
+                self.submission.load_registration_checkpoints()
+                self.assertEqual(
+                    self.submission.registration_result["intermediate"],
+                    {"status": "status"},
+                )
+
+    def test_recorded_results_are_stored(self):
+        executor = RegistrationExecutor(self.submission, plugin="test", max_workers=2)
+
+        def upload():
+            record = executor.get_recorder("intermediate.documents.1")
+            record("parts.1", {"voltooid": True})
+            raise RuntimeError("upload failed")
+
+        executor.add("intermediate.documents.1.document", upload)
+
+        with self.assertRaises(RuntimeError):
+            executor.run()
+
+        self.submission.refresh_from_db()
+        self.submission.load_registration_checkpoints()
+        self.assertEqual(
+            self.submission.registration_result["intermediate"]["documents"],
+            {"1": {"parts": {"1": {"voltooid": True}}}},
+        )
+
+
+class ThreadLocalClientTests(SimpleTestCase):
+    def test_every_thread_uses_its_own_client(self):
+        barrier = Barrier(2, timeout=5)
+        clients: list[APIClient] = []
+
+        def factory() -> APIClient:
+            client = APIClient("https://example.com/")
+            clients.append(client)
+            return client
+
+        with ThreadLocalClient(factory) as proxy:
+
+            def get_base_url(_) -> str:
+                # both threads use the proxy at the same time
+                barrier.wait()
+                return proxy.base_url
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                base_urls = list(pool.map(get_base_url, range(2)))
+            # a thread re-uses its client
+            proxy.base_url
+            proxy.headers
+
+            self.assertEqual(base_urls, ["https://example.com/"] * 2)
+            self.assertEqual(len(clients), 3)
+            self.assertTrue(all(client._in_context_manager for client in clients))
+
+        self.assertFalse(any(client._in_context_manager for client in clients))
@@ -0,0 +1,93 @@
+from unittest.mock import Mock
+
+from django.test import TestCase
+
+from openforms.submissions.models import RegistrationCheckpoint
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from ..utils import execute_unless_result_exists, with_registration_checkpoints
+
+
+class Plugin:
+    def __init__(self, callback):
+        self.callback = callback
+
+    @with_registration_checkpoints
+    def register_submission(self, submission, options):
+        zaak = execute_unless_result_exists(
+            self.callback, submission, "intermediate.zaak"
+        )
+        execute_unless_result_exists(
+            lambda: {"zaak": zaak["url"]}, submission, "intermediate.status"
+        )
+
+
+class FailingPlugin(Plugin):
+    @with_registration_checkpoints
+    def register_submission(self, submission, options):
+        execute_unless_result_exists(self.callback, submission, "intermediate.zaak")
+        raise RuntimeError("failed")
+
+
+class RegistrationCheckpointTests(TestCase):
+    def test_results_are_checkpointed_until_the_method_returns(self):
+        submission = SubmissionFactory.create(completed=True)
+
+        execute_unless_result_exists(lambda: "result", submission, "intermediate.foo")
+
+        self.assertEqual(
+            submission.registration_result, {"intermediate": {"foo": "result"}}
+        )
+        checkpoint = RegistrationCheckpoint.objects.get()
+        self.assertEqual(checkpoint.key, "intermediate.foo")
+        self.assertEqual(checkpoint.value, "result")
+        submission.refresh_from_db()
+        self.assertIsNone(submission.registration_result)
+
+    def test_results_are_saved_at_once(self):
+        submission = SubmissionFactory.create(completed=True)
+        plugin = Plugin(lambda: {"url": "zaak"})
+
+        plugin.register_submission(submission, {})
+
+        submission.refresh_from_db()
+        self.assertEqual(
+            submission.registration_result,
+            {"intermediate": {"zaak": {"url": "zaak"}, "status": {"zaak": "zaak"}}},
+        )
+        self.assertFalse(RegistrationCheckpoint.objects.exists())
+
+    def test_results_are_saved_on_failure(self):
+        submission = SubmissionFactory.create(completed=True)
+        plugin = FailingPlugin(lambda: {"url": "zaak"})
+
+        with self.assertRaises(RuntimeError):
+            plugin.register_submission(submission, {})
+
+        submission.refresh_from_db()
+        self.assertEqual(
+            submission.registration_result, {"intermediate": {"zaak": {"url": "zaak"}}}
+        )
+        self.assertFalse(RegistrationCheckpoint.objects.exists())
+
+    def test_resume_from_checkpoints_after_crash(self):
+        submission = SubmissionFactory.create(
+            completed=True, registration_result={"zaak": "existing"}
+        )
+        # checkpoint left behind by a worker that was killed
+        RegistrationCheckpoint.objects.create(
+            submission=submission, key="intermediate.zaak", value={"url": "zaak"}
+        )
+        callback = Mock()
+
+        Plugin(callback).register_submission(submission, {})
+
+        callback.assert_not_called()
+        submission.refresh_from_db()
+        self.assertEqual(
+            submission.registration_result,
+            {
+                "zaak": "existing",
+                "intermediate": {"zaak": {"url": "zaak"}, "status": {"zaak": "zaak"}},
+            },
+        )
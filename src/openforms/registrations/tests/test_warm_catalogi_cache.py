@@ -0,0 +1,56 @@
+from io import StringIO
+from unittest.mock import call, patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from openforms.forms.tests.factories import FormRegistrationBackendFactory
+
+
+class WarmCatalogiCacheCommandTests(TestCase):
+    @patch(
+        "openforms.registrations.management.commands.warm_catalogi_cache"
+        ".prefetch_catalogue"
+    )
+    def test_live_forms_are_prefetched(self, m_prefetch):
+        backend = FormRegistrationBackendFactory.create(
+            backend="zgw-create-zaak", options={"foo": "bar"}
+        )
+        FormRegistrationBackendFactory.create(form__active=False)
+        FormRegistrationBackendFactory.create(form__deleted_=True)
+        stdout = StringIO()
+
+        call_command("warm_catalogi_cache", stdout=stdout)
+
+        m_prefetch.assert_called_once_with("zgw-create-zaak", {"foo": "bar"})
+        self.assertIn(str(backend), stdout.getvalue())
+
+    @patch(
+        "openforms.registrations.management.commands.warm_catalogi_cache"
+        ".prefetch_catalogue",
+        side_effect=[RuntimeError("Could not resolve catalogue"), None],
+    )
+    def test_failures_are_reported(self, m_prefetch):
+        backend1 = FormRegistrationBackendFactory.create(backend="zgw-create-zaak")
+        backend2 = FormRegistrationBackendFactory.create(
+            form=backend1.form, backend="objects_api"
+        )
+        stdout, stderr = StringIO(), StringIO()
+
+        call_command(
+            "warm_catalogi_cache",
+            form_ids=[backend1.form.pk],
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+        m_prefetch.assert_has_calls(
+            [
+                call("zgw-create-zaak", backend1.options),
+                call("objects_api", backend2.options),
+            ]
+        )
+        self.assertIn("Could not resolve catalogue", stderr.getvalue())
+        self.assertIn(
+            "prefetching failed for 1 registration backend(s)", stdout.getvalue()
+        )
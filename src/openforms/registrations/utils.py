@@ -1,6 +1,7 @@
 from collections.abc import Callable
+from functools import wraps
 
-from glom import assign, glom
+from glom import glom
 
 from openforms.submissions.models import Submission
 
@@ -26,7 +27,33 @@ def execute_unless_result_exists[R](
     if result is unset:
         result = callback_result
 
-    # store the result
-    assign(submission.registration_result, spec, result, missing=dict)
-    submission.save(update_fields=["registration_result"])
+    # the result is saved in the registration result at the next safe point, see
+    # :func:`with_registration_checkpoints`
+    submission.record_registration_results({spec: result})
     return callback_result
+
+
+def with_registration_checkpoints[**P, R](
+    func: Callable[P, R],
+) -> Callable[P, R]:
+    """
+    Decorate a plugin method storing intermediate results of the registration.
+
+    The intermediate results are only checkpointed while the method runs, and saved in
+    the registration result of the submission once the method returns or raises. The
+    checkpoints of an earlier, interrupted run are loaded first, so the registration
+    resumes from the last completed call.
+    """
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        submission = next(
+            arg for arg in (*args, *kwargs.values()) if isinstance(arg, Submission)
+        )
+        submission.load_registration_checkpoints()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            submission.flush_registration_checkpoints()
+
+    return wrapper
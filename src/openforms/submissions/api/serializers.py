@@ -324,6 +324,15 @@ class SubmissionStepSerializer(NestedHyperlinkedModelSerializer):
         allow_null=True,
         validators=[ValidatePrefillData()],
     )
+    prefill_pending = serializers.BooleanField(
+        label=_("prefill pending"),
+        help_text=_(
+            "Indicates whether the step depends on prefill values that are still being "
+            "retrieved. The step can only be submitted once they are available, so "
+            "retrieve the step again until this is false."
+        ),
+        read_only=True,
+    )
     # Note that this field is set in the `to_representation` method.
     require_backend_logic_evaluation = serializers.BooleanField(
         label=_("Require backend logic evaluation"),
@@ -359,6 +368,7 @@ class SubmissionStepSerializer(NestedHyperlinkedModelSerializer):
             "slug",
             "data",
             "can_submit",
+            "prefill_pending",
             "configuration",
             "default_configuration",
             "require_backend_logic_evaluation",
@@ -475,8 +485,12 @@ class SubmissionStepSerializer(NestedHyperlinkedModelSerializer):
                 continue
             component["validate"]["required"] = False
 
+        form_definition = self.instance.form_step.form_definition
         step_data_serializer = build_serializer(
             configuration["components"],
+            configuration_hash=(
+                form_definition.configuration_wrapper.configuration_hash or ""
+            ),
             data=data,
             context={"submission": submission},
         )
@@ -14,7 +14,10 @@ from rest_framework.settings import api_settings
 from openforms.formio.service import build_serializer, get_dynamic_configuration
 from openforms.forms.models import FormDefinition, FormStep
 
-from ..models import Submission, SubmissionStep
+from ..attachments import get_pending_uploads
+from ..constants import VirusScanStatuses
+from ..models import Submission, SubmissionStep, TemporaryFileUpload
+from ..virus_scan import get_virus_scan_error
 from .fields import PrivacyPolicyAcceptedField, TruthDeclarationAcceptedField
 
 NON_FIELD_ERRORS_KEY = api_settings.NON_FIELD_ERRORS_KEY
@@ -86,6 +89,10 @@ class SubmissionCompletionSerializer(serializers.Serializer):
         applicable_steps: int = len(
             [step for step in submission.steps if step.is_applicable]
         )
+        # uploads scanned in the background can only be claimed once they're clean
+        has_pending_uploads = TemporaryFileUpload.objects.filter(
+            submission=submission, virus_scan_status=VirusScanStatuses.pending
+        ).exists()
 
         for step in submission.steps:
             form_step = step.form_step
@@ -119,18 +126,37 @@ class SubmissionCompletionSerializer(serializers.Serializer):
                         code="incomplete",
                     )
                 }
+            # check that the prefill values were retrieved
+            elif step.prefill_pending:
+                step_errors = {
+                    NON_FIELD_ERRORS_KEY: ErrorDetail(
+                        _(
+                            "The prefill values of step '{name}' are still being "
+                            "retrieved."
+                        ).format(name=step_name),
+                        code="prefill_pending",
+                    )
+                }
+            # check that the uploads were scanned for viruses
+            elif has_pending_uploads and (uploads := get_pending_uploads(step)):
+                step_errors = {
+                    NON_FIELD_ERRORS_KEY: ErrorDetail(
+                        get_virus_scan_error(uploads[0]), code="virus_scan_pending"
+                    )
+                }
 
             # run the full Formio validation for the step
             if step.is_applicable:
                 # evaluate dynamic configuration. We avoid calling `evaluate_form_logic`
                 # on purpose to avoid duplicate logic evaluation
-                configuration = get_dynamic_configuration(
+                config_wrapper = get_dynamic_configuration(
                     form_definition.configuration_wrapper,
                     submission=submission,
                     data=data,
-                ).configuration
+                )
                 step_data_serializer = build_serializer(
-                    configuration["components"],
+                    config_wrapper.configuration["components"],
+                    configuration_hash=config_wrapper.configuration_hash or "",
                     data=data.data,
                     context={"submission": submission},
                 )
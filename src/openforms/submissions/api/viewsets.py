@@ -19,6 +19,7 @@ from rest_framework.response import Response
 from openforms.accounts.models import User
 from openforms.api import pagination
 from openforms.api.authentication import AnonCSRFSessionAuthentication
+from openforms.api.exceptions import Conflict
 from openforms.api.filters import PermissionFilterMixin
 from openforms.api.serializers import ExceptionSerializer, ValidationErrorSerializer
 from openforms.api.throttle_classes import PollingRateThrottle
@@ -29,16 +30,19 @@ from openforms.authentication.service import (
 from openforms.forms.constants import SubmissionAllowedChoices
 from openforms.forms.models import Form, FormStep
 from openforms.logging import audit_logger
-from openforms.prefill.service import prefill_variables
+from openforms.prefill.service import start_prefill
 from openforms.typing import is_authenticated_request
 from openforms.utils.patches.rest_framework_nested.viewsets import NestedViewSetMixin
 
-from ..attachments import attach_uploads_to_submission_step
-from ..constants import PostSubmissionEvents
+from ..attachments import (
+    attach_uploads_to_submission,
+    attach_uploads_to_submission_step,
+)
+from ..constants import PostSubmissionEvents, VirusScanStatuses
 from ..exceptions import FormDeactivated, FormMaintenance
 from ..form_logic import check_submission_logic, evaluate_form_logic
 from ..metrics import start_counter, step_saved_counter, suspension_counter
-from ..models import Submission, SubmissionStep
+from ..models import Submission, SubmissionStep, TemporaryFileUpload
 from ..parsers import (
     IgnoreDataAndConfigFieldCamelCaseJSONParser,
     IgnoreDataAndConfigJSONRenderer,
@@ -191,7 +195,7 @@ class SubmissionViewSet(
 
         audit_logger.info("submission_start")
 
-        prefill_variables(submission)
+        start_prefill(submission)
         initialise_user_defined_variables(submission)
 
         logged_in = submission.is_authenticated
@@ -381,6 +385,15 @@ class SubmissionViewSet(
         )
         serializer.is_valid(raise_exception=True)
 
+        # claim the uploads that were still being scanned for viruses when their step
+        # was saved
+        if TemporaryFileUpload.objects.filter(
+            submission=submission,
+            virus_scan_status=VirusScanStatuses.clean,
+            attachments=None,
+        ).exists():
+            attach_uploads_to_submission(submission)
+
         # all is fine, we can complete it
         status_url = self._complete_submission(submission)
         serializer.save(status_url=status_url)
@@ -594,6 +607,7 @@ class SubmissionStepViewSet(
             201: SubmissionStepSerializer,
             400: ValidationErrorSerializer,
             403: ExceptionSerializer,
+            409: ExceptionSerializer,
             FormDeactivated.status_code: ExceptionSerializer,
             FormMaintenance.status_code: ExceptionSerializer,
         },
@@ -673,6 +687,7 @@ class SubmissionStepViewSet(
             204: None,
             400: ValidationErrorSerializer,
             403: ExceptionSerializer,
+            409: ExceptionSerializer,
             FormDeactivated.status_code: ExceptionSerializer,
             FormMaintenance.status_code: ExceptionSerializer,
         },
@@ -693,6 +708,10 @@ class SubmissionStepViewSet(
         self, request
     ) -> tuple[SubmissionStep, SubmissionStepSerializer]:
         instance = self.get_object()
+        if instance.prefill_pending:
+            raise Conflict(
+                _("The prefill values of this step are still being retrieved.")
+            )
         create = instance.pk is None
         if create:
             instance.uuid = SubmissionStep._meta.get_field("uuid").default()
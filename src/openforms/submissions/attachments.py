@@ -23,6 +23,7 @@ from openforms.conf.utils import Filesize
 from openforms.formio.service import FormioData, iterate_data_with_components
 from openforms.formio.typing import Component
 from openforms.submissions.models import (
+    PartialFileUpload,
     Submission,
     SubmissionFileAttachment,
     SubmissionStep,
@@ -32,6 +33,7 @@ from openforms.template import render_from_string, sandbox_backend
 from openforms.typing import JSONObject
 from openforms.utils.glom import _glom_path_to_str
 
+from .constants import VirusScanStatuses
 from .metrics import upload_file_size
 
 logger = structlog.stdlib.get_logger(__name__)
@@ -166,6 +168,11 @@ def attach_uploads_to_submission_step(
         # TODO decide what it means if this fails
         assert submission_variable is not None
 
+        # still being scanned for viruses in the background - the upload is claimed
+        # when the scan is done, or when the submission is completed
+        if not upload.is_claimable:
+            continue
+
         # grab resize settings
         resize_apply = glom(component, "of.image.resize.apply", default=False)
         resize_size = (
@@ -244,6 +251,41 @@ def attach_uploads_to_submission_step(
     return result
 
 
+def attach_uploads_to_submission(submission: Submission) -> None:
+    """
+    Attach the uploads of all steps, including the uploads that were not scanned yet
+    when their step was saved.
+    """
+    for submission_step in submission.steps:
+        if submission_step.pk is None or not submission_step.is_applicable:
+            continue
+        attach_uploads_to_submission_step(submission_step)
+
+
+def attach_scanned_upload(upload: TemporaryFileUpload) -> None:
+    """
+    Attach an upload that was still being scanned for viruses when its step was
+    saved.
+    """
+    for submission_step in upload.submission.steps:
+        if submission_step.pk is None or not submission_step.is_applicable:
+            continue
+        step_uploads = iter_step_uploads(submission_step)
+        if any(upload_context.upload == upload for upload_context in step_uploads):
+            attach_uploads_to_submission_step(submission_step)
+
+
+def get_pending_uploads(submission_step: SubmissionStep) -> list[TemporaryFileUpload]:
+    """
+    Get the uploads of the step that are still being scanned for viruses.
+    """
+    return [
+        upload_context.upload
+        for upload_context in iter_step_uploads(submission_step)
+        if upload_context.upload.virus_scan_status == VirusScanStatuses.pending
+    ]
+
+
 def cleanup_submission_temporary_uploaded_files(submission: Submission):
     for attachment in SubmissionFileAttachment.objects.for_submission(
         submission
@@ -254,6 +296,8 @@ def cleanup_submission_temporary_uploaded_files(submission: Submission):
 def cleanup_unclaimed_temporary_uploaded_files(age=timedelta(days=2)):
     for file in TemporaryFileUpload.objects.select_prune(age).filter(attachments=None):
         file.delete()
+    # abandoned uploads that were never completed
+    PartialFileUpload.objects.select_prune(age).delete()
 
 
 def iter_component_data(components: Iterable[dict], data: dict, filter_types=None):
@@ -66,3 +66,16 @@ class ComponentPreRegistrationStatuses(models.TextChoices):
     in_progress = "in_progress", _("In progress")
     success = "success", _("Success")
     failed = "failed", _("Failed")
+
+
+class VirusScanStatuses(models.TextChoices):
+    not_scanned = "not_scanned", _("Not scanned")
+    pending = "pending", _("Pending")
+    clean = "clean", _("Clean")
+    infected = "infected", _("Infected")
+    failed = "failed", _("Failed")
+
+
+class PrefillStatuses(models.TextChoices):
+    pending = "pending", _("Pending")
+    done = "done", _("Done")
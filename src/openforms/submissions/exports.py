@@ -1,14 +1,23 @@
+import csv
 import dataclasses
+import json
 from collections.abc import Iterator
+from tempfile import TemporaryFile
+from typing import Any, BinaryIO
 
 from django.db import models
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponseBase, StreamingHttpResponse
 from django.utils.timezone import make_naive
 
 import tablib
 from lxml import etree
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 from tablib.formats._json import serialize_objects_handler
 
+from openforms.forms.models import FormStep, FormVariable
+
 from .models import Submission
 from .rendering.base import Node
 from .rendering.constants import RenderModes
@@ -30,6 +39,10 @@ class ExportFileTypes:
     XML = FileType("xml", "text/xml")
 
 
+# number of submissions (and their related records) loaded at a time
+EXPORT_CHUNK_SIZE = 100
+
+
 def iter_submission_data_nodes(submission: Submission) -> Iterator[Node]:
     renderer = Renderer(submission, mode=RenderModes.export, as_html=False)
     for data_nodes in renderer.get_children():
@@ -39,30 +52,62 @@ def iter_submission_data_nodes(submission: Submission) -> Iterator[Node]:
             yield node
 
 
-def create_submission_export(queryset: models.QuerySet[Submission]) -> tablib.Dataset:
-    """
-    Turn a submissions queryset into a tablib dataset for export.
+def _get_export_queryset(
+    queryset: models.QuerySet[Submission],
+) -> models.QuerySet[Submission]:
+    # The prefetches are done per chunk of submissions while iterating, which avoids
+    # the queries for the variables and execution state of every single submission.
+    # The execution state and variables state use the prefetched form steps and form
+    # variables, so these must be loaded in the same way.
+    return queryset.select_related("form", "auth_info").prefetch_related(
+        "submissionstep_set",
+        "submissionvaluevariable_set",
+        models.Prefetch(
+            "form__formstep_set",
+            queryset=FormStep.objects.select_related("form_definition").order_by(
+                "order"
+            ),
+        ),
+        "form__formstep_set__logic_rules",
+        models.Prefetch(
+            "form__formvariable_set",
+            queryset=FormVariable.objects.select_related(
+                "service_fetch_configuration__service"
+            ).order_by("pk"),
+        ),
+    )
 
-    .. note:: the queryset of submissions must all be of the same form!
+
+def iter_submission_export_rows(
+    queryset: models.QuerySet[Submission], chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[list[Any]]:
     """
-    # queryset *could* be empty
-    if not queryset:
-        return tablib.Dataset()
+    Turn a submissions queryset into rows for export.
 
-    first_submission = queryset[0]
-    headers = ["Formuliernaam", "Inzendingdatum"]
-    if first_submission.form.translation_enabled:
-        headers.append("Taalcode")
+    The first row contains the headers, the other rows the data of a single submission
+    each. The submissions are fetched in chunks (using a server-side cursor where the
+    database supports it), so memory usage does not grow with the number of
+    submissions.
 
-    for data_node in iter_submission_data_nodes(first_submission):
-        if hasattr(data_node, "component"):
-            headers.append(data_node.component["key"])
-        elif hasattr(data_node, "variable"):
-            headers.append(data_node.variable.key)
+    .. note:: the queryset of submissions must all be of the same form!
+    """
+    translation_enabled: bool | None = None
+    for submission in _get_export_queryset(queryset).iterator(chunk_size=chunk_size):
+        data_nodes = list(iter_submission_data_nodes(submission))
 
-    data = tablib.Dataset(headers=headers)
+        # the first submission determines the headers
+        if translation_enabled is None:
+            translation_enabled = submission.form.translation_enabled
+            headers = ["Formuliernaam", "Inzendingdatum"]
+            if translation_enabled:
+                headers.append("Taalcode")
+            for data_node in data_nodes:
+                if hasattr(data_node, "component"):
+                    headers.append(data_node.component["key"])
+                elif hasattr(data_node, "variable"):
+                    headers.append(data_node.variable.key)
+            yield headers
 
-    for submission in queryset:
         inzending_datum = (
             make_naive(submission.completed_on) if submission.completed_on else None
         )
@@ -70,28 +115,30 @@ def create_submission_export(queryset: models.QuerySet[Submission]) -> tablib.Da
             submission.form.admin_name,
             inzending_datum,
         ]
-        if first_submission.form.translation_enabled:
+        if translation_enabled:
             submission_data.append(submission.language_code)
-        submission_data += [
-            data_node.value for data_node in iter_submission_data_nodes(submission)
-        ]
-        data.append(submission_data)
-    return data
+        submission_data += [data_node.value for data_node in data_nodes]
+        yield submission_data
 
 
-def export_submissions(
-    queryset: models.QuerySet[Submission], file_type: FileType
-) -> HttpResponse:
-    export_data = create_submission_export(queryset)
-    filename = f"submissions_export.{file_type.extension}"
+def create_submission_export(queryset: models.QuerySet[Submission]) -> tablib.Dataset:
+    """
+    Turn a submissions queryset into a tablib dataset for export.
 
-    response = HttpResponse(
-        export_data.export(file_type.extension),
-        content_type=file_type.content_type,
-    )
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    The complete dataset is kept in memory - use :func:`export_submissions` or
+    :func:`write_submission_export` for (potentially) large querysets.
 
-    return response
+    .. note:: the queryset of submissions must all be of the same form!
+    """
+    rows = iter_submission_export_rows(queryset)
+    # queryset *could* be empty
+    if (headers := next(rows, None)) is None:
+        return tablib.Dataset()
+
+    data = tablib.Dataset(headers=headers)
+    for row in rows:
+        data.append(row)
+    return data
 
 
 def _xml_basic_value(value) -> str:
@@ -139,13 +186,134 @@ class XMLKeyValueExport:
 
     @classmethod
     def export_set(cls, dset):
-        root = etree.Element("submissions")
-        for row in dset.dict:
-            elem = etree.SubElement(root, "submission")
-            for key, value in row.items():
-                field = etree.SubElement(elem, "field", name=key)
-                _xml_value(field, value, wrap_single=True)
-
-        return etree.tostring(
-            root, xml_declaration=True, encoding="utf8", pretty_print=True
+        return b"".join(_iter_xml(iter([dset.headers, *dset])))
+
+
+class _Echo:
+    """
+    File-like object returning what is written, so :mod:`csv` can be used in a
+    generator.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _iter_csv(rows: Iterator[list[Any]]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def _iter_json(rows: Iterator[list[Any]]) -> Iterator[str]:
+    # same output as the tablib JSON format, a list of objects
+    yield "["
+    headers = next(rows, None)
+    for index, row in enumerate(rows):
+        if index:
+            yield ", "
+        yield json.dumps(
+            dict(zip(headers, row, strict=True)),
+            default=serialize_objects_handler,
+            ensure_ascii=False,
+        )
+    yield "]"
+
+
+def _iter_xml(rows: Iterator[list[Any]]) -> Iterator[bytes]:
+    yield b"<?xml version='1.0' encoding='utf8'?>\n<submissions>\n"
+    headers = next(rows, None)
+    for row in rows:
+        elem = etree.Element("submission")
+        for key, value in zip(headers, row, strict=True):
+            field = etree.SubElement(elem, "field", name=key)
+            _xml_value(field, value, wrap_single=True)
+        yield etree.tostring(elem, encoding="utf8", pretty_print=True)
+    yield b"</submissions>\n"
+
+
+def _write_xlsx(rows: Iterator[list[Any]], outfile: BinaryIO) -> None:
+    # the write-only mode flushes the rows to a temporary file instead of building the
+    # complete worksheet in memory
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Submissions")
+    bold = Font(bold=True)
+
+    headers = next(rows, None)
+    if headers is not None:
+        worksheet.freeze_panes = "A2"
+        worksheet.append([_xlsx_cell(worksheet, h, font=bold) for h in headers])
+    for row in rows:
+        worksheet.append([_xlsx_cell(worksheet, value) for value in row])
+    workbook.save(outfile)
+
+
+def _xlsx_cell(worksheet, value: Any, **attrs) -> WriteOnlyCell:
+    # same conversion as the tablib XLSX format
+    try:
+        cell = WriteOnlyCell(worksheet, value=value)
+    except ValueError:
+        cell = WriteOnlyCell(worksheet, value=str(value))
+    for attr, attr_value in attrs.items():
+        setattr(cell, attr, attr_value)
+    return cell
+
+
+def iter_export_content(
+    queryset: models.QuerySet[Submission], file_type: FileType
+) -> Iterator[str | bytes]:
+    """
+    Produce the export file of the submissions in chunks.
+
+    The XLSX format is a zip archive and cannot be produced incrementally, use
+    :func:`write_submission_export` instead.
+    """
+    rows = iter_submission_export_rows(queryset)
+    match file_type:
+        case ExportFileTypes.CSV:
+            return _iter_csv(rows)
+        case ExportFileTypes.JSON:
+            return _iter_json(rows)
+        case ExportFileTypes.XML:
+            return _iter_xml(rows)
+        case _:
+            raise ValueError(f"Can not stream the file type '{file_type.extension}'.")
+
+
+def write_submission_export(
+    queryset: models.QuerySet[Submission], file_type: FileType, outfile: BinaryIO
+) -> None:
+    """
+    Write the export file of the submissions to the (binary) file object.
+    """
+    if file_type == ExportFileTypes.XLSX:
+        _write_xlsx(iter_submission_export_rows(queryset), outfile)
+        return
+
+    for chunk in iter_export_content(queryset, file_type):
+        outfile.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+
+
+def export_submissions(
+    queryset: models.QuerySet[Submission], file_type: FileType
+) -> HttpResponseBase:
+    filename = f"submissions_export.{file_type.extension}"
+
+    if file_type == ExportFileTypes.XLSX:
+        # spooled to disk, the response closes the file when it's done
+        outfile = TemporaryFile()
+        write_submission_export(queryset, file_type, outfile)
+        outfile.seek(0)
+        return FileResponse(
+            outfile,
+            as_attachment=True,
+            filename=filename,
+            content_type=file_type.content_type,
         )
+
+    response = StreamingHttpResponse(
+        iter_export_content(queryset, file_type),
+        content_type=file_type.content_type,
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
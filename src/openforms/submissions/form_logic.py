@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import TYPE_CHECKING
 
 import elasticapm
@@ -134,7 +133,7 @@ def evaluate_form_logic(
     # Now that conditional logic is resolved and matches the state of the frontend, we
     # can get the initial data before evaluating backend logic. This will be used to
     # create a data difference at the end
-    initial_data = deepcopy(data_for_evaluation)
+    initial_data = data_for_evaluation.snapshot()
     mutation_operations = []
 
     # 6.1 If the action type is to set a variable, update the data. This happens inside
@@ -194,9 +193,13 @@ def evaluate_form_logic(
     relevant_variables = submission_variables_state.get_variables_in_submission_step(
         step, include_unsaved=True
     )
+    changed_keys = initial_data.diff(data_for_evaluation)
     updated_step_data = FormioData()
     for key, variable in relevant_variables.items():
-        if not variable.form_variable or initial_data[key] != data_for_evaluation[key]:
+        if not variable.form_variable or (
+            key.split(".", 1)[0] in changed_keys
+            and initial_data[key] != data_for_evaluation[key]
+        ):
             updated_step_data[key] = data_for_evaluation[key]
     step.unsaved_data = updated_step_data
 
@@ -256,8 +259,10 @@ def evaluate_conditional_logic(
     """
     Evaluate conditional logic through iteration.
 
-    Note that this assumes the data converges to a final state, so no cycles can be
-    present in the complete conditional logic tree.
+    The conditionals are resolved in dependency order by processing the visibility
+    as many times as the dependency graph of the simple conditionals requires (once,
+    if every trigger component precedes the components depending on it). If the
+    graph contains a cycle, we fall back to iterating until the data converges.
 
     :param configuration: Formio configuration.
     :param data: Data used for evaluation. Mutations will be applied to the data
@@ -267,13 +272,27 @@ def evaluate_conditional_logic(
       property is ignored in determining whether the component is hidden.
     :param data_for_hidden_state: Data to apply when a component is hidden.
     """
+    if (
+        configuration is wrapper.configuration
+        and (passes := wrapper.conditional_evaluation_passes) is not None
+    ):
+        for _ in range(passes):
+            process_visibility(
+                configuration,
+                data,
+                wrapper,
+                data_for_hidden_state=data_for_hidden_state,
+                components_to_ignore_hidden=components_to_ignore_hidden,
+            )
+        return
+
     processed_data = None
     _loop_count = 0
     while processed_data != data:
         if _loop_count >= 50:  # pragma: nocover
             raise RuntimeError("Potential infinite loop stopped!")
         _loop_count += 1
-        processed_data = deepcopy(data)
+        processed_data = data.snapshot()
         process_visibility(
             configuration,
             data,
@@ -590,8 +590,13 @@ class ServiceFetchAction(ActionOperation):
     @property
     def unresolved_input_variables(self) -> set[str]:
         var = self.rule.form.formvariable_set.get(key=self.variable)
-        fetch_config: ServiceFetchConfiguration = var.service_fetch_configuration
+        return self.get_input_variables(var.service_fetch_configuration)
 
+    @staticmethod
+    def get_input_variables(fetch_config: ServiceFetchConfiguration) -> set[str]:
+        """
+        Get the variables used in the request arguments of the fetch configuration.
+        """
         # The path, query parameters, and header values support templating, so we have
         # to extract the variables from them.
         return {
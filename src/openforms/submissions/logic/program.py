@@ -0,0 +1,212 @@
+"""
+Compiled logic rule programs.
+
+Logic rules are evaluated on every logic check of a submission step (which is
+debounced on every user input in the frontend). Interpreting each JSON logic trigger
+from scratch is wasteful, as the rules themselves rarely change. Instead, every
+trigger is compiled once per version of the rule, and the compiled triggers of the
+rules that are evaluated together are assembled into a :class:`LogicProgram`.
+
+Compiled triggers are deterministic functions of their input variables, and remember
+the outcome for previously seen input values. A rule of which the input variables did
+not change since the previous logic check is therefore not re-evaluated, while the
+outcome (and thus the resulting actions and mutations) is exactly the same.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from itertools import chain
+from threading import Lock
+from uuid import UUID
+
+from json_logic.typing import JSON
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.models import FormLogic, FormVariable
+from openforms.utils.json_logic import CompiledExpression, compile_json_logic
+
+from .actions import ActionOperation, ServiceFetchAction
+
+# upper bound of compiled rule triggers kept in memory by a single process
+MAX_COMPILED_RULES = 10_000
+# upper bound of logic programs kept in memory by a single process
+MAX_PROGRAMS = 1_000
+
+_compiled_triggers: dict[UUID, CompiledExpression] = {}
+_programs: dict[tuple[UUID, ...], LogicProgram] = {}
+_lock = Lock()
+
+
+def get_compiled_trigger(rule: FormLogic) -> CompiledExpression:
+    """
+    Get the compiled JSON logic trigger of a rule.
+
+    The compiled trigger is cached in the process per rule, and is only re-compiled
+    when the trigger of the rule changed.
+    """
+    trigger: JSON = rule.json_logic_trigger
+    compiled = _compiled_triggers.get(rule.uuid)
+    if compiled is not None and compiled.expression == trigger:
+        return compiled
+
+    compiled = compile_json_logic(trigger)
+    with _lock:
+        if len(_compiled_triggers) >= MAX_COMPILED_RULES:
+            _compiled_triggers.pop(next(iter(_compiled_triggers)))
+        _compiled_triggers[rule.uuid] = compiled
+    return compiled
+
+
+@dataclass
+class CompiledRule:
+    rule: FormLogic
+    trigger: CompiledExpression
+
+    def is_triggered(self, data: Mapping[str, JSON]) -> bool:
+        return bool(self.trigger(data))
+
+
+@dataclass
+class LogicProgram:
+    """
+    The compiled logic rules to evaluate, in order of evaluation.
+    """
+
+    rules: Sequence[CompiledRule]
+    # The independent service fetches (as rule and action indices), by the input
+    # variables of the service fetches. Shared between the programs of the same rules,
+    # see :func:`compile_logic_program`.
+    _independent_fetches: dict[tuple[frozenset[str], ...], list[tuple[int, int]]] = (
+        field(default_factory=dict, repr=False)
+    )
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    def is_compiled_from(self, rules: Sequence[CompiledRule]) -> bool:
+        return len(rules) == len(self.rules) and all(
+            compiled.trigger is own.trigger
+            and compiled.rule.actions == own.rule.actions
+            for compiled, own in zip(rules, self.rules, strict=True)
+        )
+
+    def get_independent_service_fetches(
+        self, form_variables: Mapping[str, FormVariable]
+    ) -> list[tuple[CompiledRule, ServiceFetchAction]]:
+        """
+        Get the service fetch actions that do not depend on the results of earlier
+        actions in the program.
+
+        A service fetch is independent if neither the trigger of its rule nor the
+        request arguments read variables that are written by an action of an earlier
+        (or the same) rule. Note that this is a static analysis - side effects like
+        clearing the values of hidden components are not taken into account.
+
+        :param form_variables: The form variables by key, with their service fetch
+          configuration.
+        """
+        num_fetches = sum(
+            action["action"]["type"] == LogicActionTypes.fetch_from_service
+            for compiled_rule in self.rules
+            for action in compiled_rule.rule.actions
+        )
+        if num_fetches < 2:
+            return []
+
+        operations = [
+            list(compiled_rule.rule.action_operations) for compiled_rule in self.rules
+        ]
+        fetch_inputs: list[frozenset[str]] = []
+        for operation in chain.from_iterable(operations):
+            if not isinstance(operation, ServiceFetchAction):
+                continue
+            try:
+                fetch_config = form_variables[
+                    operation.variable
+                ].service_fetch_configuration
+                assert fetch_config is not None
+                fetch_inputs.append(
+                    frozenset(operation.get_input_variables(fetch_config))
+                )
+            except Exception:
+                # misconfigured action - the remaining fetches cannot be proven to be
+                # independent. The error surfaces during evaluation.
+                break
+
+        key = tuple(fetch_inputs)
+        if (indices := self._independent_fetches.get(key)) is None:
+            indices = self._independent_fetches[key] = self._analyse(
+                operations, fetch_inputs
+            )
+        independent: list[tuple[CompiledRule, ServiceFetchAction]] = []
+        for rule_index, action_index in indices:
+            operation = operations[rule_index][action_index]
+            assert isinstance(operation, ServiceFetchAction)
+            independent.append((self.rules[rule_index], operation))
+        return independent
+
+    def _analyse(
+        self,
+        operations: Sequence[Sequence[ActionOperation]],
+        fetch_inputs: Sequence[frozenset[str]],
+    ) -> list[tuple[int, int]]:
+        written: set[str] = set()
+
+        def _is_written(key: str | int) -> bool:
+            return any(
+                key == output or str(key).startswith(f"{output}.") for output in written
+            )
+
+        remaining_inputs = iter(fetch_inputs)
+        independent: list[tuple[int, int]] = []
+        for rule_index, compiled_rule in enumerate(self.rules):
+            trigger = compiled_rule.trigger
+            trigger_is_independent = (trigger.is_deterministic or not written) and (
+                not any(_is_written(key) for key in trigger.input_keys)
+            )
+            for action_index, operation in enumerate(operations[rule_index]):
+                try:
+                    if isinstance(operation, ServiceFetchAction):
+                        # no inputs left means the fetch is misconfigured
+                        inputs = next(remaining_inputs)
+                        if trigger_is_independent and not any(
+                            _is_written(key) for key in inputs
+                        ):
+                            independent.append((rule_index, action_index))
+                    written |= operation.unresolved_output_variables
+                except Exception:
+                    # misconfigured action - the remaining fetches cannot be proven
+                    # to be independent. The error surfaces during evaluation.
+                    return independent
+
+        return independent
+
+
+def compile_logic_program(rules: Iterable[FormLogic]) -> LogicProgram:
+    """
+    Compile the logic rules into a program, using the cached compiled triggers.
+
+    The analysis of the program is cached in the process for the same rules, and is
+    only repeated when (the triggers or actions of) the rules changed.
+
+    :param rules: The rules to evaluate, in order of evaluation.
+    """
+    compiled_rules = [
+        CompiledRule(rule=rule, trigger=get_compiled_trigger(rule)) for rule in rules
+    ]
+    key = tuple(compiled_rule.rule.uuid for compiled_rule in compiled_rules)
+    cached = _programs.get(key)
+    if cached is not None and cached.is_compiled_from(compiled_rules):
+        # evaluate the rule instances that were passed in, not the cached ones
+        return LogicProgram(
+            rules=compiled_rules, _independent_fetches=cached._independent_fetches
+        )
+
+    program = LogicProgram(rules=compiled_rules)
+    with _lock:
+        if len(_programs) >= MAX_PROGRAMS:
+            _programs.pop(next(iter(_programs)))
+        _programs[key] = program
+    return program
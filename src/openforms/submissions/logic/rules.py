@@ -1,9 +1,7 @@
 from collections.abc import Iterable, Iterator
-from copy import deepcopy
 from itertools import chain
 
 import elasticapm
-from json_logic import jsonLogic
 from opentelemetry import trace
 
 from openforms.formio.service import (
@@ -12,10 +10,13 @@ from openforms.formio.service import (
     process_visibility,
 )
 from openforms.forms.models import FormLogic, FormStep
+from openforms.variables.constants import ServiceFetchMethods
 
 from ..models import Submission, SubmissionStep
 from .actions import ActionOperation
 from .log_utils import log_errors
+from .program import LogicProgram, compile_logic_program
+from .service_fetching import prefetch_service_fetches
 
 tracer = trace.get_tracer("openforms.submissions.logic.rules")
 
@@ -197,6 +198,12 @@ def iter_evaluate_rules(
     action operator that updates a variable is processed immediately. The caller is
     responsible for processing (all other) actions accordingly.
 
+    The triggers are evaluated through their compiled form (see
+    :mod:`openforms.submissions.logic.program`), which avoids re-evaluating triggers
+    of which the input variables did not change. Independent service fetches of
+    triggered rules are performed concurrently up front, the results are applied in
+    the order of the rules.
+
     :param rules: An iterable of form logic rules to evaluate.
     :param data: Mapping from variable key to variable value (native Python types), for
       all variables present in the :class:`SubmissionValueVariableState`. This data
@@ -219,9 +226,13 @@ def iter_evaluate_rules(
     # override it again with user data.
     # We need to keep this isolated from data_for_hidden_state, as this contains values
     # that should be applied when a component goes from visible -> hidden.
-    data_for_visible_state = deepcopy(data)
+    data_for_visible_state = data.snapshot()
+
+    program = compile_logic_program(rules)
+    _prefetch_service_fetches(program, data, submission)
 
-    for rule in rules:
+    for compiled_rule in program:
+        rule = compiled_rule.rule
         with (
             tracer.start_as_current_span(
                 name="evaluate-rule",
@@ -240,7 +251,7 @@ def iter_evaluate_rules(
         ):
             triggered = False
             with log_errors(rule.json_logic_trigger, rule):
-                triggered = bool(jsonLogic(rule.json_logic_trigger, data.data))
+                triggered = compiled_rule.is_triggered(data.data)
 
             # If the rule was not triggered, we still need to handle the clear on hide,
             # as components can be hidden by default and shown when a logic rule is
@@ -273,6 +284,64 @@ def iter_evaluate_rules(
                 yield operation
 
 
+def _prefetch_service_fetches(
+    program: LogicProgram, data: FormioData, submission: Submission
+) -> None:
+    """
+    Concurrently perform the independent service fetches of the triggered rules.
+
+    The fetch results are cached, and the service fetch actions re-use them when they
+    are evaluated in order, provided the request arguments did not change in the
+    meantime. Otherwise, the action simply fetches again.
+
+    Only ``GET`` requests are prefetched. The dependency analysis ignores the side
+    effects of hiding components, so a rule that is triggered by the initial data may
+    not be triggered anymore when the rules are evaluated in order - the speculative
+    request must be safe to make.
+    """
+    # the form variables are already loaded by the variables state
+    form_variables = {
+        key: variable.form_variable
+        for key, variable in submission.variables_state.variables.items()
+        if variable.form_variable is not None
+    }
+    variables = []
+    for compiled_rule, operation in program.get_independent_service_fetches(
+        form_variables
+    ):
+        try:
+            variable = form_variables[operation.variable]
+            fetch_config = variable.service_fetch_configuration
+            assert fetch_config is not None
+            if fetch_config.method != ServiceFetchMethods.get:
+                continue
+            if not compiled_rule.is_triggered(data.data):
+                continue
+            variables.append(variable)
+        except Exception:
+            # errors are logged when the rule is evaluated
+            continue
+
+    # there is nothing to gain for a single fetch
+    if len(variables) < 2:
+        return
+
+    with (
+        tracer.start_as_current_span(
+            name="prefetch-service-fetches",
+            attributes={
+                "span.type": "app",
+                "span.subtype": "submissions",
+                "span.action": "logic",
+            },
+        ),
+        elasticapm.capture_span(
+            "prefetch_service_fetches", span_type="app.submissions.logic"
+        ),
+    ):
+        prefetch_service_fetches(variables, data, str(submission.uuid))
+
+
 def _handle_clear_on_hide_for_untriggered_rule(
     rule: FormLogic,
     data: FormioData,
@@ -1,12 +1,18 @@
+import hashlib
 import json
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 
-from django.core.cache import cache
+from django.core.cache import cache, caches
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
 
 import jq
 import structlog
+from ape_pie import APIClient
 from json_logic import jsonLogic
+from redis.exceptions import LockError, RedisError
 from zgw_consumers.client import build_client
 
 from openforms.formio.service import FormioData
@@ -14,8 +20,22 @@ from openforms.forms.models import FormVariable
 from openforms.typing import JSONObject, JSONValue
 from openforms.variables.models import DataMappingTypes, ServiceFetchConfiguration
 
+from ..metrics import service_fetch_cache_counter
+
 logger = structlog.stdlib.get_logger(__name__)
 
+# Maximum time (in seconds) a single service fetch may hold the lock, in case something
+# crashes.
+FETCH_LOCK_TIMEOUT = 30
+# Maximum time (in seconds) concurrent identical fetches wait for the lock before calling
+# the service themselves. Kept short, as the form (logic) check is waiting on this.
+FETCH_LOCK_BLOCKING_TIMEOUT = 3
+
+# Maximum number of service fetches performed concurrently by a single prefetch.
+MAX_CONCURRENT_FETCHES = 8
+
+_MISSING = object()
+
 
 @dataclass
 class FetchResult:
@@ -27,25 +47,81 @@ class FetchResult:
     # response_headers: JSONObject
 
 
-def perform_service_fetch(
-    var: FormVariable, context: FormioData, submission_uuid: str = ""
-) -> FetchResult:
-    """Fetch a value from a http-service, perform a transformation on it and
-    return the result.
-
-    Form variables may receive their value from external (HTTP-based) services.
-    For this a configuration object is required specifying the details on where
-    and how to retrieve the data, and how to transform that data into something
-    that can be stored in a form variable and be used in form fields and logic.
-    The result is presented as a form variable value for a given submission
-    instance.
-
-    The value returned by the request is cached using the submission UUID and the
-    arguments to the request (hashed to make a cache key).
+def get_cache_key(
+    submission_uuid: str, fetch_config: ServiceFetchConfiguration, request_args: dict
+) -> str:
     """
-    log = logger.bind(variable=var.key, submission_uuid=str(submission_uuid))
-    log.info("perform_service_fetch_started")
+    Get the cache key for the result of a service fetch.
 
+    The key is deterministic, so that it is shared between (worker) processes and
+    survives restarts.
+    """
+    request_hash = hashlib.sha256(
+        json.dumps(request_args, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    return f"openforms:service-fetch:{submission_uuid}:{fetch_config.pk}:{request_hash}"
+
+
+def _get_or_fetch(
+    cache_key: str, do_fetch: Callable[[], JSONValue], timeout: int | None
+) -> JSONValue:
+    if (value := cache.get(cache_key, _MISSING)) is not _MISSING:
+        service_fetch_cache_counter.add(1, {"outcome": "hit"})
+        return value
+
+    # See TODO in settings about renaming this cache
+    redis_cache = caches["portalocker"]
+    lock = redis_cache.lock(
+        f"{cache_key}:lock",
+        # max lifetime for the lock itself, in case something crashes
+        timeout=FETCH_LOCK_TIMEOUT,
+        blocking_timeout=FETCH_LOCK_BLOCKING_TIMEOUT,
+    )
+    try:
+        acquired = lock.acquire()
+    except RedisError as exc:
+        # the lock only prevents duplicate requests, so Redis being unavailable
+        # shouldn't break the service fetch
+        logger.warning(
+            "service_fetch_lock_unavailable", cache_key=cache_key, exc_info=exc
+        )
+        acquired = False
+
+    if not acquired:
+        # rather than failing, fall back to fetching without coalescing
+        logger.warning("service_fetch_lock_not_acquired", cache_key=cache_key)
+        service_fetch_cache_counter.add(1, {"outcome": "miss"})
+        value = do_fetch()
+        cache.set(cache_key, value, timeout=timeout)
+        return value
+
+    try:
+        # a concurrent fetch may have completed while we were waiting for the lock
+        if (value := cache.get(cache_key, _MISSING)) is not _MISSING:
+            service_fetch_cache_counter.add(1, {"outcome": "coalesced"})
+            return value
+
+        service_fetch_cache_counter.add(1, {"outcome": "miss"})
+        value = do_fetch()
+        cache.set(cache_key, value, timeout=timeout)
+    finally:
+        try:
+            lock.release()
+        except LockError:  # pragma: no cover
+            # the lock expired while fetching, nothing left to release
+            pass
+        except RedisError as exc:  # pragma: no cover
+            # the lock expires on its own
+            logger.warning(
+                "service_fetch_lock_release_failed", cache_key=cache_key, exc_info=exc
+            )
+
+    return value
+
+
+def _prepare_fetch(
+    var: FormVariable, context: FormioData
+) -> tuple[ServiceFetchConfiguration, APIClient, dict]:
     if not var.service_fetch_configuration:
         raise ValueError(
             f"Can't perform service fetch on {var}. "
@@ -55,7 +131,16 @@ def perform_service_fetch(
 
     client = build_client(fetch_config.service)
     request_args = fetch_config.request_arguments(context)
+    return fetch_config, client, request_args
+
 
+def _get_raw_value(
+    fetch_config: ServiceFetchConfiguration,
+    client: APIClient,
+    request_args: dict,
+    submission_uuid: str,
+    log: structlog.stdlib.BoundLogger,
+) -> JSONValue:
     def _do_fetch():
         log.info("perform_service_fetch_http_call_started")
         with client:
@@ -66,15 +151,40 @@ def perform_service_fetch(
         return data
 
     if not submission_uuid:
-        raw_value = _do_fetch()
-    else:
-        cache_key = hash(submission_uuid + json.dumps(request_args, sort_keys=True))
-        timeout = (
-            _timeout
-            if (_timeout := fetch_config.cache_timeout) is not None
-            else DEFAULT_TIMEOUT
-        )
-        raw_value = cache.get_or_set(cache_key, default=_do_fetch, timeout=timeout)
+        return _do_fetch()
+
+    cache_key = get_cache_key(submission_uuid, fetch_config, request_args)
+    timeout = (
+        _timeout
+        if (_timeout := fetch_config.cache_timeout) is not None
+        else DEFAULT_TIMEOUT
+    )
+    return _get_or_fetch(cache_key, _do_fetch, timeout=timeout)
+
+
+def perform_service_fetch(
+    var: FormVariable, context: FormioData, submission_uuid: str = ""
+) -> FetchResult:
+    """Fetch a value from a http-service, perform a transformation on it and
+    return the result.
+
+    Form variables may receive their value from external (HTTP-based) services.
+    For this a configuration object is required specifying the details on where
+    and how to retrieve the data, and how to transform that data into something
+    that can be stored in a form variable and be used in form fields and logic.
+    The result is presented as a form variable value for a given submission
+    instance.
+
+    The value returned by the request is cached using the submission UUID, the fetch
+    configuration and the arguments to the request (hashed to make a cache key).
+    Concurrent identical fetches (e.g. from different workers) are coalesced into a
+    single request to the service.
+    """
+    log = logger.bind(variable=var.key, submission_uuid=str(submission_uuid))
+    log.info("perform_service_fetch_started")
+
+    fetch_config, client, request_args = _prepare_fetch(var, context)
+    raw_value = _get_raw_value(fetch_config, client, request_args, submission_uuid, log)
 
     match fetch_config.data_mapping_type, fetch_config.mapping_expression:
         case DataMappingTypes.jq, expression:
@@ -92,3 +202,48 @@ def perform_service_fetch(
         request_parameters=request_args,
         response_json=raw_value,
     )
+
+
+def prefetch_service_fetches(
+    variables: Sequence[FormVariable], context: FormioData, submission_uuid: str
+) -> None:
+    """
+    Perform the service fetches of multiple variables concurrently.
+
+    The results are only cached, not returned. Subsequent calls to
+    :func:`perform_service_fetch` with the same submission UUID and request arguments
+    re-use the cached results. Errors are not raised here - the service fetch is
+    performed again (and fails) when the variable value is actually fetched.
+
+    :param variables: The variables with a service fetch configuration.
+    :param context: The data to build the request arguments from.
+    :param submission_uuid: The submission UUID to cache the results for.
+    """
+    assert submission_uuid, "Prefetching requires the results to be cached."
+
+    fetches: list[Callable[[], JSONValue]] = []
+    # resolve everything that may need the database in the calling thread
+    for var in variables:
+        log = logger.bind(variable=var.key, submission_uuid=submission_uuid)
+        try:
+            fetch_config, client, request_args = _prepare_fetch(var, context)
+        except Exception as exc:
+            log.debug("service_fetch_prefetch_skipped", exc_info=exc)
+            continue
+        fetches.append(
+            partial(
+                _get_raw_value, fetch_config, client, request_args, submission_uuid, log
+            )
+        )
+
+    if not fetches:
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(fetches), MAX_CONCURRENT_FETCHES)
+    ) as executor:
+        futures = [executor.submit(fetch) for fetch in fetches]
+
+    for future in futures:
+        if (exc := future.exception()) is not None:
+            logger.debug("service_fetch_prefetch_failed", exc_info=exc)
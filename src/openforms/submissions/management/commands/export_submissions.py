@@ -0,0 +1,58 @@
+"""
+Management command to export (a large number of) submissions of a form to a file.
+
+The export is written incrementally, so unlike the admin actions it can be used for
+forms with many submissions without running into request timeouts.
+"""
+
+from django.core.management import BaseCommand, CommandError
+
+from openforms.forms.models import Form
+
+from ...exports import ExportFileTypes, write_submission_export
+from ...models import Submission
+
+FILE_TYPES = {
+    file_type.extension: file_type
+    for file_type in (
+        ExportFileTypes.CSV,
+        ExportFileTypes.XLSX,
+        ExportFileTypes.JSON,
+        ExportFileTypes.XML,
+    )
+}
+
+
+class Command(BaseCommand):
+    help = "Export the submissions of a form to a file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("form_id", type=int, help="ID of the form to export.")
+        parser.add_argument("output", help="Path of the file to write the export to.")
+        parser.add_argument(
+            "--format",
+            choices=list(FILE_TYPES),
+            default=ExportFileTypes.CSV.extension,
+            help="File format of the export. Defaults to csv.",
+        )
+        parser.add_argument(
+            "--completed-only",
+            action="store_true",
+            help="Only export completed submissions.",
+        )
+
+    def handle(self, **options):
+        try:
+            form = Form.objects.get(pk=options["form_id"])
+        except Form.DoesNotExist as exc:
+            raise CommandError(f"Form {options['form_id']} does not exist.") from exc
+
+        queryset = Submission.objects.filter(form=form).order_by("pk")
+        if options["completed_only"]:
+            queryset = queryset.filter(completed_on__isnull=False)
+
+        file_type = FILE_TYPES[options["format"]]
+        with open(options["output"], "wb") as outfile:
+            write_submission_export(queryset, file_type, outfile)
+
+        self.stdout.write(f"Exported the submissions of form '{form.admin_name}'.")
@@ -32,6 +32,15 @@ step_saved_counter = meter.create_counter(
     description="The number of steps saved to the database.",
 )
 
+service_fetch_cache_counter = meter.create_counter(
+    "openforms.submission.service_fetch_cache_lookups",
+    unit="1",  # unitless count
+    description=(
+        "The number of service fetch cache lookups, by outcome (hit, miss or "
+        "coalesced with a concurrent fetch)."
+    ),
+)
+
 
 def count_submissions(
     options: metrics.CallbackOptions,
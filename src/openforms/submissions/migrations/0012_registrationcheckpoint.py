@@ -0,0 +1,59 @@
+# Generated by Django 5.2 on 2026-10-18 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("submissions", "0011_merge_20260304_1610"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RegistrationCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        help_text="Path of the result in the registration result.",
+                        max_length=255,
+                        verbose_name="key",
+                    ),
+                ),
+                ("value", models.JSONField(null=True, verbose_name="value")),
+                (
+                    "created_on",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created on"),
+                ),
+                (
+                    "submission",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="registration_checkpoints",
+                        to="submissions.submission",
+                        verbose_name="submission",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "registration checkpoint",
+                "verbose_name_plural": "registration checkpoints",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("submission", "key"),
+                        name="unique_registration_checkpoint_key",
+                    )
+                ],
+            },
+        ),
+    ]
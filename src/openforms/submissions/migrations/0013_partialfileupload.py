@@ -0,0 +1,89 @@
+# Generated by Django 5.2 on 2026-10-18 12:00
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import privates.fields
+import privates.storages
+
+import openforms.submissions.models.submission_files
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("submissions", "0012_registrationcheckpoint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PartialFileUpload",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        default=uuid.uuid4, unique=True, verbose_name="UUID"
+                    ),
+                ),
+                (
+                    "content",
+                    privates.fields.PrivateMediaFileField(
+                        help_text="The content received so far.",
+                        storage=privates.storages.PrivateMediaFileSystemStorage(),
+                        upload_to=openforms.submissions.models.submission_files.partial_file_upload_to,
+                        verbose_name="content",
+                    ),
+                ),
+                (
+                    "file_name",
+                    models.CharField(max_length=255, verbose_name="original name"),
+                ),
+                (
+                    "content_type",
+                    models.CharField(max_length=255, verbose_name="content type"),
+                ),
+                (
+                    "file_size",
+                    models.PositiveIntegerField(
+                        help_text="Size in bytes of the complete file, as announced by the client.",
+                        verbose_name="file size",
+                    ),
+                ),
+                (
+                    "offset",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of bytes received so far.",
+                        verbose_name="offset",
+                    ),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created on"),
+                ),
+                (
+                    "submission",
+                    models.ForeignKey(
+                        help_text="Submission the file upload belongs to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="submissions.submission",
+                        verbose_name="submission",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "partial file upload",
+                "verbose_name_plural": "partial file uploads",
+            },
+        ),
+    ]
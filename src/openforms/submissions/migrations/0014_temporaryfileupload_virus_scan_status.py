@@ -0,0 +1,39 @@
+# Generated by Django 5.2 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("submissions", "0013_partialfileupload"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="temporaryfileupload",
+            name="virus_scan_status",
+            field=models.CharField(
+                choices=[
+                    ("not_scanned", "Not scanned"),
+                    ("pending", "Pending"),
+                    ("clean", "Clean"),
+                    ("infected", "Infected"),
+                    ("failed", "Failed"),
+                ],
+                default="not_scanned",
+                help_text="Outcome of the virus scan. Uploads scanned in the background can only be claimed by the submission once they are clean.",
+                max_length=20,
+                verbose_name="virus scan status",
+            ),
+        ),
+        migrations.AddField(
+            model_name="temporaryfileupload",
+            name="virus_scan_result",
+            field=models.CharField(
+                blank=True,
+                help_text="The virus found or the error of the scanner, if any.",
+                max_length=255,
+                verbose_name="virus scan result",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("submissions", "0014_temporaryfileupload_virus_scan_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submission",
+            name="prefill_status",
+            field=models.CharField(
+                choices=[("pending", "Pending"), ("done", "Done")],
+                default="done",
+                help_text="Indicates whether the prefill values are still being retrieved in the background.",
+                max_length=20,
+                verbose_name="prefill status",
+            ),
+        ),
+    ]
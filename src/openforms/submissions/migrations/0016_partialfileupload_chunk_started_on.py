@@ -0,0 +1,22 @@
+# Generated by Django 5.2.13 on 2026-10-18 03:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("submissions", "0015_submission_prefill_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="partialfileupload",
+            name="chunk_started_on",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Start of the chunk being received. Other chunks are refused in the meantime.",
+                null=True,
+                verbose_name="chunk started on",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.13 on 2026-10-18 04:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("submissions", "0016_partialfileupload_chunk_started_on"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submission",
+            name="prefill_started_on",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the prefill values started being retrieved in the background.",
+                null=True,
+                verbose_name="prefill started on",
+            ),
+        ),
+    ]
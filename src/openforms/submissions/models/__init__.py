@@ -1,8 +1,10 @@
 from .cosign import CosignOTP
 from .email_verification import EmailVerification
 from .post_completion_metadata import PostCompletionMetadata
+from .registration_checkpoint import RegistrationCheckpoint
 from .submission import Submission
 from .submission_files import (
+    PartialFileUpload,
     SubmissionFileAttachment,
     SubmissionFileAttachmentManager,
     SubmissionFileAttachmentQuerySet,
@@ -18,7 +20,9 @@ from .submission_value_variable import (
 )
 
 __all__ = [
+    "PartialFileUpload",
     "PostCompletionMetadata",
+    "RegistrationCheckpoint",
     "Submission",
     "SubmissionStep",
     "SubmissionReport",
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from django.db import models
+from django.db.models import UniqueConstraint
+from django.utils.translation import gettext_lazy as _
+
+if TYPE_CHECKING:
+    from .submission import Submission
+
+
+class RegistrationCheckpointQuerySet(models.QuerySet["RegistrationCheckpoint"]):
+    def record(self, submission: Submission, results: Mapping[str, Any]) -> None:
+        """
+        Insert (or overwrite) the checkpoints of the intermediate results in a single
+        query.
+        """
+        self.bulk_create(
+            [
+                self.model(submission=submission, key=key, value=value)
+                for key, value in results.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["submission", "key"],
+            update_fields=["value"],
+        )
+
+
+class RegistrationCheckpoint(models.Model):
+    """
+    Intermediate result of a registration, stored while the registration is running.
+
+    Storing the result of every call made by a registration plugin in the
+    :attr:`Submission.registration_result` rewrites the entire (growing) result for
+    every call. Instead, every result is appended as a small checkpoint, which is
+    merged into the registration result when the registration status is saved (or
+    when a registration resumes after the worker crashed).
+    """
+
+    submission = models.ForeignKey(
+        to="Submission",
+        on_delete=models.CASCADE,
+        verbose_name=_("submission"),
+        related_name="registration_checkpoints",
+    )
+    key = models.CharField(
+        _("key"),
+        max_length=255,
+        help_text=_("Path of the result in the registration result."),
+    )
+    value = models.JSONField(_("value"), null=True)
+    created_on = models.DateTimeField(_("created on"), auto_now_add=True)
+
+    objects = RegistrationCheckpointQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("registration checkpoint")
+        verbose_name_plural = _("registration checkpoints")
+        constraints = [
+            UniqueConstraint(
+                fields=["submission", "key"],
+                name="unique_registration_checkpoint_key",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.submission.uuid}: {self.key}"
@@ -2,10 +2,9 @@ from __future__ import annotations
 
 import uuid
 from collections.abc import Mapping
-from copy import deepcopy
 from dataclasses import dataclass
-from datetime import datetime
-from typing import TYPE_CHECKING, ClassVar, assert_never
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, ClassVar, assert_never
 
 from django.conf import settings
 from django.db import models, transaction
@@ -20,6 +19,7 @@ import elasticapm
 import structlog
 from django_jsonform.models.fields import ArrayField
 from furl import furl
+from glom import assign
 from opentelemetry import trace
 
 from openforms.appointments.models import AppointmentInfo
@@ -34,6 +34,7 @@ from openforms.utils.validators import AllowedRedirectValidator, SerializerValid
 
 from ..constants import (
     PostSubmissionEvents,
+    PrefillStatuses,
     RegistrationStatuses,
     SubmissionValueVariableSources,
 )
@@ -41,6 +42,7 @@ from ..cosigning import CosignData, CosignState
 from ..pricing import get_submission_price
 from ..query import SubmissionQuerySet, SubmissionsManagerType
 from ..serializers import CoSignDataSerializer
+from .registration_checkpoint import RegistrationCheckpoint
 from .submission_step import SubmissionStep
 from .typing import SubmissionCosignData
 
@@ -294,6 +296,24 @@ class Submission(models.Model):
             "This can be an object reference in the Objects API, for example."
         ),
     )
+    prefill_status = models.CharField(
+        _("prefill status"),
+        max_length=20,
+        choices=PrefillStatuses.choices,
+        default=PrefillStatuses.done,
+        help_text=_(
+            "Indicates whether the prefill values are still being retrieved in the "
+            "background."
+        ),
+    )
+    prefill_started_on = models.DateTimeField(
+        _("prefill started on"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "When the prefill values started being retrieved in the background."
+        ),
+    )
 
     # TODO: Deprecated, replaced by the PostCompletionMetadata model
     on_completion_task_ids = ArrayField(
@@ -344,6 +364,8 @@ class Submission(models.Model):
 
     _form_login_required: bool | None = None  # can be set via annotation
     _total_configuration_wrapper = None
+    # set when the registration result has (unsaved) results from checkpoints
+    _has_registration_checkpoints: bool = False
 
     # type hints for (reverse) related fields
     auth_info: AuthInfo
@@ -429,7 +451,55 @@ class Submission(models.Model):
             self.registration_attempts += 1
             update_fields += ["last_register_date", "registration_attempts"]
 
-        self.save(update_fields=update_fields)
+        with transaction.atomic():
+            self.save(update_fields=update_fields)
+            self._delete_registration_checkpoints()
+
+    def record_registration_results(self, results: Mapping[str, Any]) -> None:
+        """
+        Store intermediate results of the registration, by their path in the
+        registration result.
+
+        Rather than saving the entire registration result, the results are appended as
+        checkpoints in a single query. They are merged into the saved registration
+        result at a safe point - see :meth:`flush_registration_checkpoints`.
+        """
+        if self.registration_result is None:
+            self.registration_result = {}
+        for key, value in results.items():
+            assign(self.registration_result, key, value, missing=dict)
+        RegistrationCheckpoint.objects.record(self, results)
+        self._has_registration_checkpoints = True
+
+    def load_registration_checkpoints(self) -> None:
+        """
+        Merge the checkpoints of an interrupted registration in the registration result.
+        """
+        checkpoints = self.registration_checkpoints.order_by("pk").values_list(
+            "key", "value"
+        )
+        for key, value in checkpoints:
+            if self.registration_result is None:
+                self.registration_result = {}
+            assign(self.registration_result, key, value, missing=dict)
+            self._has_registration_checkpoints = True
+
+    def flush_registration_checkpoints(self) -> None:
+        """
+        Save the registration result including the checkpointed results, replacing the
+        checkpoints.
+        """
+        if not self._has_registration_checkpoints:
+            return
+        with transaction.atomic():
+            self.save(update_fields=["registration_result"])
+            self._delete_registration_checkpoints()
+
+    def _delete_registration_checkpoints(self) -> None:
+        if not self._has_registration_checkpoints:
+            return
+        self.registration_checkpoints.all().delete()
+        self._has_registration_checkpoints = False
 
     @property
     def cleaned_form_url(self) -> furl:
@@ -459,8 +529,9 @@ class Submission(models.Model):
             if len(form_steps) == 0:
                 return FormioConfigurationWrapper(configuration={})
 
-            begin_configuration = deepcopy(form_steps[0].form_definition.configuration)
-            wrapper = FormioConfigurationWrapper(begin_configuration)
+            # Logic mutates the components of the total configuration, which may not
+            # leak into the configuration of the first step.
+            wrapper = form_steps[0].form_definition.configuration_wrapper.copy()
             for form_step in form_steps[1:]:
                 wrapper += form_step.form_definition.configuration_wrapper
             self._total_configuration_wrapper = wrapper
@@ -497,6 +568,23 @@ class Submission(models.Model):
     def is_completed(self):
         return bool(self.completed_on)
 
+    @property
+    def prefill_pending(self) -> bool:
+        """
+        Indicate whether the prefill values are still being retrieved in the background.
+
+        A prefill that takes longer than ``settings.PREFILL_BACKGROUND_TIMEOUT`` is
+        considered lost, so that the form can be filled out without the prefill values.
+        """
+        if self.prefill_status != PrefillStatuses.pending:
+            return False
+        if self.prefill_started_on is None:
+            return True
+        expires_on = self.prefill_started_on + timedelta(
+            seconds=settings.PREFILL_BACKGROUND_TIMEOUT
+        )
+        return timezone.now() < expires_on
+
     @property
     def is_ready_to_hash_identifying_attributes(self) -> bool:
         """
@@ -609,9 +697,14 @@ class Submission(models.Model):
         if hasattr(self, "_execution_state") and not refresh:
             return self._execution_state
 
-        form_steps = list(
-            self.form.formstep_set.select_related("form_definition").order_by("order")
-        )
+        form_steps_qs = self.form.formstep_set.all()
+        # the exports prefetch the form steps (in the same way) for a chunk of
+        # submissions
+        if "formstep_set" not in getattr(self.form, "_prefetched_objects_cache", {}):
+            form_steps_qs = form_steps_qs.select_related("form_definition").order_by(
+                "order"
+            )
+        form_steps = list(form_steps_qs)
         # ⚡️ no select_related/prefetch ON PURPOSE - while processing the form steps,
         # we're doing this in python as we have the objects already from the query
         # above.
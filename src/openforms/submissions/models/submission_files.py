@@ -9,7 +9,8 @@ from datetime import date, timedelta
 from typing import TYPE_CHECKING, ClassVar
 
 from django.core.files.base import File
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -20,6 +21,7 @@ from privates.fields import PrivateMediaFileField
 from openforms.typing import JSONValue
 from openforms.utils.files import DeleteFileFieldFilesMixin, DeleteFilesQuerySetMixin
 
+from ..constants import VirusScanStatuses
 from .submission import Submission
 from .submission_step import SubmissionStep
 
@@ -40,6 +42,10 @@ def temporary_file_upload_to(instance, filename):
     return fmt_upload_to("temporary-uploads", instance, filename)
 
 
+def partial_file_upload_to(instance, filename):
+    return fmt_upload_to("temporary-uploads/partial", instance, filename)
+
+
 def submission_file_upload_to(instance, filename):
     return fmt_upload_to("submission-uploads", instance, filename)
 
@@ -70,6 +76,22 @@ class TemporaryFileUpload(DeleteFileFieldFilesMixin, models.Model):
         default=0,
         help_text=_("Size in bytes of the uploaded file."),
     )
+    virus_scan_status = models.CharField(
+        _("virus scan status"),
+        max_length=20,
+        choices=VirusScanStatuses.choices,
+        default=VirusScanStatuses.not_scanned,
+        help_text=_(
+            "Outcome of the virus scan. Uploads scanned in the background can only be "
+            "claimed by the submission once they are clean."
+        ),
+    )
+    virus_scan_result = models.CharField(
+        _("virus scan result"),
+        max_length=255,
+        blank=True,
+        help_text=_("The virus found or the error of the scanner, if any."),
+    )
     created_on = models.DateTimeField(_("created on"), auto_now_add=True)
 
     objects = TemporaryFileUploadQuerySet.as_manager()
@@ -81,6 +103,152 @@ class TemporaryFileUpload(DeleteFileFieldFilesMixin, models.Model):
     def __str__(self):
         return self.file_name
 
+    @property
+    def is_claimable(self) -> bool:
+        return self.virus_scan_status in (
+            VirusScanStatuses.not_scanned,
+            VirusScanStatuses.clean,
+        )
+
+
+class PartialFileUploadQuerySet(DeleteFilesQuerySetMixin, models.QuerySet):
+    def select_prune(self, age: timedelta):
+        return self.filter(created_on__lt=timezone.now() - age)
+
+
+# maximum time a chunk of a partial file upload may take, after which the next chunk
+# can take over (e.g. after a crash)
+CHUNK_TIMEOUT = timedelta(minutes=15)
+
+
+class PartialFileUpload(DeleteFileFieldFilesMixin, models.Model):
+    """
+    A temporary file upload in progress, received in chunks.
+
+    The chunks are appended to the content file, :attr:`offset` tracks the number of
+    bytes received so far. Once the file is complete (and valid), it is converted into
+    a :class:`TemporaryFileUpload`.
+
+    A chunk is received one at a time: the offset is claimed before the chunk is
+    received (:meth:`claim_chunk`), and committed afterwards (:meth:`commit_chunk`). No
+    database transaction or lock is held while the request body is received.
+    """
+
+    uuid = models.UUIDField(_("UUID"), unique=True, default=uuid.uuid4)
+    submission = models.ForeignKey(
+        "submissions.Submission",
+        on_delete=models.CASCADE,
+        verbose_name=_("submission"),
+        help_text=_("Submission the file upload belongs to."),
+    )
+    content = PrivateMediaFileField(
+        verbose_name=_("content"),
+        upload_to=partial_file_upload_to,
+        help_text=_("The content received so far."),
+    )
+    file_name = models.CharField(_("original name"), max_length=255)
+    content_type = models.CharField(_("content type"), max_length=255)
+    file_size = models.PositiveIntegerField(
+        _("file size"),
+        help_text=_("Size in bytes of the complete file, as announced by the client."),
+    )
+    offset = models.PositiveIntegerField(
+        _("offset"),
+        default=0,
+        help_text=_("Number of bytes received so far."),
+    )
+    chunk_started_on = models.DateTimeField(
+        _("chunk started on"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "Start of the chunk being received. Other chunks are refused in the "
+            "meantime."
+        ),
+    )
+    created_on = models.DateTimeField(_("created on"), auto_now_add=True)
+
+    objects = PartialFileUploadQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("partial file upload")
+        verbose_name_plural = _("partial file uploads")
+
+    def __str__(self):
+        return self.file_name
+
+    @property
+    def is_complete(self) -> bool:
+        return self.offset == self.file_size
+
+    def claim_chunk(self, offset: int) -> bool:
+        """
+        Claim the offset to receive a chunk at.
+
+        :returns: Whether the offset was claimed. Fails if the offset doesn't match the
+          bytes received so far, or if another chunk is being received.
+        """
+        now = timezone.now()
+        claimed = (
+            PartialFileUpload.objects.filter(pk=self.pk, offset=offset)
+            .filter(
+                Q(chunk_started_on__isnull=True)
+                | Q(chunk_started_on__lt=now - CHUNK_TIMEOUT)
+            )
+            .update(chunk_started_on=now)
+        )
+        if claimed:
+            self.offset = offset
+            self.chunk_started_on = now
+        return bool(claimed)
+
+    def commit_chunk(self, size: int) -> bool:
+        """
+        Move the offset past the received chunk, releasing the claim.
+
+        :returns: Whether the chunk was committed. Fails if the claim expired and was
+          taken over by another chunk.
+        """
+        committed = PartialFileUpload.objects.filter(
+            pk=self.pk, chunk_started_on=self.chunk_started_on
+        ).update(offset=F("offset") + size, chunk_started_on=None)
+        if committed:
+            self.offset += size
+            self.chunk_started_on = None
+        return bool(committed)
+
+    def release_chunk(self) -> None:
+        """
+        Release the claim of a chunk that was not received.
+        """
+        PartialFileUpload.objects.filter(
+            pk=self.pk, chunk_started_on=self.chunk_started_on
+        ).update(chunk_started_on=None)
+        self.chunk_started_on = None
+
+    @transaction.atomic
+    def complete(
+        self, content_type: str, virus_scan_status: VirusScanStatuses
+    ) -> TemporaryFileUpload:
+        """
+        Convert the received file into a temporary file upload.
+
+        The file is not copied - the temporary upload takes over the content file.
+        """
+        assert self.is_complete, "The upload is not complete yet"
+        upload = TemporaryFileUpload.objects.create(
+            submission=self.submission,
+            content=self.content.name,
+            file_name=self.file_name,
+            content_type=content_type,
+            file_size=self.file_size,
+            virus_scan_status=virus_scan_status,
+        )
+        # the content file now belongs to the temporary upload, so only delete the
+        # database record
+        models.Model.delete(self)
+        return upload
+
 
 class SubmissionFileAttachmentQuerySet(
     DeleteFilesQuerySetMixin, models.QuerySet["SubmissionFileAttachment"]
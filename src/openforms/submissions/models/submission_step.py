@@ -10,6 +10,7 @@ from frozendict import frozendict
 
 from openforms.formio.service import FormioData
 from openforms.forms.models import FormDefinition, FormStep
+from openforms.variables.constants import FormVariableSources
 
 
 def _make_frozen(obj):
@@ -192,6 +193,29 @@ class SubmissionStep(models.Model):  # noqa: DJ008
     def can_submit(self, value: bool) -> None:
         self._can_submit = value
 
+    @property
+    def prefill_pending(self) -> bool:
+        """
+        Indicate whether the step depends on prefill values that are still being
+        retrieved in the background.
+        """
+        if not self.submission.prefill_pending:
+            return False
+        state = self.submission.variables_state
+        prefilled_variables = state.prefilled_variables
+        # user defined variables can be used in any step, and the prefill options may
+        # set the value of any variable
+        if any(
+            variable.form_variable.source == FormVariableSources.user_defined
+            for variable in prefilled_variables.values()
+            if variable.form_variable
+        ):
+            return True
+        return any(
+            key in prefilled_variables
+            for key in state.get_variables_in_submission_step(self)
+        )
+
     @property
     def is_applicable(self) -> bool:
         if self._is_applicable is not None:
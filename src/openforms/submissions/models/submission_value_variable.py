@@ -7,7 +7,7 @@ from datetime import date, datetime, time
 from typing import TYPE_CHECKING, Any
 
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import models, transaction
 from django.db.models.constraints import CheckConstraint
 from django.utils import timezone
 from django.utils.dateparse import parse_date
@@ -46,6 +46,8 @@ from ..constants import ComponentPreRegistrationStatuses, SubmissionValueVariabl
 from .submission import Submission
 
 if TYPE_CHECKING:
+    from openforms.forms.models import FormDefinition
+
     from .submission_step import SubmissionStep
 
 
@@ -68,6 +70,11 @@ class SubmissionValueVariablesState:
     _static_variables: dict[str, SubmissionValueVariable] | None = field(
         init=False, default=None
     )
+    # component keys of each form definition (by ID) in the submission, see
+    # ``get_variables_in_submission_step``
+    _keys_by_form_definition: dict[int, frozenset[str]] = field(
+        init=False, default_factory=dict
+    )
 
     @property
     def variables(self) -> dict[str, SubmissionValueVariable]:
@@ -178,12 +185,11 @@ class SubmissionValueVariablesState:
         submission_step: SubmissionStep,
         include_unsaved=True,
     ) -> dict[str, SubmissionValueVariable]:
-        configuration_wrapper = (
-            submission_step.form_step.form_definition.configuration_wrapper
+        variables = self.variables
+        keys_in_step = self._get_keys_in_form_definition(
+            submission_step.form_step.form_definition
         )
-        keys_in_step = list(configuration_wrapper.component_map.keys())
 
-        variables = self.variables
         if not include_unsaved:
             variables = self.saved_variables
 
@@ -193,6 +199,17 @@ class SubmissionValueVariablesState:
             if variable.key in keys_in_step
         }
 
+    def _get_keys_in_form_definition(
+        self, form_definition: FormDefinition
+    ) -> frozenset[str]:
+        # the index is populated when collecting the variables, but the step may use a
+        # form definition that is no longer part of the form
+        keys = self._keys_by_form_definition.get(form_definition.pk)
+        if keys is None:
+            keys = frozenset(form_definition.configuration_wrapper.component_map)
+            self._keys_by_form_definition[form_definition.pk] = keys
+        return keys
+
     def collect_variables(self) -> dict[str, SubmissionValueVariable]:
         # leverage the (already populated) submission state to get access to form
         # steps and form definitions
@@ -201,11 +218,26 @@ class SubmissionValueVariablesState:
             form_step.form_definition.id: form_step.form_definition
             for form_step in submission_state.form_steps
         }
+        # index the component keys of every step once, so that looking up the
+        # variables of a step does not require scanning the configuration
+        self._keys_by_form_definition = {
+            form_definition_id: frozenset(
+                form_definition.configuration_wrapper.component_map
+            )
+            for form_definition_id, form_definition in form_definition_map.items()
+        }
 
-        # Build a collection of all form variables
+        # Build a collection of all form variables, including the service fetch
+        # configurations the logic rules need. The exports prefetch them (in the same
+        # way) for a chunk of submissions.
+        form = self.submission.form
+        form_variables = form.formvariable_set.all()
+        if "formvariable_set" not in getattr(form, "_prefetched_objects_cache", {}):
+            form_variables = form_variables.select_related(
+                "service_fetch_configuration__service"
+            ).order_by("pk")
         all_form_variables = {
-            form_variable.key: form_variable
-            for form_variable in self.submission.form.formvariable_set.all()
+            form_variable.key: form_variable for form_variable in form_variables
         }
         # optimize the access from form_variable.form_definition using the already
         # existing map, saving a `select_related` call on data we (probably) already
@@ -330,8 +362,14 @@ class SubmissionValueVariablesState:
         ``self.prefilled_variables``.
 
         Component and data-type normalization will be applied before saving.
+
+        The prefill may be completed in the background (see
+        :attr:`openforms.config.models.GlobalConfiguration.prefill_in_background`),
+        after the variables with initial values were saved already. These are updated
+        with the prefill data.
         """
         variables_to_create: list[SubmissionValueVariable] = []
+        variables_to_update: list[SubmissionValueVariable] = []
         for variable in self.variables.values():
             value = data.get(variable.key, empty)
             if value is empty:
@@ -346,9 +384,21 @@ class SubmissionValueVariablesState:
             # user-defined variables).
             variable.value = variable.to_json(variable.to_python(value))
             variable.source = SubmissionValueVariableSources.prefill
-            variables_to_create.append(variable)
+            if variable.pk:
+                variables_to_update.append(variable)
+            else:
+                variables_to_create.append(variable)
 
-        SubmissionValueVariable.objects.bulk_create(variables_to_create)
+        with transaction.atomic():
+            SubmissionValueVariable.objects.bulk_update(
+                variables_to_update, fields=["value", "source"]
+            )
+            SubmissionValueVariable.objects.bulk_create(
+                variables_to_create,
+                update_conflicts=True,
+                unique_fields=["submission", "key"],
+                update_fields=["value", "source"],
+            )
 
     def set_values(self, data: FormioData) -> None:
         """
@@ -11,6 +11,7 @@ from django.db.models import (
     ExpressionWrapper,
     F,
     IntegerField,
+    OuterRef,
     Value,
     When,
 )
@@ -18,7 +19,11 @@ from django.utils import timezone
 
 from openforms.config.models import GlobalConfiguration
 
-from .constants import RegistrationStatuses, Stages
+from .constants import (
+    RegistrationStatuses,
+    Stages,
+    SubmissionValueVariableSources,
+)
 
 if TYPE_CHECKING:
     from .models import Submission  # noqa
@@ -85,6 +90,58 @@ class SubmissionQuerySet(models.QuerySet["Submission"]):
         )
         return self.annotate(stage=stage_case_when)
 
+    def remove_sensitive_data(self) -> int:
+        """
+        Set-based equivalent of :meth:`Submission.remove_sensitive_data`.
+
+        Instead of processing the submissions one by one, a fixed number of queries is
+        used for the whole queryset. Returns the number of cleaned submissions.
+        """
+        from openforms.authentication.models import AuthInfo
+        from openforms.forms.models import FormVariable
+
+        from .models import SubmissionFileAttachment, SubmissionValueVariable
+
+        submissions = self.model._default_manager.filter(
+            pk__in=models.Subquery(self.values("pk"))
+        )
+
+        AuthInfo.objects.filter(submission__in=submissions).update(value="")
+
+        sensitive_variables = SubmissionValueVariable.objects.filter(
+            models.Exists(
+                FormVariable.objects.filter(
+                    form=OuterRef("submission__form"),
+                    key=OuterRef("key"),
+                    is_sensitive_data=True,
+                )
+            ),
+            submission__in=submissions,
+        )
+        sensitive_variables.update(
+            value="", source=SubmissionValueVariableSources.sensitive_data_cleaner
+        )
+
+        SubmissionFileAttachment.objects.filter(
+            models.Exists(
+                FormVariable.objects.filter(
+                    form=OuterRef("submission_step__submission__form"),
+                    key=OuterRef("submission_variable__key"),
+                    is_sensitive_data=True,
+                )
+            ),
+            submission_step__submission__in=submissions,
+        ).delete()
+
+        # FIXME: this only deals with cosign v1 and not v2
+        # We do keep the representation, as that is used in PDF and confirmation e-mail
+        # generation and is usually a label derived from the source fields.
+        for submission in submissions.exclude(co_sign_data={}).only("co_sign_data"):
+            submission.co_sign_data.update({"identifier": "", "fields": {}})
+            submission.save(update_fields=["co_sign_data"])
+
+        return submissions.update(_is_cleaned=True)
+
 
 # Purely used for static type checking.
 class SubmissionsManagerType(models.Manager["Submission"]):
@@ -93,3 +150,5 @@ class SubmissionsManagerType(models.Manager["Submission"]):
     ) -> SubmissionQuerySet: ...
 
     def annotate_stage(self) -> SubmissionQuerySet: ...
+
+    def remove_sensitive_data(self) -> int: ...
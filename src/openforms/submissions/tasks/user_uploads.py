@@ -5,16 +5,20 @@ from django.conf import settings
 from openforms.celery import app
 
 from ..attachments import (
+    attach_scanned_upload,
     cleanup_submission_temporary_uploaded_files,
     cleanup_unclaimed_temporary_uploaded_files,
     resize_attachment,
 )
-from ..models import Submission, SubmissionFileAttachment
+from ..constants import VirusScanStatuses
+from ..models import Submission, SubmissionFileAttachment, TemporaryFileUpload
+from ..virus_scan import scan_upload
 
 __all__ = [
     "cleanup_temporary_files_for",
     "cleanup_unclaimed_temporary_files",
     "resize_submission_attachment",
+    "scan_temporary_upload",
 ]
 
 
@@ -34,3 +38,24 @@ def cleanup_unclaimed_temporary_files() -> None:
 def resize_submission_attachment(attachment_id: int, size: tuple[int, int]) -> None:
     attachment = SubmissionFileAttachment.objects.get(id=attachment_id)
     resize_attachment(attachment, size)
+
+
+@app.task(
+    bind=True,
+    ignore_result=True,
+    autoretry_for=(OSError,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def scan_temporary_upload(task, upload_id: int) -> None:
+    upload = TemporaryFileUpload.objects.filter(
+        pk=upload_id, virus_scan_status=VirusScanStatuses.pending
+    ).first()
+    # deleted in the meantime or already scanned
+    if upload is None:
+        return
+    # retry while ClamAV cannot be reached, the last attempt records the failure
+    scan_upload(upload, raise_unavailable=task.request.retries < task.max_retries)
+    # the step may have been saved while the upload was being scanned
+    if upload.is_claimable:
+        attach_scanned_upload(upload)
@@ -0,0 +1,107 @@
+"""
+A fake clamd server for the tests, speaking the subset of the protocol that is used.
+"""
+
+import socketserver
+import struct
+import threading
+
+# part of the EICAR test file, which every virus scanner detects
+EICAR = b"EICAR-STANDARD-ANTIVIRUS-TEST-FILE"
+
+
+class _ClamdHandler(socketserver.BaseRequestHandler):
+    server: "FakeClamd"
+
+    def _read(self, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            if not (received := self.request.recv(size - len(data))):
+                raise ConnectionError("Connection closed")
+            data += received
+        return data
+
+    def _read_command(self) -> bytes:
+        command = b""
+        while not command.endswith(b"\0"):
+            if not (received := self.request.recv(1)):
+                return b""
+            command += received
+        return command[:-1]
+
+    def _read_stream(self) -> bytes:
+        content = b""
+        while size := struct.unpack("!L", self._read(4))[0]:
+            content += self._read(size)
+        return content
+
+    def handle(self):
+        self.server.connections += 1
+        session = False
+        command_id = 0
+        while command := self._read_command():
+            command_id += 1
+            match command:
+                case b"zIDSESSION":
+                    session = True
+                    command_id = 0
+                    continue
+                case b"zEND":
+                    return
+                case b"zPING":
+                    reply = "PONG"
+                case b"zINSTREAM":
+                    content = self._read_stream()
+                    self.server.scanned.append(content)
+                    reply = (
+                        "stream: Win.Test.EICAR_HDB-1 FOUND"
+                        if EICAR in content
+                        else "stream: OK"
+                    )
+                case _:
+                    reply = "UNKNOWN COMMAND"
+
+            prefix = f"{command_id}: " if session else ""
+            self.request.sendall(f"{prefix}{reply}\0".encode())
+            if not session or self.server.close_after_reply:
+                return
+
+
+class FakeClamd(socketserver.ThreadingTCPServer):
+    """
+    Run a fake clamd server on a free port of localhost.
+
+    Files containing the EICAR test signature are reported as infected.
+
+    .. code-block:: python
+
+        with FakeClamd() as clamd:
+            ...  # connect to clamd.host and clamd.port
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, close_after_reply: bool = False):
+        super().__init__(("127.0.0.1", 0), _ClamdHandler)
+        self.close_after_reply = close_after_reply
+        self.connections = 0
+        self.scanned: list[bytes] = []
+
+    @property
+    def host(self) -> str:
+        return self.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
@@ -1,13 +1,17 @@
+import uuid
 from typing import Any
 from unittest import skip
+from unittest.mock import patch
 from urllib.parse import unquote
 
+from django.core.cache import cache
 from django.core.exceptions import SuspiciousOperation
 from django.test import SimpleTestCase, tag
 
 import requests_mock
 from furl import furl
 from hypothesis import assume, example, given, strategies as st
+from redis.exceptions import ConnectionError as RedisConnectionError
 from zgw_consumers.constants import APITypes, AuthTypes
 from zgw_consumers.test.factories import ServiceFactory
 
@@ -19,7 +23,7 @@ from openforms.variables.models import _convert_to_string
 from openforms.variables.tests.factories import ServiceFetchConfigurationFactory
 from openforms.variables.validators import HeaderValidator, ValidationError
 
-from ...logic.service_fetching import perform_service_fetch
+from ...logic.service_fetching import get_cache_key, perform_service_fetch
 
 DEFAULT_REQUEST_HEADERS = {
     "Accept",
@@ -414,3 +418,122 @@ class ServiceFetchConfigVariableBindingTests(DisableNLXRewritingMixin, SimpleTes
 
         with self.assertRaises(ValueError):
             perform_service_fetch(var, FormioData())
+
+
+class ServiceFetchCachingTests(DisableNLXRewritingMixin, SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.service = ServiceFactory.build(
+            api_type=APITypes.orc,
+            api_root="https://httpbin.org/",
+            auth_type=AuthTypes.no_auth,
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        self.submission_uuid = str(uuid.uuid4())
+        self.addCleanup(cache.clear)
+
+        patcher = patch(
+            "openforms.submissions.logic.service_fetching.service_fetch_cache_counter"
+        )
+        self.mock_counter = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_outcomes(self) -> list[str]:
+        return [
+            call.args[1]["outcome"] for call in self.mock_counter.add.call_args_list
+        ]
+
+    def test_cache_key_is_deterministic(self):
+        fetch_config = ServiceFetchConfigurationFactory.build(
+            pk=1, service=self.service, path="get"
+        )
+        request_args = {"method": "GET", "url": "https://httpbin.org/get", "params": {}}
+
+        key = get_cache_key(self.submission_uuid, fetch_config, request_args)
+
+        self.assertEqual(
+            key,
+            get_cache_key(self.submission_uuid, fetch_config, dict(request_args)),
+        )
+        self.assertTrue(
+            key.startswith(f"openforms:service-fetch:{self.submission_uuid}:1:")
+        )
+        self.assertNotEqual(
+            key, get_cache_key(str(uuid.uuid4()), fetch_config, request_args)
+        )
+        self.assertNotEqual(
+            key,
+            get_cache_key(
+                self.submission_uuid, fetch_config, {**request_args, "params": {"a": 1}}
+            ),
+        )
+
+    @requests_mock.Mocker()
+    def test_cached_result_is_reused(self, m):
+        m.get("https://httpbin.org/get", json={"url": "https://httpbin.org/get"})
+        var = FormVariableFactory.build(
+            service_fetch_configuration=ServiceFetchConfigurationFactory.build(
+                service=self.service,
+                path="get",
+            )
+        )
+
+        result1 = perform_service_fetch(var, FormioData(), self.submission_uuid)
+        result2 = perform_service_fetch(var, FormioData(), self.submission_uuid)
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(result1.value, result2.value)
+        self.assertEqual(self._get_outcomes(), ["miss", "hit"])
+
+    @requests_mock.Mocker()
+    def test_concurrent_fetch_is_coalesced(self, m):
+        m.get("https://httpbin.org/get", json={"url": "https://httpbin.org/get"})
+        var = FormVariableFactory.build(
+            service_fetch_configuration=ServiceFetchConfigurationFactory.build(
+                service=self.service,
+                path="get",
+            )
+        )
+        original_get = cache.get
+        lookups = []
+
+        def get(key, default=None, **kwargs):
+            # the first lookup misses, and the result is cached by a concurrent fetch
+            # before the lock is acquired
+            if not lookups:
+                lookups.append(key)
+                cache.set(key, {"url": "concurrent"})
+                return default
+            return original_get(key, default, **kwargs)
+
+        with patch.object(cache, "get", side_effect=get):
+            result = perform_service_fetch(var, FormioData(), self.submission_uuid)
+
+        self.assertFalse(m.called)
+        self.assertEqual(result.value, {"url": "concurrent"})
+        self.assertEqual(self._get_outcomes(), ["coalesced"])
+
+    @requests_mock.Mocker()
+    def test_fetch_without_lock_when_redis_is_unavailable(self, m):
+        m.get("https://httpbin.org/get", json={"url": "https://httpbin.org/get"})
+        var = FormVariableFactory.build(
+            service_fetch_configuration=ServiceFetchConfigurationFactory.build(
+                service=self.service,
+                path="get",
+            )
+        )
+
+        with patch("openforms.submissions.logic.service_fetching.caches") as m_caches:
+            m_caches.__getitem__.return_value.lock.return_value.acquire.side_effect = (
+                RedisConnectionError("Connection refused")
+            )
+
+            result = perform_service_fetch(var, FormioData(), self.submission_uuid)
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(result.value, {"url": "https://httpbin.org/get"})
+        self.assertEqual(self._get_outcomes(), ["miss"])
@@ -0,0 +1,36 @@
+from django.test import SimpleTestCase
+
+from openforms.forms.tests.factories import FormLogicFactory
+
+from ...logic.program import compile_logic_program, get_compiled_trigger
+
+
+class LogicProgramTests(SimpleTestCase):
+    def test_compiled_trigger_is_cached_per_rule(self):
+        rule = FormLogicFactory.build(json_logic_trigger={"==": [{"var": "foo"}, 1]})
+
+        compiled1 = get_compiled_trigger(rule)
+        compiled2 = get_compiled_trigger(rule)
+
+        self.assertIs(compiled1, compiled2)
+
+    def test_compiled_trigger_is_invalidated_when_trigger_changes(self):
+        rule = FormLogicFactory.build(json_logic_trigger={"==": [{"var": "foo"}, 1]})
+        compiled1 = get_compiled_trigger(rule)
+
+        rule.json_logic_trigger = {"==": [{"var": "foo"}, 2]}
+        compiled2 = get_compiled_trigger(rule)
+
+        self.assertIsNot(compiled1, compiled2)
+        self.assertFalse(compiled2({"foo": 1}))
+        self.assertTrue(compiled2({"foo": 2}))
+
+    def test_rule_order_is_preserved(self):
+        rules = [
+            FormLogicFactory.build(json_logic_trigger={"var": f"var{i}"})
+            for i in range(5)
+        ]
+
+        program = compile_logic_program(reversed(rules))
+
+        self.assertEqual([compiled.rule for compiled in program], list(reversed(rules)))
@@ -1,15 +1,29 @@
-from datetime import datetime
+import json
+from datetime import UTC, datetime
+from io import BytesIO, StringIO
+from tempfile import NamedTemporaryFile
 
+from django.core.management import CommandError, call_command
+from django.db import connection
 from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
+import tablib
 from freezegun import freeze_time
 from privates.test import temp_private_root
 
 from openforms.formio.tests.factories import SubmittedFileFactory
 from openforms.forms.tests.factories import FormFactory, FormStepFactory
 
-from ..exports import create_submission_export
+from ..exports import (
+    ExportFileTypes,
+    FileType,
+    create_submission_export,
+    iter_export_content,
+    iter_submission_export_rows,
+    write_submission_export,
+)
 from ..models import Submission
 from .factories import (
     SubmissionFactory,
@@ -389,3 +403,144 @@ class ExportTests(TestCase):
         self.assertEqual(len(dataset), 2)
         self.assertEqual(len(dataset[0]), 3)
         self.assertEqual(len(dataset[1]), 3)
+
+
+class StreamingExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        form = FormFactory.create(
+            generate_minimal_setup=True,
+            name="Export test",
+            formstep__form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "name", "label": "Name"},
+                    {
+                        "type": "textfield",
+                        "key": "multi",
+                        "label": "Multi",
+                        "multiple": True,
+                    },
+                ]
+            },
+        )
+        for index in range(3):
+            SubmissionStepFactory.create(
+                submission__form=form,
+                submission__completed=True,
+                submission__completed_on=datetime(2022, 5, 9, 13, tzinfo=UTC),
+                form_step=form.formstep_set.get(),
+                data={"name": f"Name {index}", "multi": ["a", "b"]},
+            )
+
+    def _get_content(self, file_type: FileType) -> bytes:
+        chunks = iter_export_content(Submission.objects.order_by("pk"), file_type)
+        return b"".join(
+            chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            for chunk in chunks
+        )
+
+    def test_rows_do_not_depend_on_chunk_size(self):
+        queryset = Submission.objects.order_by("pk")
+
+        rows = list(iter_submission_export_rows(queryset))
+
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(
+            list(iter_submission_export_rows(queryset, chunk_size=1)), rows
+        )
+
+    def test_same_output_as_dataset_export(self):
+        dataset = create_submission_export(Submission.objects.order_by("pk"))
+
+        for file_type in (
+            ExportFileTypes.CSV,
+            ExportFileTypes.JSON,
+            ExportFileTypes.XML,
+        ):
+            with self.subTest(file_type=file_type.extension):
+                content = self._get_content(file_type)
+
+                expected = dataset.export(file_type.extension)
+                if isinstance(expected, str):
+                    expected = expected.encode("utf-8")
+                self.assertEqual(content, expected)
+
+    def test_queries_do_not_grow_with_the_number_of_submissions(self):
+        queryset = Submission.objects.order_by("pk")
+        with CaptureQueriesContext(connection) as context:
+            list(iter_submission_export_rows(queryset))
+        num_queries = len(context.captured_queries)
+        submission = queryset.first()
+        assert submission is not None
+        for index in range(3, 6):
+            SubmissionStepFactory.create(
+                submission__form=submission.form,
+                submission__completed=True,
+                form_step=submission.form.formstep_set.get(),
+                data={"name": f"Name {index}", "multi": ["c"]},
+            )
+
+        with self.assertNumQueries(num_queries):
+            rows = list(iter_submission_export_rows(queryset))
+
+        self.assertEqual(len(rows), 7)
+
+    def test_empty_queryset(self):
+        queryset = Submission.objects.none()
+
+        csv_content = b"".join(
+            chunk.encode("utf-8")
+            for chunk in iter_export_content(queryset, ExportFileTypes.CSV)
+        )
+        json_content = "".join(iter_export_content(queryset, ExportFileTypes.JSON))
+
+        self.assertEqual(csv_content, b"")
+        self.assertEqual(json_content, "[]")
+
+    def test_write_xlsx(self):
+        outfile = BytesIO()
+
+        write_submission_export(
+            Submission.objects.order_by("pk"), ExportFileTypes.XLSX, outfile
+        )
+
+        dataset = tablib.Dataset().load(outfile.getvalue(), format="xlsx")
+        self.assertEqual(
+            dataset.headers, ["Formuliernaam", "Inzendingdatum", "name", "multi"]
+        )
+        self.assertEqual(len(dataset), 3)
+        self.assertEqual(
+            dataset[0],
+            (
+                "Export test",
+                datetime(2022, 5, 9, 15, 0, 0),
+                "Name 0",
+                "['a', 'b']",
+            ),
+        )
+
+    def test_management_command(self):
+        form = Submission.objects.first().form
+        stdout = StringIO()
+
+        with NamedTemporaryFile(suffix=".json") as outfile:
+            call_command(
+                "export_submissions",
+                form.pk,
+                outfile.name,
+                format="json",
+                stdout=stdout,
+            )
+
+            exported = json.load(outfile)
+
+        self.assertEqual(
+            [row["name"] for row in exported], ["Name 0", "Name 1", "Name 2"]
+        )
+        self.assertEqual(exported[0]["multi"], ["a", "b"])
+
+    def test_management_command_unknown_form(self):
+        with self.assertRaises(CommandError):
+            call_command("export_submissions", 0, "/dev/null", stdout=StringIO())
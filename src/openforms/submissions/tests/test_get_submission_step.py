@@ -127,6 +127,7 @@ class ReadSubmissionStepTests(SubmissionsMixin, APITestCase):
             },
             "data": {},
             "canSubmit": True,
+            "prefillPending": False,
             "requireBackendLogicEvaluation": False,
             "logicRules": [],
         }
@@ -184,6 +185,7 @@ class ReadSubmissionStepTests(SubmissionsMixin, APITestCase):
             },
             "data": {},
             "canSubmit": True,
+            "prefillPending": False,
             # wrong but our introspection code is not aware of this ad-hoc plugin
             "requireBackendLogicEvaluation": False,
             "logicRules": [],
@@ -911,6 +913,7 @@ class IntegrationTests(SubmissionsMixin, APITestCase):
             },
             "data": {},
             "canSubmit": True,
+            "prefillPending": False,
             "requireBackendLogicEvaluation": False,
             "logicRules": [],
         }
@@ -954,6 +957,7 @@ class IntegrationTests(SubmissionsMixin, APITestCase):
             },
             "data": {},
             "canSubmit": True,
+            "prefillPending": False,
             "requireBackendLogicEvaluation": True,
             "logicRules": [],
         }
@@ -1022,6 +1026,7 @@ class IntegrationTests(SubmissionsMixin, APITestCase):
             },
             "data": {},
             "canSubmit": True,
+            "prefillPending": False,
             "requireBackendLogicEvaluation": False,
             "logicRules": [
                 {
@@ -1108,6 +1113,7 @@ class IntegrationTests(SubmissionsMixin, APITestCase):
             },
             "data": {},
             "canSubmit": True,
+            "prefillPending": False,
             "requireBackendLogicEvaluation": True,
             "logicRules": [],  # logic rules are not serialized when the backend is required
         }
@@ -1174,6 +1180,7 @@ class IntegrationTests(SubmissionsMixin, APITestCase):
             },
             "data": {},
             "canSubmit": True,
+            "prefillPending": False,
             "requireBackendLogicEvaluation": True,
             "logicRules": [],  # logic rules are not serialized when the backend is required
         }
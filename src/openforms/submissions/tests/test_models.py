@@ -160,6 +160,94 @@ class SubmissionTests(TestCase):
             },
         )
 
+    def test_queryset_remove_sensitive_data(self):
+        form_definition = FormDefinitionFactory.create(
+            configuration={
+                "components": [
+                    {
+                        "key": "textFieldSensitive",
+                        "type": "textfield",
+                        "isSensitiveData": True,
+                    },
+                    {
+                        "key": "textFieldNotSensitive",
+                        "type": "textfield",
+                        "isSensitiveData": False,
+                    },
+                    {"key": "sensitiveFile", "type": "file", "isSensitiveData": True},
+                    {"key": "file", "type": "file", "isSensitiveData": False},
+                ],
+            }
+        )
+        form_step = FormStepFactory.create(form_definition=form_definition)
+        submission, other_submission = SubmissionFactory.create_batch(
+            2, form=form_step.form, auth_info__value="999990676"
+        )
+        attachments = {}
+        for _submission in (submission, other_submission):
+            submission_step = SubmissionStepFactory.create(
+                submission=_submission,
+                data={
+                    "textFieldSensitive": "this is sensitive",
+                    "textFieldNotSensitive": "this is not sensitive",
+                },
+                form_step=form_step,
+            )
+            attachments[_submission] = (
+                SubmissionFileAttachmentFactory.create(
+                    submission_step=submission_step, form_key="sensitiveFile"
+                ),
+                SubmissionFileAttachmentFactory.create(
+                    submission_step=submission_step, form_key="file"
+                ),
+            )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            amount = Submission.objects.filter(pk=submission.pk).remove_sensitive_data()
+
+        self.assertEqual(amount, 1)
+        submission.refresh_from_db()
+        other_submission.refresh_from_db()
+        self.assertTrue(submission._is_cleaned)
+        self.assertFalse(other_submission._is_cleaned)
+        self.assertEqual(submission.auth_info.value, "")
+        self.assertEqual(other_submission.auth_info.value, "999990676")
+        self.assertEqual(
+            dict(
+                submission.submissionvaluevariable_set.filter(
+                    key__startswith="textField"
+                ).values_list("key", "value")
+            ),
+            {
+                "textFieldSensitive": "",
+                "textFieldNotSensitive": "this is not sensitive",
+            },
+        )
+        self.assertEqual(
+            dict(
+                other_submission.submissionvaluevariable_set.filter(
+                    key__startswith="textField"
+                ).values_list("key", "value")
+            ),
+            {
+                "textFieldSensitive": "this is sensitive",
+                "textFieldNotSensitive": "this is not sensitive",
+            },
+        )
+        sensitive_attachment, attachment = attachments[submission]
+        self.assertFalse(
+            SubmissionFileAttachment.objects.filter(pk=sensitive_attachment.pk).exists()
+        )
+        self.assertTrue(
+            SubmissionFileAttachment.objects.filter(pk=attachment.pk).exists()
+        )
+        self.assertEqual(
+            SubmissionFileAttachment.objects.filter(
+                submission_step__submission=other_submission
+            ).count(),
+            2,
+        )
+
     def test_submission_delete_file_uploads_cascade(self):
         """
         Assert that when a submission is deleted, the file uploads (on disk!) are deleted.
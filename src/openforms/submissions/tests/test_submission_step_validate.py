@@ -442,7 +442,7 @@ class SubmissionStepValidationTests(SubmissionsMixin, APITestCase):
 
     @tag("gh-1899")
     @patch(
-        "openforms.prefill.service.fetch_prefill_values_from_attribute",
+        "openforms.prefill.service.fetch_prefill_values",
         return_value={"postcode": "1015CJ"},
     )
     def test_flow_with_badly_structure_prefill_data(self, m_prefill):
@@ -83,6 +83,7 @@ class FormStepSubmissionTests(SubmissionsMixin, APITestCase):
                 },
                 "data": {"test-key": "example data"},
                 "canSubmit": True,
+                "prefillPending": False,
                 "logicRules": [],
                 "requireBackendLogicEvaluation": False,
             },
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.test import TestCase
 
 import requests_mock
@@ -8,9 +10,12 @@ from zgw_consumers.test.factories import ServiceFactory
 from openforms.formio.service import FormioData
 from openforms.forms.constants import LogicActionTypes
 from openforms.forms.tests.factories import FormLogicFactory, FormVariableFactory
+from openforms.variables.constants import ServiceFetchMethods
 from openforms.variables.tests.factories import ServiceFetchConfigurationFactory
 
 from ...form_logic import evaluate_form_logic
+from ...logic.program import compile_logic_program
+from ...logic.service_fetching import prefetch_service_fetches
 from ..factories import SubmissionFactory
 
 
@@ -162,9 +167,12 @@ class ServiceFetchWithActionsTest(TestCase):
             FormioData({"fieldC": 42}),
         )
 
+        # independent fetches are performed concurrently, in no particular order
         self.assertEqual(len(m.request_history), 2)
-        self.assertEqual(m.request_history[-1].url, "https://httpbin.org/get?fieldC=42")
-        self.assertEqual(m.request_history[-2].url, "https://httpbin.org/get")
+        self.assertCountEqual(
+            [request.url for request in m.request_history],
+            ["https://httpbin.org/get", "https://httpbin.org/get?fieldC=42"],
+        )
 
         evaluate_form_logic(
             submission,
@@ -216,3 +224,188 @@ class ServiceFetchWithActionsTest(TestCase):
 
         self.assertEqual(len(m.request_history), 2)
         self.assertEqual(m.request_history[-1].url, "https://httpbin.org/get")
+
+
+def _fetch_action(variable: str):
+    return {
+        "variable": variable,
+        "action": {
+            "name": "Fetch some field from some server",
+            "type": LogicActionTypes.fetch_from_service,
+        },
+    }
+
+
+class ConcurrentServiceFetchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.service = ServiceFactory.create(
+            api_type=APITypes.orc,
+            api_root="https://httpbin.org/",
+            auth_type=AuthTypes.no_auth,
+        )
+
+    def _create_fetch_variable(self, submission, key: str, **kwargs):
+        return FormVariableFactory.create(
+            key=key,
+            form=submission.form,
+            service_fetch_configuration=ServiceFetchConfigurationFactory.create(
+                service=self.service, path="get", **kwargs
+            ),
+        )
+
+    @requests_mock.Mocker(case_sensitive=True)
+    def test_independent_fetches_are_prefetched(self, m):
+        submission = SubmissionFactory.from_components(
+            [{"type": "textfield", "key": "fieldC"}]
+        )
+        self._create_fetch_variable(submission, "someVariable1")
+        self._create_fetch_variable(
+            submission, "someVariable2", query_params={"fieldC": ["{{ fieldC }}"]}
+        )
+        for order, variable in enumerate(("someVariable1", "someVariable2")):
+            FormLogicFactory.create(
+                form=submission.form,
+                order=order,
+                json_logic_trigger=True,
+                actions=[_fetch_action(variable)],
+            )
+        submission.form.apply_logic_analysis()
+        # the last registered matcher takes precedence
+        m.get("https://httpbin.org/get", json="without param")
+        m.get("https://httpbin.org/get?fieldC=a", json="with param")
+
+        with patch(
+            "openforms.submissions.logic.rules.prefetch_service_fetches",
+            wraps=prefetch_service_fetches,
+        ) as mock_prefetch:
+            evaluate_form_logic(
+                submission,
+                submission.submissionstep_set.get(),
+                FormioData({"fieldC": "a"}),
+            )
+
+        mock_prefetch.assert_called_once()
+        self.assertEqual(
+            [var.key for var in mock_prefetch.call_args.args[0]],
+            ["someVariable1", "someVariable2"],
+        )
+        self.assertEqual(len(m.request_history), 2)
+        state = submission.variables_state
+        self.assertEqual(state.get_variable("someVariable1").value, "without param")
+        self.assertEqual(state.get_variable("someVariable2").value, "with param")
+
+    @requests_mock.Mocker(case_sensitive=True)
+    def test_post_fetches_are_not_prefetched(self, m):
+        submission = SubmissionFactory.from_components(
+            [{"type": "textfield", "key": "fieldC"}]
+        )
+        self._create_fetch_variable(submission, "someVariable1")
+        self._create_fetch_variable(submission, "someVariable2")
+        self._create_fetch_variable(
+            submission, "someVariable3", method=ServiceFetchMethods.post
+        )
+        for order, variable in enumerate(
+            ("someVariable1", "someVariable2", "someVariable3")
+        ):
+            FormLogicFactory.create(
+                form=submission.form,
+                order=order,
+                json_logic_trigger=True,
+                actions=[_fetch_action(variable)],
+            )
+        submission.form.apply_logic_analysis()
+        m.get("https://httpbin.org/get", json="get")
+        m.post("https://httpbin.org/get", json="post")
+
+        with patch(
+            "openforms.submissions.logic.rules.prefetch_service_fetches",
+            wraps=prefetch_service_fetches,
+        ) as mock_prefetch:
+            evaluate_form_logic(
+                submission,
+                submission.submissionstep_set.get(),
+                FormioData({"fieldC": "a"}),
+            )
+
+        mock_prefetch.assert_called_once()
+        self.assertEqual(
+            [var.key for var in mock_prefetch.call_args.args[0]],
+            ["someVariable1", "someVariable2"],
+        )
+        # the POST request is only made when its action is evaluated
+        self.assertEqual(
+            [request.method for request in m.request_history], ["GET", "GET", "POST"]
+        )
+
+    def test_fetches_depending_on_earlier_actions_are_not_independent(self):
+        submission = SubmissionFactory.from_components(
+            [{"type": "textfield", "key": "fieldC"}]
+        )
+        self._create_fetch_variable(submission, "someVariable1")
+        self._create_fetch_variable(
+            submission,
+            "someVariable2",
+            query_params={"param": ["{{ someVariable1 }}"]},
+        )
+        self._create_fetch_variable(submission, "someVariable3")
+        self._create_fetch_variable(submission, "someVariable4")
+        rules = [
+            FormLogicFactory.create(
+                form=submission.form,
+                order=0,
+                json_logic_trigger=True,
+                actions=[_fetch_action("someVariable1")],
+            ),
+            # request arguments depend on the result of the first rule
+            FormLogicFactory.create(
+                form=submission.form,
+                order=1,
+                json_logic_trigger=True,
+                actions=[_fetch_action("someVariable2")],
+            ),
+            # trigger depends on the result of the second rule
+            FormLogicFactory.create(
+                form=submission.form,
+                order=2,
+                json_logic_trigger={"==": [{"var": "someVariable2"}, "foo"]},
+                actions=[_fetch_action("someVariable3")],
+            ),
+            FormLogicFactory.create(
+                form=submission.form,
+                order=3,
+                json_logic_trigger={"==": [{"var": "fieldC"}, "foo"]},
+                actions=[_fetch_action("someVariable4")],
+            ),
+        ]
+
+        form_variables = {
+            variable.key: variable
+            for variable in submission.form.formvariable_set.select_related(
+                "service_fetch_configuration"
+            )
+        }
+
+        program = compile_logic_program(rules)
+        with self.assertNumQueries(0):
+            independent = program.get_independent_service_fetches(form_variables)
+
+        self.assertEqual(
+            [operation.variable for _, operation in independent],
+            ["someVariable1", "someVariable4"],
+        )
+
+        with self.subTest("analysis is re-used for the same rules"):
+            program2 = compile_logic_program(rules)
+
+            with patch.object(
+                program2, "_analyse", wraps=program2._analyse
+            ) as m_analyse:
+                independent2 = program2.get_independent_service_fetches(form_variables)
+
+            m_analyse.assert_not_called()
+            self.assertEqual(
+                [operation.variable for _, operation in independent2],
+                ["someVariable1", "someVariable4"],
+            )
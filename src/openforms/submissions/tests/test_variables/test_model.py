@@ -1,7 +1,8 @@
+import timeit
 from datetime import date, datetime, time
 
 from django.db import IntegrityError
-from django.test import TestCase
+from django.test import TestCase, tag
 from django.utils import timezone
 
 from unittest_parametrize import ParametrizedTestCase, param, parametrize
@@ -807,3 +808,43 @@ class SubmissionValueVariableManagerTests(TestCase):
         variable = state.variables["user_defined"]
         self.assertIsNone(variable.pk)
         self.assertEqual(variable.value, "")
+
+
+@tag("slow")
+class SubmissionValueVariablesStatePerformanceTests(TestCase):
+    def test_get_variables_in_submission_step_for_large_form(self):
+        form = FormFactory.create()
+        for step_index in range(20):
+            FormStepFactory.create(
+                form=form,
+                form_definition__configuration={
+                    "components": [
+                        {
+                            "type": "textfield",
+                            "key": f"step{step_index}Component{index}",
+                            "label": f"Component {index}",
+                        }
+                        for index in range(100)
+                    ]
+                },
+            )
+        submission = SubmissionFactory.create(form=form)
+        state = submission.variables_state
+        submission_steps = submission.load_execution_state().submission_steps
+        assert len(state.variables) == 2000
+
+        variables = {}
+        start_time = timeit.default_timer()
+        # the variables of a step are looked up many times in a single request
+        for _ in range(20):
+            for submission_step in submission_steps:
+                variables = state.get_variables_in_submission_step(submission_step)
+        execution_time = timeit.default_timer() - start_time
+
+        self.assertEqual(len(variables), 100)
+        self.assertEqual(next(iter(variables)), "step19Component0")
+        # Scanning a list of the component keys of the step for every variable took
+        # over 2 seconds, with the step index this takes in the order of 50ms.
+        self.assertLess(
+            execution_time, 1, f"Execution took too long: {execution_time:.2f}s"
+        )
@@ -0,0 +1,317 @@
+import io
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from openforms.config.models import GlobalConfiguration
+from openforms.forms.tests.factories import FormStepFactory
+
+from ..attachments import attach_uploads_to_submission_step
+from ..constants import VirusScanStatuses
+from ..models import SubmissionFileAttachment
+from ..tasks import scan_temporary_upload
+from ..virus_scan import ClamdSession, get_session
+from .clamd import EICAR, FakeClamd
+from .factories import (
+    SubmissionFactory,
+    SubmissionStepFactory,
+    TemporaryFileUploadFactory,
+)
+from .mixins import SubmissionsMixin
+
+
+def _create_step_with_upload(**upload_kwargs):
+    form_step = FormStepFactory.create(
+        form_definition__configuration={
+            "components": [{"type": "file", "key": "file", "label": "File"}]
+        }
+    )
+    submission = SubmissionFactory.create(form=form_step.form)
+    upload = TemporaryFileUploadFactory.create(
+        submission=submission, file_name="my-file.txt", **upload_kwargs
+    )
+    upload_url = reverse("api:submissions:temporary-file", kwargs={"uuid": upload.uuid})
+    return SubmissionStepFactory.create(
+        submission=submission,
+        form_step=form_step,
+        data={
+            "file": [
+                {
+                    "url": f"http://localhost{upload_url}",
+                    "data": {
+                        "url": f"http://localhost{upload_url}",
+                        "form": "",
+                        "name": upload.file_name,
+                        "size": upload.file_size,
+                        "baseUrl": "http://localhost",
+                        "project": "",
+                    },
+                    "name": upload.file_name,
+                    "size": upload.file_size,
+                    "type": upload.content_type,
+                    "storage": "url",
+                    "originalName": upload.file_name,
+                }
+            ]
+        },
+    )
+
+
+class ClamdSessionTests(SimpleTestCase):
+    def test_scan(self):
+        with FakeClamd() as clamd:
+            session = ClamdSession(clamd.host, clamd.port, timeout=5)
+            self.addCleanup(session.close)
+
+            with self.subTest("clean"):
+                result = session.instream(io.BytesIO(b"my content" * 10_000))
+
+                self.assertEqual(result, ("OK", ""))
+
+            with self.subTest("infected"):
+                result = session.instream(io.BytesIO(b"my content " + EICAR))
+
+                self.assertEqual(result, ("FOUND", "Win.Test.EICAR_HDB-1"))
+
+        self.assertEqual(clamd.connections, 1)
+        self.assertEqual(clamd.scanned[0], b"my content" * 10_000)
+
+    def test_reconnects_closed_session(self):
+        with FakeClamd(close_after_reply=True) as clamd:
+            session = ClamdSession(clamd.host, clamd.port, timeout=5)
+            self.addCleanup(session.close)
+
+            first = session.instream(io.BytesIO(b"first"))
+            second = session.instream(io.BytesIO(b"second"))
+
+        self.assertEqual(first, ("OK", ""))
+        self.assertEqual(second, ("OK", ""))
+        self.assertEqual(clamd.connections, 2)
+        self.assertEqual(clamd.scanned, [b"first", b"second"])
+
+    def test_cannot_connect(self):
+        with FakeClamd() as clamd:
+            port = clamd.port
+        session = ClamdSession("127.0.0.1", port, timeout=1)
+
+        with self.assertRaises(OSError):
+            session.instream(io.BytesIO(b"my content"))
+
+    def test_session_per_thread(self):
+        session = get_session("127.0.0.1", 3310, None)
+        self.addCleanup(session.close)
+
+        self.assertIs(get_session("127.0.0.1", 3310, None), session)
+        self.assertIsNot(get_session("127.0.0.1", 3311, None), session)
+
+
+@temp_private_root()
+class ScanTemporaryUploadTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.clamd = FakeClamd()
+        self.clamd.__enter__()
+        self.addCleanup(self.clamd.__exit__)
+
+        patcher = patch(
+            "openforms.submissions.virus_scan.GlobalConfiguration.get_solo",
+            return_value=GlobalConfiguration(
+                enable_virus_scan=True,
+                virus_scan_in_background=True,
+                clamav_host=self.clamd.host,
+                clamav_port=self.clamd.port,
+                clamav_timeout=5,
+            ),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # don't leak the connection to the stopped server to other tests
+        self.addCleanup(lambda: get_session("", 0, None))
+
+    def test_clean_upload(self):
+        upload = TemporaryFileUploadFactory.create(
+            virus_scan_status=VirusScanStatuses.pending
+        )
+
+        scan_temporary_upload(upload.pk)
+
+        upload.refresh_from_db()
+        self.assertEqual(upload.virus_scan_status, VirusScanStatuses.clean)
+        self.assertTrue(upload.is_claimable)
+
+    def test_infected_upload(self):
+        upload = TemporaryFileUploadFactory.create(
+            content__data=b"my content " + EICAR,
+            virus_scan_status=VirusScanStatuses.pending,
+        )
+
+        scan_temporary_upload(upload.pk)
+
+        upload.refresh_from_db()
+        self.assertEqual(upload.virus_scan_status, VirusScanStatuses.infected)
+        self.assertEqual(upload.virus_scan_result, "Win.Test.EICAR_HDB-1")
+        self.assertFalse(upload.content)
+        self.assertFalse(upload.is_claimable)
+
+    def test_scanner_unavailable(self):
+        upload = TemporaryFileUploadFactory.create(
+            virus_scan_status=VirusScanStatuses.pending
+        )
+        self.clamd.__exit__()
+
+        with patch(
+            "openforms.submissions.virus_scan.ClamdSession.instream",
+            side_effect=ConnectionRefusedError,
+        ) as m_instream:
+            result = scan_temporary_upload.apply(args=(upload.pk,))
+
+        self.assertTrue(result.successful())
+        self.assertEqual(m_instream.call_count, 6)
+        upload.refresh_from_db()
+        self.assertEqual(upload.virus_scan_status, VirusScanStatuses.failed)
+
+    def test_scanner_unavailable_is_retried(self):
+        upload = TemporaryFileUploadFactory.create(
+            virus_scan_status=VirusScanStatuses.pending
+        )
+
+        with patch(
+            "openforms.submissions.virus_scan.ClamdSession.instream",
+            side_effect=[ConnectionRefusedError, ("OK", "")],
+        ):
+            scan_temporary_upload.apply(args=(upload.pk,))
+
+        upload.refresh_from_db()
+        self.assertEqual(upload.virus_scan_status, VirusScanStatuses.clean)
+
+    def test_clean_upload_is_claimed(self):
+        step = _create_step_with_upload(virus_scan_status=VirusScanStatuses.pending)
+        upload = step.submission.temporaryfileupload_set.get()
+
+        scan_temporary_upload(upload.pk)
+
+        attachment = SubmissionFileAttachment.objects.get()
+        self.assertEqual(attachment.temporary_file, upload)
+        self.assertEqual(attachment.submission_step, step)
+
+    def test_connection_reused(self):
+        uploads = TemporaryFileUploadFactory.create_batch(
+            3, virus_scan_status=VirusScanStatuses.pending
+        )
+
+        for upload in uploads:
+            scan_temporary_upload(upload.pk)
+
+        self.assertEqual(len(self.clamd.scanned), 3)
+        self.assertEqual(self.clamd.connections, 1)
+
+    def test_scanned_upload_is_skipped(self):
+        upload = TemporaryFileUploadFactory.create(
+            virus_scan_status=VirusScanStatuses.clean
+        )
+
+        scan_temporary_upload(upload.pk)
+
+        self.assertEqual(self.clamd.scanned, [])
+
+
+@temp_private_root()
+@override_settings(LANGUAGE_CODE="en")
+class BackgroundVirusScanAPITests(SubmissionsMixin, APITestCase):
+    @patch("openforms.formio.api.validators.GlobalConfiguration.get_solo")
+    @patch("openforms.submissions.virus_scan.GlobalConfiguration.get_solo")
+    def test_upload_is_scanned_in_background(self, *mocks):
+        for mock in mocks:
+            mock.return_value = GlobalConfiguration(
+                enable_virus_scan=True,
+                virus_scan_in_background=True,
+                clamav_host="clamav.example.com",
+                clamav_port=3310,
+            )
+        submission = SubmissionFactory.create()
+        self._add_submission_to_session(submission)
+        file = SimpleUploadedFile(
+            "my-file.txt", b"my content", content_type="text/plain"
+        )
+
+        with (
+            patch(
+                "openforms.submissions.tasks.scan_temporary_upload.delay"
+            ) as mock_scan,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = self.client.post(
+                reverse("api:formio:temporary-file-upload"),
+                {
+                    "file": file,
+                    "submission": reverse(
+                        "api:submission-detail", kwargs={"uuid": submission.uuid}
+                    ),
+                },
+                format="multipart",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(body["virusScanStatus"], VirusScanStatuses.pending)
+        upload = submission.temporaryfileupload_set.get()
+        mock_scan.assert_called_once_with(upload.pk)
+
+        with self.subTest("status endpoint"):
+            upload.virus_scan_status = VirusScanStatuses.clean
+            upload.save()
+
+            response = self.client.get(
+                reverse(
+                    "api:formio:temporary-file-upload-detail",
+                    kwargs={"uuid": upload.uuid},
+                )
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()["virusScanStatus"], "clean")
+
+    def test_pending_upload_is_not_claimed(self):
+        step = _create_step_with_upload(virus_scan_status=VirusScanStatuses.pending)
+        submission = step.submission
+        upload = submission.temporaryfileupload_set.get()
+
+        result = attach_uploads_to_submission_step(step)
+
+        self.assertEqual(result, [])
+        self.assertFalse(SubmissionFileAttachment.objects.exists())
+
+        with self.subTest("completion is blocked"):
+            self._add_submission_to_session(submission)
+
+            response = self.client.post(
+                reverse("api:submission-complete", kwargs={"uuid": submission.uuid}),
+                {"privacy_policy_accepted": True},
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            codes = [param["code"] for param in response.json()["invalidParams"]]
+            self.assertIn("virus_scan_pending", codes)
+
+        with self.subTest("claimed on completion once clean"):
+            upload.virus_scan_status = VirusScanStatuses.clean
+            upload.save()
+
+            with patch("openforms.submissions.api.mixins.on_post_submission_event"):
+                response = self.client.post(
+                    reverse(
+                        "api:submission-complete", kwargs={"uuid": submission.uuid}
+                    ),
+                    {"privacy_policy_accepted": True},
+                )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            attachment = SubmissionFileAttachment.objects.get()
+            self.assertEqual(attachment.temporary_file, upload)
@@ -0,0 +1,216 @@
+"""
+Scan temporary file uploads for viruses in the background.
+
+The synchronous scan (see :class:`openforms.formio.api.validators.NoVirusValidator`)
+opens a new connection to ClamAV for every upload. The background scans run in the
+Celery workers, which keep a connection open in a clamd session (``IDSESSION``) and
+send every file over it with ``INSTREAM``.
+"""
+
+import re
+import socket
+import struct
+import threading
+from typing import BinaryIO
+
+from django.db import transaction
+from django.utils.translation import gettext
+
+import structlog
+
+from openforms.config.models import GlobalConfiguration
+
+from .constants import VirusScanStatuses
+from .models import TemporaryFileUpload
+
+logger = structlog.stdlib.get_logger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+# a reply in a session is prefixed with the ID of the command: ``1: stream: OK``
+REPLY_RE = re.compile(
+    r"^(\d+: )?(stream: )?((?P<virus>.+) )?(?P<status>FOUND|OK|ERROR)$"
+)
+
+
+class ClamdError(Exception):
+    pass
+
+
+class ClamdSession:
+    """
+    A connection to clamd in session mode, re-used for multiple commands.
+
+    Not thread-safe, use :func:`get_session` to obtain a session for the current
+    thread.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float | None = None):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._socket: socket.socket | None = None
+
+    def _connect(self) -> socket.socket:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.sendall(b"zIDSESSION\0")
+        return sock
+
+    def _read_reply(self, sock: socket.socket) -> str:
+        reply = b""
+        while not reply.endswith(b"\0"):
+            data = sock.recv(4096)
+            if not data:
+                raise ClamdError("Connection closed by clamd.")
+            reply += data
+        return reply[:-1].decode()
+
+    def _instream(self, sock: socket.socket, file: BinaryIO) -> str:
+        sock.sendall(b"zINSTREAM\0")
+        while chunk := file.read(CHUNK_SIZE):
+            sock.sendall(struct.pack("!L", len(chunk)) + chunk)
+        sock.sendall(struct.pack("!L", 0))
+        return self._read_reply(sock)
+
+    def instream(self, file: BinaryIO) -> tuple[str, str]:
+        """
+        Scan the content of the file.
+
+        :returns: The status (``OK``, ``FOUND`` or ``ERROR``) and the name of the
+          virus or the error message.
+        """
+        reused = self._socket is not None
+        try:
+            if self._socket is None:
+                self._socket = self._connect()
+            reply = self._instream(self._socket, file)
+        except (OSError, ClamdError):
+            self.close()
+            # clamd closes idle sessions, so retry once with a new connection
+            if not reused:
+                raise
+            file.seek(0)
+            self._socket = self._connect()
+            reply = self._instream(self._socket, file)
+
+        if not (match := REPLY_RE.match(reply)):
+            self.close()
+            raise ClamdError(f"Unexpected reply from clamd: {reply}")
+        status, message = match.group("status"), match.group("virus") or ""
+        # clamd closes the connection after an error
+        if status == "ERROR":
+            self.close()
+        return status, message
+
+    def close(self) -> None:
+        if self._socket is None:
+            return
+        sock, self._socket = self._socket, None
+        try:
+            sock.sendall(b"zEND\0")
+        except OSError:
+            pass
+        sock.close()
+
+
+_local = threading.local()
+
+
+def get_session(host: str, port: int, timeout: float | None) -> ClamdSession:
+    """
+    Get the clamd session of the current thread, creating it if needed.
+    """
+    session: ClamdSession | None = getattr(_local, "session", None)
+    if session is not None and (session.host, session.port, session.timeout) == (
+        host,
+        port,
+        timeout,
+    ):
+        return session
+    if session is not None:
+        session.close()
+    session = _local.session = ClamdSession(host, port, timeout)
+    return session
+
+
+def get_initial_scan_status() -> VirusScanStatuses:
+    """
+    Determine the virus scan status of a new upload, which passed the validators.
+    """
+    config = GlobalConfiguration.get_solo()
+    if not config.enable_virus_scan:
+        return VirusScanStatuses.not_scanned
+    if config.virus_scan_in_background:
+        return VirusScanStatuses.pending
+    return VirusScanStatuses.clean
+
+
+def schedule_virus_scan(upload: TemporaryFileUpload) -> None:
+    # circular import
+    from .tasks import scan_temporary_upload
+
+    if upload.virus_scan_status != VirusScanStatuses.pending:
+        return
+    transaction.on_commit(lambda: scan_temporary_upload.delay(upload.pk))
+
+
+def scan_upload(upload: TemporaryFileUpload, raise_unavailable: bool = False) -> None:
+    """
+    Scan the upload and record the outcome.
+
+    Infected files are deleted, the upload itself is kept to report the outcome.
+
+    :param raise_unavailable: Raise the connection errors (:class:`OSError`) instead
+      of recording the scan as failed, so that the scan can be retried later.
+    """
+    config = GlobalConfiguration.get_solo()
+    session = get_session(config.clamav_host, config.clamav_port, config.clamav_timeout)
+    log = logger.bind(upload_uuid=str(upload.uuid))
+
+    try:
+        with upload.content.open("rb") as content:
+            status, message = session.instream(content)
+    except OSError as exc:
+        if raise_unavailable:
+            log.warning("clamav.unavailable", exc_info=exc)
+            raise
+        status, message = "ERROR", str(exc) or type(exc).__name__
+    except ClamdError as exc:
+        status, message = "ERROR", str(exc)
+
+    match status:
+        case "OK":
+            upload.virus_scan_status = VirusScanStatuses.clean
+        case "FOUND":
+            log.warning("clamav.virus_found", virus_name=message)
+            upload.virus_scan_status = VirusScanStatuses.infected
+            upload.content.delete(save=False)
+        case _:
+            log.error("clamav.error", message=message)
+            upload.virus_scan_status = VirusScanStatuses.failed
+
+    upload.virus_scan_result = message[:255]
+    upload.save(update_fields=["virus_scan_status", "virus_scan_result", "content"])
+
+
+def get_virus_scan_error(upload: TemporaryFileUpload) -> str:
+    """
+    Describe why the upload cannot be claimed, for the end-user.
+    """
+    match upload.virus_scan_status:
+        case VirusScanStatuses.pending:
+            return gettext(
+                "The file '{name}' is still being scanned for viruses. Please try "
+                "again in a moment."
+            ).format(name=upload.file_name)
+        case VirusScanStatuses.infected:
+            return gettext(
+                "File did not pass the virus scan. It was found to contain "
+                "'{virus_name}'."
+            ).format(virus_name=upload.virus_scan_result)
+        case VirusScanStatuses.failed:
+            return gettext(
+                "The virus scan could not be performed at this time. Please retry "
+                "later."
+            )
+        case _:
+            return ""
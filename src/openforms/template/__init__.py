@@ -6,11 +6,7 @@ The ``template`` package provides generic template rendering constructs. Feature
 * Option to sandbox templates to only allow safe-ish public API
 * Utilities to evaluate templates from string (user-contributed content and inherently
   unsafe).
-
-Possible future features:
-
-* Caching for string-based templates
-* ...
+* Caching for string-based templates, see :mod:`openforms.template.caching`.
 """
 
 from collections.abc import Iterator, Mapping
@@ -18,8 +14,10 @@ from collections.abc import Iterator, Mapping
 from django.template.backends.django import Template as DjangoTemplate
 from django.template.base import FilterExpression, Node, Variable, VariableNode
 from django.template.defaulttags import ForNode, IfNode, TemplateLiteral
+from django.utils.safestring import mark_safe
 
 from .backends.sandboxed_django import backend as sandbox_backend, openforms_backend
+from .caching import template_cache
 
 __all__ = [
     "render_from_string",
@@ -60,13 +58,24 @@ def render_from_string(
     :raises: :class:`django.template.TemplateSyntaxError` if the template source is
       invalid
     """
+    assert isinstance(context, dict)
+    # without any template syntax, the source renders as is (and like any rendered
+    # template, the result is marked safe)
+    if not _has_template_syntax(source):
+        return mark_safe(source)
+
     if disable_autoescape:
         source = f"{{% autoescape off %}}{source}{{% endautoescape %}}"
-    template = parse(source, backend=backend)
-    assert isinstance(context, dict)
+    if (template := template_cache.get(backend, source)) is None:
+        template = parse(source, backend=backend)
+        template_cache.set(backend, source, template)
     return template.render(context)
 
 
+def _has_template_syntax(source: str) -> bool:
+    return "{{" in source or "{%" in source or "{#" in source
+
+
 def _iter_nodes(nodelist: list[Node]) -> Iterator[Node]:
     for node in nodelist:
         yield node
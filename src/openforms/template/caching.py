@@ -0,0 +1,53 @@
+"""
+Cache the parsed string-based templates.
+
+Parsing a template is much more expensive than rendering it, while the same templates
+are rendered over and over again - e.g. every templated property of the form components
+is rendered on every logic check. The parsed templates are kept in a bounded, process
+local LRU cache, keyed by the backend and the template source. A parsed template does
+not hold any render state, so it can be rendered concurrently.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+
+from django.template.backends.django import Template as DjangoTemplate
+
+from .metrics import template_cache_lookups
+
+TEMPLATE_CACHE_MAX_SIZE = 1024
+
+
+class TemplateCache:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._templates: OrderedDict[tuple[object, str], DjangoTemplate] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(self, backend, source: str) -> DjangoTemplate | None:
+        key = (backend, source)
+        with self._lock:
+            if (template := self._templates.get(key)) is not None:
+                self._templates.move_to_end(key)
+        template_cache_lookups.add(
+            1, attributes={"type": "miss" if template is None else "hit"}
+        )
+        return template
+
+    def set(self, backend, source: str, template: DjangoTemplate) -> None:
+        key = (backend, source)
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            if len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+
+template_cache = TemplateCache(max_size=TEMPLATE_CACHE_MAX_SIZE)
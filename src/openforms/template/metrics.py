@@ -0,0 +1,12 @@
+from opentelemetry import metrics
+
+meter = metrics.get_meter("openforms.template")
+
+template_cache_lookups = meter.create_counter(
+    "openforms.template.cache_lookups",
+    unit="1",  # unitless count
+    description=(
+        "The number of parsed template lookups when rendering a template from a "
+        "string, by whether the template was cached (hit) or had to be parsed (miss)."
+    ),
+)
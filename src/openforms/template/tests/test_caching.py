@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from django.utils.safestring import SafeString
+
+from .. import render_from_string, sandbox_backend
+from ..backends.sandboxed_django import SandboxedDjangoTemplates
+from ..caching import TemplateCache, template_cache
+
+
+class TemplateCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        template_cache.clear()
+        self.addCleanup(template_cache.clear)
+
+    def test_parsed_template_is_reused(self):
+        with patch.object(
+            sandbox_backend, "from_string", wraps=sandbox_backend.from_string
+        ) as m_from_string:
+            result1 = render_from_string("{{ foo }} bar", {"foo": "<b>"})
+            result2 = render_from_string("{{ foo }} bar", {"foo": "baz"})
+
+        self.assertEqual(result1, "&lt;b&gt; bar")
+        self.assertEqual(result2, "baz bar")
+        m_from_string.assert_called_once_with("{{ foo }} bar")
+
+    def test_templates_are_cached_per_backend(self):
+        other_backend = SandboxedDjangoTemplates({"NAME": "other"})
+
+        with (
+            patch.object(
+                sandbox_backend, "from_string", wraps=sandbox_backend.from_string
+            ) as m_from_string,
+            patch.object(
+                other_backend, "from_string", wraps=other_backend.from_string
+            ) as m_other_from_string,
+        ):
+            for backend in (sandbox_backend, other_backend, sandbox_backend):
+                render_from_string("{{ foo }}", {"foo": "bar"}, backend=backend)
+
+        m_from_string.assert_called_once()
+        m_other_from_string.assert_called_once()
+        self.assertEqual(len(template_cache), 2)
+
+    def test_autoescape_is_part_of_the_key(self):
+        escaped = render_from_string("{{ foo }}", {"foo": "<b>"})
+        unescaped = render_from_string(
+            "{{ foo }}", {"foo": "<b>"}, disable_autoescape=True
+        )
+
+        self.assertEqual(escaped, "&lt;b&gt;")
+        self.assertEqual(unescaped, "<b>")
+
+    def test_source_without_template_syntax_is_not_parsed(self):
+        with patch.object(sandbox_backend, "from_string") as m_from_string:
+            result = render_from_string("<p>Plain {text}</p>", {})
+
+        self.assertEqual(result, "<p>Plain {text}</p>")
+        self.assertIsInstance(result, SafeString)
+        m_from_string.assert_not_called()
+        self.assertEqual(len(template_cache), 0)
+
+    def test_comments_are_rendered(self):
+        result = render_from_string("foo{# comment #}", {})
+
+        self.assertEqual(result, "foo")
+
+    def test_least_recently_used_template_is_evicted(self):
+        cache = TemplateCache(max_size=2)
+        templates = {
+            source: sandbox_backend.from_string(source)
+            for source in ("{{ a }}", "{{ b }}", "{{ c }}")
+        }
+
+        cache.set(sandbox_backend, "{{ a }}", templates["{{ a }}"])
+        cache.set(sandbox_backend, "{{ b }}", templates["{{ b }}"])
+        cache.get(sandbox_backend, "{{ a }}")
+        cache.set(sandbox_backend, "{{ c }}", templates["{{ c }}"])
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get(sandbox_backend, "{{ a }}"))
+        self.assertIsNone(cache.get(sandbox_backend, "{{ b }}"))
+        self.assertIsNotNone(cache.get(sandbox_backend, "{{ c }}"))
@@ -0,0 +1,118 @@
+"""
+Generate forms of a parametrized size for the benchmarks.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from openforms.formio.typing import Component
+from openforms.forms.models import Form
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormStepFactory,
+)
+from openforms.typing import JSONObject
+
+
+@dataclass(frozen=True)
+class FormSize:
+    steps: int = 2
+    components: int = 20  # per step
+    logic_rules: int = 10
+    editgrid_depth: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"steps={self.steps},components={self.components},"
+            f"logic_rules={self.logic_rules},editgrid_depth={self.editgrid_depth}"
+        )
+
+
+def _get_editgrid(key: str, depth: int) -> tuple[Component, list[JSONObject]]:
+    child: Component
+    if depth > 1:
+        child, child_value = _get_editgrid(f"{key}Nested", depth - 1)
+    else:
+        child = {"type": "textfield", "key": "text", "label": "Text"}
+        child_value = "Lorem ipsum"
+
+    component: Component = {
+        "type": "editgrid",
+        "key": key,
+        "label": key,
+        "groupLabel": "Item",
+        "components": [child],
+    }
+    return component, [{child["key"]: child_value}, {child["key"]: child_value}]
+
+
+def get_step_components(
+    step_index: int, size: FormSize
+) -> tuple[list[Component], JSONObject]:
+    components: list[Component] = []
+    data: JSONObject = {}
+    for index in range(size.components):
+        key = f"step{step_index}Component{index}"
+        if index % 2:
+            components.append({"type": "number", "key": key, "label": key})
+            data[key] = index
+        else:
+            component: Component = {"type": "textfield", "key": key, "label": key}
+            # the text fields depend on the preceding number
+            if index:
+                component["conditional"] = {
+                    "show": True,
+                    "when": f"step{step_index}Component{index - 1}",
+                    "eq": index - 1,
+                }
+            components.append(component)
+            data[key] = f"Value {index}"
+
+    if size.editgrid_depth:
+        key = f"step{step_index}Editgrid"
+        editgrid, value = _get_editgrid(key, size.editgrid_depth)
+        components.append(editgrid)
+        data[key] = value
+
+    return components, data
+
+
+def generate_form(size: FormSize) -> tuple[Form, list[JSONObject]]:
+    """
+    Create a form with the given size.
+
+    :returns: The form and the (valid) data to submit for every step.
+    """
+    form = FormFactory.create(name=f"Benchmark {size}")
+    step_data = []
+    for step_index in range(size.steps):
+        components, data = get_step_components(step_index, size)
+        FormStepFactory.create(
+            form=form,
+            form_definition__configuration={"components": components},
+        )
+        step_data.append(data)
+
+    # the rules read the numbers of the first step and change the components of the
+    # last step
+    for index in range(size.logic_rules):
+        source = f"step0Component{(index * 2 + 1) % size.components}"
+        target = f"step{size.steps - 1}Component{(index * 2) % size.components}"
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={">": [{"var": source}, 1000]},
+            actions=[
+                {
+                    "component": target,
+                    "action": {
+                        "type": "property",
+                        "property": {"value": "hidden", "type": "bool"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+    form.apply_logic_analysis()
+    return form, step_data
@@ -0,0 +1,166 @@
+"""
+Minimal benchmark harness, comparing the results against a stored baseline.
+
+Every benchmark records the latency (median and maximum of a number of runs), the
+number of database queries and the peak memory allocated during a single run. Timings
+depend on the machine, so the baseline is meant to be recorded and compared on the same
+machine:
+
+.. code-block:: bash
+
+    # on the main branch
+    BENCHMARK_UPDATE_BASELINE=true src/manage.py test openforms.tests.benchmarks
+    # on your branch
+    src/manage.py test openforms.tests.benchmarks
+
+The location of the baseline file can be set with the ``BENCHMARK_BASELINE`` envvar.
+Without a baseline entry for a benchmark, the results are only logged.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import structlog
+
+logger = structlog.stdlib.get_logger(__name__)
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+# allowed relative increase of the latency and allocations before a benchmark is
+# considered a regression
+DEFAULT_TOLERANCE = 1.25
+
+_lock = Lock()
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    median: float
+    max: float
+    queries: int
+    allocated: int
+
+
+def _get_baseline_path() -> Path:
+    return Path(os.environ.get("BENCHMARK_BASELINE", DEFAULT_BASELINE))
+
+
+def _update_baseline() -> bool:
+    return os.environ.get("BENCHMARK_UPDATE_BASELINE", "").lower() == "true"
+
+
+def load_baseline() -> dict[str, dict[str, float]]:
+    path = _get_baseline_path()
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def store_result(result: BenchmarkResult) -> None:
+    with _lock:
+        baseline = load_baseline()
+        baseline[result.name] = {
+            key: value for key, value in asdict(result).items() if key != "name"
+        }
+        _get_baseline_path().write_text(
+            json.dumps(baseline, indent=2, sort_keys=True) + "\n"
+        )
+
+
+def run_benchmark(
+    name: str,
+    func: Callable[[], object],
+    *,
+    repeat: int = 10,
+    setup: Callable[[], object] | None = None,
+    count_queries: bool = True,
+) -> BenchmarkResult:
+    """
+    Measure the callable.
+
+    :param name: Unique name of the benchmark, used as key in the baseline.
+    :param func: The code to benchmark.
+    :param repeat: Number of timed runs.
+    :param setup: Optional callable to run before every run, excluded from the
+      measurements.
+    :param count_queries: Whether to count the database queries. Disable this for
+      tests without database access.
+    """
+    # warm up caches and lazy imports, counting the queries of a single run
+    if setup is not None:
+        setup()
+    if count_queries:
+        with CaptureQueriesContext(connection) as queries:
+            func()
+        num_queries = len(queries)
+    else:
+        func()
+        num_queries = 0
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        _, allocated = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = timeit.default_timer()
+        func()
+        timings.append(timeit.default_timer() - start)
+
+    return BenchmarkResult(
+        name=name,
+        median=statistics.median(timings),
+        max=max(timings),
+        queries=num_queries,
+        allocated=allocated,
+    )
+
+
+class BenchmarkMixin:
+    """
+    Test case mixin to check benchmark results against the baseline.
+    """
+
+    tolerance = float(os.environ.get("BENCHMARK_TOLERANCE", DEFAULT_TOLERANCE))
+
+    def assertNoRegression(self, result: BenchmarkResult) -> None:
+        logger.info("benchmark_result", **asdict(result))
+        if _update_baseline():
+            store_result(result)
+            return
+
+        if (expected := load_baseline().get(result.name)) is None:
+            return
+
+        # the number of queries is deterministic, so no increase is allowed at all
+        self.assertLessEqual(  # pyright: ignore[reportAttributeAccessIssue]
+            result.queries,
+            expected["queries"],
+            f"{result.name}: the number of queries increased",
+        )
+        for metric in ("median", "allocated"):
+            self.assertLessEqual(  # pyright: ignore[reportAttributeAccessIssue]
+                getattr(result, metric),
+                expected[metric] * self.tolerance,
+                f"{result.name}: {metric} regressed more than the tolerance of "
+                f"{self.tolerance}",
+            )
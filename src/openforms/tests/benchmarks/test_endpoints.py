@@ -0,0 +1,161 @@
+"""
+Benchmarks of the submission endpoints taking most of the traffic.
+"""
+
+from django.test import override_settings, tag
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+from unittest_parametrize import ParametrizedTestCase, param, parametrize
+
+from openforms.submissions.models import Submission
+from openforms.submissions.tests.factories import (
+    SubmissionFactory,
+    SubmissionStepFactory,
+)
+from openforms.submissions.tests.mixins import SubmissionsMixin
+from openforms.utils.tests.cache import clear_caches
+
+from .forms import FormSize, generate_form
+from .harness import BenchmarkMixin, run_benchmark
+
+SIZES = [
+    param(FormSize(), id="default"),
+    param(
+        FormSize(steps=5, components=100, logic_rules=50, editgrid_depth=2),
+        id="large",
+    ),
+]
+
+
+@tag("benchmark")
+@override_settings(
+    CORS_ALLOW_ALL_ORIGINS=False, CORS_ALLOWED_ORIGINS=["http://testserver.com"]
+)
+class SubmissionEndpointBenchmarks(
+    BenchmarkMixin, SubmissionsMixin, ParametrizedTestCase, APITestCase
+):
+    def _create_submission(self, form, step_data, completed_steps: int) -> Submission:
+        submission = SubmissionFactory.create(form=form)
+        form_steps = list(form.formstep_set.order_by("order"))
+        for form_step, data in zip(
+            form_steps[:completed_steps], step_data[:completed_steps], strict=True
+        ):
+            SubmissionStepFactory.create(
+                submission=submission, form_step=form_step, data=data
+            )
+        self._add_submission_to_session(submission)
+        return submission
+
+    @parametrize("size", SIZES)
+    def test_create_submission(self, size: FormSize):
+        form, _ = generate_form(size)
+        form_url = reverse("api:form-detail", kwargs={"uuid_or_slug": form.uuid})
+        body = {
+            "form": f"http://testserver{form_url}",
+            "formUrl": "http://testserver.com/my-form",
+        }
+
+        def create():
+            response = self.client.post(reverse("api:submission-list"), body)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.assertNoRegression(run_benchmark(f"create_submission[{size}]", create))
+
+    @parametrize("size", SIZES)
+    def test_save_step(self, size: FormSize):
+        form, step_data = generate_form(size)
+        submission = self._create_submission(form, step_data, completed_steps=0)
+        endpoint = reverse(
+            "api:submission-steps-detail",
+            kwargs={
+                "submission_uuid": submission.uuid,
+                "step_uuid": form.formstep_set.order_by("order")[0].uuid,
+            },
+        )
+
+        def save_step():
+            response = self.client.put(endpoint, {"data": step_data[0]})
+            self.assertIn(
+                response.status_code, (status.HTTP_200_OK, status.HTTP_201_CREATED)
+            )
+
+        self.assertNoRegression(run_benchmark(f"save_step[{size}]", save_step))
+
+    @parametrize("size", SIZES)
+    def test_validate_step(self, size: FormSize):
+        form, step_data = generate_form(size)
+        submission = self._create_submission(form, step_data, completed_steps=0)
+        endpoint = reverse(
+            "api:submission-steps-validate",
+            kwargs={
+                "submission_uuid": submission.uuid,
+                "step_uuid": form.formstep_set.order_by("order")[0].uuid,
+            },
+        )
+
+        def validate():
+            response = self.client.post(endpoint, {"data": step_data[0]})
+            self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertNoRegression(run_benchmark(f"validate_step[{size}]", validate))
+
+    @parametrize("size", SIZES)
+    def test_check_logic(self, size: FormSize):
+        form, step_data = generate_form(size)
+        submission = self._create_submission(
+            form, step_data, completed_steps=size.steps - 1
+        )
+        endpoint = reverse(
+            "api:submission-steps-logic-check",
+            kwargs={
+                "submission_uuid": submission.uuid,
+                "step_uuid": form.formstep_set.order_by("order")[size.steps - 1].uuid,
+            },
+        )
+
+        def check_logic():
+            response = self.client.post(endpoint, {"data": step_data[-1]})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertNoRegression(run_benchmark(f"check_logic[{size}]", check_logic))
+
+    @parametrize("size", SIZES)
+    def test_summary(self, size: FormSize):
+        form, step_data = generate_form(size)
+        submission = self._create_submission(
+            form, step_data, completed_steps=size.steps
+        )
+        endpoint = reverse("api:submission-summary", kwargs={"uuid": submission.uuid})
+
+        def summary():
+            response = self.client.get(endpoint)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertNoRegression(run_benchmark(f"summary[{size}]", summary))
+
+    @parametrize("size", SIZES)
+    def test_complete(self, size: FormSize):
+        form, step_data = generate_form(size)
+        endpoint = ""
+
+        def setup():
+            nonlocal endpoint
+            # reset the submit rate limit, which also drops the (cached) session
+            clear_caches()
+            self.client.logout()
+            submission = self._create_submission(
+                form, step_data, completed_steps=size.steps
+            )
+            endpoint = reverse(
+                "api:submission-complete", kwargs={"uuid": submission.uuid}
+            )
+
+        def complete():
+            response = self.client.post(endpoint, {"privacy_policy_accepted": True})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertNoRegression(
+            run_benchmark(f"complete[{size}]", complete, setup=setup)
+        )
@@ -0,0 +1,171 @@
+"""
+Micro-benchmarks of the building blocks of the submission hot path.
+"""
+
+from copy import deepcopy
+
+from django.test import SimpleTestCase, TestCase, tag
+
+from unittest_parametrize import ParametrizedTestCase, param, parametrize
+
+from openforms.formio.datastructures import FormioConfigurationWrapper, FormioData
+from openforms.formio.variables import inject_variables
+from openforms.formio.visibility import process_visibility
+from openforms.submissions.form_logic import evaluate_form_logic
+from openforms.submissions.models import Submission
+from openforms.submissions.rendering.constants import RenderModes
+from openforms.submissions.rendering.renderer import Renderer
+from openforms.submissions.tests.factories import (
+    SubmissionFactory,
+    SubmissionStepFactory,
+)
+from openforms.template.caching import template_cache
+
+from .forms import FormSize, generate_form, get_step_components
+from .harness import BenchmarkMixin, run_benchmark
+
+SIZES = [
+    param(FormSize(), id="default"),
+    param(
+        FormSize(steps=5, components=100, logic_rules=50, editgrid_depth=2),
+        id="large",
+    ),
+]
+
+
+@tag("benchmark")
+class FormioMicroBenchmarks(BenchmarkMixin, ParametrizedTestCase, SimpleTestCase):
+    @parametrize("size", SIZES)
+    def test_formio_data(self, size: FormSize):
+        keys = [
+            f"step{step}.component{index}"
+            for step in range(size.steps)
+            for index in range(size.components)
+        ]
+
+        def operations():
+            data = FormioData()
+            for key in keys:
+                data[key] = key
+            values = [data[key] for key in keys if key in data]
+            assert len(values) == len(keys)
+            snapshot = data.snapshot()
+            snapshot[keys[0]] = "changed"
+            data.diff(snapshot)
+
+        self.assertNoRegression(
+            run_benchmark(f"formio_data[{size}]", operations, count_queries=False)
+        )
+
+    @parametrize("size", SIZES)
+    def test_process_visibility(self, size: FormSize):
+        components, step_data = get_step_components(0, size)
+        configuration = {"components": components}
+        wrapper = FormioConfigurationWrapper(configuration)
+
+        def visibility():
+            process_visibility(
+                configuration,
+                FormioData(step_data),
+                wrapper,
+                data_for_hidden_state=FormioData(),
+            )
+
+        self.assertNoRegression(
+            run_benchmark(
+                f"process_visibility[{size}]", visibility, count_queries=False
+            )
+        )
+
+
+@tag("benchmark")
+class TemplateMicroBenchmarks(BenchmarkMixin, ParametrizedTestCase, SimpleTestCase):
+    def _get_configuration(self, size: FormSize) -> tuple[dict, FormioData]:
+        components, step_data = get_step_components(0, size)
+        for component in components:
+            key = component["key"]
+            component["label"] = f"{key}: {{{{ {key} }}}}"
+            component["description"] = f"{{% if {key} %}}Filled in{{% endif %}}"
+            # no template syntax, skips the parsing altogether
+            component["tooltip"] = f"Tooltip of {key}"
+        return {"components": components}, FormioData(step_data)
+
+    @parametrize(
+        "size,cache",
+        [
+            param(*size.args, cache, id=f"{size.id}_{cache}")
+            for size in SIZES
+            for cache in ("cold", "warm")
+        ],
+    )
+    def test_inject_variables(self, size: FormSize, cache: str):
+        configuration, values = self._get_configuration(size)
+        self.addCleanup(template_cache.clear)
+        wrapper = FormioConfigurationWrapper(configuration)
+
+        def setup():
+            nonlocal wrapper
+            # the configuration is mutated, start from the templates every run
+            wrapper = FormioConfigurationWrapper(deepcopy(configuration))
+            if cache == "cold":
+                template_cache.clear()
+
+        def inject():
+            inject_variables(wrapper, values)
+
+        self.assertNoRegression(
+            run_benchmark(
+                f"inject_variables[{size},{cache}]",
+                inject,
+                setup=setup,
+                count_queries=False,
+            )
+        )
+
+
+@tag("benchmark")
+class SubmissionMicroBenchmarks(BenchmarkMixin, ParametrizedTestCase, TestCase):
+    def _create_submission(self, size: FormSize) -> tuple[Submission, list]:
+        form, step_data = generate_form(size)
+        submission = SubmissionFactory.create(form=form)
+        for form_step, data in zip(
+            form.formstep_set.order_by("order"), step_data, strict=True
+        ):
+            SubmissionStepFactory.create(
+                submission=submission, form_step=form_step, data=data
+            )
+        return submission, step_data
+
+    @parametrize("size", SIZES)
+    def test_evaluate_form_logic(self, size: FormSize):
+        submission, step_data = self._create_submission(size)
+        submission_pk = submission.pk
+
+        def setup():
+            nonlocal submission
+            # start without the cached (and mutated) state of the previous run
+            submission = Submission.objects.get(pk=submission_pk)
+
+        def logic():
+            step = submission.steps[-1]
+            evaluate_form_logic(submission, step, FormioData(step_data[-1]))
+
+        self.assertNoRegression(
+            run_benchmark(f"evaluate_form_logic[{size}]", logic, setup=setup)
+        )
+
+    @parametrize("size", SIZES)
+    def test_renderer(self, size: FormSize):
+        submission, _ = self._create_submission(size)
+        submission_pk = submission.pk
+
+        def setup():
+            nonlocal submission
+            submission = Submission.objects.get(pk=submission_pk)
+
+        def render():
+            renderer = Renderer(submission, mode=RenderModes.pdf, as_html=True)
+            for node in renderer:
+                node.render()
+
+        self.assertNoRegression(run_benchmark(f"renderer[{size}]", render, setup=setup))
@@ -52,6 +52,9 @@ def log_deletes(filefield: FieldFile):
 def _delete_obj_files(fields: list[str], obj: models.Model) -> None:
     for name in fields:
         filefield = getattr(obj, name)
+        # the file may have been deleted already
+        if not filefield:
+            continue
         with log_deletes(filefield):
             filefield.delete(save=False)
 
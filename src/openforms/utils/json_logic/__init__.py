@@ -3,11 +3,14 @@ Utilities to parse/process jsonLogic expressions.
 """
 # ruff: noqa: F403 F405
 
+from .compilation import CompiledExpression, compile_json_logic
 from .datastructures import *
 from .introspection import *
 from .partial_evaluation import partially_evaluate_json_logic
 
 __all__ = [
+    "CompiledExpression",
+    "compile_json_logic",
     "OPERATION_DESCRIPTION_BUILDERS",
     "generate_rule_description",
     "ComponentMeta",
@@ -0,0 +1,194 @@
+"""
+Compile JsonLogic expressions into Python callables.
+
+:func:`json_logic.jsonLogic` interprets the expression on every call - it destructures
+every (nested) operation, normalizes the arguments and dispatches to the operator
+implementation. For expressions that are evaluated over and over again with different
+data (like logic rule triggers), we can do the destructuring once and build a tree of
+closures instead. The compiled expression is guaranteed to produce the same results
+(and raise the same errors) as :func:`json_logic.jsonLogic`, because the actual
+operator implementations of the library are used.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+import json_logic
+from json_logic import get_var, missing, missing_some
+from json_logic.meta.expressions import destructure
+from json_logic.typing import JSON
+
+__all__ = ["CompiledExpression", "compile_json_logic"]
+
+type _Evaluator = Callable[[Any], Any]
+
+# Operators whose result does not (only) depend on the input data - results of
+# expressions using these can never be re-used.
+NON_DETERMINISTIC_OPERATORS = frozenset({"today", "log"})
+# Operators that read data with keys determined by their arguments.
+DATA_READING_OPERATORS = frozenset({"missing", "missing_some"})
+
+_MEMO_MAX_SIZE = 64
+_MISSING = object()
+
+
+class _Unmemoizable(Exception):
+    pass
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert a (nested) variable value into a hashable key.
+
+    Values that compare equal but behave differently in JsonLogic (``1`` vs. ``True``,
+    ``0.0`` vs. ``-0.0``, ``Decimal("1.0")`` vs. ``Decimal("1.00")``...) must produce
+    different keys, so the type and representation are included.
+    """
+    match value:
+        case None | str() | int():  # includes bool
+            return (type(value), value)
+        case dict():
+            return (dict, tuple((key, _freeze(val)) for key, val in value.items()))
+        case list() | tuple():
+            return (type(value), tuple(_freeze(item) for item in value))
+        case _:
+            try:
+                hash(value)
+            except TypeError as exc:
+                raise _Unmemoizable from exc
+            return (type(value), repr(value))
+
+
+@dataclass(eq=False)
+class CompiledExpression:
+    """
+    A JsonLogic expression compiled to a Python callable.
+
+    Call the instance with the data to evaluate the expression. When the expression is
+    deterministic (the result only depends on the values of :attr:`input_keys`), the
+    results are memoized, keyed by the input values.
+    """
+
+    expression: JSON
+    evaluator: _Evaluator = field(repr=False)
+    input_keys: tuple[str | int, ...]
+    is_deterministic: bool
+    _memo: dict[Hashable, Any] = field(default_factory=dict, init=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def __call__(self, data: Mapping[str, Any] | None = None) -> Any:
+        data = data or {}
+        if not self.is_deterministic:
+            return self.evaluator(data)
+
+        try:
+            key = tuple(_freeze(get_var(data, k, _MISSING)) for k in self.input_keys)
+        except _Unmemoizable:
+            return self.evaluator(data)
+
+        if (result := self._memo.get(key, _MISSING)) is not _MISSING:
+            return result
+
+        result = self.evaluator(data)
+        # mutable results cannot be shared between callers
+        if isinstance(result, dict | list):
+            return result
+
+        with self._lock:
+            if len(self._memo) >= _MEMO_MAX_SIZE:
+                self._memo.pop(next(iter(self._memo)))
+            self._memo[key] = result
+        return result
+
+
+@dataclass
+class _CompilationContext:
+    input_keys: dict[str | int, None] = field(default_factory=dict)
+    is_deterministic: bool = True
+
+
+def compile_json_logic(expression: JSON) -> CompiledExpression:
+    """
+    Compile a JsonLogic expression.
+
+    :param expression: The JsonLogic expression, as you would pass it to
+      :func:`json_logic.jsonLogic`.
+    :returns: A callable taking the data as single argument.
+    """
+    context = _CompilationContext()
+    evaluator = _compile(expression, context)
+    return CompiledExpression(
+        expression=expression,
+        evaluator=evaluator,
+        input_keys=tuple(context.input_keys),
+        is_deterministic=context.is_deterministic,
+    )
+
+
+def _compile(tests: JSON, context: _CompilationContext) -> _Evaluator:
+    if isinstance(tests, list):
+        evaluators = [_compile(item, context) for item in tests]
+        return lambda data: [evaluator(data) for evaluator in evaluators]
+
+    if tests is None or not isinstance(tests, dict):
+        return lambda data: tests
+
+    try:
+        operator, values = destructure(tests)
+    except Exception:
+        # let the library raise the appropriate error at evaluation time
+        context.is_deterministic = False
+        return lambda data: json_logic.jsonLogic(tests, data)
+
+    if not isinstance(values, list) and not isinstance(values, tuple):
+        values = [values]
+
+    if operator in json_logic.scoped_operations:
+        # The arguments of scoped operators are interpreted by the operator itself, but
+        # we do need to know which data they read. The scoped logic (the second
+        # argument) reads the items of the array (and the accumulator), not the data.
+        scoped_context = _CompilationContext()
+        for index, value in enumerate(values):
+            _compile(value, scoped_context if index == 1 else context)
+        context.is_deterministic &= scoped_context.is_deterministic
+        scoped_operation = json_logic.scoped_operations[operator]
+        return lambda data: scoped_operation(data, *values)
+
+    if operator in NON_DETERMINISTIC_OPERATORS | DATA_READING_OPERATORS:
+        context.is_deterministic = False
+    elif operator == "var":
+        var_name = values[0] if values else None
+        if isinstance(var_name, str | int) and var_name != "":
+            context.input_keys[var_name] = None
+        else:
+            # dynamic keys or the whole data object
+            context.is_deterministic = False
+    elif operator not in json_logic.operations:
+        context.is_deterministic = False
+
+    evaluators = [_compile(value, context) for value in values]
+
+    match operator:
+        case "var":
+            return lambda data: get_var(data, *[ev(data) for ev in evaluators])
+        case "missing":
+            return lambda data: missing(data, *[ev(data) for ev in evaluators])
+        case "missing_some":
+            return lambda data: missing_some(data, *[ev(data) for ev in evaluators])
+
+    empty_values = json_logic.empty_operand_values_for_operators.get(operator)
+
+    def evaluate(data):
+        args = [evaluator(data) for evaluator in evaluators]
+        # look up the operation at evaluation time, as it may be patched
+        if (operation := json_logic.operations.get(operator)) is None:
+            raise ValueError(f"Unrecognized operation {operator}")
+        if empty_values and any([value in empty_values for value in args]):
+            return None
+        return operation(*args)
+
+    return evaluate
@@ -0,0 +1,146 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from json_logic import jsonLogic
+from unittest_parametrize import ParametrizedTestCase, param, parametrize
+
+from ..json_logic import compile_json_logic
+
+DATA = {
+    "textfield": "foo",
+    "number": 3,
+    "float": -0.0,
+    "decimal": Decimal("1.00"),
+    "checkbox": True,
+    "date": "2024-03-01",
+    "selectboxes": {"a": True, "b": False},
+    "editgrid": [{"amount": 1}, {"amount": 2}],
+    "empty": None,
+}
+
+
+class CompiledJsonLogicTests(ParametrizedTestCase, SimpleTestCase):
+    @parametrize(
+        "expression",
+        [
+            param(42, id="primitive"),
+            param([1, {"var": "number"}], id="list"),
+            param({"var": "textfield"}, id="var_shorthand"),
+            param({"var": ["missing_key", "default"]}, id="var_default"),
+            param({"var": "selectboxes.a"}, id="nested_var"),
+            param({"var": "editgrid.1.amount"}, id="editgrid_var"),
+            param({"==": [{"var": "number"}, "3"]}, id="soft_equals"),
+            param({"===": [{"var": "checkbox"}, 1]}, id="hard_equals"),
+            param({"==": [{"var": "float"}, "0.0"]}, id="negative_zero"),
+            param({"==": [{"var": "decimal"}, "1.0"]}, id="decimal"),
+            param({"and": [{"var": "checkbox"}, {"!": {"var": "empty"}}]}, id="and"),
+            param({"or": [{"var": "empty"}, {"var": "textfield"}]}, id="or"),
+            param({">": [{"var": "empty"}, 1]}, id="empty_operand"),
+            param({"+": [{"var": "number"}, "1.5"]}, id="plus"),
+            param(
+                {
+                    "reduce": [
+                        {"var": "editgrid"},
+                        {"+": [{"var": "accumulator"}, {"var": "current.amount"}]},
+                        0,
+                    ]
+                },
+                id="reduce",
+            ),
+            param({"map": [{"var": "editgrid"}, {"var": "amount"}]}, id="map"),
+            param({"missing": ["textfield", "unknown"]}, id="missing"),
+            param({"missing_some": [1, ["unknown", "number"]]}, id="missing_some"),
+            param({"var": {"cat": ["text", "field"]}}, id="dynamic_var"),
+            param({"in": [{"var": "textfield"}, ["foo", "bar"]]}, id="in"),
+            param(
+                {"if": [{"var": "empty"}, "a", {"var": "checkbox"}, "b", "c"]}, id="if"
+            ),
+            param(
+                {">": [{"date": {"var": "date"}}, {"date": "2024-01-01"}]}, id="date"
+            ),
+        ],
+    )
+    def test_same_result_as_interpreter(self, expression):
+        compiled = compile_json_logic(expression)
+
+        for data in (DATA, {}, None):
+            with self.subTest(data=data):
+                self.assertEqual(compiled(data), jsonLogic(expression, data))
+                # memoized evaluation must not change the result
+                self.assertEqual(compiled(data), jsonLogic(expression, data))
+
+    def test_unknown_operator_raises_at_evaluation_time(self):
+        compiled = compile_json_logic({"unknown": [1]})
+
+        with self.assertRaisesMessage(ValueError, "Unrecognized operation unknown"):
+            compiled({})
+
+    def test_input_keys(self):
+        compiled = compile_json_logic(
+            {
+                "and": [
+                    {"==": [{"var": "foo"}, 1]},
+                    {"in": [{"var": "bar.baz"}, {"var": ["foo"]}]},
+                ]
+            }
+        )
+
+        self.assertEqual(compiled.input_keys, ("foo", "bar.baz"))
+        self.assertTrue(compiled.is_deterministic)
+
+    def test_input_keys_of_scoped_operations(self):
+        compiled = compile_json_logic(
+            {
+                "reduce": [
+                    {"var": "editgrid"},
+                    {"+": [{"var": "accumulator"}, {"var": "current.amount"}]},
+                    {"var": "start"},
+                ]
+            }
+        )
+
+        self.assertEqual(compiled.input_keys, ("editgrid", "start"))
+        self.assertTrue(compiled.is_deterministic)
+
+    def test_non_deterministic_expressions(self):
+        expressions = [
+            {">": [{"var": "date"}, {"today": []}]},
+            {"var": {"var": "key"}},
+            {"var": ""},
+            {"missing": ["foo"]},
+            {"unknown": []},
+        ]
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                compiled = compile_json_logic(expression)
+
+                self.assertFalse(compiled.is_deterministic)
+
+    def test_results_are_reused_for_unchanged_inputs(self):
+        compiled = compile_json_logic({"==": [{"var": "foo"}, 1]})
+
+        with patch.object(
+            compiled, "evaluator", wraps=compiled.evaluator
+        ) as mock_evaluator:
+            self.assertTrue(compiled({"foo": 1, "bar": "a"}))
+            # unrelated input changed
+            self.assertTrue(compiled({"foo": 1, "bar": "b"}))
+            # equal, but different type
+            self.assertTrue(compiled({"foo": True, "bar": "b"}))
+            self.assertFalse(compiled({"foo": 2}))
+
+        self.assertEqual(mock_evaluator.call_count, 3)
+
+    def test_non_deterministic_results_are_not_reused(self):
+        compiled = compile_json_logic({"==": [{"var": "foo"}, {"today": []}]})
+
+        with patch("json_logic.date") as mock_date:
+            mock_date.today.return_value = date(2024, 1, 1)
+            self.assertTrue(compiled({"foo": date(2024, 1, 1)}))
+
+            mock_date.today.return_value = date(2024, 1, 2)
+            self.assertFalse(compiled({"foo": date(2024, 1, 1)}))
@@ -0,0 +1,33 @@
+"""
+Share the (parsed) WSDL documents between clients and processes.
+
+Loading and parsing the WSDL and the XSD's it imports is the most expensive part of
+building a :class:`zeep.Client`. The documents are stored in the default cache, so that
+every process doesn't have to download them again.
+"""
+
+from django.core.cache import cache
+
+from zeep.cache import Base
+
+WSDL_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _get_cache_key(url: str) -> str:
+    return f"soap|wsdl|url:{url}"
+
+
+class WSDLCache(Base):
+    """
+    :class:`zeep.cache.Base` implementation backed by the Django cache.
+    """
+
+    def add(self, url: str, content: bytes) -> None:
+        cache.set(_get_cache_key(url), content, timeout=WSDL_CACHE_TIMEOUT)
+
+    def get(self, url: str) -> bytes | None:
+        return cache.get(_get_cache_key(url))
+
+
+def invalidate_wsdl(url: str) -> None:
+    cache.delete(_get_cache_key(url))
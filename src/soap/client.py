@@ -1,10 +1,18 @@
+import hashlib
+from collections.abc import Callable
+from time import perf_counter
+
 from ape_pie.client import APIClient as SessionBase, is_base_url
 from zeep.client import Client
 from zeep.transports import Transport
 
+from .caching import WSDLCache
+from .metrics import client_build_duration, client_lookup_counter
 from .models import SoapService
 from .session_factory import SessionFactory
 
+_cached_clients: dict[int, tuple[str, Client]] = {}
+
 
 def build_client(
     service: SoapService,
@@ -17,6 +25,7 @@ def build_client(
 
     The mTLS and authentication parameters are taken from the service configuration
     and configured on the session, which is then used as transport for the zeep client.
+    The WSDL documents are cached (see :class:`soap.caching.WSDLCache`).
 
     Any additional kwargs are passed through to the :class:`zeep.Client` instantiation.
     """
@@ -24,6 +33,7 @@ def build_client(
     session = SOAPSession.configure_from(session_factory)
     transport = transport_factory(
         session=session,
+        cache=WSDLCache(),
         timeout=service.timeout,
         # operation_timeout gets passed as a parameter on all requests, overriding any
         # monkeypatched requests.Session defaults
@@ -38,6 +48,60 @@ def build_client(
     return client
 
 
+def _get_configuration_fingerprint(service: SoapService) -> str:
+    # the certificates are tracked by their primary key, changes to the certificates
+    # themselves clear all the cached clients (see :mod:`soap.signals`)
+    configuration = (
+        service.url,
+        service.soap_version,
+        service.timeout,
+        service.endpoint_security,
+        service.user,
+        service.password,
+        service.client_certificate_id,
+        service.server_certificate_id,
+    )
+    return hashlib.sha256(repr(configuration).encode()).hexdigest()
+
+
+def get_cached_client(
+    service: SoapService, build: Callable[[SoapService], Client] = build_client
+) -> Client:
+    """
+    Get the (shared) :class:`zeep.Client` for the service.
+
+    Building a client parses the WSDL, which is too expensive to do on every call. The
+    clients are kept for the lifetime of the process, so their session (and connection
+    pool) is reused as well. A client is rebuilt when the configuration of the service
+    changed, so the admin changes are picked up by the other processes too.
+    """
+    if service.pk is None:
+        return build(service)
+
+    fingerprint = _get_configuration_fingerprint(service)
+    cached = _cached_clients.get(service.pk)
+    if cached is not None and cached[0] == fingerprint:
+        client_lookup_counter.add(1, attributes={"type": "warm"})
+        return cached[1]
+
+    start = perf_counter()
+    client = build(service)
+    client_build_duration.record(perf_counter() - start)
+    client_lookup_counter.add(1, attributes={"type": "cold"})
+    _cached_clients[service.pk] = (fingerprint, client)
+    return client
+
+
+def clear_cached_clients(service_pk: int | None = None) -> None:
+    """
+    Discard the cached client of a service, or all of them.
+    """
+    if service_pk is None:
+        _cached_clients.clear()
+    else:
+        _cached_clients.pop(service_pk, None)
+
+
 class SOAPSession(SessionBase):
     def to_absolute_url(self, maybe_relative_url: str) -> str:
         """
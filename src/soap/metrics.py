@@ -0,0 +1,19 @@
+from opentelemetry import metrics
+
+meter = metrics.get_meter("soap")
+
+client_lookup_counter = meter.create_counter(
+    "openforms.soap.client_lookups",
+    unit="1",  # unitless count
+    description=(
+        "The number of SOAP client lookups, by whether the client had to be built "
+        "(cold) or could be reused (warm)."
+    ),
+)
+
+client_build_duration = meter.create_histogram(
+    name="openforms.soap.client_build_duration",
+    unit="s",
+    description="Duration of building a SOAP client, including loading the WSDL.",
+    explicit_bucket_boundaries_advisory=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from simple_certmanager.models import Certificate
+
+from .caching import invalidate_wsdl
+from .client import clear_cached_clients
+from .models import SoapService
+
+
+@receiver(post_save, sender=SoapService, dispatch_uid="soap.invalidate_service")
+@receiver(post_delete, sender=SoapService, dispatch_uid="soap.invalidate_service")
+def invalidate_service(sender, instance: SoapService, **kwargs) -> None:
+    # saving the service in the admin is the natural way to pick up a changed WSDL
+    if instance.url:
+        invalidate_wsdl(instance.url)
+    clear_cached_clients(instance.pk)
+
+
+@receiver(post_save, sender=Certificate, dispatch_uid="soap.invalidate_certificate")
+def invalidate_certificate(sender, instance: Certificate, **kwargs) -> None:
+    # the certificate files may have been replaced
+    clear_cached_clients()
@@ -3,6 +3,7 @@ Test the client factory from SOAPService configuration.
 """
 
 from pathlib import Path
+from unittest.mock import Mock
 
 from django.test import TestCase
 
@@ -13,9 +14,15 @@ from simple_certmanager.test.factories import CertificateFactory
 from zeep.exceptions import XMLSyntaxError
 from zeep.wsse import Signature, UsernameToken
 
+from openforms.utils.tests.cache import clear_caches
 from openforms.utils.tests.vcr import OFVCRMixin
 
-from ..client import SOAPSession, build_client
+from ..client import (
+    SOAPSession,
+    build_client,
+    clear_cached_clients,
+    get_cached_client,
+)
 from ..constants import EndpointSecurity
 from ..session_factory import SessionFactory
 from .factories import SoapServiceFactory
@@ -261,3 +268,59 @@ class ClientTransportTimeoutTests(TestCase):
             except XMLSyntaxError:
                 # timeout time has passed and we're trying
                 self.fail("timeout not honoured by SOAP client")
+
+
+class CachedClientTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+        self.addCleanup(clear_cached_clients)
+
+    def test_client_is_reused(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+        build = Mock(wraps=build_client)
+
+        client1 = get_cached_client(service, build=build)
+        client2 = get_cached_client(service, build=build)
+
+        self.assertIs(client1, client2)
+        build.assert_called_once_with(service)
+
+    def test_client_is_rebuilt_when_configuration_changes(self):
+        service = SoapServiceFactory.create(url=WSDL_URI, timeout=10)
+        client1 = get_cached_client(service)
+
+        service.timeout = 5
+        client2 = get_cached_client(service)
+
+        self.assertIsNot(client1, client2)
+        self.assertEqual(client2.transport.operation_timeout, 5)
+
+    def test_client_is_discarded_when_service_is_saved(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+        build = Mock(wraps=build_client)
+        get_cached_client(service, build=build)
+
+        service.save()
+        get_cached_client(service, build=build)
+
+        self.assertEqual(build.call_count, 2)
+
+    def test_unsaved_service_is_not_cached(self):
+        service = SoapServiceFactory.build(url=WSDL_URI)
+
+        client1 = get_cached_client(service)
+        client2 = get_cached_client(service)
+
+        self.assertIsNot(client1, client2)
+
+    @requests_mock.Mocker()
+    def test_wsdl_is_cached(self, m):
+        m.get("https://example.com/service?wsdl", content=WSDL.read_bytes())
+        service = SoapServiceFactory.build(url="https://example.com/service?wsdl")
+
+        build_client(service)
+        build_client(service)
+
+        self.assertEqual(len(m.request_history), 1)
@@ -26,11 +26,16 @@ from requests.models import Response
 from soap.constants import SOAP_VERSION_CONTENT_TYPES, SOAPVersion
 
 from .constants import EndpointType
+from .streaming import StreamingBody, build_streaming_body, extract_binary_contents
 from .stuf import StuurGegevens, WSSecurity
 from .xml import sanitize_users_input_data
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# bodies with binary contents smaller than this are sent in one go (which also allows
+# the outgoing requests log to record them)
+STREAMING_BODY_MIN_SIZE = 1024 * 1024
+
 
 class BaseClient(APIClient):
     """
@@ -133,7 +138,7 @@ class BaseClient(APIClient):
     def soap_request(
         self,
         soap_action: str,
-        body: str,
+        body: str | bytes | StreamingBody,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
     ) -> Response:
         normalized_url = self.to_absolute_url(endpoint_type)
@@ -146,7 +151,7 @@ class BaseClient(APIClient):
         log.debug("stuf_request_started")
         response = self.post(
             normalized_url,
-            data=body.encode("utf-8"),
+            data=body.encode("utf-8") if isinstance(body, str) else body,
             # See https://docs.python-requests.org/en/latest/user/advanced/#session-objects,
             # both the session.headers and these run-time headers are sent.
             headers={
@@ -192,6 +197,10 @@ class BaseClient(APIClient):
 
         The context is merged with the base context and the resolved template is
         rendered into a string, suitable to be passed down to :meth:`request`.
+
+        File contents can be passed as :class:`stuf.streaming.Base64Content` context
+        values. They are not rendered, but encoded while the body is sent, so that
+        large documents are not held in memory.
         """
         initial_full_context = {**self.build_base_context(), **(context or {})}
         structlog.contextvars.bind_contextvars(
@@ -201,6 +210,9 @@ class BaseClient(APIClient):
             referentienummer=initial_full_context["referentienummer"],
         )
 
+        # the binary contents are replaced with markers, so that they are neither
+        # copied nor rendered
+        initial_full_context, contents = extract_binary_contents(initial_full_context)
         sanitized_full_context = sanitize_users_input_data(
             copy.deepcopy(initial_full_context)
         )
@@ -209,6 +221,10 @@ class BaseClient(APIClient):
 
         logger.debug("prepare_and_make_request")
         body = loader.render_to_string(template, sanitized_full_context)
+        if contents:
+            body = build_streaming_body(body, contents)
+            if len(body) < STREAMING_BODY_MIN_SIZE:
+                body = body.read()
         response = self.soap_request(
             soap_action, body=body, endpoint_type=endpoint_type
         )
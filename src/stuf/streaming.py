@@ -0,0 +1,140 @@
+"""
+Stream (large) file contents in StUF requests.
+
+Documents are included base64 encoded in the SOAP envelope. Rather than rendering the
+encoded content into the envelope, the envelope is rendered with a marker in its place
+and the content is encoded in chunks while the request body is being sent. This keeps
+the memory usage flat, regardless of the size of the document.
+"""
+
+import base64
+import re
+import uuid
+from collections.abc import Iterator, Mapping, Sequence
+from io import UnsupportedOperation
+from math import ceil
+from typing import Any
+
+from django.core.files import File
+
+# read a multiple of 3 bytes, so the encoded chunks can be concatenated
+CHUNK_SIZE = 3 * 16 * 1024
+
+
+class Base64Content:
+    """
+    Template context value for file content that must be included base64 encoded.
+
+    See :meth:`stuf.client.BaseClient.templated_request`.
+    """
+
+    def __init__(self, file: File):
+        self.file = file
+
+    def __len__(self) -> int:
+        return 4 * ceil(self.file.size / 3)
+
+    def iter_encoded(self) -> Iterator[bytes]:
+        self.file.seek(0)
+        remainder = b""
+        while data := self.file.read(CHUNK_SIZE):
+            data = remainder + data
+            # a read may return less than requested, only encode complete groups of 3
+            # bytes to avoid padding in the middle of the content
+            cut = len(data) - len(data) % 3
+            remainder = data[cut:]
+            if cut:
+                yield base64.b64encode(data[:cut])
+        if remainder:
+            yield base64.b64encode(remainder)
+
+
+class StreamingBody:
+    """
+    File-like request body, backed by a generator over its parts.
+
+    The length is known up front, so a ``Content-Length`` header is sent rather than
+    using chunked transfer encoding. The body can be rewound, so requests can retry
+    sending it.
+    """
+
+    def __init__(self, parts: Sequence[bytes | Base64Content]):
+        self.parts = parts
+        self._chunks: Iterator[bytes] | None = None
+        self._buffer = b""
+        self._position = 0
+
+    def __len__(self) -> int:
+        return sum(len(part) for part in self.parts)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._iter_chunks()
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        for part in self.parts:
+            if isinstance(part, bytes):
+                yield part
+            else:
+                yield from part.iter_encoded()
+
+    def read(self, size: int = -1) -> bytes:
+        if self._chunks is None:
+            self._chunks = self._iter_chunks()
+
+        while size < 0 or len(self._buffer) < size:
+            if (chunk := next(self._chunks, None)) is None:
+                break
+            self._buffer += chunk
+
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        self._position += len(data)
+        return data
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if offset != 0 or whence != 0:
+            raise UnsupportedOperation("The body can only be rewound to the start.")
+        self._chunks = None
+        self._buffer = b""
+        self._position = 0
+        return 0
+
+
+def extract_binary_contents(
+    context: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, Base64Content]]:
+    """
+    Replace the binary contents in the (top level) context with unique markers.
+
+    :returns: A copy of the context and the binary contents by their marker.
+    """
+    context = {**context}
+    contents: dict[str, Base64Content] = {}
+    for key, value in context.items():
+        if isinstance(value, Base64Content):
+            marker = f"__binary_content_{uuid.uuid4().hex}__"
+            contents[marker] = value
+            context[key] = marker
+    return context, contents
+
+
+def build_streaming_body(
+    rendered: str, contents: Mapping[str, Base64Content]
+) -> StreamingBody:
+    """
+    Assemble the body from the rendered envelope, replacing the markers by the content.
+    """
+    pattern = re.compile("|".join(re.escape(marker) for marker in contents))
+    parts: list[bytes | Base64Content] = []
+    position = 0
+    for match in pattern.finditer(rendered):
+        parts.append(rendered[position : match.start()].encode("utf-8"))
+        parts.append(contents[match.group()])
+        position = match.end()
+    parts.append(rendered[position:].encode("utf-8"))
+    return StreamingBody(parts)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import base64
 import uuid
 from collections import OrderedDict
 from collections.abc import Iterator, MutableMapping
@@ -33,6 +32,7 @@ from ..client import BaseClient
 from ..constants import EndpointType
 from ..models import StufService
 from ..service_client_factory import ServiceClientFactory, get_client_init_kwargs
+from ..streaming import Base64Content
 from ..xml import fromstring
 from .constants import STUF_ZDS_EXPIRY_MINUTES
 from .models import StufZDSConfig
@@ -304,9 +304,6 @@ class Client(BaseClient):
         content: File,
         doc_data: dict,
     ) -> None:
-        content.seek(0)
-        base64_body = base64.b64encode(content.read()).decode()
-
         now = timezone.now()
         # TODO: vertrouwelijkAanduiding
         context = {
@@ -323,7 +320,7 @@ class Client(BaseClient):
             "document_identificatie": doc_id,
             "auteur": "open-forms",
             "taal": "nld",
-            "inhoud": base64_body,
+            "inhoud": Base64Content(content),
             "status": "definitief",
             **doc_data,
         }
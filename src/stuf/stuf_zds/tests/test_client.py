@@ -1,3 +1,6 @@
+import base64
+import os
+from io import BytesIO
 from unittest.mock import patch
 
 from django.template.loader import render_to_string
@@ -13,8 +16,10 @@ from openforms.utils.tests.vcr import OFVCRMixin
 
 from ...constants import EndpointType
 from ...tests.factories import StufServiceFactory
+from ...xml import fromstring
 from ..client import StufZDSClient, ZaakOptions
 from ..models import StufZDSConfig
+from .utils import load_mock
 
 
 @requests_mock.Mocker()
@@ -127,6 +132,29 @@ class StufZdsClientTest(TestCase):
         self.assertTrue(request_with_tls.verify)
         self.assertIsNone(request_with_tls.cert)
 
+    def test_document_content_is_streamed(self, m):
+        stuf_service = StufServiceFactory.create()
+        client = StufZDSClient(
+            stuf_service, self.client_options, config=StufZDSConfig()
+        )
+        m.post(
+            stuf_service.soap_service.url,
+            content=load_mock("voegZaakdocumentToe.xml"),
+        )
+        content = os.urandom(100_000)
+
+        with patch("stuf.client.STREAMING_BODY_MIN_SIZE", 0):
+            client.create_confirmation_email_attachment(
+                zaak_id="ZAAK-01", doc_id="DOC-01", email_content=BytesIO(content)
+            )
+
+        body = m.last_request.body
+        self.assertEqual(int(m.last_request.headers["Content-Length"]), len(body))
+        body.seek(0)
+        xml = fromstring(body.read())
+        inhoud = xml.xpath("//*[local-name()='inhoud']")[0].text
+        self.assertEqual(base64.b64decode(inhoud), content)
+
 
 @disable_timelinelog()
 class StufZdsRegressionTests(OFVCRMixin, SimpleTestCase):